@@ -0,0 +1 @@
+insert ignore into PVTypeInfo VALUES ;
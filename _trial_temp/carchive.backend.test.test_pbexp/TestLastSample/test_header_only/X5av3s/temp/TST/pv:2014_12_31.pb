@@ -0,0 +1 @@
+TST:pv
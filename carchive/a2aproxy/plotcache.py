@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright 2015 Brookhaven Science Assoc.
+ as operator of Brookhaven National Lab.
+
+Cache of encoded replies to plot binned (how=3) requests.
+"""
+
+import logging
+_log = logging.getLogger(__name__)
+
+import time
+
+from collections import OrderedDict
+
+from ..backend.appl import plotBinSize
+
+class PlotCache(object):
+    """Least recently used cache of the encoded reply for one PV,
+    bounded by the total size of the cached replies.
+
+    Entries expire after maxage seconds, or liveage seconds if the
+    time range ends less than holdoff seconds before now,
+    as recent bins may still change.
+
+    >>> C = PlotCache(maxsize=20, maxentry=10, maxage=100, liveage=10, holdoff=50,
+    ...               clock=lambda:1000)
+    >>> C.put(('a', 10, 10, 20), 'x'*8)
+    >>> C.put(('b', 10, 10, 20), 'y'*8)
+    >>> C.get(('a', 10, 10, 20))
+    'xxxxxxxx'
+    >>> C.put(('c', 10, 10, 20), 'z'*8) # evicts b
+    >>> C.get(('b', 10, 10, 20)), C.size
+    (None, 16)
+    >>> C.put(('d', 10, 90, 100), 'w') # ends at 1000
+    >>> C.clock = lambda:1011
+    >>> C.get(('a', 10, 10, 20)), C.get(('d', 10, 90, 100))
+    ('xxxxxxxx', None)
+    """
+    def __init__(self, maxsize=64*2**20, maxentry=None,
+                 maxage=300, liveage=10, holdoff=60,
+                 clock=time.time):
+        self.maxsize, self.maxage = maxsize, maxage
+        self.liveage, self.holdoff = liveage, holdoff
+        self.clock = clock
+        # largest single entry
+        self.maxentry = maxentry or maxsize//8
+        self._entries = OrderedDict() # key -> (expires, data)
+        self.size, self.hits, self.misses = 0, 0, 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(pv, T0, Tend, count):
+        """Cache key for a request, or None if not cacheable.
+        The start and end times (in seconds) are aligned to the bin size,
+        as the Appliance does.
+
+        >>> PlotCache.key('pv', 1000, 2000, 100)
+        ('pv', 10, 100, 200)
+        >>> PlotCache.key('pv', 1005, 2003, 100)
+        ('pv', 9, 111, 223)
+        >>> PlotCache.key('pv', 1000, 2099, 100)
+        ('pv', 10, 100, 210)
+        >>> PlotCache.key('pv', 1000, 1050, 100) # raw
+        """
+        if count<=0 or Tend<=T0:
+            return None
+        N = plotBinSize(T0, Tend, count)
+        if N<=1:
+            return None # fetchplot() switches to raw
+        return (pv, N, T0//N, -(-Tend//N))
+
+    def get(self, key):
+        E = self._entries.pop(key, None)
+        if E is not None:
+            expires, data = E
+            if self.clock()<expires:
+                self._entries[key] = E # now most recently used
+                self.hits += 1
+                return data
+            self.size -= len(data)
+        self.misses += 1
+        return None
+
+    def put(self, key, data):
+        if len(data)>self.maxentry:
+            return
+        now = self.clock()
+        _pv, N, _S, E = key
+        if E*N>=now-self.holdoff:
+            age = self.liveage
+        else:
+            age = self.maxage
+        if age<=0:
+            return
+
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.size -= len(old[1])
+        self._entries[key] = (now+age, data)
+        self.size += len(data)
+
+        while self.size>self.maxsize and self._entries:
+            _K, (_T, D) = self._entries.popitem(last=False)
+            self.size -= len(D)
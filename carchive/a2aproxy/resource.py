@@ -18,6 +18,7 @@ from .xrpcrequest import NamesRequest, ValuesRequest
 
 from .._conf import ConfigDict
 from ..backend.appl import getArchive
+from ..backend.decodepool import getDecodePool
 from ..status import status
 
 _info = {
@@ -67,6 +68,8 @@ class DataServer(Resource):
     NamesRequest=NamesRequest
     ValuesRequest=ValuesRequest
     applinfo=None
+    concurrent=None
+    plotcache=None
 
     def fetchInfo(self):
         if self.applinfo is not None:
@@ -119,7 +122,9 @@ class DataServer(Resource):
                            req.getClientIP(), args)
                 @Dinfo.addCallback
                 def startValues(info):
-                    R = self.ValuesRequest(req, args, applinfo=info)
+                    R = self.ValuesRequest(req, args, applinfo=info,
+                                           concurrent=self.concurrent,
+                                           plotcache=self.plotcache)
                     return R.defer
             else:
                 _log.error("%s: Request for unknown method %s",
@@ -134,17 +139,40 @@ class DataServer(Resource):
 
         return NOT_DONE_YET
 
-def buildResource(infourl=None):
+class StatusPage(Resource):
+    """Plain text summary of decoder and cache statistics
+    """
+    isLeaf=True
+    plotcache=None
+
+    def render_GET(self, req):
+        req.setHeader('Content-Type', 'text/plain')
+        L = []
+        C = self.plotcache
+        if C is not None:
+            L += ['Plot cache: %d entries  %d of %d bytes  hits: %d  misses: %d'%(
+                    len(C), C.size, C.maxsize, C.hits, C.misses), '']
+        L += getDecodePool().report()
+        L.append('')
+        return '\n'.join(L)
+
+def buildResource(infourl=None, concurrent=None, plotcache=None):
     if not infourl.startswith('http') and infourl.find('/')==-1:
         # only host:port is provided, use default URL
         infourl = "http://%s/mgmt/bpl/getApplianceInfo"%infourl
     C = DataServer()
     C.infourl = infourl
+    C.concurrent = concurrent
+    C.plotcache = plotcache
 
     root= Resource()
     cgibin = Resource()
     root.putChild('cgi-bin', cgibin)
     cgibin.putChild('ArchiveDataServer.cgi', C)
+
+    S = StatusPage()
+    S.plotcache = plotcache
+    root.putChild('status', S)
     return root
 
 def main():
@@ -14,12 +14,16 @@ if sys.version_info<(2,7):
 from cStringIO import StringIO
 from xmlrpclib import dumps, loads, Fault
 
+import numpy
+
 from twisted.web.xmlrpc import Proxy
 
 from twisted.internet import defer, reactor
 from twisted.web.server import Site
 
 from .. import resource, xrpcrequest
+from ..plotcache import PlotCache
+from ...dtype import dbr_time
 
 class TestRequest(object):
     code = 200
@@ -32,6 +36,10 @@ class TestRequest(object):
         self.code = code
     def setHeader(self, K, V):
         self.Hs[K] = [V]
+    def registerProducer(self, P, streaming):
+        self.producer = P
+    def unregisterProducer(self):
+        self.producer = None
     def notifyFinish(self):
         self.Ds.append(defer.Deferred())
         return self.Ds[-1]
@@ -153,3 +161,194 @@ class TestValuesEncoder(unittest.TestCase):
             except:
                 print 'Error in',type,val
                 raise
+
+    def test_encode_chunk(self):
+        M = numpy.zeros(3, dtype=dbr_time)
+        M['sec'] = [10, 11, 12]
+        M['ns'] = [1, 2, 3]
+        M['severity'] = [0, 1, 2]
+        M['status'] = [3, 4, 5]
+
+        for V in [numpy.asarray([[1.5], [2.25], [-1e300]]),
+                  numpy.asarray([[1.5, 2], [3, 4], [5, 6]], dtype=numpy.float32),
+                  numpy.arange(9, dtype=numpy.int16).reshape((3,3)),
+                  numpy.asarray([['a<b'], ['c&d'], ['']], dtype='a40')]:
+            E = xrpcrequest._encoder[xrpcrequest._d2x[V.dtype]]
+            A = ''.join([xrpcrequest._sample_head%{'stat':M[i]['status'], 'sevr':M[i]['severity'],
+                                                   'secs':M[i]['sec'], 'nano':M[i]['ns']}
+                         +xrpcrequest._sample_start+''.join(map(E, V[i,:]))
+                         +xrpcrequest._sample_foot for i in range(3)])
+            B = xrpcrequest.encodeSamples(V, M)
+
+            A = loads(xrpcrequest._values_start+A+xrpcrequest._values_end)[0][0]
+            B = loads(xrpcrequest._values_start+B+xrpcrequest._values_end)[0][0]
+            self.assertEqual(A, B)
+
+    def test_encode_float32(self):
+        # formatted as the per-value _encoder does
+        M = numpy.zeros(2, dtype=dbr_time)
+        V = numpy.asarray([[0.1, 1/3.], [2.5, -7.7]], dtype=numpy.float32)
+        E = xrpcrequest._encoder[3]
+        B = xrpcrequest.encodeSamples(V, M)
+        for i in range(2):
+            self.assertIn(''.join(map(E, V[i,:])), B)
+        self.assertIn('<value><double>0.1</double></value>', B)
+
+        self.assertEqual(xrpcrequest.encodeSamples(numpy.zeros((0,0)), []), '')
+
+class FakeAppl(object):
+    """fetchraw() completes when the test says so
+    """
+    def __init__(self):
+        self.Ds, self.waits = {}, {}
+    def fetchraw(self, name, callback, cbArgs=(), **kws):
+        D = defer.Deferred()
+        def done(N):
+            M = numpy.zeros(N, dtype=dbr_time)
+            M['sec'] = range(N)
+            W = callback(numpy.arange(N, dtype=numpy.float64).reshape((N,1)), M, *cbArgs)
+            self.waits[name] = W
+            return N
+        D.addCallback(done)
+        self.Ds[name] = D
+        return D
+    fetchplot = fetchraw
+
+class SlotAppl(object):
+    """Holds an agent slot while fetching, and stops when a sample
+    callback fails, as the Appliance does.  Fetches of 'bad' complete
+    when the test says so.
+    """
+    def __init__(self):
+        self.held, self.started, self.Ds = 0, [], {}
+    def fetchraw(self, name, callback, cbArgs=(), **kws):
+        self.started.append(name)
+        self.held += 1
+        if name=='bad':
+            D = self.Ds[name] = defer.Deferred()
+        else:
+            M = numpy.zeros(1, dtype=dbr_time)
+            D = defer.maybeDeferred(callback, numpy.zeros((1,1)), M, *cbArgs)
+            D.addCallback(lambda _ign:1)
+        @D.addBoth
+        def release(R):
+            self.held -= 1
+            return R
+        return D
+
+class TestValuesOrder(unittest.TestCase):
+    def test_order(self):
+        A = FakeAppl()
+        R = TestRequest('')
+        X = xrpcrequest.ValuesRequest(R, [42, ['a', 'b', 'c'], 0, 0, 10, 0, 100, 0],
+                                      applinfo=A, concurrent=2)
+        self.assertEqual(sorted(A.Ds), ['a', 'b']) # limited
+
+        A.Ds['b'].callback(2)
+        self.assertNotIn("<string>b</string>", R.data.getvalue()) # spooled
+        self.assertIn('c', A.Ds)
+
+        A.Ds['a'].callback(1)
+        self.assertIn("<string>b</string>", R.data.getvalue())
+        self.assertIsNotNone(R.Ds)
+
+        A.Ds['c'].callback(0)
+        self.assertIsNone(R.Ds) # finished
+
+        V = loads(R.data.getvalue())[0][0]
+        self.assertEqual([P['name'] for P in V], ['a', 'b', 'c'])
+        self.assertEqual([len(P['values']) for P in V], [1, 2, 0])
+        self.assertEqual(X.defer.called, True)
+
+    def test_pause(self):
+        A = FakeAppl()
+        R = TestRequest('')
+        X = xrpcrequest.ValuesRequest(R, [42, ['a', 'b'], 0, 0, 10, 0, 100, 0],
+                                      applinfo=A)
+        self.assertIs(R.producer, X)
+
+        A.Ds['b'].callback(2)
+        self.assertIsInstance(A.waits['b'], defer.Deferred) # spooled
+
+        X.pauseProducing()
+        A.Ds['a'].callback(1)
+        self.assertIsInstance(A.waits['a'], defer.Deferred) # paused
+        self.assertFalse(A.waits['b'].called)
+
+        X.resumeProducing()
+        self.assertTrue(A.waits['a'].called)
+        self.assertTrue(A.waits['b'].called)
+        self.assertIsNone(R.producer)
+        self.assertIsNone(R.Ds) # finished
+
+    def test_stop(self):
+        A = SlotAppl()
+        R = TestRequest('')
+        X = xrpcrequest.ValuesRequest(R, [42, ['a', 'bad', 'c', 'd', 'e'], 0, 0, 10, 0, 100, 0],
+                                      applinfo=A, concurrent=3)
+        self.assertEqual(A.started, ['a', 'bad', 'c', 'd'])
+        self.assertEqual(A.held, 3) # c and d wait for bad
+
+        A.Ds['bad'].errback(RuntimeError('oops'))
+        self.assertEqual(A.held, 0)
+        self.assertEqual(A.started, ['a', 'bad', 'c', 'd']) # e not started
+        self.assertFailure(X.defer, RuntimeError)
+        return X.defer
+
+    def test_error(self):
+        A = FakeAppl()
+        R = TestRequest('')
+        X = xrpcrequest.ValuesRequest(R, [42, ['a', 'b'], 0, 0, 10, 0, 100, 0],
+                                      applinfo=A)
+        self.assertIs(R.producer, X)
+
+        A.Ds['a'].errback(RuntimeError('oops'))
+        self.assertIsNone(R.producer)
+        self.assertFailure(X.defer, RuntimeError)
+        return X.defer
+
+    def test_lost(self):
+        A = FakeAppl()
+        R = TestRequest('')
+        R.unregisterProducer = None # channel is gone
+        X = xrpcrequest.ValuesRequest(R, [42, ['a', 'b'], 0, 0, 10, 0, 100, 0],
+                                      applinfo=A)
+        R.connectionLost(RuntimeError('lost'))
+        self.assertFailure(X._complete, RuntimeError)
+        self.assertFailure(X.defer, defer.CancelledError)
+        return X.defer
+
+class TestPlotCache(unittest.TestCase):
+    def test_cached(self):
+        A = FakeAppl()
+        C = PlotCache(clock=lambda:10000)
+        args = [42, ['a', 'b'], 1000, 0, 2000, 0, 100, 3]
+
+        R1 = TestRequest('')
+        xrpcrequest.ValuesRequest(R1, args, applinfo=A, plotcache=C)
+        A.Ds['a'].callback(2)
+        A.Ds['b'].callback(3)
+        self.assertIsNone(R1.Ds) # finished
+        self.assertEqual(len(C), 2)
+
+        A.Ds.clear()
+        R2 = TestRequest('')
+        xrpcrequest.ValuesRequest(R2, args, applinfo=A, plotcache=C)
+        self.assertEqual(A.Ds, {}) # not fetched
+        self.assertIsNone(R2.Ds)
+        self.assertEqual(R1.data.getvalue(), R2.data.getvalue())
+        self.assertEqual(C.hits, 2)
+
+        # raw requests not cached
+        R3 = TestRequest('')
+        xrpcrequest.ValuesRequest(R3, args[:-1]+[0], applinfo=A, plotcache=C)
+        self.assertEqual(sorted(A.Ds), ['a', 'b'])
+
+class TestStatus(unittest.TestCase):
+    def test_status(self):
+        S = resource.StatusPage()
+        S.plotcache = PlotCache()
+        R = TestRequest('')
+        X = S.render_GET(R)
+        self.assertIn('Plot cache: 0 entries', X)
+        self.assertIn('Decode workers:', X)
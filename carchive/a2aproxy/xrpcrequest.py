@@ -13,7 +13,10 @@ from xmlrpclib import dumps, Fault, escape
 
 import numpy
 
+from zope.interface import implements
+
 from twisted.internet import defer
+from twisted.internet.interfaces import IPushProducer
 
 from ..date import makeTime
 from ..backend.appl import _dtypes
@@ -171,12 +174,93 @@ _values_foot = "</data></array></value>\n</member>\n"+\
 # Once.  Closes array.
 _values_end = "</data></array></value>\n</param>\n</params></methodResponse>\n"
 
+# Per sample templates for encodeSamples(), with positional arguments
+# (stat, sevr, secs, nano, value0, value1, ...)
+_sample_pos = _sample_head%{'stat':'%d', 'sevr':'%d', 'secs':'%d', 'nano':'%d'}+_sample_start
+
+_value_pos = {
+    0:"<value><string>%s</string></value>",
+    2:"<value><int>%d</int></value>",
+    3:"<value><double>%r</double></value>",
+    # float32, pre-formatted by numpy
+    'f4':"<value><double>%s</double></value>",
+}
+
+_sample_tmpl = {}
+
+def _sampleTemplate(xtype, count):
+    """Template for one sample with count elements of XMLRPC type code xtype
+    (or a key of _value_pos)
+    """
+    try:
+        return _sample_tmpl[(xtype, count)]
+    except KeyError:
+        T = _sample_tmpl[(xtype, count)] = _sample_pos+_value_pos[xtype]*count+_sample_foot
+        return T
+
+def encodeSamples(V, M):
+    """Encode a chunk of samples as one string.
+
+    Equivalent to, but much faster than, encoding each sample with
+    _sample_head, _encoder, and _sample_foot.
+    """
+    N, W = V.shape[0], V.shape[1] if V.ndim>1 else 1
+    if N==0:
+        return ''
+    xtype = _d2x[V.dtype]
+
+    # Arguments for all samples in one row major table,
+    # converted to python types once.
+    args = numpy.empty((N, 4+W), dtype=object)
+    args[:,0] = M['status']
+    args[:,1] = M['severity']
+    args[:,2] = M['sec']
+    args[:,3] = M['ns']
+    V = V.reshape((N, W))
+    if xtype==0:
+        V = numpy.char.replace(V, '&', '&amp;')
+        V = numpy.char.replace(V, '<', '&lt;')
+        V = numpy.char.replace(V, '>', '&gt;')
+    elif V.dtype==numpy.float32:
+        # numpy's shortest repr of float32, as _encoder gives. eg. '0.1'
+        xtype = 'f4'
+        V = numpy.asarray(map(repr, V.ravel()), dtype=object).reshape((N, W))
+    args[:,4:] = V
+
+    return (_sampleTemplate(xtype, W)*N)%tuple(args.ravel().tolist())
+
+class _Spool(object):
+    """Reply for one PV, held until it can be written in order
+    """
+    def __init__(self, name):
+        self.name, self.first, self.done = name, True, False
+        self.parts = []
+        # fires when parts have been written
+        self.wait = None
+        # copy of the reply to be cached, or None
+        self.record, self.recsize = None, 0
+
 class ValuesRequest(XMLRPCRequest):
+    """Reply to archiver.values
+
+    Registered as a push producer with the HTTP request.  While paused by
+    a slow client, sample callbacks return a Deferred to pause reading
+    from the Appliance.
+    """
+    implements(IPushProducer)
     # key, names, start_sec, start_nano, end_sec, end_nano, count, how
     argumentTypes = (int, list, int, int, int, int, int, int)
-    def __init__(self, httprequest, args, applinfo=None):
+    # default max. number of PVs fetched concurrently
+    concurrent = 4
+    _pending, _spools, _paused = (), (), None
+    _failed, _failure = False, None
+    def __init__(self, httprequest, args, applinfo=None, concurrent=None,
+                 plotcache=None):
         super(ValuesRequest, self).__init__(httprequest, args)
         self.applinfo = applinfo
+        self.plotcache = plotcache
+        if concurrent is not None:
+            self.concurrent = concurrent
 
         self._names = self.args[1]
         self._start = makeTime((self.args[2],self.args[3]))
@@ -204,78 +288,198 @@ class ValuesRequest(XMLRPCRequest):
             self.defer = defer.succeed(None)
             return
 
-        self._cur_pv, self._first_val = None, True
+        # PVs are fetched concurrently, but replies must be sent in order.
+        # Output for the PV at _head is written immediately,
+        # and spooled for the others.
+        self._spools = [_Spool(name) for name in self._names]
+        self._head = 0
+        self._pending = []
         self._count = 0
 
-        #TODO: throttle reply
+        self._paused = None
+        self._lost = False
+        self.request.registerProducer(self, True)
         self.request.write(_values_start)
 
         self.defer = self.getPVs()
 
+    def abortEnd(self, R):
+        self._lost = True # producer was removed with the connection
+        self._abort()
+        return super(ValuesRequest, self).abortEnd(R)
+
+    def _abort(self):
+        """Stop fetching all PVs.
+
+        PVs not yet started are cancelled.  Sample callbacks of those
+        in progress fail, which closes their connections.
+        """
+        self._failed = True
+        for D in self._pending:
+            D.cancel()
+        waits = [S.wait for S in self._spools if S.wait is not None]
+        for S in self._spools:
+            S.wait = None
+        if self._paused is not None:
+            waits.append(self._paused)
+            self._paused = None
+        for D in waits:
+            if not D.called:
+                D.errback(defer.CancelledError())
+
+    def pauseProducing(self):
+        if self._paused is None:
+            self._paused = defer.Deferred()
+
+    def resumeProducing(self):
+        D, self._paused = self._paused, None
+        if D is not None and not D.called:
+            D.callback(None)
+
+    def stopProducing(self):
+        for D in self._pending:
+            D.cancel()
+
+    def _write(self, S, data):
+        """Write, or spool, data for the PV S.
+
+        Returns a Deferred if the caller should wait before sending more.
+        """
+        if self._failed:
+            return defer.fail(defer.CancelledError())
+        if S.record is not None:
+            S.record.append(data)
+            S.recsize += len(data)
+            if S.recsize>self.plotcache.maxentry:
+                S.record = None # too large to cache
+        if self._head<len(self._spools) and S is self._spools[self._head]:
+            self.request.write(data)
+            return self._paused
+        else:
+            S.parts.append(data)
+            if S.wait is None:
+                S.wait = defer.Deferred()
+            return S.wait
+
+    def _finish(self, S):
+        S.done = True
+        spools = self._spools
+        while self._head<len(spools) and spools[self._head].done:
+            self._head += 1
+            if self._head<len(spools):
+                N = spools[self._head]
+                if N.parts:
+                    self.request.write(''.join(N.parts))
+                    N.parts = []
+                D, N.wait = N.wait, None
+                if D is None:
+                    pass
+                elif self._paused is None:
+                    D.callback(None)
+                else:
+                    self._paused.chainDeferred(D)
+
     @defer.inlineCallbacks
     def getPVs(self):
-        for name in self._names:
-            self._cur_pv = name
-            self._first_val = True
-
-            if self._how==3:
-                # Request for plot binning
-                C = yield self.applinfo.fetchplot(name, T0=self._start, Tend=self._end,
-                                                  count=self._count_limit, callback=self.processRaw)
-
-                if self._first_val and C==0:
-                    # So the plot binning didn't return anything, which is a bug.
-                    # We try to get the last raw data point so we can at least
-                    # give the client something...
-                    _log.warn('plotbin returned zero samples: %s', self._cur_pv)
-                    C = yield self.applinfo.fetchraw(name,
-                                                     T0=self._end,
-                                                     Tend=self._end+datetime.timedelta(seconds=1),
-                                                     count=1, callback=self.processRaw)
-
-                if self._first_val and C==0:
-                    # oh well, we tried.  Ensure that an empty array is returned
-                    _log.warn('raw fallback returned zero samples: %s', self._cur_pv)
-                    self.processRaw(numpy.zeros((0,0)), [])
-
-            else:
-                C = yield self.applinfo.fetchraw(name, T0=self._start, Tend=self._end,
-                                                 count=self._count_limit, callback=self.processRaw)
-                if C==0:
-                    # oh well, we tried.  Ensure that an empty array is returned
-                    _log.warn('raw returned zero samples: %s', self._cur_pv)
-                    self.processRaw(numpy.zeros((0,0)), [])
-
-            assert not self._first_val, "values header never sent"
-            self.request.write(_values_foot)
+        sem = defer.DeferredSemaphore(self.concurrent)
+        self._pending = [sem.run(self._runPV, S) for S in self._spools]
+        try:
+            yield defer.gatherResults(self._pending, consumeErrors=True)
+        except defer.FirstError as e:
+            if not self._lost:
+                self.request.unregisterProducer()
+            # the first failure, not the cancellation of the others
+            (self._failure or e.subFailure).raiseException()
 
         self.request.write(_values_end)
+        self.request.unregisterProducer()
         self.request.finish()
 
-    def processRaw(self, V, M):
-        if self._first_val:
-            # first callback for this PV, emit header
-            self.request.write(_values_head%{'name':self._cur_pv,
-                                             'type':_d2x[V.dtype],
-                                             'count':V.shape[1]})
-        self._first_val = False
-
-        E = _encoder[_d2x[V.dtype]]
-
-        for i in range(len(M)):
-            SM = M[i]
-            self.request.write(_sample_head%{'stat':SM['status'],
-                                             'sevr':SM['severity'],
-                                             'secs':SM['sec'],
-                                             'nano':SM['ns']}
-                               +_sample_start)
+    def _runPV(self, S):
+        if self._failed:
+            return defer.fail(defer.CancelledError())
+        D = self.getPV(S)
+        @D.addErrback
+        def stopOthers(F):
+            # before the semaphore starts the next PV
+            if not self._failed:
+                self._failure = F
+                self._abort()
+            return F
+        return D
 
-            self.request.write(''.join(map(E, V[i,:])))
-
-            self.request.write(_sample_foot)
+    @defer.inlineCallbacks
+    def getPV(self, S):
+        name = S.name
+
+        key = None
+        if self._how==3 and self.plotcache is not None:
+            key = self.plotcache.key(name, self.args[2], self.args[4], self._count_limit)
+
+        if key is not None:
+            R = self.plotcache.get(key)
+            if R is not None:
+                _log.debug('plotbin reply from cache: %s', name)
+                S.first = False
+                self._write(S, R)
+                self._finish(S)
+                return
+            S.record = []
+
+        if self._how==3:
+            # Request for plot binning
+            C = yield self.applinfo.fetchplot(name, T0=self._start, Tend=self._end,
+                                              count=self._count_limit,
+                                              callback=self.processRaw, cbArgs=(S,))
+
+            if S.first and C==0:
+                # So the plot binning didn't return anything, which is a bug.
+                # We try to get the last raw data point so we can at least
+                # give the client something...
+                _log.warn('plotbin returned zero samples: %s', name)
+                S.record = None # depends on the exact end time
+                C = yield self.applinfo.fetchraw(name,
+                                                 T0=self._end,
+                                                 Tend=self._end+datetime.timedelta(seconds=1),
+                                                 count=1,
+                                                 callback=self.processRaw, cbArgs=(S,))
+
+            if S.first and C==0:
+                # oh well, we tried.  Ensure that an empty array is returned
+                _log.warn('raw fallback returned zero samples: %s', name)
+                self.processRaw(numpy.zeros((0,0)), [], S)
+
+        else:
+            C = yield self.applinfo.fetchraw(name, T0=self._start, Tend=self._end,
+                                             count=self._count_limit,
+                                             callback=self.processRaw, cbArgs=(S,))
+            if C==0:
+                # oh well, we tried.  Ensure that an empty array is returned
+                _log.warn('raw returned zero samples: %s', name)
+                self.processRaw(numpy.zeros((0,0)), [], S)
+
+        assert not S.first, "values header never sent"
+        self._write(S, _values_foot)
+        if S.record is not None:
+            self.plotcache.put(key, ''.join(S.record))
+            S.record = None
+        self._finish(S)
+
+    def processRaw(self, V, M, S):
+        if S.first:
+            # first callback for this PV, emit header
+            head = _values_head%{'name':S.name,
+                                 'type':_d2x[V.dtype],
+                                 'count':V.shape[1]}
+        else:
+            head = ''
+        S.first = False
 
         self._count += len(M)
 
+        # one write per chunk
+        return self._write(S, head+encodeSamples(V, M))
+
     _pv_template = [
         ('meanSample_%d(%s)', 0),
         ('minSample_%d(%s)', 1),
@@ -13,6 +13,7 @@ from fnmatch import filter
 from twisted.internet import defer
 
 from ..rpcmunge import NiceProxy as Proxy
+from ..util import LRUCache
 
 class KeyNameMap(object):
     """Hold the pre-configured mapping
@@ -76,11 +77,19 @@ class InfoCache(object):
     # Cache timeout
     timeout = 30
 
-    def __init__(self, url, infomap):
+    # Max num. of PVs resolved by one archiver.names request
+    batchsize = 100
+
+    def __init__(self, url, infomap, pvlimit=None, timeout=None):
         self.url = url
         P = self.proxy = Proxy(url, limit=10, qlimit=30)
         P.connectTimeout=3.0
 
+        if pvlimit is not None:
+            self.pvlimit = pvlimit
+        if timeout is not None:
+            self.timeout = timeout
+
         self.flush()
 
         self._map = infomap
@@ -93,7 +102,8 @@ class InfoCache(object):
         self._archives = None
         self._time = 0 # time of last archiver.archives call
 
-        self._pv_cache = {}
+        # (PV name, client key) -> server key
+        self._pv_cache = LRUCache(maxcount=self.pvlimit, maxage=self.timeout)
 
     @defer.inlineCallbacks
     def mapKey(self, clientKey):
@@ -103,7 +113,8 @@ class InfoCache(object):
             _log.debug("Key cache timeout in mapKey: %s", time.time()-self._time)
             R = yield self.proxy.callRemote('archiver.archives')
             self._map.updateArchives(R)
-            self._pv_cache = {}
+            # server key numbers may have changed
+            self._pv_cache.clear()
             self._time = time.time()
         else:
             _log.debug("Map cache hit")
@@ -115,43 +126,48 @@ class InfoCache(object):
         """Find the one server key associated with this client key
         where data for the named PV may be found.
         """
-        if time.time()-self._time>=self.timeout:
-            _log.debug("Key cache timeout in getKey: %s", time.time()-self._time)
-            self.flush()
+        R = yield self.getKeys([name], cK)
+        defer.returnValue(R[name])
 
-        try:
-            CV = self._pv_cache[name][cK]
-            _log.debug("Name cache hit: %s %s", name, cK)
-            defer.returnValue(CV)
-        except KeyError:
-            _log.debug("Name cache miss: %s %s", name, cK)
-            pass # no info on which server key has our data.
-
-        if len(self._pv_cache)>self.pvlimit:
-            #TODO: time based cache
-            self._pv_cache = {}
+    @defer.inlineCallbacks
+    def getKeys(self, names, cK):
+        """Find the server key for each of the named PVs.
 
+        Returns a dict of PV name -> server key.
+        PVs not found in any server key are given the first.
+        """
         sKs = yield self.mapKey(cK)
 
-        # devise a regexp to match only this PV
-        # TODO: not efficient...
-        escname = '^%s$'%re.escape(name)
-
-        cache = {}
-
-        names = yield self.lookup(sKs, escname)
-        for sK,R in names.iteritems():
-            if len(R)>1:
-                _log.warn("name lookup returned several results. %s %s %s", sK, escname, R)
-
-            if len(R):
-                cache[cK] = sK
-                break
-
-        self._pv_cache[name] = cache
-        _log.debug("Update name cache: %s", self._pv_cache)
-
-        defer.returnValue(sK)
+        result, missing = {}, []
+        for name in names:
+            sK = self._pv_cache.get((name, cK))
+            if sK is None:
+                missing.append(name)
+            else:
+                result[name] = sK
+        _log.debug("Name cache %d hits, %d misses", len(result), len(missing))
+
+        # one archiver.names request per server key for each batch of PVs
+        for i in range(0, len(missing), self.batchsize):
+            batch = missing[i:i+self.batchsize]
+            # the server uses POSIX extended regexps, without (?:...)
+            pat = '^(%s)$'%'|'.join(map(re.escape, batch))
+
+            found = yield self.lookup(sKs, pat)
+            for sK in sKs:
+                for pv in found[sK]:
+                    name = pv['name']
+                    if name in result:
+                        continue # first server key wins
+                    result[name] = sK
+                    self._pv_cache.set((name, cK), sK)
+
+        for name in missing:
+            if name not in result:
+                _log.warn("PV %s not found in %s", name, sKs)
+                result[name] = sKs[0] if sKs else None
+
+        defer.returnValue(result)
 
     @defer.inlineCallbacks
     def lookup(self, sKs, pat):
@@ -11,13 +11,16 @@ import weakref, time
 
 from zope.interface import implements
 
-from xmlrpclib import loads, dumps, Fault
+from xmlrpclib import loads, dumps, Fault, Marshaller
 
 from twisted.internet import defer, protocol
+from twisted.python import failure
 from twisted.web.iweb import IBodyProducer
+from twisted.internet.interfaces import IPushProducer
 from twisted.web.resource import Resource
 from twisted.web.server import NOT_DONE_YET
 from twisted.web.http_headers import Headers
+from twisted.web.client import readBody
 
 from ..util import LimitedAgent
 
@@ -34,60 +37,166 @@ class StringProducer(object):
     def stopProducing(self):
         pass
 
-class ReverseProxyProducer(protocol.Protocol):
-    """Proxy between an HTTP Client (acting as IProtcol)
-    and an HTTP Server (acting as IPushProducer)
+class SharedResponse(protocol.Protocol):
+    """Receives the body of one upstream (HTTP client) response
+    and passes it to one or more server requests.
+
+    The body received so far is kept (up to maxhistory bytes)
+    so that requests which attach() late receive all of it.
+
+    Each request buffers the data it can not yet send.  Upstream is
+    paused while any request has more than highwater bytes buffered.
     """
+    def __init__(self, maxhistory=4*2**20, highwater=2**20):
+        self.maxhistory, self.highwater = maxhistory, highwater
+        self._clients, self._history, self._size = [], [], 0
+        self._done, self._paused = False, False
+        self.transport = None
+        # fires when upstream is complete
+        self.defer = defer.Deferred()
 
-    def __init__(self, req):
-        self._req, self._done, self._buf = req, False, ''
-        self._paused = False
+    def joinable(self):
+        return not self._done and self._history is not None
+
+    def attach(self, req):
+        """Send this response to req.
+        Returns a Deferred which fires when req is complete.
+        """
+        C = _ClientStream(self, req)
+        self._clients.append(C)
+        for raw in self._history:
+            C.write(raw)
+        self._check()
+        return C.defer
+
+    def detach(self, C):
+        self._clients.remove(C)
+        if not self._clients and not self._done:
+            # nobody left to send to
+            self._done = True
+            if self.transport is not None:
+                self.transport.stopProducing()
+            self.defer.callback(None)
+        else:
+            self._check()
+
+    def fail(self, reason):
+        """Upstream request failed before the body arrived
+        """
+        if self._done:
+            return
+        self._done = True
+        C, self._clients = self._clients, []
+        for S in C:
+            S.fail(reason)
+        self.defer.callback(None)
+
+    def _check(self):
+        if self.transport is None or self._done:
+            return
+        busy = any([C.pending>self.highwater for C in self._clients])
+        if busy and not self._paused:
+            self._paused = True
+            self.transport.pauseProducing()
+        elif not busy and self._paused:
+            self._paused = False
+            self.transport.resumeProducing()
+
+    # IProtocol methods
+    # Called by client
+    def connectionMade(self):
+        if self._done:
+            # all requests have gone away
+            self.transport.stopProducing()
+
+    def dataReceived(self, raw):
+        if self._history is not None:
+            self._size += len(raw)
+            if self._size>self.maxhistory:
+                # too large to keep.  No more requests may join
+                self._history = None
+            else:
+                self._history.append(raw)
+        for C in self._clients:
+            C.write(raw)
+        self._check()
+
+    def connectionLost(self, reason):
+        if self._done:
+            return
+        self._done, self._history = True, None
+        for C in self._clients[:]:
+            C.finish()
+        self.defer.callback(None)
+
+class _ClientStream(object):
+    """One request receiving a SharedResponse.
+    Acts as IPushProducer for the server request.
+    """
+    implements(IPushProducer)
+
+    def __init__(self, shared, req):
+        self._shared, self._req = shared, req
+        self._buf, self.pending = [], 0
+        self._paused, self._finishing, self._done = False, False, False
         self.defer = defer.Deferred()
         req.registerProducer(self, True)
 
+    def write(self, raw):
+        if self._paused:
+            self._buf.append(raw)
+            self.pending += len(raw)
+        else:
+            self._req.write(raw)
+
+    def finish(self):
+        if self._paused:
+            self._finishing = True
+        else:
+            self._complete()
+
+    def fail(self, reason):
+        self._done = True
+        self._req.unregisterProducer()
+        self.defer.errback(reason)
+
+    def _complete(self):
+        self._done = True
+        self._req.unregisterProducer()
+        self._req.finish()
+        self._shared._clients.remove(self)
+        self.defer.callback(None)
+
     # IPushProducer methods
     # Called by server Request
     def pauseProducing(self):
         self._paused = True
-        self.transport.pauseProducing()
 
     def resumeProducing(self):
-        assert not self._done
+        if self._done:
+            return
         self._paused = False
-        if self._buf:
-            self._req.write(self._buf)
-            self._req.write(self._buf)
-            self._buf = ''
-        if not self._paused:
-            self.transport.resumeProducing()
+        B, self._buf, self.pending = self._buf, [], 0
+        if B:
+            self._req.write(''.join(B))
+        if self._finishing:
+            self._complete()
+        else:
+            self._shared._check()
 
     def stopProducing(self):
+        # client has gone away
         if self._done:
             return
-        self._done, self._paused = True, True
-        self.transport.stopProducing()
+        self._done, self._buf, self.pending = True, [], 0
         self._req.unregisterProducer()
         self._req.finish()
+        self._shared.detach(self)
         self.defer.callback(None)
 
-    # IProtocol methods
-    # Called by client
-    def dataReceived(self, raw):
-        if self._paused:
-            self._buf += raw
-        else:
-            if self._buf:
-                self._req.write(self._buf)
-                self._buf = ''
-            self._req.write(raw)
-
-    def connectionLost(self, reason):
-        if not self._done:
-            self._req.unregisterProducer()
-            self._req.finish()
-            self.transport.stopProducing()
-            self.defer.callback(None)
-        self._done, self._paused = True, True
+# archiver.values reply, around the <struct> for each PV
+_head, _tail = dumps(([],), methodresponse=True).split('</data>')
+_tail = '</data>'+_tail
 
 def cleanupRequest(R, req):
     if not req.startedWriting:
@@ -100,9 +209,13 @@ def cleanupRequest(R, req):
 _msg = """<html><body><h1>Archive Data Server middleware</h1>
 <pre>
 %d requests in progress.
+%d upstream requests in progress, %d requests joined another.
 %d/%d PVs in cache.
+Cache hits: %d misses: %d
 Cache age: %s sec.
 Cache expires after: %s sec.
+
+%s
 </pre>
 </html></body>
 """
@@ -112,8 +225,11 @@ class XMLRPCProxy(Resource):
 
     def render_GET(self, req):
         return _msg%(len(self.requests),
+                     len(self.inflight), self.coalesced,
                      len(self.info._pv_cache), self.info.pvlimit,
-                     time.time()-self.info._time, self.info.timeout
+                     self.info._pv_cache.hits, self.info._pv_cache.misses,
+                     time.time()-self.info._time, self.info.timeout,
+                     '\n'.join(self.info.proxy.scheduler.report()),
                      )
 
     def render_POST(self, req):
@@ -137,7 +253,8 @@ class XMLRPCProxy(Resource):
             elif meth == 'archiver.values':
                 D =self._values(req, args)
             else:
-                D =self._proxy(req, rawreq)
+                # canonical form, for coalescing
+                D =self._proxy(req, dumps(args, methodname=meth))
 
         except Exception as e:
             import traceback
@@ -172,46 +289,136 @@ class XMLRPCProxy(Resource):
 
     @defer.inlineCallbacks
     def _values(self, req, args):
-        """Find the one server key holding data for each requested PV
+        """Find the one server key holding data for each requested PV.
+
+        When the PVs are found in several server keys, then one
+        request is made for each, concurrently.
         """
         cK, names = args[:2]
+        keys = yield self.info.getKeys(names, cK)
         sKs = {}
         for pv in names:
-            sK = yield self.info.getKey(pv, cK)
+            sK = keys[pv]
             try:
                 sKs[sK].append(pv)
             except KeyError:
                 sKs[sK] = [pv]
 
-        if len(sKs)!=1:
-            R = dumps(Fault(308, "archiver.values w/ PVs in several sections not supported"),
-                      methodresponse=True)
-            req.write(R)
+        if len(sKs)==0:
+            req.write(dumps(([],), methodresponse=True))
             req.finish()
 
-        else:
+        elif len(sKs)==1:
             args = (sK,) + args[1:]
 
             rawreq = dumps(args, methodname='archiver.values')
             yield self._proxy(req, rawreq)
 
+        else:
+            yield self._fanout(req, args, names, keys, sKs)
+
     @defer.inlineCallbacks
-    def _proxy(self, req, rawreq):
-        post = StringProducer(rawreq)
+    def _fanout(self, req, args, names, keys, sKs):
+        """Request the PVs of each server key concurrently.
+        The results are written in the order of the original request.
+        """
+        _log.debug("Split archiver.values over %s", sKs.keys())
+        parts, results = {}, {}
+        for sK, pvs in sKs.iteritems():
+            rawreq = dumps((sK, pvs) + args[2:], methodname='archiver.values')
+            # the results in the order requested
+            parts[sK] = self._call(rawreq).addCallback(iter)
+
+        def consume():
+            for D in parts.values():
+                D.addErrback(lambda F: None)
+
+        try:
+            # wait for the first PV before starting the reply,
+            # so that a Fault can still be sent.
+            sK = keys[names[0]]
+            results[sK] = yield parts[sK]
+        except Fault as F:
+            consume()
+            req.write(dumps(F, methodresponse=True))
+            req.finish()
+            defer.returnValue(None)
+        except:
+            consume()
+            raise
 
+        req.write(_head)
+        M = Marshaller()
+        try:
+            for pv in names:
+                sK = keys[pv]
+                if sK not in results:
+                    results[sK] = yield parts[sK]
+                S = next(results[sK], None)
+                if S is None:
+                    raise RuntimeError("No result for %s"%pv)
+                L = []
+                M.dump_struct(S, L.append)
+                req.write(''.join(L))
+        except:
+            # too late for a Fault.  The truncated reply
+            # will be seen as an error by the client
+            consume()
+            raise
+
+        req.write(_tail)
+        req.finish()
+
+    @defer.inlineCallbacks
+    def _call(self, rawreq):
+        """Make a request and decode the reply
+        """
         D = yield self.agent.request('POST', self.info.url,
                                      Headers({'Content-Type':['text/xml']}),
-                                     bodyProducer=post)
+                                     bodyProducer=StringProducer(rawreq))
+        body = yield readBody(D)
         if D.code!=200:
             raise RuntimeError("Request fails %d: %s -> %s"%(D.code, rawreq, self.info.url))
 
-        _log.debug("%d: %s", D.code, loads(rawreq))
+        R, _meth = loads(body)
+        defer.returnValue(R[0])
 
-        P = ReverseProxyProducer(req)
-        D.deliverBody(P)
-        yield P.defer
+    def _proxy(self, req, rawreq):
+        """Forward a request upstream, and stream the reply back.
+
+        Concurrent requests with identical bodies share one upstream request.
+        """
+        S = self.inflight.get(rawreq)
+        if S is None or not S.joinable():
+            S = self.inflight[rawreq] = SharedResponse()
+            S.defer.addCallback(self._finished, rawreq, S)
+            D = S.attach(req)
+            self._fetch(rawreq, S)
+        else:
+            _log.debug("Join in-flight request")
+            self.coalesced += 1
+            D = S.attach(req)
+        return D
+
+    def _finished(self, _ignore, rawreq, S):
+        if self.inflight.get(rawreq) is S:
+            del self.inflight[rawreq]
 
-        defer.returnValue(None)
+    @defer.inlineCallbacks
+    def _fetch(self, rawreq, S):
+        post = StringProducer(rawreq)
+
+        try:
+            D = yield self.agent.request('POST', self.info.url,
+                                         Headers({'Content-Type':['text/xml']}),
+                                         bodyProducer=post)
+            if D.code!=200:
+                raise RuntimeError("Request fails %d: %s -> %s"%(D.code, rawreq, self.info.url))
+        except:
+            S.fail(failure.Failure())
+        else:
+            _log.debug("%d: %s", D.code, loads(rawreq))
+            D.deliverBody(S)
 
 def buildResource(info=None, reactor=None):
 #    I = InfoCache(rpcurl, mapconf)
@@ -224,5 +431,6 @@ def buildResource(info=None, reactor=None):
     C.info = info
     C.agent = LimitedAgent(reactor)
     C.requests = weakref.WeakKeyDictionary()
+    C.inflight, C.coalesced = {}, 0
 
     return root, C
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright 2015 Brookhaven Science Assoc.
+ as operator of Brookhaven National Lab.
+"""
+
+import re
+
+from twisted.internet import defer
+from twisted.trial import unittest
+
+from ..info import InfoCache, KeyNameMap
+
+class FakeProxy(object):
+    def __init__(self, archives, names):
+        self.archives, self.names = archives, names
+        self.calls = []
+
+    def callRemote(self, meth, *args):
+        self.calls.append((meth,)+args)
+        if meth=='archiver.archives':
+            return defer.succeed(self.archives)
+        elif meth=='archiver.names':
+            sK, pat = args
+            M = re.compile(pat).match
+            return defer.succeed([{'name':N} for N in self.names[sK] if M(N)])
+        raise RuntimeError(meth)
+
+class TestInfoCache(unittest.TestCase):
+    def setUp(self):
+        KM = KeyNameMap([('All', 0, ['a/*'])])
+        self.I = InfoCache('http://localhost/', KM, timeout=1000)
+        self.P = self.I.proxy = FakeProxy(
+            [{'key':10, 'name':'a/Current'}, {'key':11, 'name':'a/Old'}],
+            {10:['pv%d'%i for i in range(0, 50, 2)],
+             11:['pv%d'%i for i in range(1, 50, 2)]+['pv1.VAL']})
+
+    def names(self):
+        return [C for C in self.P.calls if C[0]=='archiver.names']
+
+    @defer.inlineCallbacks
+    def test_batch(self):
+        PVs = ['pv%d'%i for i in range(50)]
+        R = yield self.I.getKeys(PVs, 0)
+
+        self.assertEqual(R, dict([('pv%d'%i, 11 if i%2 else 10) for i in range(50)]))
+        # one request per server key
+        self.assertEqual(len(self.names()), 2)
+
+        # now cached
+        R2 = yield self.I.getKeys(PVs, 0)
+        self.assertEqual(R, R2)
+        self.assertEqual(len(self.names()), 2)
+        self.assertEqual(self.I._pv_cache.hits, 50)
+
+    @defer.inlineCallbacks
+    def test_small_batch(self):
+        self.I.batchsize = 20
+        R = yield self.I.getKeys(['pv%d'%i for i in range(50)], 0)
+        self.assertEqual(len(R), 50)
+        self.assertEqual(len(self.names()), 6)
+
+    @defer.inlineCallbacks
+    def test_pattern(self):
+        yield self.I.getKey('pv1:a', 0)
+        self.assertEqual(self.names(), [('archiver.names', 10, r'^(pv1\:a)$'),
+                                        ('archiver.names', 11, r'^(pv1\:a)$')])
+        yield self.I.getKeys(['pv1', 'pv2'], 0)
+        self.assertEqual(self.names()[2:], [('archiver.names', 10, '^(pv1|pv2)$'),
+                                            ('archiver.names', 11, '^(pv1|pv2)$')])
+
+    @defer.inlineCallbacks
+    def test_escape(self):
+        R = yield self.I.getKey('pv1.VAL', 0)
+        self.assertEqual(R, 11)
+        R = yield self.I.getKeys(['pv1?', 'pv3'], 0)
+        self.assertEqual(R['pv3'], 11)
+        self.assertIn(R['pv1?'], [10, 11]) # not found
+        self.assertNotIn(('pv1?', 0), self.I._pv_cache._values)
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright 2015 Brookhaven Science Assoc.
+ as operator of Brookhaven National Lab.
+"""
+
+from cStringIO import StringIO
+from xmlrpclib import dumps, loads, Fault
+
+from twisted.internet import defer
+from twisted.python import failure
+from twisted.trial import unittest
+
+from ..proxy import XMLRPCProxy, SharedResponse
+
+class FakeInfo(object):
+    def __init__(self, keys):
+        self.keys = keys
+    def getKeys(self, names, cK):
+        return defer.succeed(dict([(N, self.keys[N]) for N in names]))
+
+class FakeRequest(object):
+    def __init__(self):
+        self.data, self.finished = StringIO(), False
+        self.write = self.data.write
+        self.producer = None
+    def finish(self):
+        self.finished = True
+    def registerProducer(self, P, streaming):
+        self.producer = P
+    def unregisterProducer(self):
+        self.producer = None
+
+def _result(name):
+    return {'name':name, 'type':3, 'count':1, 'meta':{'type':0, 'states':[]},
+            'values':[{'stat':0, 'sevr':0, 'secs':1, 'nano':2, 'value':[1.5]}]}
+
+class TestFanout(unittest.TestCase):
+    def setUp(self):
+        self.P = XMLRPCProxy()
+        self.P.info = FakeInfo({'a':1, 'b':2, 'c':1, 'd':2})
+        self.calls = {}
+        def call(rawreq):
+            args, _meth = loads(rawreq)
+            D = self.calls[args[0]] = defer.Deferred()
+            self.assertEqual(args[2:], (0, 0, 10, 20, 100, 0))
+            D.names = args[1]
+            return D
+        self.P._call = call
+
+    def test_order(self):
+        R = FakeRequest()
+        D = self.P._values(R, (0, ['a', 'b', 'c', 'd'], 0, 0, 10, 20, 100, 0))
+
+        self.assertEqual(sorted(self.calls), [1, 2])
+        self.assertEqual(self.calls[1].names, ['a', 'c'])
+        self.assertEqual(self.calls[2].names, ['b', 'd'])
+
+        self.calls[2].callback([_result('b'), _result('d')])
+        self.assertEqual(R.data.getvalue(), '')
+        self.calls[1].callback([_result('a'), _result('c')])
+        self.assertTrue(R.finished)
+
+        V, _ = loads(R.data.getvalue())
+        self.assertEqual([S['name'] for S in V[0]], ['a', 'b', 'c', 'd'])
+        self.assertEqual(V[0][1], _result('b'))
+        return D
+
+    def test_fault(self):
+        R = FakeRequest()
+        D = self.P._values(R, (0, ['a', 'b'], 0, 0, 10, 20, 100, 0))
+        self.calls[2].callback([_result('b')])
+        self.calls[1].errback(Fault(42, 'oops'))
+        self.assertTrue(R.finished)
+        self.assertRaises(Fault, loads, R.data.getvalue())
+        return D
+
+    def test_single(self):
+        R = FakeRequest()
+        self.P._proxy = lambda req, rawreq: defer.succeed(loads(rawreq))
+        D = self.P._values(R, (0, ['a', 'c'], 0, 0, 10, 20, 100, 0))
+        self.assertEqual(self.calls, {})
+        return D
+
+_req, _other = dumps((1,), 'archiver.x'), dumps((2,), 'archiver.x')
+
+class FakeTransport(object):
+    paused = stopped = False
+    def pauseProducing(self):
+        self.paused = True
+    def resumeProducing(self):
+        self.paused = False
+    def stopProducing(self):
+        self.stopped = True
+
+class FakeResponse(object):
+    code = 200
+    def deliverBody(self, P):
+        self.protocol = P
+        P.makeConnection(FakeTransport())
+
+class FakeAgent(object):
+    def __init__(self):
+        self.calls = []
+    def request(self, meth, url, headers, bodyProducer):
+        D = defer.Deferred()
+        self.calls.append((bodyProducer.body, D))
+        return D
+
+class TestCoalesce(unittest.TestCase):
+    def setUp(self):
+        self.P = XMLRPCProxy()
+        self.P.info = FakeInfo({})
+        self.P.info.url = 'http://localhost/'
+        self.A = self.P.agent = FakeAgent()
+        self.P.inflight, self.P.coalesced = {}, 0
+
+    def test_share(self):
+        R1, R2, R3 = FakeRequest(), FakeRequest(), FakeRequest()
+        D1 = self.P._proxy(R1, _req)
+        D2 = self.P._proxy(R2, _req)
+        D3 = self.P._proxy(R3, _other)
+        self.assertEqual([B for B,_D in self.A.calls], [_req, _other])
+        self.assertEqual(self.P.coalesced, 1)
+
+        F = FakeResponse()
+        self.A.calls[0][1].callback(F)
+        F.protocol.dataReceived('hello ')
+
+        # joins late
+        R4 = FakeRequest()
+        D4 = self.P._proxy(R4, _req)
+        self.assertEqual(len(self.A.calls), 2)
+
+        F.protocol.dataReceived('world')
+        F.protocol.connectionLost(None)
+
+        for R in [R1, R2, R4]:
+            self.assertEqual(R.data.getvalue(), 'hello world')
+            self.assertTrue(R.finished)
+        self.assertFalse(R3.finished)
+        self.assertEqual(self.P.inflight.keys(), [_other])
+
+        self.A.calls[1][1].errback(failure.Failure(RuntimeError('oops')))
+        self.assertEqual(self.P.inflight, {})
+        D3 = self.assertFailure(D3, RuntimeError)
+        return defer.gatherResults([D1, D2, D3, D4])
+
+    def test_history(self):
+        R1, R2 = FakeRequest(), FakeRequest()
+        self.P._proxy(R1, _req)
+        F = FakeResponse()
+        self.A.calls[0][1].callback(F)
+        F.protocol.maxhistory = 4
+        F.protocol.dataReceived('hello')
+
+        # too late to join
+        self.P._proxy(R2, _req)
+        self.assertEqual(len(self.A.calls), 2)
+
+    def test_backpressure(self):
+        R1, R2 = FakeRequest(), FakeRequest()
+        self.P._proxy(R1, _req)
+        self.P._proxy(R2, _req)
+        F = FakeResponse()
+        self.A.calls[0][1].callback(F)
+        S, T = F.protocol, F.protocol.transport
+        S.highwater = 4
+
+        R1.producer.pauseProducing()
+        S.dataReceived('abc')
+        self.assertFalse(T.paused)
+        S.dataReceived('def')
+        self.assertTrue(T.paused)
+        self.assertEqual(R1.data.getvalue(), '')
+        self.assertEqual(R2.data.getvalue(), 'abcdef')
+
+        S.connectionLost(None)
+        self.assertTrue(R2.finished)
+        self.assertFalse(R1.finished)
+
+        R1.producer.resumeProducing()
+        self.assertEqual(R1.data.getvalue(), 'abcdef')
+        self.assertTrue(R1.finished)
+
+    def test_resume(self):
+        R1 = FakeRequest()
+        self.P._proxy(R1, _req)
+        F = FakeResponse()
+        self.A.calls[0][1].callback(F)
+        S, T = F.protocol, F.protocol.transport
+        S.highwater = 1
+
+        R1.producer.pauseProducing()
+        S.dataReceived('abc')
+        self.assertTrue(T.paused)
+        R1.producer.resumeProducing()
+        self.assertFalse(T.paused)
+        self.assertEqual(R1.data.getvalue(), 'abc')
+
+    def test_stop(self):
+        R1, R2 = FakeRequest(), FakeRequest()
+        D1 = self.P._proxy(R1, _req)
+        D2 = self.P._proxy(R2, _req)
+        F = FakeResponse()
+        self.A.calls[0][1].callback(F)
+        T = F.protocol.transport
+
+        R1.producer.stopProducing()
+        self.assertFalse(T.stopped)
+        R2.producer.stopProducing()
+        self.assertTrue(T.stopped)
+        self.assertEqual(self.P.inflight, {})
+        return defer.gatherResults([D1, D2])
@@ -0,0 +1,8727 @@
+// Generated by the protocol buffer compiler.  DO NOT EDIT!
+// source: carchive/backend/EPICSEvent.proto
+
+#include "carchive/backend/EPICSEvent.pb.h"
+
+#include <algorithm>
+
+#include <google/protobuf/io/coded_stream.h>
+#include <google/protobuf/extension_set.h>
+#include <google/protobuf/wire_format_lite.h>
+#include <google/protobuf/descriptor.h>
+#include <google/protobuf/generated_message_reflection.h>
+#include <google/protobuf/reflection_ops.h>
+#include <google/protobuf/wire_format.h>
+// @@protoc_insertion_point(includes)
+#include <google/protobuf/port_def.inc>
+
+PROTOBUF_PRAGMA_INIT_SEG
+
+namespace _pb = ::PROTOBUF_NAMESPACE_ID;
+namespace _pbi = _pb::internal;
+
+namespace EPICS {
+PROTOBUF_CONSTEXPR FieldValue::FieldValue(
+    ::_pbi::ConstantInitialized): _impl_{
+    /*decltype(_impl_._has_bits_)*/{}
+  , /*decltype(_impl_._cached_size_)*/{}
+  , /*decltype(_impl_.name_)*/{&::_pbi::fixed_address_empty_string, ::_pbi::ConstantInitialized{}}
+  , /*decltype(_impl_.val_)*/{&::_pbi::fixed_address_empty_string, ::_pbi::ConstantInitialized{}}} {}
+struct FieldValueDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR FieldValueDefaultTypeInternal()
+      : _instance(::_pbi::ConstantInitialized{}) {}
+  ~FieldValueDefaultTypeInternal() {}
+  union {
+    FieldValue _instance;
+  };
+};
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 FieldValueDefaultTypeInternal _FieldValue_default_instance_;
+PROTOBUF_CONSTEXPR ScalarString::ScalarString(
+    ::_pbi::ConstantInitialized): _impl_{
+    /*decltype(_impl_._has_bits_)*/{}
+  , /*decltype(_impl_._cached_size_)*/{}
+  , /*decltype(_impl_.fieldvalues_)*/{}
+  , /*decltype(_impl_.val_)*/{&::_pbi::fixed_address_empty_string, ::_pbi::ConstantInitialized{}}
+  , /*decltype(_impl_.secondsintoyear_)*/0u
+  , /*decltype(_impl_.nano_)*/0u
+  , /*decltype(_impl_.severity_)*/0
+  , /*decltype(_impl_.status_)*/0
+  , /*decltype(_impl_.repeatcount_)*/0u
+  , /*decltype(_impl_.fieldactualchange_)*/false} {}
+struct ScalarStringDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR ScalarStringDefaultTypeInternal()
+      : _instance(::_pbi::ConstantInitialized{}) {}
+  ~ScalarStringDefaultTypeInternal() {}
+  union {
+    ScalarString _instance;
+  };
+};
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 ScalarStringDefaultTypeInternal _ScalarString_default_instance_;
+PROTOBUF_CONSTEXPR ScalarByte::ScalarByte(
+    ::_pbi::ConstantInitialized): _impl_{
+    /*decltype(_impl_._has_bits_)*/{}
+  , /*decltype(_impl_._cached_size_)*/{}
+  , /*decltype(_impl_.fieldvalues_)*/{}
+  , /*decltype(_impl_.val_)*/{&::_pbi::fixed_address_empty_string, ::_pbi::ConstantInitialized{}}
+  , /*decltype(_impl_.secondsintoyear_)*/0u
+  , /*decltype(_impl_.nano_)*/0u
+  , /*decltype(_impl_.severity_)*/0
+  , /*decltype(_impl_.status_)*/0
+  , /*decltype(_impl_.repeatcount_)*/0u
+  , /*decltype(_impl_.fieldactualchange_)*/false} {}
+struct ScalarByteDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR ScalarByteDefaultTypeInternal()
+      : _instance(::_pbi::ConstantInitialized{}) {}
+  ~ScalarByteDefaultTypeInternal() {}
+  union {
+    ScalarByte _instance;
+  };
+};
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 ScalarByteDefaultTypeInternal _ScalarByte_default_instance_;
+PROTOBUF_CONSTEXPR ScalarShort::ScalarShort(
+    ::_pbi::ConstantInitialized): _impl_{
+    /*decltype(_impl_._has_bits_)*/{}
+  , /*decltype(_impl_._cached_size_)*/{}
+  , /*decltype(_impl_.fieldvalues_)*/{}
+  , /*decltype(_impl_.secondsintoyear_)*/0u
+  , /*decltype(_impl_.nano_)*/0u
+  , /*decltype(_impl_.val_)*/0
+  , /*decltype(_impl_.severity_)*/0
+  , /*decltype(_impl_.status_)*/0
+  , /*decltype(_impl_.repeatcount_)*/0u
+  , /*decltype(_impl_.fieldactualchange_)*/false} {}
+struct ScalarShortDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR ScalarShortDefaultTypeInternal()
+      : _instance(::_pbi::ConstantInitialized{}) {}
+  ~ScalarShortDefaultTypeInternal() {}
+  union {
+    ScalarShort _instance;
+  };
+};
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 ScalarShortDefaultTypeInternal _ScalarShort_default_instance_;
+PROTOBUF_CONSTEXPR ScalarInt::ScalarInt(
+    ::_pbi::ConstantInitialized): _impl_{
+    /*decltype(_impl_._has_bits_)*/{}
+  , /*decltype(_impl_._cached_size_)*/{}
+  , /*decltype(_impl_.fieldvalues_)*/{}
+  , /*decltype(_impl_.secondsintoyear_)*/0u
+  , /*decltype(_impl_.nano_)*/0u
+  , /*decltype(_impl_.val_)*/0
+  , /*decltype(_impl_.severity_)*/0
+  , /*decltype(_impl_.status_)*/0
+  , /*decltype(_impl_.repeatcount_)*/0u
+  , /*decltype(_impl_.fieldactualchange_)*/false} {}
+struct ScalarIntDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR ScalarIntDefaultTypeInternal()
+      : _instance(::_pbi::ConstantInitialized{}) {}
+  ~ScalarIntDefaultTypeInternal() {}
+  union {
+    ScalarInt _instance;
+  };
+};
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 ScalarIntDefaultTypeInternal _ScalarInt_default_instance_;
+PROTOBUF_CONSTEXPR ScalarEnum::ScalarEnum(
+    ::_pbi::ConstantInitialized): _impl_{
+    /*decltype(_impl_._has_bits_)*/{}
+  , /*decltype(_impl_._cached_size_)*/{}
+  , /*decltype(_impl_.fieldvalues_)*/{}
+  , /*decltype(_impl_.secondsintoyear_)*/0u
+  , /*decltype(_impl_.nano_)*/0u
+  , /*decltype(_impl_.val_)*/0
+  , /*decltype(_impl_.severity_)*/0
+  , /*decltype(_impl_.status_)*/0
+  , /*decltype(_impl_.repeatcount_)*/0u
+  , /*decltype(_impl_.fieldactualchange_)*/false} {}
+struct ScalarEnumDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR ScalarEnumDefaultTypeInternal()
+      : _instance(::_pbi::ConstantInitialized{}) {}
+  ~ScalarEnumDefaultTypeInternal() {}
+  union {
+    ScalarEnum _instance;
+  };
+};
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 ScalarEnumDefaultTypeInternal _ScalarEnum_default_instance_;
+PROTOBUF_CONSTEXPR ScalarFloat::ScalarFloat(
+    ::_pbi::ConstantInitialized): _impl_{
+    /*decltype(_impl_._has_bits_)*/{}
+  , /*decltype(_impl_._cached_size_)*/{}
+  , /*decltype(_impl_.fieldvalues_)*/{}
+  , /*decltype(_impl_.secondsintoyear_)*/0u
+  , /*decltype(_impl_.nano_)*/0u
+  , /*decltype(_impl_.val_)*/0
+  , /*decltype(_impl_.severity_)*/0
+  , /*decltype(_impl_.status_)*/0
+  , /*decltype(_impl_.repeatcount_)*/0u
+  , /*decltype(_impl_.fieldactualchange_)*/false} {}
+struct ScalarFloatDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR ScalarFloatDefaultTypeInternal()
+      : _instance(::_pbi::ConstantInitialized{}) {}
+  ~ScalarFloatDefaultTypeInternal() {}
+  union {
+    ScalarFloat _instance;
+  };
+};
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 ScalarFloatDefaultTypeInternal _ScalarFloat_default_instance_;
+PROTOBUF_CONSTEXPR ScalarDouble::ScalarDouble(
+    ::_pbi::ConstantInitialized): _impl_{
+    /*decltype(_impl_._has_bits_)*/{}
+  , /*decltype(_impl_._cached_size_)*/{}
+  , /*decltype(_impl_.fieldvalues_)*/{}
+  , /*decltype(_impl_.secondsintoyear_)*/0u
+  , /*decltype(_impl_.nano_)*/0u
+  , /*decltype(_impl_.val_)*/0
+  , /*decltype(_impl_.severity_)*/0
+  , /*decltype(_impl_.status_)*/0
+  , /*decltype(_impl_.repeatcount_)*/0u
+  , /*decltype(_impl_.fieldactualchange_)*/false} {}
+struct ScalarDoubleDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR ScalarDoubleDefaultTypeInternal()
+      : _instance(::_pbi::ConstantInitialized{}) {}
+  ~ScalarDoubleDefaultTypeInternal() {}
+  union {
+    ScalarDouble _instance;
+  };
+};
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 ScalarDoubleDefaultTypeInternal _ScalarDouble_default_instance_;
+PROTOBUF_CONSTEXPR VectorString::VectorString(
+    ::_pbi::ConstantInitialized): _impl_{
+    /*decltype(_impl_._has_bits_)*/{}
+  , /*decltype(_impl_._cached_size_)*/{}
+  , /*decltype(_impl_.val_)*/{}
+  , /*decltype(_impl_.fieldvalues_)*/{}
+  , /*decltype(_impl_.secondsintoyear_)*/0u
+  , /*decltype(_impl_.nano_)*/0u
+  , /*decltype(_impl_.severity_)*/0
+  , /*decltype(_impl_.status_)*/0
+  , /*decltype(_impl_.repeatcount_)*/0u
+  , /*decltype(_impl_.fieldactualchange_)*/false} {}
+struct VectorStringDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR VectorStringDefaultTypeInternal()
+      : _instance(::_pbi::ConstantInitialized{}) {}
+  ~VectorStringDefaultTypeInternal() {}
+  union {
+    VectorString _instance;
+  };
+};
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 VectorStringDefaultTypeInternal _VectorString_default_instance_;
+PROTOBUF_CONSTEXPR VectorChar::VectorChar(
+    ::_pbi::ConstantInitialized): _impl_{
+    /*decltype(_impl_._has_bits_)*/{}
+  , /*decltype(_impl_._cached_size_)*/{}
+  , /*decltype(_impl_.fieldvalues_)*/{}
+  , /*decltype(_impl_.val_)*/{&::_pbi::fixed_address_empty_string, ::_pbi::ConstantInitialized{}}
+  , /*decltype(_impl_.secondsintoyear_)*/0u
+  , /*decltype(_impl_.nano_)*/0u
+  , /*decltype(_impl_.severity_)*/0
+  , /*decltype(_impl_.status_)*/0
+  , /*decltype(_impl_.repeatcount_)*/0u
+  , /*decltype(_impl_.fieldactualchange_)*/false} {}
+struct VectorCharDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR VectorCharDefaultTypeInternal()
+      : _instance(::_pbi::ConstantInitialized{}) {}
+  ~VectorCharDefaultTypeInternal() {}
+  union {
+    VectorChar _instance;
+  };
+};
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 VectorCharDefaultTypeInternal _VectorChar_default_instance_;
+PROTOBUF_CONSTEXPR VectorShort::VectorShort(
+    ::_pbi::ConstantInitialized): _impl_{
+    /*decltype(_impl_._has_bits_)*/{}
+  , /*decltype(_impl_._cached_size_)*/{}
+  , /*decltype(_impl_.val_)*/{}
+  , /*decltype(_impl_._val_cached_byte_size_)*/{0}
+  , /*decltype(_impl_.fieldvalues_)*/{}
+  , /*decltype(_impl_.secondsintoyear_)*/0u
+  , /*decltype(_impl_.nano_)*/0u
+  , /*decltype(_impl_.severity_)*/0
+  , /*decltype(_impl_.status_)*/0
+  , /*decltype(_impl_.repeatcount_)*/0u
+  , /*decltype(_impl_.fieldactualchange_)*/false} {}
+struct VectorShortDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR VectorShortDefaultTypeInternal()
+      : _instance(::_pbi::ConstantInitialized{}) {}
+  ~VectorShortDefaultTypeInternal() {}
+  union {
+    VectorShort _instance;
+  };
+};
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 VectorShortDefaultTypeInternal _VectorShort_default_instance_;
+PROTOBUF_CONSTEXPR VectorInt::VectorInt(
+    ::_pbi::ConstantInitialized): _impl_{
+    /*decltype(_impl_._has_bits_)*/{}
+  , /*decltype(_impl_._cached_size_)*/{}
+  , /*decltype(_impl_.val_)*/{}
+  , /*decltype(_impl_.fieldvalues_)*/{}
+  , /*decltype(_impl_.secondsintoyear_)*/0u
+  , /*decltype(_impl_.nano_)*/0u
+  , /*decltype(_impl_.severity_)*/0
+  , /*decltype(_impl_.status_)*/0
+  , /*decltype(_impl_.repeatcount_)*/0u
+  , /*decltype(_impl_.fieldactualchange_)*/false} {}
+struct VectorIntDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR VectorIntDefaultTypeInternal()
+      : _instance(::_pbi::ConstantInitialized{}) {}
+  ~VectorIntDefaultTypeInternal() {}
+  union {
+    VectorInt _instance;
+  };
+};
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 VectorIntDefaultTypeInternal _VectorInt_default_instance_;
+PROTOBUF_CONSTEXPR VectorEnum::VectorEnum(
+    ::_pbi::ConstantInitialized): _impl_{
+    /*decltype(_impl_._has_bits_)*/{}
+  , /*decltype(_impl_._cached_size_)*/{}
+  , /*decltype(_impl_.val_)*/{}
+  , /*decltype(_impl_._val_cached_byte_size_)*/{0}
+  , /*decltype(_impl_.fieldvalues_)*/{}
+  , /*decltype(_impl_.secondsintoyear_)*/0u
+  , /*decltype(_impl_.nano_)*/0u
+  , /*decltype(_impl_.severity_)*/0
+  , /*decltype(_impl_.status_)*/0
+  , /*decltype(_impl_.repeatcount_)*/0u
+  , /*decltype(_impl_.fieldactualchange_)*/false} {}
+struct VectorEnumDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR VectorEnumDefaultTypeInternal()
+      : _instance(::_pbi::ConstantInitialized{}) {}
+  ~VectorEnumDefaultTypeInternal() {}
+  union {
+    VectorEnum _instance;
+  };
+};
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 VectorEnumDefaultTypeInternal _VectorEnum_default_instance_;
+PROTOBUF_CONSTEXPR VectorFloat::VectorFloat(
+    ::_pbi::ConstantInitialized): _impl_{
+    /*decltype(_impl_._has_bits_)*/{}
+  , /*decltype(_impl_._cached_size_)*/{}
+  , /*decltype(_impl_.val_)*/{}
+  , /*decltype(_impl_.fieldvalues_)*/{}
+  , /*decltype(_impl_.secondsintoyear_)*/0u
+  , /*decltype(_impl_.nano_)*/0u
+  , /*decltype(_impl_.severity_)*/0
+  , /*decltype(_impl_.status_)*/0
+  , /*decltype(_impl_.repeatcount_)*/0u
+  , /*decltype(_impl_.fieldactualchange_)*/false} {}
+struct VectorFloatDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR VectorFloatDefaultTypeInternal()
+      : _instance(::_pbi::ConstantInitialized{}) {}
+  ~VectorFloatDefaultTypeInternal() {}
+  union {
+    VectorFloat _instance;
+  };
+};
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 VectorFloatDefaultTypeInternal _VectorFloat_default_instance_;
+PROTOBUF_CONSTEXPR VectorDouble::VectorDouble(
+    ::_pbi::ConstantInitialized): _impl_{
+    /*decltype(_impl_._has_bits_)*/{}
+  , /*decltype(_impl_._cached_size_)*/{}
+  , /*decltype(_impl_.val_)*/{}
+  , /*decltype(_impl_.fieldvalues_)*/{}
+  , /*decltype(_impl_.secondsintoyear_)*/0u
+  , /*decltype(_impl_.nano_)*/0u
+  , /*decltype(_impl_.severity_)*/0
+  , /*decltype(_impl_.status_)*/0
+  , /*decltype(_impl_.repeatcount_)*/0u
+  , /*decltype(_impl_.fieldactualchange_)*/false} {}
+struct VectorDoubleDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR VectorDoubleDefaultTypeInternal()
+      : _instance(::_pbi::ConstantInitialized{}) {}
+  ~VectorDoubleDefaultTypeInternal() {}
+  union {
+    VectorDouble _instance;
+  };
+};
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 VectorDoubleDefaultTypeInternal _VectorDouble_default_instance_;
+PROTOBUF_CONSTEXPR V4GenericBytes::V4GenericBytes(
+    ::_pbi::ConstantInitialized): _impl_{
+    /*decltype(_impl_._has_bits_)*/{}
+  , /*decltype(_impl_._cached_size_)*/{}
+  , /*decltype(_impl_.fieldvalues_)*/{}
+  , /*decltype(_impl_.val_)*/{&::_pbi::fixed_address_empty_string, ::_pbi::ConstantInitialized{}}
+  , /*decltype(_impl_.secondsintoyear_)*/0u
+  , /*decltype(_impl_.nano_)*/0u
+  , /*decltype(_impl_.severity_)*/0
+  , /*decltype(_impl_.status_)*/0
+  , /*decltype(_impl_.repeatcount_)*/0u
+  , /*decltype(_impl_.fieldactualchange_)*/false} {}
+struct V4GenericBytesDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR V4GenericBytesDefaultTypeInternal()
+      : _instance(::_pbi::ConstantInitialized{}) {}
+  ~V4GenericBytesDefaultTypeInternal() {}
+  union {
+    V4GenericBytes _instance;
+  };
+};
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 V4GenericBytesDefaultTypeInternal _V4GenericBytes_default_instance_;
+PROTOBUF_CONSTEXPR PayloadInfo::PayloadInfo(
+    ::_pbi::ConstantInitialized): _impl_{
+    /*decltype(_impl_._has_bits_)*/{}
+  , /*decltype(_impl_._cached_size_)*/{}
+  , /*decltype(_impl_.headers_)*/{}
+  , /*decltype(_impl_.pvname_)*/{&::_pbi::fixed_address_empty_string, ::_pbi::ConstantInitialized{}}
+  , /*decltype(_impl_.unused09_)*/{&::_pbi::fixed_address_empty_string, ::_pbi::ConstantInitialized{}}
+  , /*decltype(_impl_.type_)*/0
+  , /*decltype(_impl_.year_)*/0
+  , /*decltype(_impl_.unused00_)*/0
+  , /*decltype(_impl_.unused01_)*/0
+  , /*decltype(_impl_.unused02_)*/0
+  , /*decltype(_impl_.unused03_)*/0
+  , /*decltype(_impl_.unused04_)*/0
+  , /*decltype(_impl_.unused05_)*/0
+  , /*decltype(_impl_.unused06_)*/0
+  , /*decltype(_impl_.unused07_)*/0
+  , /*decltype(_impl_.unused08_)*/0
+  , /*decltype(_impl_.elementcount_)*/0} {}
+struct PayloadInfoDefaultTypeInternal {
+  PROTOBUF_CONSTEXPR PayloadInfoDefaultTypeInternal()
+      : _instance(::_pbi::ConstantInitialized{}) {}
+  ~PayloadInfoDefaultTypeInternal() {}
+  union {
+    PayloadInfo _instance;
+  };
+};
+PROTOBUF_ATTRIBUTE_NO_DESTROY PROTOBUF_CONSTINIT PROTOBUF_ATTRIBUTE_INIT_PRIORITY1 PayloadInfoDefaultTypeInternal _PayloadInfo_default_instance_;
+}  // namespace EPICS
+static ::_pb::Metadata file_level_metadata_carchive_2fbackend_2fEPICSEvent_2eproto[17];
+static const ::_pb::EnumDescriptor* file_level_enum_descriptors_carchive_2fbackend_2fEPICSEvent_2eproto[1];
+static constexpr ::_pb::ServiceDescriptor const** file_level_service_descriptors_carchive_2fbackend_2fEPICSEvent_2eproto = nullptr;
+
+const uint32_t TableStruct_carchive_2fbackend_2fEPICSEvent_2eproto::offsets[] PROTOBUF_SECTION_VARIABLE(protodesc_cold) = {
+  PROTOBUF_FIELD_OFFSET(::EPICS::FieldValue, _impl_._has_bits_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::FieldValue, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  ~0u,  // no _inlined_string_donated_
+  PROTOBUF_FIELD_OFFSET(::EPICS::FieldValue, _impl_.name_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::FieldValue, _impl_.val_),
+  0,
+  1,
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarString, _impl_._has_bits_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarString, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  ~0u,  // no _inlined_string_donated_
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarString, _impl_.secondsintoyear_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarString, _impl_.nano_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarString, _impl_.val_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarString, _impl_.severity_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarString, _impl_.status_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarString, _impl_.repeatcount_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarString, _impl_.fieldvalues_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarString, _impl_.fieldactualchange_),
+  1,
+  2,
+  0,
+  3,
+  4,
+  5,
+  ~0u,
+  6,
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarByte, _impl_._has_bits_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarByte, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  ~0u,  // no _inlined_string_donated_
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarByte, _impl_.secondsintoyear_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarByte, _impl_.nano_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarByte, _impl_.val_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarByte, _impl_.severity_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarByte, _impl_.status_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarByte, _impl_.repeatcount_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarByte, _impl_.fieldvalues_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarByte, _impl_.fieldactualchange_),
+  1,
+  2,
+  0,
+  3,
+  4,
+  5,
+  ~0u,
+  6,
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarShort, _impl_._has_bits_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarShort, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  ~0u,  // no _inlined_string_donated_
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarShort, _impl_.secondsintoyear_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarShort, _impl_.nano_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarShort, _impl_.val_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarShort, _impl_.severity_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarShort, _impl_.status_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarShort, _impl_.repeatcount_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarShort, _impl_.fieldvalues_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarShort, _impl_.fieldactualchange_),
+  0,
+  1,
+  2,
+  3,
+  4,
+  5,
+  ~0u,
+  6,
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarInt, _impl_._has_bits_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarInt, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  ~0u,  // no _inlined_string_donated_
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarInt, _impl_.secondsintoyear_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarInt, _impl_.nano_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarInt, _impl_.val_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarInt, _impl_.severity_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarInt, _impl_.status_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarInt, _impl_.repeatcount_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarInt, _impl_.fieldvalues_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarInt, _impl_.fieldactualchange_),
+  0,
+  1,
+  2,
+  3,
+  4,
+  5,
+  ~0u,
+  6,
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarEnum, _impl_._has_bits_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarEnum, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  ~0u,  // no _inlined_string_donated_
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarEnum, _impl_.secondsintoyear_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarEnum, _impl_.nano_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarEnum, _impl_.val_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarEnum, _impl_.severity_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarEnum, _impl_.status_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarEnum, _impl_.repeatcount_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarEnum, _impl_.fieldvalues_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarEnum, _impl_.fieldactualchange_),
+  0,
+  1,
+  2,
+  3,
+  4,
+  5,
+  ~0u,
+  6,
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarFloat, _impl_._has_bits_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarFloat, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  ~0u,  // no _inlined_string_donated_
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarFloat, _impl_.secondsintoyear_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarFloat, _impl_.nano_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarFloat, _impl_.val_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarFloat, _impl_.severity_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarFloat, _impl_.status_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarFloat, _impl_.repeatcount_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarFloat, _impl_.fieldvalues_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarFloat, _impl_.fieldactualchange_),
+  0,
+  1,
+  2,
+  3,
+  4,
+  5,
+  ~0u,
+  6,
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarDouble, _impl_._has_bits_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarDouble, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  ~0u,  // no _inlined_string_donated_
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarDouble, _impl_.secondsintoyear_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarDouble, _impl_.nano_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarDouble, _impl_.val_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarDouble, _impl_.severity_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarDouble, _impl_.status_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarDouble, _impl_.repeatcount_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarDouble, _impl_.fieldvalues_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::ScalarDouble, _impl_.fieldactualchange_),
+  0,
+  1,
+  2,
+  3,
+  4,
+  5,
+  ~0u,
+  6,
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorString, _impl_._has_bits_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorString, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  ~0u,  // no _inlined_string_donated_
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorString, _impl_.secondsintoyear_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorString, _impl_.nano_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorString, _impl_.val_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorString, _impl_.severity_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorString, _impl_.status_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorString, _impl_.repeatcount_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorString, _impl_.fieldvalues_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorString, _impl_.fieldactualchange_),
+  0,
+  1,
+  ~0u,
+  2,
+  3,
+  4,
+  ~0u,
+  5,
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorChar, _impl_._has_bits_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorChar, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  ~0u,  // no _inlined_string_donated_
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorChar, _impl_.secondsintoyear_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorChar, _impl_.nano_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorChar, _impl_.val_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorChar, _impl_.severity_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorChar, _impl_.status_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorChar, _impl_.repeatcount_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorChar, _impl_.fieldvalues_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorChar, _impl_.fieldactualchange_),
+  1,
+  2,
+  0,
+  3,
+  4,
+  5,
+  ~0u,
+  6,
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorShort, _impl_._has_bits_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorShort, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  ~0u,  // no _inlined_string_donated_
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorShort, _impl_.secondsintoyear_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorShort, _impl_.nano_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorShort, _impl_.val_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorShort, _impl_.severity_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorShort, _impl_.status_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorShort, _impl_.repeatcount_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorShort, _impl_.fieldvalues_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorShort, _impl_.fieldactualchange_),
+  0,
+  1,
+  ~0u,
+  2,
+  3,
+  4,
+  ~0u,
+  5,
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorInt, _impl_._has_bits_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorInt, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  ~0u,  // no _inlined_string_donated_
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorInt, _impl_.secondsintoyear_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorInt, _impl_.nano_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorInt, _impl_.val_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorInt, _impl_.severity_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorInt, _impl_.status_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorInt, _impl_.repeatcount_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorInt, _impl_.fieldvalues_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorInt, _impl_.fieldactualchange_),
+  0,
+  1,
+  ~0u,
+  2,
+  3,
+  4,
+  ~0u,
+  5,
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorEnum, _impl_._has_bits_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorEnum, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  ~0u,  // no _inlined_string_donated_
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorEnum, _impl_.secondsintoyear_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorEnum, _impl_.nano_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorEnum, _impl_.val_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorEnum, _impl_.severity_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorEnum, _impl_.status_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorEnum, _impl_.repeatcount_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorEnum, _impl_.fieldvalues_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorEnum, _impl_.fieldactualchange_),
+  0,
+  1,
+  ~0u,
+  2,
+  3,
+  4,
+  ~0u,
+  5,
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorFloat, _impl_._has_bits_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorFloat, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  ~0u,  // no _inlined_string_donated_
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorFloat, _impl_.secondsintoyear_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorFloat, _impl_.nano_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorFloat, _impl_.val_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorFloat, _impl_.severity_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorFloat, _impl_.status_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorFloat, _impl_.repeatcount_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorFloat, _impl_.fieldvalues_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorFloat, _impl_.fieldactualchange_),
+  0,
+  1,
+  ~0u,
+  2,
+  3,
+  4,
+  ~0u,
+  5,
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorDouble, _impl_._has_bits_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorDouble, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  ~0u,  // no _inlined_string_donated_
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorDouble, _impl_.secondsintoyear_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorDouble, _impl_.nano_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorDouble, _impl_.val_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorDouble, _impl_.severity_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorDouble, _impl_.status_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorDouble, _impl_.repeatcount_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorDouble, _impl_.fieldvalues_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::VectorDouble, _impl_.fieldactualchange_),
+  0,
+  1,
+  ~0u,
+  2,
+  3,
+  4,
+  ~0u,
+  5,
+  PROTOBUF_FIELD_OFFSET(::EPICS::V4GenericBytes, _impl_._has_bits_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::V4GenericBytes, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  ~0u,  // no _inlined_string_donated_
+  PROTOBUF_FIELD_OFFSET(::EPICS::V4GenericBytes, _impl_.secondsintoyear_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::V4GenericBytes, _impl_.nano_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::V4GenericBytes, _impl_.val_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::V4GenericBytes, _impl_.severity_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::V4GenericBytes, _impl_.status_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::V4GenericBytes, _impl_.repeatcount_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::V4GenericBytes, _impl_.fieldvalues_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::V4GenericBytes, _impl_.fieldactualchange_),
+  1,
+  2,
+  0,
+  3,
+  4,
+  5,
+  ~0u,
+  6,
+  PROTOBUF_FIELD_OFFSET(::EPICS::PayloadInfo, _impl_._has_bits_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::PayloadInfo, _internal_metadata_),
+  ~0u,  // no _extensions_
+  ~0u,  // no _oneof_case_
+  ~0u,  // no _weak_field_map_
+  ~0u,  // no _inlined_string_donated_
+  PROTOBUF_FIELD_OFFSET(::EPICS::PayloadInfo, _impl_.type_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::PayloadInfo, _impl_.pvname_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::PayloadInfo, _impl_.year_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::PayloadInfo, _impl_.elementcount_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::PayloadInfo, _impl_.unused00_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::PayloadInfo, _impl_.unused01_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::PayloadInfo, _impl_.unused02_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::PayloadInfo, _impl_.unused03_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::PayloadInfo, _impl_.unused04_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::PayloadInfo, _impl_.unused05_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::PayloadInfo, _impl_.unused06_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::PayloadInfo, _impl_.unused07_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::PayloadInfo, _impl_.unused08_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::PayloadInfo, _impl_.unused09_),
+  PROTOBUF_FIELD_OFFSET(::EPICS::PayloadInfo, _impl_.headers_),
+  2,
+  0,
+  3,
+  13,
+  4,
+  5,
+  6,
+  7,
+  8,
+  9,
+  10,
+  11,
+  12,
+  1,
+  ~0u,
+};
+static const ::_pbi::MigrationSchema schemas[] PROTOBUF_SECTION_VARIABLE(protodesc_cold) = {
+  { 0, 8, -1, sizeof(::EPICS::FieldValue)},
+  { 10, 24, -1, sizeof(::EPICS::ScalarString)},
+  { 32, 46, -1, sizeof(::EPICS::ScalarByte)},
+  { 54, 68, -1, sizeof(::EPICS::ScalarShort)},
+  { 76, 90, -1, sizeof(::EPICS::ScalarInt)},
+  { 98, 112, -1, sizeof(::EPICS::ScalarEnum)},
+  { 120, 134, -1, sizeof(::EPICS::ScalarFloat)},
+  { 142, 156, -1, sizeof(::EPICS::ScalarDouble)},
+  { 164, 178, -1, sizeof(::EPICS::VectorString)},
+  { 186, 200, -1, sizeof(::EPICS::VectorChar)},
+  { 208, 222, -1, sizeof(::EPICS::VectorShort)},
+  { 230, 244, -1, sizeof(::EPICS::VectorInt)},
+  { 252, 266, -1, sizeof(::EPICS::VectorEnum)},
+  { 274, 288, -1, sizeof(::EPICS::VectorFloat)},
+  { 296, 310, -1, sizeof(::EPICS::VectorDouble)},
+  { 318, 332, -1, sizeof(::EPICS::V4GenericBytes)},
+  { 340, 361, -1, sizeof(::EPICS::PayloadInfo)},
+};
+
+static const ::_pb::Message* const file_default_instances[] = {
+  &::EPICS::_FieldValue_default_instance_._instance,
+  &::EPICS::_ScalarString_default_instance_._instance,
+  &::EPICS::_ScalarByte_default_instance_._instance,
+  &::EPICS::_ScalarShort_default_instance_._instance,
+  &::EPICS::_ScalarInt_default_instance_._instance,
+  &::EPICS::_ScalarEnum_default_instance_._instance,
+  &::EPICS::_ScalarFloat_default_instance_._instance,
+  &::EPICS::_ScalarDouble_default_instance_._instance,
+  &::EPICS::_VectorString_default_instance_._instance,
+  &::EPICS::_VectorChar_default_instance_._instance,
+  &::EPICS::_VectorShort_default_instance_._instance,
+  &::EPICS::_VectorInt_default_instance_._instance,
+  &::EPICS::_VectorEnum_default_instance_._instance,
+  &::EPICS::_VectorFloat_default_instance_._instance,
+  &::EPICS::_VectorDouble_default_instance_._instance,
+  &::EPICS::_V4GenericBytes_default_instance_._instance,
+  &::EPICS::_PayloadInfo_default_instance_._instance,
+};
+
+const char descriptor_table_protodef_carchive_2fbackend_2fEPICSEvent_2eproto[] PROTOBUF_SECTION_VARIABLE(protodesc_cold) =
+  "\n!carchive/backend/EPICSEvent.proto\022\005EPI"
+  "CS\"\'\n\nFieldValue\022\014\n\004name\030\001 \002(\t\022\013\n\003val\030\002 "
+  "\002(\t\"\302\001\n\014ScalarString\022\027\n\017secondsintoyear\030"
+  "\001 \002(\r\022\014\n\004nano\030\002 \002(\r\022\013\n\003val\030\003 \002(\t\022\023\n\010seve"
+  "rity\030\004 \001(\005:\0010\022\021\n\006status\030\005 \001(\005:\0010\022\023\n\013repe"
+  "atcount\030\006 \001(\r\022&\n\013fieldvalues\030\007 \003(\0132\021.EPI"
+  "CS.FieldValue\022\031\n\021fieldactualchange\030\010 \001(\010"
+  "\"\300\001\n\nScalarByte\022\027\n\017secondsintoyear\030\001 \002(\r"
+  "\022\014\n\004nano\030\002 \002(\r\022\013\n\003val\030\003 \002(\014\022\023\n\010severity\030"
+  "\004 \001(\005:\0010\022\021\n\006status\030\005 \001(\005:\0010\022\023\n\013repeatcou"
+  "nt\030\006 \001(\r\022&\n\013fieldvalues\030\007 \003(\0132\021.EPICS.Fi"
+  "eldValue\022\031\n\021fieldactualchange\030\010 \001(\010\"\301\001\n\013"
+  "ScalarShort\022\027\n\017secondsintoyear\030\001 \002(\r\022\014\n\004"
+  "nano\030\002 \002(\r\022\013\n\003val\030\003 \002(\021\022\023\n\010severity\030\004 \001("
+  "\005:\0010\022\021\n\006status\030\005 \001(\005:\0010\022\023\n\013repeatcount\030\006"
+  " \001(\r\022&\n\013fieldvalues\030\007 \003(\0132\021.EPICS.FieldV"
+  "alue\022\031\n\021fieldactualchange\030\010 \001(\010\"\277\001\n\tScal"
+  "arInt\022\027\n\017secondsintoyear\030\001 \002(\r\022\014\n\004nano\030\002"
+  " \002(\r\022\013\n\003val\030\003 \002(\017\022\023\n\010severity\030\004 \001(\005:\0010\022\021"
+  "\n\006status\030\005 \001(\005:\0010\022\023\n\013repeatcount\030\006 \001(\r\022&"
+  "\n\013fieldvalues\030\007 \003(\0132\021.EPICS.FieldValue\022\031"
+  "\n\021fieldactualchange\030\010 \001(\010\"\300\001\n\nScalarEnum"
+  "\022\027\n\017secondsintoyear\030\001 \002(\r\022\014\n\004nano\030\002 \002(\r\022"
+  "\013\n\003val\030\003 \002(\021\022\023\n\010severity\030\004 \001(\005:\0010\022\021\n\006sta"
+  "tus\030\005 \001(\005:\0010\022\023\n\013repeatcount\030\006 \001(\r\022&\n\013fie"
+  "ldvalues\030\007 \003(\0132\021.EPICS.FieldValue\022\031\n\021fie"
+  "ldactualchange\030\010 \001(\010\"\301\001\n\013ScalarFloat\022\027\n\017"
+  "secondsintoyear\030\001 \002(\r\022\014\n\004nano\030\002 \002(\r\022\013\n\003v"
+  "al\030\003 \002(\002\022\023\n\010severity\030\004 \001(\005:\0010\022\021\n\006status\030"
+  "\005 \001(\005:\0010\022\023\n\013repeatcount\030\006 \001(\r\022&\n\013fieldva"
+  "lues\030\007 \003(\0132\021.EPICS.FieldValue\022\031\n\021fieldac"
+  "tualchange\030\010 \001(\010\"\302\001\n\014ScalarDouble\022\027\n\017sec"
+  "ondsintoyear\030\001 \002(\r\022\014\n\004nano\030\002 \002(\r\022\013\n\003val\030"
+  "\003 \002(\001\022\023\n\010severity\030\004 \001(\005:\0010\022\021\n\006status\030\005 \001"
+  "(\005:\0010\022\023\n\013repeatcount\030\006 \001(\r\022&\n\013fieldvalue"
+  "s\030\007 \003(\0132\021.EPICS.FieldValue\022\031\n\021fieldactua"
+  "lchange\030\010 \001(\010\"\302\001\n\014VectorString\022\027\n\017second"
+  "sintoyear\030\001 \002(\r\022\014\n\004nano\030\002 \002(\r\022\013\n\003val\030\003 \003"
+  "(\t\022\023\n\010severity\030\004 \001(\005:\0010\022\021\n\006status\030\005 \001(\005:"
+  "\0010\022\023\n\013repeatcount\030\006 \001(\r\022&\n\013fieldvalues\030\007"
+  " \003(\0132\021.EPICS.FieldValue\022\031\n\021fieldactualch"
+  "ange\030\010 \001(\010\"\300\001\n\nVectorChar\022\027\n\017secondsinto"
+  "year\030\001 \002(\r\022\014\n\004nano\030\002 \002(\r\022\013\n\003val\030\003 \002(\014\022\023\n"
+  "\010severity\030\004 \001(\005:\0010\022\021\n\006status\030\005 \001(\005:\0010\022\023\n"
+  "\013repeatcount\030\006 \001(\r\022&\n\013fieldvalues\030\007 \003(\0132"
+  "\021.EPICS.FieldValue\022\031\n\021fieldactualchange\030"
+  "\010 \001(\010\"\305\001\n\013VectorShort\022\027\n\017secondsintoyear"
+  "\030\001 \002(\r\022\014\n\004nano\030\002 \002(\r\022\017\n\003val\030\003 \003(\021B\002\020\001\022\023\n"
+  "\010severity\030\004 \001(\005:\0010\022\021\n\006status\030\005 \001(\005:\0010\022\023\n"
+  "\013repeatcount\030\006 \001(\r\022&\n\013fieldvalues\030\007 \003(\0132"
+  "\021.EPICS.FieldValue\022\031\n\021fieldactualchange\030"
+  "\010 \001(\010\"\303\001\n\tVectorInt\022\027\n\017secondsintoyear\030\001"
+  " \002(\r\022\014\n\004nano\030\002 \002(\r\022\017\n\003val\030\003 \003(\017B\002\020\001\022\023\n\010s"
+  "everity\030\004 \001(\005:\0010\022\021\n\006status\030\005 \001(\005:\0010\022\023\n\013r"
+  "epeatcount\030\006 \001(\r\022&\n\013fieldvalues\030\007 \003(\0132\021."
+  "EPICS.FieldValue\022\031\n\021fieldactualchange\030\010 "
+  "\001(\010\"\304\001\n\nVectorEnum\022\027\n\017secondsintoyear\030\001 "
+  "\002(\r\022\014\n\004nano\030\002 \002(\r\022\017\n\003val\030\003 \003(\021B\002\020\001\022\023\n\010se"
+  "verity\030\004 \001(\005:\0010\022\021\n\006status\030\005 \001(\005:\0010\022\023\n\013re"
+  "peatcount\030\006 \001(\r\022&\n\013fieldvalues\030\007 \003(\0132\021.E"
+  "PICS.FieldValue\022\031\n\021fieldactualchange\030\010 \001"
+  "(\010\"\305\001\n\013VectorFloat\022\027\n\017secondsintoyear\030\001 "
+  "\002(\r\022\014\n\004nano\030\002 \002(\r\022\017\n\003val\030\003 \003(\002B\002\020\001\022\023\n\010se"
+  "verity\030\004 \001(\005:\0010\022\021\n\006status\030\005 \001(\005:\0010\022\023\n\013re"
+  "peatcount\030\006 \001(\r\022&\n\013fieldvalues\030\007 \003(\0132\021.E"
+  "PICS.FieldValue\022\031\n\021fieldactualchange\030\010 \001"
+  "(\010\"\306\001\n\014VectorDouble\022\027\n\017secondsintoyear\030\001"
+  " \002(\r\022\014\n\004nano\030\002 \002(\r\022\017\n\003val\030\003 \003(\001B\002\020\001\022\023\n\010s"
+  "everity\030\004 \001(\005:\0010\022\021\n\006status\030\005 \001(\005:\0010\022\023\n\013r"
+  "epeatcount\030\006 \001(\r\022&\n\013fieldvalues\030\007 \003(\0132\021."
+  "EPICS.FieldValue\022\031\n\021fieldactualchange\030\010 "
+  "\001(\010\"\304\001\n\016V4GenericBytes\022\027\n\017secondsintoyea"
+  "r\030\001 \002(\r\022\014\n\004nano\030\002 \002(\r\022\013\n\003val\030\003 \002(\014\022\023\n\010se"
+  "verity\030\004 \001(\005:\0010\022\021\n\006status\030\005 \001(\005:\0010\022\023\n\013re"
+  "peatcount\030\006 \001(\r\022&\n\013fieldvalues\030\007 \003(\0132\021.E"
+  "PICS.FieldValue\022\031\n\021fieldactualchange\030\010 \001"
+  "(\010\"\273\002\n\013PayloadInfo\022 \n\004type\030\001 \002(\0162\022.EPICS"
+  ".PayloadType\022\016\n\006pvname\030\002 \002(\t\022\014\n\004year\030\003 \002"
+  "(\005\022\024\n\014elementCount\030\004 \001(\005\022\020\n\010unused00\030\005 \001"
+  "(\001\022\020\n\010unused01\030\006 \001(\001\022\020\n\010unused02\030\007 \001(\001\022\020"
+  "\n\010unused03\030\010 \001(\001\022\020\n\010unused04\030\t \001(\001\022\020\n\010un"
+  "used05\030\n \001(\001\022\020\n\010unused06\030\013 \001(\001\022\020\n\010unused"
+  "07\030\014 \001(\001\022\020\n\010unused08\030\r \001(\001\022\020\n\010unused09\030\016"
+  " \001(\t\022\"\n\007headers\030\017 \003(\0132\021.EPICS.FieldValue"
+  "*\251\002\n\013PayloadType\022\021\n\rSCALAR_STRING\020\000\022\020\n\014S"
+  "CALAR_SHORT\020\001\022\020\n\014SCALAR_FLOAT\020\002\022\017\n\013SCALA"
+  "R_ENUM\020\003\022\017\n\013SCALAR_BYTE\020\004\022\016\n\nSCALAR_INT\020"
+  "\005\022\021\n\rSCALAR_DOUBLE\020\006\022\023\n\017WAVEFORM_STRING\020"
+  "\007\022\022\n\016WAVEFORM_SHORT\020\010\022\022\n\016WAVEFORM_FLOAT\020"
+  "\t\022\021\n\rWAVEFORM_ENUM\020\n\022\021\n\rWAVEFORM_BYTE\020\013\022"
+  "\020\n\014WAVEFORM_INT\020\014\022\023\n\017WAVEFORM_DOUBLE\020\r\022\024"
+  "\n\020V4_GENERIC_BYTES\020\016B4\n&edu.stanford.sla"
+  "c.archiverappliance.PBB\nEPICSEvent"
+  ;
+static ::_pbi::once_flag descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_once;
+const ::_pbi::DescriptorTable descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto = {
+    false, false, 3714, descriptor_table_protodef_carchive_2fbackend_2fEPICSEvent_2eproto,
+    "carchive/backend/EPICSEvent.proto",
+    &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_once, nullptr, 0, 17,
+    schemas, file_default_instances, TableStruct_carchive_2fbackend_2fEPICSEvent_2eproto::offsets,
+    file_level_metadata_carchive_2fbackend_2fEPICSEvent_2eproto, file_level_enum_descriptors_carchive_2fbackend_2fEPICSEvent_2eproto,
+    file_level_service_descriptors_carchive_2fbackend_2fEPICSEvent_2eproto,
+};
+PROTOBUF_ATTRIBUTE_WEAK const ::_pbi::DescriptorTable* descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_getter() {
+  return &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto;
+}
+
+// Force running AddDescriptors() at dynamic initialization time.
+PROTOBUF_ATTRIBUTE_INIT_PRIORITY2 static ::_pbi::AddDescriptorsRunner dynamic_init_dummy_carchive_2fbackend_2fEPICSEvent_2eproto(&descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto);
+namespace EPICS {
+const ::PROTOBUF_NAMESPACE_ID::EnumDescriptor* PayloadType_descriptor() {
+  ::PROTOBUF_NAMESPACE_ID::internal::AssignDescriptors(&descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto);
+  return file_level_enum_descriptors_carchive_2fbackend_2fEPICSEvent_2eproto[0];
+}
+bool PayloadType_IsValid(int value) {
+  switch (value) {
+    case 0:
+    case 1:
+    case 2:
+    case 3:
+    case 4:
+    case 5:
+    case 6:
+    case 7:
+    case 8:
+    case 9:
+    case 10:
+    case 11:
+    case 12:
+    case 13:
+    case 14:
+      return true;
+    default:
+      return false;
+  }
+}
+
+
+// ===================================================================
+
+class FieldValue::_Internal {
+ public:
+  using HasBits = decltype(std::declval<FieldValue>()._impl_._has_bits_);
+  static void set_has_name(HasBits* has_bits) {
+    (*has_bits)[0] |= 1u;
+  }
+  static void set_has_val(HasBits* has_bits) {
+    (*has_bits)[0] |= 2u;
+  }
+  static bool MissingRequiredFields(const HasBits& has_bits) {
+    return ((has_bits[0] & 0x00000003) ^ 0x00000003) != 0;
+  }
+};
+
+FieldValue::FieldValue(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                         bool is_message_owned)
+  : ::PROTOBUF_NAMESPACE_ID::Message(arena, is_message_owned) {
+  SharedCtor(arena, is_message_owned);
+  // @@protoc_insertion_point(arena_constructor:EPICS.FieldValue)
+}
+FieldValue::FieldValue(const FieldValue& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message() {
+  FieldValue* const _this = this; (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){from._impl_._has_bits_}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.name_){}
+    , decltype(_impl_.val_){}};
+
+  _internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+  _impl_.name_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+    _impl_.name_.Set("", GetArenaForAllocation());
+  #endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (from._internal_has_name()) {
+    _this->_impl_.name_.Set(from._internal_name(), 
+      _this->GetArenaForAllocation());
+  }
+  _impl_.val_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+    _impl_.val_.Set("", GetArenaForAllocation());
+  #endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (from._internal_has_val()) {
+    _this->_impl_.val_.Set(from._internal_val(), 
+      _this->GetArenaForAllocation());
+  }
+  // @@protoc_insertion_point(copy_constructor:EPICS.FieldValue)
+}
+
+inline void FieldValue::SharedCtor(
+    ::_pb::Arena* arena, bool is_message_owned) {
+  (void)arena;
+  (void)is_message_owned;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.name_){}
+    , decltype(_impl_.val_){}
+  };
+  _impl_.name_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+    _impl_.name_.Set("", GetArenaForAllocation());
+  #endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  _impl_.val_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+    _impl_.val_.Set("", GetArenaForAllocation());
+  #endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+}
+
+FieldValue::~FieldValue() {
+  // @@protoc_insertion_point(destructor:EPICS.FieldValue)
+  if (auto *arena = _internal_metadata_.DeleteReturnArena<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>()) {
+  (void)arena;
+    return;
+  }
+  SharedDtor();
+}
+
+inline void FieldValue::SharedDtor() {
+  GOOGLE_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.name_.Destroy();
+  _impl_.val_.Destroy();
+}
+
+void FieldValue::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+void FieldValue::Clear() {
+// @@protoc_insertion_point(message_clear_start:EPICS.FieldValue)
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x00000003u) {
+    if (cached_has_bits & 0x00000001u) {
+      _impl_.name_.ClearNonDefaultToEmpty();
+    }
+    if (cached_has_bits & 0x00000002u) {
+      _impl_.val_.ClearNonDefaultToEmpty();
+    }
+  }
+  _impl_._has_bits_.Clear();
+  _internal_metadata_.Clear<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+}
+
+const char* FieldValue::_InternalParse(const char* ptr, ::_pbi::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  _Internal::HasBits has_bits{};
+  while (!ctx->Done(&ptr)) {
+    uint32_t tag;
+    ptr = ::_pbi::ReadTag(ptr, &tag);
+    switch (tag >> 3) {
+      // required string name = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 10)) {
+          auto str = _internal_mutable_name();
+          ptr = ::_pbi::InlineGreedyStringParser(str, ptr, ctx);
+          CHK_(ptr);
+          #ifndef NDEBUG
+          ::_pbi::VerifyUTF8(str, "EPICS.FieldValue.name");
+          #endif  // !NDEBUG
+        } else
+          goto handle_unusual;
+        continue;
+      // required string val = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 18)) {
+          auto str = _internal_mutable_val();
+          ptr = ::_pbi::InlineGreedyStringParser(str, ptr, ctx);
+          CHK_(ptr);
+          #ifndef NDEBUG
+          ::_pbi::VerifyUTF8(str, "EPICS.FieldValue.val");
+          #endif  // !NDEBUG
+        } else
+          goto handle_unusual;
+        continue;
+      default:
+        goto handle_unusual;
+    }  // switch
+  handle_unusual:
+    if ((tag == 0) || ((tag & 7) == 4)) {
+      CHK_(ptr);
+      ctx->SetLastTag(tag);
+      goto message_done;
+    }
+    ptr = UnknownFieldParse(
+        tag,
+        _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(),
+        ptr, ctx);
+    CHK_(ptr != nullptr);
+  }  // while
+message_done:
+  _impl_._has_bits_.Or(has_bits);
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto message_done;
+#undef CHK_
+}
+
+uint8_t* FieldValue::_InternalSerialize(
+    uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:EPICS.FieldValue)
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  cached_has_bits = _impl_._has_bits_[0];
+  // required string name = 1;
+  if (cached_has_bits & 0x00000001u) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::VerifyUTF8StringNamedField(
+      this->_internal_name().data(), static_cast<int>(this->_internal_name().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SERIALIZE,
+      "EPICS.FieldValue.name");
+    target = stream->WriteStringMaybeAliased(
+        1, this->_internal_name(), target);
+  }
+
+  // required string val = 2;
+  if (cached_has_bits & 0x00000002u) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::VerifyUTF8StringNamedField(
+      this->_internal_val().data(), static_cast<int>(this->_internal_val().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SERIALIZE,
+      "EPICS.FieldValue.val");
+    target = stream->WriteStringMaybeAliased(
+        2, this->_internal_val(), target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target = ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:EPICS.FieldValue)
+  return target;
+}
+
+size_t FieldValue::RequiredFieldsByteSizeFallback() const {
+// @@protoc_insertion_point(required_fields_byte_size_fallback_start:EPICS.FieldValue)
+  size_t total_size = 0;
+
+  if (_internal_has_name()) {
+    // required string name = 1;
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->_internal_name());
+  }
+
+  if (_internal_has_val()) {
+    // required string val = 2;
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->_internal_val());
+  }
+
+  return total_size;
+}
+size_t FieldValue::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:EPICS.FieldValue)
+  size_t total_size = 0;
+
+  if (((_impl_._has_bits_[0] & 0x00000003) ^ 0x00000003) == 0) {  // All required fields are present.
+    // required string name = 1;
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->_internal_name());
+
+    // required string val = 2;
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->_internal_val());
+
+  } else {
+    total_size += RequiredFieldsByteSizeFallback();
+  }
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData FieldValue::_class_data_ = {
+    ::PROTOBUF_NAMESPACE_ID::Message::CopyWithSourceCheck,
+    FieldValue::MergeImpl
+};
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*FieldValue::GetClassData() const { return &_class_data_; }
+
+
+void FieldValue::MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg) {
+  auto* const _this = static_cast<FieldValue*>(&to_msg);
+  auto& from = static_cast<const FieldValue&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:EPICS.FieldValue)
+  GOOGLE_DCHECK_NE(&from, _this);
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  cached_has_bits = from._impl_._has_bits_[0];
+  if (cached_has_bits & 0x00000003u) {
+    if (cached_has_bits & 0x00000001u) {
+      _this->_internal_set_name(from._internal_name());
+    }
+    if (cached_has_bits & 0x00000002u) {
+      _this->_internal_set_val(from._internal_val());
+    }
+  }
+  _this->_internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void FieldValue::CopyFrom(const FieldValue& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:EPICS.FieldValue)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool FieldValue::IsInitialized() const {
+  if (_Internal::MissingRequiredFields(_impl_._has_bits_)) return false;
+  return true;
+}
+
+void FieldValue::InternalSwap(FieldValue* other) {
+  using std::swap;
+  auto* lhs_arena = GetArenaForAllocation();
+  auto* rhs_arena = other->GetArenaForAllocation();
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  swap(_impl_._has_bits_[0], other->_impl_._has_bits_[0]);
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr::InternalSwap(
+      &_impl_.name_, lhs_arena,
+      &other->_impl_.name_, rhs_arena
+  );
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr::InternalSwap(
+      &_impl_.val_, lhs_arena,
+      &other->_impl_.val_, rhs_arena
+  );
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata FieldValue::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_getter, &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_once,
+      file_level_metadata_carchive_2fbackend_2fEPICSEvent_2eproto[0]);
+}
+
+// ===================================================================
+
+class ScalarString::_Internal {
+ public:
+  using HasBits = decltype(std::declval<ScalarString>()._impl_._has_bits_);
+  static void set_has_secondsintoyear(HasBits* has_bits) {
+    (*has_bits)[0] |= 2u;
+  }
+  static void set_has_nano(HasBits* has_bits) {
+    (*has_bits)[0] |= 4u;
+  }
+  static void set_has_val(HasBits* has_bits) {
+    (*has_bits)[0] |= 1u;
+  }
+  static void set_has_severity(HasBits* has_bits) {
+    (*has_bits)[0] |= 8u;
+  }
+  static void set_has_status(HasBits* has_bits) {
+    (*has_bits)[0] |= 16u;
+  }
+  static void set_has_repeatcount(HasBits* has_bits) {
+    (*has_bits)[0] |= 32u;
+  }
+  static void set_has_fieldactualchange(HasBits* has_bits) {
+    (*has_bits)[0] |= 64u;
+  }
+  static bool MissingRequiredFields(const HasBits& has_bits) {
+    return ((has_bits[0] & 0x00000007) ^ 0x00000007) != 0;
+  }
+};
+
+ScalarString::ScalarString(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                         bool is_message_owned)
+  : ::PROTOBUF_NAMESPACE_ID::Message(arena, is_message_owned) {
+  SharedCtor(arena, is_message_owned);
+  // @@protoc_insertion_point(arena_constructor:EPICS.ScalarString)
+}
+ScalarString::ScalarString(const ScalarString& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message() {
+  ScalarString* const _this = this; (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){from._impl_._has_bits_}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.fieldvalues_){from._impl_.fieldvalues_}
+    , decltype(_impl_.val_){}
+    , decltype(_impl_.secondsintoyear_){}
+    , decltype(_impl_.nano_){}
+    , decltype(_impl_.severity_){}
+    , decltype(_impl_.status_){}
+    , decltype(_impl_.repeatcount_){}
+    , decltype(_impl_.fieldactualchange_){}};
+
+  _internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+  _impl_.val_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+    _impl_.val_.Set("", GetArenaForAllocation());
+  #endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (from._internal_has_val()) {
+    _this->_impl_.val_.Set(from._internal_val(), 
+      _this->GetArenaForAllocation());
+  }
+  ::memcpy(&_impl_.secondsintoyear_, &from._impl_.secondsintoyear_,
+    static_cast<size_t>(reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+    reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  // @@protoc_insertion_point(copy_constructor:EPICS.ScalarString)
+}
+
+inline void ScalarString::SharedCtor(
+    ::_pb::Arena* arena, bool is_message_owned) {
+  (void)arena;
+  (void)is_message_owned;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.fieldvalues_){arena}
+    , decltype(_impl_.val_){}
+    , decltype(_impl_.secondsintoyear_){0u}
+    , decltype(_impl_.nano_){0u}
+    , decltype(_impl_.severity_){0}
+    , decltype(_impl_.status_){0}
+    , decltype(_impl_.repeatcount_){0u}
+    , decltype(_impl_.fieldactualchange_){false}
+  };
+  _impl_.val_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+    _impl_.val_.Set("", GetArenaForAllocation());
+  #endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+}
+
+ScalarString::~ScalarString() {
+  // @@protoc_insertion_point(destructor:EPICS.ScalarString)
+  if (auto *arena = _internal_metadata_.DeleteReturnArena<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>()) {
+  (void)arena;
+    return;
+  }
+  SharedDtor();
+}
+
+inline void ScalarString::SharedDtor() {
+  GOOGLE_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.fieldvalues_.~RepeatedPtrField();
+  _impl_.val_.Destroy();
+}
+
+void ScalarString::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+void ScalarString::Clear() {
+// @@protoc_insertion_point(message_clear_start:EPICS.ScalarString)
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.fieldvalues_.Clear();
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x00000001u) {
+    _impl_.val_.ClearNonDefaultToEmpty();
+  }
+  if (cached_has_bits & 0x0000007eu) {
+    ::memset(&_impl_.secondsintoyear_, 0, static_cast<size_t>(
+        reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+        reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  }
+  _impl_._has_bits_.Clear();
+  _internal_metadata_.Clear<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+}
+
+const char* ScalarString::_InternalParse(const char* ptr, ::_pbi::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  _Internal::HasBits has_bits{};
+  while (!ctx->Done(&ptr)) {
+    uint32_t tag;
+    ptr = ::_pbi::ReadTag(ptr, &tag);
+    switch (tag >> 3) {
+      // required uint32 secondsintoyear = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 8)) {
+          _Internal::set_has_secondsintoyear(&has_bits);
+          _impl_.secondsintoyear_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // required uint32 nano = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 16)) {
+          _Internal::set_has_nano(&has_bits);
+          _impl_.nano_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // required string val = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 26)) {
+          auto str = _internal_mutable_val();
+          ptr = ::_pbi::InlineGreedyStringParser(str, ptr, ctx);
+          CHK_(ptr);
+          #ifndef NDEBUG
+          ::_pbi::VerifyUTF8(str, "EPICS.ScalarString.val");
+          #endif  // !NDEBUG
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 severity = 4 [default = 0];
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 32)) {
+          _Internal::set_has_severity(&has_bits);
+          _impl_.severity_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 status = 5 [default = 0];
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 40)) {
+          _Internal::set_has_status(&has_bits);
+          _impl_.status_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional uint32 repeatcount = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 48)) {
+          _Internal::set_has_repeatcount(&has_bits);
+          _impl_.repeatcount_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated .EPICS.FieldValue fieldvalues = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 58)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ctx->ParseMessage(_internal_add_fieldvalues(), ptr);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::ExpectTag<58>(ptr));
+        } else
+          goto handle_unusual;
+        continue;
+      // optional bool fieldactualchange = 8;
+      case 8:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 64)) {
+          _Internal::set_has_fieldactualchange(&has_bits);
+          _impl_.fieldactualchange_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint64(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      default:
+        goto handle_unusual;
+    }  // switch
+  handle_unusual:
+    if ((tag == 0) || ((tag & 7) == 4)) {
+      CHK_(ptr);
+      ctx->SetLastTag(tag);
+      goto message_done;
+    }
+    ptr = UnknownFieldParse(
+        tag,
+        _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(),
+        ptr, ctx);
+    CHK_(ptr != nullptr);
+  }  // while
+message_done:
+  _impl_._has_bits_.Or(has_bits);
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto message_done;
+#undef CHK_
+}
+
+uint8_t* ScalarString::_InternalSerialize(
+    uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:EPICS.ScalarString)
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  cached_has_bits = _impl_._has_bits_[0];
+  // required uint32 secondsintoyear = 1;
+  if (cached_has_bits & 0x00000002u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(1, this->_internal_secondsintoyear(), target);
+  }
+
+  // required uint32 nano = 2;
+  if (cached_has_bits & 0x00000004u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(2, this->_internal_nano(), target);
+  }
+
+  // required string val = 3;
+  if (cached_has_bits & 0x00000001u) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::VerifyUTF8StringNamedField(
+      this->_internal_val().data(), static_cast<int>(this->_internal_val().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SERIALIZE,
+      "EPICS.ScalarString.val");
+    target = stream->WriteStringMaybeAliased(
+        3, this->_internal_val(), target);
+  }
+
+  // optional int32 severity = 4 [default = 0];
+  if (cached_has_bits & 0x00000008u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(4, this->_internal_severity(), target);
+  }
+
+  // optional int32 status = 5 [default = 0];
+  if (cached_has_bits & 0x00000010u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(5, this->_internal_status(), target);
+  }
+
+  // optional uint32 repeatcount = 6;
+  if (cached_has_bits & 0x00000020u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(6, this->_internal_repeatcount(), target);
+  }
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_fieldvalues_size()); i < n; i++) {
+    const auto& repfield = this->_internal_fieldvalues(i);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+        InternalWriteMessage(7, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  // optional bool fieldactualchange = 8;
+  if (cached_has_bits & 0x00000040u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteBoolToArray(8, this->_internal_fieldactualchange(), target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target = ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:EPICS.ScalarString)
+  return target;
+}
+
+size_t ScalarString::RequiredFieldsByteSizeFallback() const {
+// @@protoc_insertion_point(required_fields_byte_size_fallback_start:EPICS.ScalarString)
+  size_t total_size = 0;
+
+  if (_internal_has_val()) {
+    // required string val = 3;
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->_internal_val());
+  }
+
+  if (_internal_has_secondsintoyear()) {
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+  }
+
+  if (_internal_has_nano()) {
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+  }
+
+  return total_size;
+}
+size_t ScalarString::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:EPICS.ScalarString)
+  size_t total_size = 0;
+
+  if (((_impl_._has_bits_[0] & 0x00000007) ^ 0x00000007) == 0) {  // All required fields are present.
+    // required string val = 3;
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->_internal_val());
+
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+
+  } else {
+    total_size += RequiredFieldsByteSizeFallback();
+  }
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  total_size += 1UL * this->_internal_fieldvalues_size();
+  for (const auto& msg : this->_impl_.fieldvalues_) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(msg);
+  }
+
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x00000078u) {
+    // optional int32 severity = 4 [default = 0];
+    if (cached_has_bits & 0x00000008u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_severity());
+    }
+
+    // optional int32 status = 5 [default = 0];
+    if (cached_has_bits & 0x00000010u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_status());
+    }
+
+    // optional uint32 repeatcount = 6;
+    if (cached_has_bits & 0x00000020u) {
+      total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_repeatcount());
+    }
+
+    // optional bool fieldactualchange = 8;
+    if (cached_has_bits & 0x00000040u) {
+      total_size += 1 + 1;
+    }
+
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData ScalarString::_class_data_ = {
+    ::PROTOBUF_NAMESPACE_ID::Message::CopyWithSourceCheck,
+    ScalarString::MergeImpl
+};
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*ScalarString::GetClassData() const { return &_class_data_; }
+
+
+void ScalarString::MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg) {
+  auto* const _this = static_cast<ScalarString*>(&to_msg);
+  auto& from = static_cast<const ScalarString&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:EPICS.ScalarString)
+  GOOGLE_DCHECK_NE(&from, _this);
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_impl_.fieldvalues_.MergeFrom(from._impl_.fieldvalues_);
+  cached_has_bits = from._impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000007fu) {
+    if (cached_has_bits & 0x00000001u) {
+      _this->_internal_set_val(from._internal_val());
+    }
+    if (cached_has_bits & 0x00000002u) {
+      _this->_impl_.secondsintoyear_ = from._impl_.secondsintoyear_;
+    }
+    if (cached_has_bits & 0x00000004u) {
+      _this->_impl_.nano_ = from._impl_.nano_;
+    }
+    if (cached_has_bits & 0x00000008u) {
+      _this->_impl_.severity_ = from._impl_.severity_;
+    }
+    if (cached_has_bits & 0x00000010u) {
+      _this->_impl_.status_ = from._impl_.status_;
+    }
+    if (cached_has_bits & 0x00000020u) {
+      _this->_impl_.repeatcount_ = from._impl_.repeatcount_;
+    }
+    if (cached_has_bits & 0x00000040u) {
+      _this->_impl_.fieldactualchange_ = from._impl_.fieldactualchange_;
+    }
+    _this->_impl_._has_bits_[0] |= cached_has_bits;
+  }
+  _this->_internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void ScalarString::CopyFrom(const ScalarString& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:EPICS.ScalarString)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool ScalarString::IsInitialized() const {
+  if (_Internal::MissingRequiredFields(_impl_._has_bits_)) return false;
+  if (!::PROTOBUF_NAMESPACE_ID::internal::AllAreInitialized(_impl_.fieldvalues_))
+    return false;
+  return true;
+}
+
+void ScalarString::InternalSwap(ScalarString* other) {
+  using std::swap;
+  auto* lhs_arena = GetArenaForAllocation();
+  auto* rhs_arena = other->GetArenaForAllocation();
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  swap(_impl_._has_bits_[0], other->_impl_._has_bits_[0]);
+  _impl_.fieldvalues_.InternalSwap(&other->_impl_.fieldvalues_);
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr::InternalSwap(
+      &_impl_.val_, lhs_arena,
+      &other->_impl_.val_, rhs_arena
+  );
+  ::PROTOBUF_NAMESPACE_ID::internal::memswap<
+      PROTOBUF_FIELD_OFFSET(ScalarString, _impl_.fieldactualchange_)
+      + sizeof(ScalarString::_impl_.fieldactualchange_)
+      - PROTOBUF_FIELD_OFFSET(ScalarString, _impl_.secondsintoyear_)>(
+          reinterpret_cast<char*>(&_impl_.secondsintoyear_),
+          reinterpret_cast<char*>(&other->_impl_.secondsintoyear_));
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata ScalarString::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_getter, &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_once,
+      file_level_metadata_carchive_2fbackend_2fEPICSEvent_2eproto[1]);
+}
+
+// ===================================================================
+
+class ScalarByte::_Internal {
+ public:
+  using HasBits = decltype(std::declval<ScalarByte>()._impl_._has_bits_);
+  static void set_has_secondsintoyear(HasBits* has_bits) {
+    (*has_bits)[0] |= 2u;
+  }
+  static void set_has_nano(HasBits* has_bits) {
+    (*has_bits)[0] |= 4u;
+  }
+  static void set_has_val(HasBits* has_bits) {
+    (*has_bits)[0] |= 1u;
+  }
+  static void set_has_severity(HasBits* has_bits) {
+    (*has_bits)[0] |= 8u;
+  }
+  static void set_has_status(HasBits* has_bits) {
+    (*has_bits)[0] |= 16u;
+  }
+  static void set_has_repeatcount(HasBits* has_bits) {
+    (*has_bits)[0] |= 32u;
+  }
+  static void set_has_fieldactualchange(HasBits* has_bits) {
+    (*has_bits)[0] |= 64u;
+  }
+  static bool MissingRequiredFields(const HasBits& has_bits) {
+    return ((has_bits[0] & 0x00000007) ^ 0x00000007) != 0;
+  }
+};
+
+ScalarByte::ScalarByte(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                         bool is_message_owned)
+  : ::PROTOBUF_NAMESPACE_ID::Message(arena, is_message_owned) {
+  SharedCtor(arena, is_message_owned);
+  // @@protoc_insertion_point(arena_constructor:EPICS.ScalarByte)
+}
+ScalarByte::ScalarByte(const ScalarByte& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message() {
+  ScalarByte* const _this = this; (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){from._impl_._has_bits_}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.fieldvalues_){from._impl_.fieldvalues_}
+    , decltype(_impl_.val_){}
+    , decltype(_impl_.secondsintoyear_){}
+    , decltype(_impl_.nano_){}
+    , decltype(_impl_.severity_){}
+    , decltype(_impl_.status_){}
+    , decltype(_impl_.repeatcount_){}
+    , decltype(_impl_.fieldactualchange_){}};
+
+  _internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+  _impl_.val_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+    _impl_.val_.Set("", GetArenaForAllocation());
+  #endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (from._internal_has_val()) {
+    _this->_impl_.val_.Set(from._internal_val(), 
+      _this->GetArenaForAllocation());
+  }
+  ::memcpy(&_impl_.secondsintoyear_, &from._impl_.secondsintoyear_,
+    static_cast<size_t>(reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+    reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  // @@protoc_insertion_point(copy_constructor:EPICS.ScalarByte)
+}
+
+inline void ScalarByte::SharedCtor(
+    ::_pb::Arena* arena, bool is_message_owned) {
+  (void)arena;
+  (void)is_message_owned;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.fieldvalues_){arena}
+    , decltype(_impl_.val_){}
+    , decltype(_impl_.secondsintoyear_){0u}
+    , decltype(_impl_.nano_){0u}
+    , decltype(_impl_.severity_){0}
+    , decltype(_impl_.status_){0}
+    , decltype(_impl_.repeatcount_){0u}
+    , decltype(_impl_.fieldactualchange_){false}
+  };
+  _impl_.val_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+    _impl_.val_.Set("", GetArenaForAllocation());
+  #endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+}
+
+ScalarByte::~ScalarByte() {
+  // @@protoc_insertion_point(destructor:EPICS.ScalarByte)
+  if (auto *arena = _internal_metadata_.DeleteReturnArena<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>()) {
+  (void)arena;
+    return;
+  }
+  SharedDtor();
+}
+
+inline void ScalarByte::SharedDtor() {
+  GOOGLE_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.fieldvalues_.~RepeatedPtrField();
+  _impl_.val_.Destroy();
+}
+
+void ScalarByte::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+void ScalarByte::Clear() {
+// @@protoc_insertion_point(message_clear_start:EPICS.ScalarByte)
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.fieldvalues_.Clear();
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x00000001u) {
+    _impl_.val_.ClearNonDefaultToEmpty();
+  }
+  if (cached_has_bits & 0x0000007eu) {
+    ::memset(&_impl_.secondsintoyear_, 0, static_cast<size_t>(
+        reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+        reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  }
+  _impl_._has_bits_.Clear();
+  _internal_metadata_.Clear<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+}
+
+const char* ScalarByte::_InternalParse(const char* ptr, ::_pbi::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  _Internal::HasBits has_bits{};
+  while (!ctx->Done(&ptr)) {
+    uint32_t tag;
+    ptr = ::_pbi::ReadTag(ptr, &tag);
+    switch (tag >> 3) {
+      // required uint32 secondsintoyear = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 8)) {
+          _Internal::set_has_secondsintoyear(&has_bits);
+          _impl_.secondsintoyear_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // required uint32 nano = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 16)) {
+          _Internal::set_has_nano(&has_bits);
+          _impl_.nano_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // required bytes val = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 26)) {
+          auto str = _internal_mutable_val();
+          ptr = ::_pbi::InlineGreedyStringParser(str, ptr, ctx);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 severity = 4 [default = 0];
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 32)) {
+          _Internal::set_has_severity(&has_bits);
+          _impl_.severity_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 status = 5 [default = 0];
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 40)) {
+          _Internal::set_has_status(&has_bits);
+          _impl_.status_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional uint32 repeatcount = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 48)) {
+          _Internal::set_has_repeatcount(&has_bits);
+          _impl_.repeatcount_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated .EPICS.FieldValue fieldvalues = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 58)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ctx->ParseMessage(_internal_add_fieldvalues(), ptr);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::ExpectTag<58>(ptr));
+        } else
+          goto handle_unusual;
+        continue;
+      // optional bool fieldactualchange = 8;
+      case 8:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 64)) {
+          _Internal::set_has_fieldactualchange(&has_bits);
+          _impl_.fieldactualchange_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint64(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      default:
+        goto handle_unusual;
+    }  // switch
+  handle_unusual:
+    if ((tag == 0) || ((tag & 7) == 4)) {
+      CHK_(ptr);
+      ctx->SetLastTag(tag);
+      goto message_done;
+    }
+    ptr = UnknownFieldParse(
+        tag,
+        _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(),
+        ptr, ctx);
+    CHK_(ptr != nullptr);
+  }  // while
+message_done:
+  _impl_._has_bits_.Or(has_bits);
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto message_done;
+#undef CHK_
+}
+
+uint8_t* ScalarByte::_InternalSerialize(
+    uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:EPICS.ScalarByte)
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  cached_has_bits = _impl_._has_bits_[0];
+  // required uint32 secondsintoyear = 1;
+  if (cached_has_bits & 0x00000002u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(1, this->_internal_secondsintoyear(), target);
+  }
+
+  // required uint32 nano = 2;
+  if (cached_has_bits & 0x00000004u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(2, this->_internal_nano(), target);
+  }
+
+  // required bytes val = 3;
+  if (cached_has_bits & 0x00000001u) {
+    target = stream->WriteBytesMaybeAliased(
+        3, this->_internal_val(), target);
+  }
+
+  // optional int32 severity = 4 [default = 0];
+  if (cached_has_bits & 0x00000008u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(4, this->_internal_severity(), target);
+  }
+
+  // optional int32 status = 5 [default = 0];
+  if (cached_has_bits & 0x00000010u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(5, this->_internal_status(), target);
+  }
+
+  // optional uint32 repeatcount = 6;
+  if (cached_has_bits & 0x00000020u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(6, this->_internal_repeatcount(), target);
+  }
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_fieldvalues_size()); i < n; i++) {
+    const auto& repfield = this->_internal_fieldvalues(i);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+        InternalWriteMessage(7, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  // optional bool fieldactualchange = 8;
+  if (cached_has_bits & 0x00000040u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteBoolToArray(8, this->_internal_fieldactualchange(), target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target = ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:EPICS.ScalarByte)
+  return target;
+}
+
+size_t ScalarByte::RequiredFieldsByteSizeFallback() const {
+// @@protoc_insertion_point(required_fields_byte_size_fallback_start:EPICS.ScalarByte)
+  size_t total_size = 0;
+
+  if (_internal_has_val()) {
+    // required bytes val = 3;
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::BytesSize(
+        this->_internal_val());
+  }
+
+  if (_internal_has_secondsintoyear()) {
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+  }
+
+  if (_internal_has_nano()) {
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+  }
+
+  return total_size;
+}
+size_t ScalarByte::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:EPICS.ScalarByte)
+  size_t total_size = 0;
+
+  if (((_impl_._has_bits_[0] & 0x00000007) ^ 0x00000007) == 0) {  // All required fields are present.
+    // required bytes val = 3;
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::BytesSize(
+        this->_internal_val());
+
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+
+  } else {
+    total_size += RequiredFieldsByteSizeFallback();
+  }
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  total_size += 1UL * this->_internal_fieldvalues_size();
+  for (const auto& msg : this->_impl_.fieldvalues_) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(msg);
+  }
+
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x00000078u) {
+    // optional int32 severity = 4 [default = 0];
+    if (cached_has_bits & 0x00000008u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_severity());
+    }
+
+    // optional int32 status = 5 [default = 0];
+    if (cached_has_bits & 0x00000010u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_status());
+    }
+
+    // optional uint32 repeatcount = 6;
+    if (cached_has_bits & 0x00000020u) {
+      total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_repeatcount());
+    }
+
+    // optional bool fieldactualchange = 8;
+    if (cached_has_bits & 0x00000040u) {
+      total_size += 1 + 1;
+    }
+
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData ScalarByte::_class_data_ = {
+    ::PROTOBUF_NAMESPACE_ID::Message::CopyWithSourceCheck,
+    ScalarByte::MergeImpl
+};
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*ScalarByte::GetClassData() const { return &_class_data_; }
+
+
+void ScalarByte::MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg) {
+  auto* const _this = static_cast<ScalarByte*>(&to_msg);
+  auto& from = static_cast<const ScalarByte&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:EPICS.ScalarByte)
+  GOOGLE_DCHECK_NE(&from, _this);
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_impl_.fieldvalues_.MergeFrom(from._impl_.fieldvalues_);
+  cached_has_bits = from._impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000007fu) {
+    if (cached_has_bits & 0x00000001u) {
+      _this->_internal_set_val(from._internal_val());
+    }
+    if (cached_has_bits & 0x00000002u) {
+      _this->_impl_.secondsintoyear_ = from._impl_.secondsintoyear_;
+    }
+    if (cached_has_bits & 0x00000004u) {
+      _this->_impl_.nano_ = from._impl_.nano_;
+    }
+    if (cached_has_bits & 0x00000008u) {
+      _this->_impl_.severity_ = from._impl_.severity_;
+    }
+    if (cached_has_bits & 0x00000010u) {
+      _this->_impl_.status_ = from._impl_.status_;
+    }
+    if (cached_has_bits & 0x00000020u) {
+      _this->_impl_.repeatcount_ = from._impl_.repeatcount_;
+    }
+    if (cached_has_bits & 0x00000040u) {
+      _this->_impl_.fieldactualchange_ = from._impl_.fieldactualchange_;
+    }
+    _this->_impl_._has_bits_[0] |= cached_has_bits;
+  }
+  _this->_internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void ScalarByte::CopyFrom(const ScalarByte& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:EPICS.ScalarByte)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool ScalarByte::IsInitialized() const {
+  if (_Internal::MissingRequiredFields(_impl_._has_bits_)) return false;
+  if (!::PROTOBUF_NAMESPACE_ID::internal::AllAreInitialized(_impl_.fieldvalues_))
+    return false;
+  return true;
+}
+
+void ScalarByte::InternalSwap(ScalarByte* other) {
+  using std::swap;
+  auto* lhs_arena = GetArenaForAllocation();
+  auto* rhs_arena = other->GetArenaForAllocation();
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  swap(_impl_._has_bits_[0], other->_impl_._has_bits_[0]);
+  _impl_.fieldvalues_.InternalSwap(&other->_impl_.fieldvalues_);
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr::InternalSwap(
+      &_impl_.val_, lhs_arena,
+      &other->_impl_.val_, rhs_arena
+  );
+  ::PROTOBUF_NAMESPACE_ID::internal::memswap<
+      PROTOBUF_FIELD_OFFSET(ScalarByte, _impl_.fieldactualchange_)
+      + sizeof(ScalarByte::_impl_.fieldactualchange_)
+      - PROTOBUF_FIELD_OFFSET(ScalarByte, _impl_.secondsintoyear_)>(
+          reinterpret_cast<char*>(&_impl_.secondsintoyear_),
+          reinterpret_cast<char*>(&other->_impl_.secondsintoyear_));
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata ScalarByte::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_getter, &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_once,
+      file_level_metadata_carchive_2fbackend_2fEPICSEvent_2eproto[2]);
+}
+
+// ===================================================================
+
+class ScalarShort::_Internal {
+ public:
+  using HasBits = decltype(std::declval<ScalarShort>()._impl_._has_bits_);
+  static void set_has_secondsintoyear(HasBits* has_bits) {
+    (*has_bits)[0] |= 1u;
+  }
+  static void set_has_nano(HasBits* has_bits) {
+    (*has_bits)[0] |= 2u;
+  }
+  static void set_has_val(HasBits* has_bits) {
+    (*has_bits)[0] |= 4u;
+  }
+  static void set_has_severity(HasBits* has_bits) {
+    (*has_bits)[0] |= 8u;
+  }
+  static void set_has_status(HasBits* has_bits) {
+    (*has_bits)[0] |= 16u;
+  }
+  static void set_has_repeatcount(HasBits* has_bits) {
+    (*has_bits)[0] |= 32u;
+  }
+  static void set_has_fieldactualchange(HasBits* has_bits) {
+    (*has_bits)[0] |= 64u;
+  }
+  static bool MissingRequiredFields(const HasBits& has_bits) {
+    return ((has_bits[0] & 0x00000007) ^ 0x00000007) != 0;
+  }
+};
+
+ScalarShort::ScalarShort(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                         bool is_message_owned)
+  : ::PROTOBUF_NAMESPACE_ID::Message(arena, is_message_owned) {
+  SharedCtor(arena, is_message_owned);
+  // @@protoc_insertion_point(arena_constructor:EPICS.ScalarShort)
+}
+ScalarShort::ScalarShort(const ScalarShort& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message() {
+  ScalarShort* const _this = this; (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){from._impl_._has_bits_}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.fieldvalues_){from._impl_.fieldvalues_}
+    , decltype(_impl_.secondsintoyear_){}
+    , decltype(_impl_.nano_){}
+    , decltype(_impl_.val_){}
+    , decltype(_impl_.severity_){}
+    , decltype(_impl_.status_){}
+    , decltype(_impl_.repeatcount_){}
+    , decltype(_impl_.fieldactualchange_){}};
+
+  _internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+  ::memcpy(&_impl_.secondsintoyear_, &from._impl_.secondsintoyear_,
+    static_cast<size_t>(reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+    reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  // @@protoc_insertion_point(copy_constructor:EPICS.ScalarShort)
+}
+
+inline void ScalarShort::SharedCtor(
+    ::_pb::Arena* arena, bool is_message_owned) {
+  (void)arena;
+  (void)is_message_owned;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.fieldvalues_){arena}
+    , decltype(_impl_.secondsintoyear_){0u}
+    , decltype(_impl_.nano_){0u}
+    , decltype(_impl_.val_){0}
+    , decltype(_impl_.severity_){0}
+    , decltype(_impl_.status_){0}
+    , decltype(_impl_.repeatcount_){0u}
+    , decltype(_impl_.fieldactualchange_){false}
+  };
+}
+
+ScalarShort::~ScalarShort() {
+  // @@protoc_insertion_point(destructor:EPICS.ScalarShort)
+  if (auto *arena = _internal_metadata_.DeleteReturnArena<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>()) {
+  (void)arena;
+    return;
+  }
+  SharedDtor();
+}
+
+inline void ScalarShort::SharedDtor() {
+  GOOGLE_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.fieldvalues_.~RepeatedPtrField();
+}
+
+void ScalarShort::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+void ScalarShort::Clear() {
+// @@protoc_insertion_point(message_clear_start:EPICS.ScalarShort)
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.fieldvalues_.Clear();
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000007fu) {
+    ::memset(&_impl_.secondsintoyear_, 0, static_cast<size_t>(
+        reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+        reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  }
+  _impl_._has_bits_.Clear();
+  _internal_metadata_.Clear<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+}
+
+const char* ScalarShort::_InternalParse(const char* ptr, ::_pbi::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  _Internal::HasBits has_bits{};
+  while (!ctx->Done(&ptr)) {
+    uint32_t tag;
+    ptr = ::_pbi::ReadTag(ptr, &tag);
+    switch (tag >> 3) {
+      // required uint32 secondsintoyear = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 8)) {
+          _Internal::set_has_secondsintoyear(&has_bits);
+          _impl_.secondsintoyear_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // required uint32 nano = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 16)) {
+          _Internal::set_has_nano(&has_bits);
+          _impl_.nano_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // required sint32 val = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 24)) {
+          _Internal::set_has_val(&has_bits);
+          _impl_.val_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarintZigZag32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 severity = 4 [default = 0];
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 32)) {
+          _Internal::set_has_severity(&has_bits);
+          _impl_.severity_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 status = 5 [default = 0];
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 40)) {
+          _Internal::set_has_status(&has_bits);
+          _impl_.status_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional uint32 repeatcount = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 48)) {
+          _Internal::set_has_repeatcount(&has_bits);
+          _impl_.repeatcount_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated .EPICS.FieldValue fieldvalues = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 58)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ctx->ParseMessage(_internal_add_fieldvalues(), ptr);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::ExpectTag<58>(ptr));
+        } else
+          goto handle_unusual;
+        continue;
+      // optional bool fieldactualchange = 8;
+      case 8:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 64)) {
+          _Internal::set_has_fieldactualchange(&has_bits);
+          _impl_.fieldactualchange_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint64(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      default:
+        goto handle_unusual;
+    }  // switch
+  handle_unusual:
+    if ((tag == 0) || ((tag & 7) == 4)) {
+      CHK_(ptr);
+      ctx->SetLastTag(tag);
+      goto message_done;
+    }
+    ptr = UnknownFieldParse(
+        tag,
+        _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(),
+        ptr, ctx);
+    CHK_(ptr != nullptr);
+  }  // while
+message_done:
+  _impl_._has_bits_.Or(has_bits);
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto message_done;
+#undef CHK_
+}
+
+uint8_t* ScalarShort::_InternalSerialize(
+    uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:EPICS.ScalarShort)
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  cached_has_bits = _impl_._has_bits_[0];
+  // required uint32 secondsintoyear = 1;
+  if (cached_has_bits & 0x00000001u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(1, this->_internal_secondsintoyear(), target);
+  }
+
+  // required uint32 nano = 2;
+  if (cached_has_bits & 0x00000002u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(2, this->_internal_nano(), target);
+  }
+
+  // required sint32 val = 3;
+  if (cached_has_bits & 0x00000004u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteSInt32ToArray(3, this->_internal_val(), target);
+  }
+
+  // optional int32 severity = 4 [default = 0];
+  if (cached_has_bits & 0x00000008u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(4, this->_internal_severity(), target);
+  }
+
+  // optional int32 status = 5 [default = 0];
+  if (cached_has_bits & 0x00000010u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(5, this->_internal_status(), target);
+  }
+
+  // optional uint32 repeatcount = 6;
+  if (cached_has_bits & 0x00000020u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(6, this->_internal_repeatcount(), target);
+  }
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_fieldvalues_size()); i < n; i++) {
+    const auto& repfield = this->_internal_fieldvalues(i);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+        InternalWriteMessage(7, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  // optional bool fieldactualchange = 8;
+  if (cached_has_bits & 0x00000040u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteBoolToArray(8, this->_internal_fieldactualchange(), target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target = ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:EPICS.ScalarShort)
+  return target;
+}
+
+size_t ScalarShort::RequiredFieldsByteSizeFallback() const {
+// @@protoc_insertion_point(required_fields_byte_size_fallback_start:EPICS.ScalarShort)
+  size_t total_size = 0;
+
+  if (_internal_has_secondsintoyear()) {
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+  }
+
+  if (_internal_has_nano()) {
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+  }
+
+  if (_internal_has_val()) {
+    // required sint32 val = 3;
+    total_size += ::_pbi::WireFormatLite::SInt32SizePlusOne(this->_internal_val());
+  }
+
+  return total_size;
+}
+size_t ScalarShort::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:EPICS.ScalarShort)
+  size_t total_size = 0;
+
+  if (((_impl_._has_bits_[0] & 0x00000007) ^ 0x00000007) == 0) {  // All required fields are present.
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+
+    // required sint32 val = 3;
+    total_size += ::_pbi::WireFormatLite::SInt32SizePlusOne(this->_internal_val());
+
+  } else {
+    total_size += RequiredFieldsByteSizeFallback();
+  }
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  total_size += 1UL * this->_internal_fieldvalues_size();
+  for (const auto& msg : this->_impl_.fieldvalues_) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(msg);
+  }
+
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x00000078u) {
+    // optional int32 severity = 4 [default = 0];
+    if (cached_has_bits & 0x00000008u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_severity());
+    }
+
+    // optional int32 status = 5 [default = 0];
+    if (cached_has_bits & 0x00000010u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_status());
+    }
+
+    // optional uint32 repeatcount = 6;
+    if (cached_has_bits & 0x00000020u) {
+      total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_repeatcount());
+    }
+
+    // optional bool fieldactualchange = 8;
+    if (cached_has_bits & 0x00000040u) {
+      total_size += 1 + 1;
+    }
+
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData ScalarShort::_class_data_ = {
+    ::PROTOBUF_NAMESPACE_ID::Message::CopyWithSourceCheck,
+    ScalarShort::MergeImpl
+};
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*ScalarShort::GetClassData() const { return &_class_data_; }
+
+
+void ScalarShort::MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg) {
+  auto* const _this = static_cast<ScalarShort*>(&to_msg);
+  auto& from = static_cast<const ScalarShort&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:EPICS.ScalarShort)
+  GOOGLE_DCHECK_NE(&from, _this);
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_impl_.fieldvalues_.MergeFrom(from._impl_.fieldvalues_);
+  cached_has_bits = from._impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000007fu) {
+    if (cached_has_bits & 0x00000001u) {
+      _this->_impl_.secondsintoyear_ = from._impl_.secondsintoyear_;
+    }
+    if (cached_has_bits & 0x00000002u) {
+      _this->_impl_.nano_ = from._impl_.nano_;
+    }
+    if (cached_has_bits & 0x00000004u) {
+      _this->_impl_.val_ = from._impl_.val_;
+    }
+    if (cached_has_bits & 0x00000008u) {
+      _this->_impl_.severity_ = from._impl_.severity_;
+    }
+    if (cached_has_bits & 0x00000010u) {
+      _this->_impl_.status_ = from._impl_.status_;
+    }
+    if (cached_has_bits & 0x00000020u) {
+      _this->_impl_.repeatcount_ = from._impl_.repeatcount_;
+    }
+    if (cached_has_bits & 0x00000040u) {
+      _this->_impl_.fieldactualchange_ = from._impl_.fieldactualchange_;
+    }
+    _this->_impl_._has_bits_[0] |= cached_has_bits;
+  }
+  _this->_internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void ScalarShort::CopyFrom(const ScalarShort& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:EPICS.ScalarShort)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool ScalarShort::IsInitialized() const {
+  if (_Internal::MissingRequiredFields(_impl_._has_bits_)) return false;
+  if (!::PROTOBUF_NAMESPACE_ID::internal::AllAreInitialized(_impl_.fieldvalues_))
+    return false;
+  return true;
+}
+
+void ScalarShort::InternalSwap(ScalarShort* other) {
+  using std::swap;
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  swap(_impl_._has_bits_[0], other->_impl_._has_bits_[0]);
+  _impl_.fieldvalues_.InternalSwap(&other->_impl_.fieldvalues_);
+  ::PROTOBUF_NAMESPACE_ID::internal::memswap<
+      PROTOBUF_FIELD_OFFSET(ScalarShort, _impl_.fieldactualchange_)
+      + sizeof(ScalarShort::_impl_.fieldactualchange_)
+      - PROTOBUF_FIELD_OFFSET(ScalarShort, _impl_.secondsintoyear_)>(
+          reinterpret_cast<char*>(&_impl_.secondsintoyear_),
+          reinterpret_cast<char*>(&other->_impl_.secondsintoyear_));
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata ScalarShort::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_getter, &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_once,
+      file_level_metadata_carchive_2fbackend_2fEPICSEvent_2eproto[3]);
+}
+
+// ===================================================================
+
+class ScalarInt::_Internal {
+ public:
+  using HasBits = decltype(std::declval<ScalarInt>()._impl_._has_bits_);
+  static void set_has_secondsintoyear(HasBits* has_bits) {
+    (*has_bits)[0] |= 1u;
+  }
+  static void set_has_nano(HasBits* has_bits) {
+    (*has_bits)[0] |= 2u;
+  }
+  static void set_has_val(HasBits* has_bits) {
+    (*has_bits)[0] |= 4u;
+  }
+  static void set_has_severity(HasBits* has_bits) {
+    (*has_bits)[0] |= 8u;
+  }
+  static void set_has_status(HasBits* has_bits) {
+    (*has_bits)[0] |= 16u;
+  }
+  static void set_has_repeatcount(HasBits* has_bits) {
+    (*has_bits)[0] |= 32u;
+  }
+  static void set_has_fieldactualchange(HasBits* has_bits) {
+    (*has_bits)[0] |= 64u;
+  }
+  static bool MissingRequiredFields(const HasBits& has_bits) {
+    return ((has_bits[0] & 0x00000007) ^ 0x00000007) != 0;
+  }
+};
+
+ScalarInt::ScalarInt(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                         bool is_message_owned)
+  : ::PROTOBUF_NAMESPACE_ID::Message(arena, is_message_owned) {
+  SharedCtor(arena, is_message_owned);
+  // @@protoc_insertion_point(arena_constructor:EPICS.ScalarInt)
+}
+ScalarInt::ScalarInt(const ScalarInt& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message() {
+  ScalarInt* const _this = this; (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){from._impl_._has_bits_}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.fieldvalues_){from._impl_.fieldvalues_}
+    , decltype(_impl_.secondsintoyear_){}
+    , decltype(_impl_.nano_){}
+    , decltype(_impl_.val_){}
+    , decltype(_impl_.severity_){}
+    , decltype(_impl_.status_){}
+    , decltype(_impl_.repeatcount_){}
+    , decltype(_impl_.fieldactualchange_){}};
+
+  _internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+  ::memcpy(&_impl_.secondsintoyear_, &from._impl_.secondsintoyear_,
+    static_cast<size_t>(reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+    reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  // @@protoc_insertion_point(copy_constructor:EPICS.ScalarInt)
+}
+
+inline void ScalarInt::SharedCtor(
+    ::_pb::Arena* arena, bool is_message_owned) {
+  (void)arena;
+  (void)is_message_owned;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.fieldvalues_){arena}
+    , decltype(_impl_.secondsintoyear_){0u}
+    , decltype(_impl_.nano_){0u}
+    , decltype(_impl_.val_){0}
+    , decltype(_impl_.severity_){0}
+    , decltype(_impl_.status_){0}
+    , decltype(_impl_.repeatcount_){0u}
+    , decltype(_impl_.fieldactualchange_){false}
+  };
+}
+
+ScalarInt::~ScalarInt() {
+  // @@protoc_insertion_point(destructor:EPICS.ScalarInt)
+  if (auto *arena = _internal_metadata_.DeleteReturnArena<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>()) {
+  (void)arena;
+    return;
+  }
+  SharedDtor();
+}
+
+inline void ScalarInt::SharedDtor() {
+  GOOGLE_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.fieldvalues_.~RepeatedPtrField();
+}
+
+void ScalarInt::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+void ScalarInt::Clear() {
+// @@protoc_insertion_point(message_clear_start:EPICS.ScalarInt)
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.fieldvalues_.Clear();
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000007fu) {
+    ::memset(&_impl_.secondsintoyear_, 0, static_cast<size_t>(
+        reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+        reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  }
+  _impl_._has_bits_.Clear();
+  _internal_metadata_.Clear<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+}
+
+const char* ScalarInt::_InternalParse(const char* ptr, ::_pbi::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  _Internal::HasBits has_bits{};
+  while (!ctx->Done(&ptr)) {
+    uint32_t tag;
+    ptr = ::_pbi::ReadTag(ptr, &tag);
+    switch (tag >> 3) {
+      // required uint32 secondsintoyear = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 8)) {
+          _Internal::set_has_secondsintoyear(&has_bits);
+          _impl_.secondsintoyear_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // required uint32 nano = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 16)) {
+          _Internal::set_has_nano(&has_bits);
+          _impl_.nano_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // required sfixed32 val = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 29)) {
+          _Internal::set_has_val(&has_bits);
+          _impl_.val_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<int32_t>(ptr);
+          ptr += sizeof(int32_t);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 severity = 4 [default = 0];
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 32)) {
+          _Internal::set_has_severity(&has_bits);
+          _impl_.severity_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 status = 5 [default = 0];
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 40)) {
+          _Internal::set_has_status(&has_bits);
+          _impl_.status_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional uint32 repeatcount = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 48)) {
+          _Internal::set_has_repeatcount(&has_bits);
+          _impl_.repeatcount_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated .EPICS.FieldValue fieldvalues = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 58)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ctx->ParseMessage(_internal_add_fieldvalues(), ptr);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::ExpectTag<58>(ptr));
+        } else
+          goto handle_unusual;
+        continue;
+      // optional bool fieldactualchange = 8;
+      case 8:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 64)) {
+          _Internal::set_has_fieldactualchange(&has_bits);
+          _impl_.fieldactualchange_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint64(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      default:
+        goto handle_unusual;
+    }  // switch
+  handle_unusual:
+    if ((tag == 0) || ((tag & 7) == 4)) {
+      CHK_(ptr);
+      ctx->SetLastTag(tag);
+      goto message_done;
+    }
+    ptr = UnknownFieldParse(
+        tag,
+        _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(),
+        ptr, ctx);
+    CHK_(ptr != nullptr);
+  }  // while
+message_done:
+  _impl_._has_bits_.Or(has_bits);
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto message_done;
+#undef CHK_
+}
+
+uint8_t* ScalarInt::_InternalSerialize(
+    uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:EPICS.ScalarInt)
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  cached_has_bits = _impl_._has_bits_[0];
+  // required uint32 secondsintoyear = 1;
+  if (cached_has_bits & 0x00000001u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(1, this->_internal_secondsintoyear(), target);
+  }
+
+  // required uint32 nano = 2;
+  if (cached_has_bits & 0x00000002u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(2, this->_internal_nano(), target);
+  }
+
+  // required sfixed32 val = 3;
+  if (cached_has_bits & 0x00000004u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteSFixed32ToArray(3, this->_internal_val(), target);
+  }
+
+  // optional int32 severity = 4 [default = 0];
+  if (cached_has_bits & 0x00000008u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(4, this->_internal_severity(), target);
+  }
+
+  // optional int32 status = 5 [default = 0];
+  if (cached_has_bits & 0x00000010u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(5, this->_internal_status(), target);
+  }
+
+  // optional uint32 repeatcount = 6;
+  if (cached_has_bits & 0x00000020u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(6, this->_internal_repeatcount(), target);
+  }
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_fieldvalues_size()); i < n; i++) {
+    const auto& repfield = this->_internal_fieldvalues(i);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+        InternalWriteMessage(7, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  // optional bool fieldactualchange = 8;
+  if (cached_has_bits & 0x00000040u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteBoolToArray(8, this->_internal_fieldactualchange(), target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target = ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:EPICS.ScalarInt)
+  return target;
+}
+
+size_t ScalarInt::RequiredFieldsByteSizeFallback() const {
+// @@protoc_insertion_point(required_fields_byte_size_fallback_start:EPICS.ScalarInt)
+  size_t total_size = 0;
+
+  if (_internal_has_secondsintoyear()) {
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+  }
+
+  if (_internal_has_nano()) {
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+  }
+
+  if (_internal_has_val()) {
+    // required sfixed32 val = 3;
+    total_size += 1 + 4;
+  }
+
+  return total_size;
+}
+size_t ScalarInt::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:EPICS.ScalarInt)
+  size_t total_size = 0;
+
+  if (((_impl_._has_bits_[0] & 0x00000007) ^ 0x00000007) == 0) {  // All required fields are present.
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+
+    // required sfixed32 val = 3;
+    total_size += 1 + 4;
+
+  } else {
+    total_size += RequiredFieldsByteSizeFallback();
+  }
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  total_size += 1UL * this->_internal_fieldvalues_size();
+  for (const auto& msg : this->_impl_.fieldvalues_) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(msg);
+  }
+
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x00000078u) {
+    // optional int32 severity = 4 [default = 0];
+    if (cached_has_bits & 0x00000008u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_severity());
+    }
+
+    // optional int32 status = 5 [default = 0];
+    if (cached_has_bits & 0x00000010u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_status());
+    }
+
+    // optional uint32 repeatcount = 6;
+    if (cached_has_bits & 0x00000020u) {
+      total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_repeatcount());
+    }
+
+    // optional bool fieldactualchange = 8;
+    if (cached_has_bits & 0x00000040u) {
+      total_size += 1 + 1;
+    }
+
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData ScalarInt::_class_data_ = {
+    ::PROTOBUF_NAMESPACE_ID::Message::CopyWithSourceCheck,
+    ScalarInt::MergeImpl
+};
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*ScalarInt::GetClassData() const { return &_class_data_; }
+
+
+void ScalarInt::MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg) {
+  auto* const _this = static_cast<ScalarInt*>(&to_msg);
+  auto& from = static_cast<const ScalarInt&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:EPICS.ScalarInt)
+  GOOGLE_DCHECK_NE(&from, _this);
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_impl_.fieldvalues_.MergeFrom(from._impl_.fieldvalues_);
+  cached_has_bits = from._impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000007fu) {
+    if (cached_has_bits & 0x00000001u) {
+      _this->_impl_.secondsintoyear_ = from._impl_.secondsintoyear_;
+    }
+    if (cached_has_bits & 0x00000002u) {
+      _this->_impl_.nano_ = from._impl_.nano_;
+    }
+    if (cached_has_bits & 0x00000004u) {
+      _this->_impl_.val_ = from._impl_.val_;
+    }
+    if (cached_has_bits & 0x00000008u) {
+      _this->_impl_.severity_ = from._impl_.severity_;
+    }
+    if (cached_has_bits & 0x00000010u) {
+      _this->_impl_.status_ = from._impl_.status_;
+    }
+    if (cached_has_bits & 0x00000020u) {
+      _this->_impl_.repeatcount_ = from._impl_.repeatcount_;
+    }
+    if (cached_has_bits & 0x00000040u) {
+      _this->_impl_.fieldactualchange_ = from._impl_.fieldactualchange_;
+    }
+    _this->_impl_._has_bits_[0] |= cached_has_bits;
+  }
+  _this->_internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void ScalarInt::CopyFrom(const ScalarInt& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:EPICS.ScalarInt)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool ScalarInt::IsInitialized() const {
+  if (_Internal::MissingRequiredFields(_impl_._has_bits_)) return false;
+  if (!::PROTOBUF_NAMESPACE_ID::internal::AllAreInitialized(_impl_.fieldvalues_))
+    return false;
+  return true;
+}
+
+void ScalarInt::InternalSwap(ScalarInt* other) {
+  using std::swap;
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  swap(_impl_._has_bits_[0], other->_impl_._has_bits_[0]);
+  _impl_.fieldvalues_.InternalSwap(&other->_impl_.fieldvalues_);
+  ::PROTOBUF_NAMESPACE_ID::internal::memswap<
+      PROTOBUF_FIELD_OFFSET(ScalarInt, _impl_.fieldactualchange_)
+      + sizeof(ScalarInt::_impl_.fieldactualchange_)
+      - PROTOBUF_FIELD_OFFSET(ScalarInt, _impl_.secondsintoyear_)>(
+          reinterpret_cast<char*>(&_impl_.secondsintoyear_),
+          reinterpret_cast<char*>(&other->_impl_.secondsintoyear_));
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata ScalarInt::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_getter, &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_once,
+      file_level_metadata_carchive_2fbackend_2fEPICSEvent_2eproto[4]);
+}
+
+// ===================================================================
+
+class ScalarEnum::_Internal {
+ public:
+  using HasBits = decltype(std::declval<ScalarEnum>()._impl_._has_bits_);
+  static void set_has_secondsintoyear(HasBits* has_bits) {
+    (*has_bits)[0] |= 1u;
+  }
+  static void set_has_nano(HasBits* has_bits) {
+    (*has_bits)[0] |= 2u;
+  }
+  static void set_has_val(HasBits* has_bits) {
+    (*has_bits)[0] |= 4u;
+  }
+  static void set_has_severity(HasBits* has_bits) {
+    (*has_bits)[0] |= 8u;
+  }
+  static void set_has_status(HasBits* has_bits) {
+    (*has_bits)[0] |= 16u;
+  }
+  static void set_has_repeatcount(HasBits* has_bits) {
+    (*has_bits)[0] |= 32u;
+  }
+  static void set_has_fieldactualchange(HasBits* has_bits) {
+    (*has_bits)[0] |= 64u;
+  }
+  static bool MissingRequiredFields(const HasBits& has_bits) {
+    return ((has_bits[0] & 0x00000007) ^ 0x00000007) != 0;
+  }
+};
+
+ScalarEnum::ScalarEnum(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                         bool is_message_owned)
+  : ::PROTOBUF_NAMESPACE_ID::Message(arena, is_message_owned) {
+  SharedCtor(arena, is_message_owned);
+  // @@protoc_insertion_point(arena_constructor:EPICS.ScalarEnum)
+}
+ScalarEnum::ScalarEnum(const ScalarEnum& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message() {
+  ScalarEnum* const _this = this; (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){from._impl_._has_bits_}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.fieldvalues_){from._impl_.fieldvalues_}
+    , decltype(_impl_.secondsintoyear_){}
+    , decltype(_impl_.nano_){}
+    , decltype(_impl_.val_){}
+    , decltype(_impl_.severity_){}
+    , decltype(_impl_.status_){}
+    , decltype(_impl_.repeatcount_){}
+    , decltype(_impl_.fieldactualchange_){}};
+
+  _internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+  ::memcpy(&_impl_.secondsintoyear_, &from._impl_.secondsintoyear_,
+    static_cast<size_t>(reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+    reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  // @@protoc_insertion_point(copy_constructor:EPICS.ScalarEnum)
+}
+
+inline void ScalarEnum::SharedCtor(
+    ::_pb::Arena* arena, bool is_message_owned) {
+  (void)arena;
+  (void)is_message_owned;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.fieldvalues_){arena}
+    , decltype(_impl_.secondsintoyear_){0u}
+    , decltype(_impl_.nano_){0u}
+    , decltype(_impl_.val_){0}
+    , decltype(_impl_.severity_){0}
+    , decltype(_impl_.status_){0}
+    , decltype(_impl_.repeatcount_){0u}
+    , decltype(_impl_.fieldactualchange_){false}
+  };
+}
+
+ScalarEnum::~ScalarEnum() {
+  // @@protoc_insertion_point(destructor:EPICS.ScalarEnum)
+  if (auto *arena = _internal_metadata_.DeleteReturnArena<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>()) {
+  (void)arena;
+    return;
+  }
+  SharedDtor();
+}
+
+inline void ScalarEnum::SharedDtor() {
+  GOOGLE_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.fieldvalues_.~RepeatedPtrField();
+}
+
+void ScalarEnum::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+void ScalarEnum::Clear() {
+// @@protoc_insertion_point(message_clear_start:EPICS.ScalarEnum)
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.fieldvalues_.Clear();
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000007fu) {
+    ::memset(&_impl_.secondsintoyear_, 0, static_cast<size_t>(
+        reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+        reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  }
+  _impl_._has_bits_.Clear();
+  _internal_metadata_.Clear<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+}
+
+const char* ScalarEnum::_InternalParse(const char* ptr, ::_pbi::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  _Internal::HasBits has_bits{};
+  while (!ctx->Done(&ptr)) {
+    uint32_t tag;
+    ptr = ::_pbi::ReadTag(ptr, &tag);
+    switch (tag >> 3) {
+      // required uint32 secondsintoyear = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 8)) {
+          _Internal::set_has_secondsintoyear(&has_bits);
+          _impl_.secondsintoyear_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // required uint32 nano = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 16)) {
+          _Internal::set_has_nano(&has_bits);
+          _impl_.nano_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // required sint32 val = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 24)) {
+          _Internal::set_has_val(&has_bits);
+          _impl_.val_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarintZigZag32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 severity = 4 [default = 0];
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 32)) {
+          _Internal::set_has_severity(&has_bits);
+          _impl_.severity_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 status = 5 [default = 0];
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 40)) {
+          _Internal::set_has_status(&has_bits);
+          _impl_.status_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional uint32 repeatcount = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 48)) {
+          _Internal::set_has_repeatcount(&has_bits);
+          _impl_.repeatcount_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated .EPICS.FieldValue fieldvalues = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 58)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ctx->ParseMessage(_internal_add_fieldvalues(), ptr);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::ExpectTag<58>(ptr));
+        } else
+          goto handle_unusual;
+        continue;
+      // optional bool fieldactualchange = 8;
+      case 8:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 64)) {
+          _Internal::set_has_fieldactualchange(&has_bits);
+          _impl_.fieldactualchange_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint64(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      default:
+        goto handle_unusual;
+    }  // switch
+  handle_unusual:
+    if ((tag == 0) || ((tag & 7) == 4)) {
+      CHK_(ptr);
+      ctx->SetLastTag(tag);
+      goto message_done;
+    }
+    ptr = UnknownFieldParse(
+        tag,
+        _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(),
+        ptr, ctx);
+    CHK_(ptr != nullptr);
+  }  // while
+message_done:
+  _impl_._has_bits_.Or(has_bits);
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto message_done;
+#undef CHK_
+}
+
+uint8_t* ScalarEnum::_InternalSerialize(
+    uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:EPICS.ScalarEnum)
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  cached_has_bits = _impl_._has_bits_[0];
+  // required uint32 secondsintoyear = 1;
+  if (cached_has_bits & 0x00000001u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(1, this->_internal_secondsintoyear(), target);
+  }
+
+  // required uint32 nano = 2;
+  if (cached_has_bits & 0x00000002u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(2, this->_internal_nano(), target);
+  }
+
+  // required sint32 val = 3;
+  if (cached_has_bits & 0x00000004u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteSInt32ToArray(3, this->_internal_val(), target);
+  }
+
+  // optional int32 severity = 4 [default = 0];
+  if (cached_has_bits & 0x00000008u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(4, this->_internal_severity(), target);
+  }
+
+  // optional int32 status = 5 [default = 0];
+  if (cached_has_bits & 0x00000010u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(5, this->_internal_status(), target);
+  }
+
+  // optional uint32 repeatcount = 6;
+  if (cached_has_bits & 0x00000020u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(6, this->_internal_repeatcount(), target);
+  }
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_fieldvalues_size()); i < n; i++) {
+    const auto& repfield = this->_internal_fieldvalues(i);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+        InternalWriteMessage(7, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  // optional bool fieldactualchange = 8;
+  if (cached_has_bits & 0x00000040u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteBoolToArray(8, this->_internal_fieldactualchange(), target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target = ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:EPICS.ScalarEnum)
+  return target;
+}
+
+size_t ScalarEnum::RequiredFieldsByteSizeFallback() const {
+// @@protoc_insertion_point(required_fields_byte_size_fallback_start:EPICS.ScalarEnum)
+  size_t total_size = 0;
+
+  if (_internal_has_secondsintoyear()) {
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+  }
+
+  if (_internal_has_nano()) {
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+  }
+
+  if (_internal_has_val()) {
+    // required sint32 val = 3;
+    total_size += ::_pbi::WireFormatLite::SInt32SizePlusOne(this->_internal_val());
+  }
+
+  return total_size;
+}
+size_t ScalarEnum::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:EPICS.ScalarEnum)
+  size_t total_size = 0;
+
+  if (((_impl_._has_bits_[0] & 0x00000007) ^ 0x00000007) == 0) {  // All required fields are present.
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+
+    // required sint32 val = 3;
+    total_size += ::_pbi::WireFormatLite::SInt32SizePlusOne(this->_internal_val());
+
+  } else {
+    total_size += RequiredFieldsByteSizeFallback();
+  }
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  total_size += 1UL * this->_internal_fieldvalues_size();
+  for (const auto& msg : this->_impl_.fieldvalues_) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(msg);
+  }
+
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x00000078u) {
+    // optional int32 severity = 4 [default = 0];
+    if (cached_has_bits & 0x00000008u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_severity());
+    }
+
+    // optional int32 status = 5 [default = 0];
+    if (cached_has_bits & 0x00000010u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_status());
+    }
+
+    // optional uint32 repeatcount = 6;
+    if (cached_has_bits & 0x00000020u) {
+      total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_repeatcount());
+    }
+
+    // optional bool fieldactualchange = 8;
+    if (cached_has_bits & 0x00000040u) {
+      total_size += 1 + 1;
+    }
+
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData ScalarEnum::_class_data_ = {
+    ::PROTOBUF_NAMESPACE_ID::Message::CopyWithSourceCheck,
+    ScalarEnum::MergeImpl
+};
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*ScalarEnum::GetClassData() const { return &_class_data_; }
+
+
+void ScalarEnum::MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg) {
+  auto* const _this = static_cast<ScalarEnum*>(&to_msg);
+  auto& from = static_cast<const ScalarEnum&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:EPICS.ScalarEnum)
+  GOOGLE_DCHECK_NE(&from, _this);
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_impl_.fieldvalues_.MergeFrom(from._impl_.fieldvalues_);
+  cached_has_bits = from._impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000007fu) {
+    if (cached_has_bits & 0x00000001u) {
+      _this->_impl_.secondsintoyear_ = from._impl_.secondsintoyear_;
+    }
+    if (cached_has_bits & 0x00000002u) {
+      _this->_impl_.nano_ = from._impl_.nano_;
+    }
+    if (cached_has_bits & 0x00000004u) {
+      _this->_impl_.val_ = from._impl_.val_;
+    }
+    if (cached_has_bits & 0x00000008u) {
+      _this->_impl_.severity_ = from._impl_.severity_;
+    }
+    if (cached_has_bits & 0x00000010u) {
+      _this->_impl_.status_ = from._impl_.status_;
+    }
+    if (cached_has_bits & 0x00000020u) {
+      _this->_impl_.repeatcount_ = from._impl_.repeatcount_;
+    }
+    if (cached_has_bits & 0x00000040u) {
+      _this->_impl_.fieldactualchange_ = from._impl_.fieldactualchange_;
+    }
+    _this->_impl_._has_bits_[0] |= cached_has_bits;
+  }
+  _this->_internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void ScalarEnum::CopyFrom(const ScalarEnum& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:EPICS.ScalarEnum)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool ScalarEnum::IsInitialized() const {
+  if (_Internal::MissingRequiredFields(_impl_._has_bits_)) return false;
+  if (!::PROTOBUF_NAMESPACE_ID::internal::AllAreInitialized(_impl_.fieldvalues_))
+    return false;
+  return true;
+}
+
+void ScalarEnum::InternalSwap(ScalarEnum* other) {
+  using std::swap;
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  swap(_impl_._has_bits_[0], other->_impl_._has_bits_[0]);
+  _impl_.fieldvalues_.InternalSwap(&other->_impl_.fieldvalues_);
+  ::PROTOBUF_NAMESPACE_ID::internal::memswap<
+      PROTOBUF_FIELD_OFFSET(ScalarEnum, _impl_.fieldactualchange_)
+      + sizeof(ScalarEnum::_impl_.fieldactualchange_)
+      - PROTOBUF_FIELD_OFFSET(ScalarEnum, _impl_.secondsintoyear_)>(
+          reinterpret_cast<char*>(&_impl_.secondsintoyear_),
+          reinterpret_cast<char*>(&other->_impl_.secondsintoyear_));
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata ScalarEnum::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_getter, &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_once,
+      file_level_metadata_carchive_2fbackend_2fEPICSEvent_2eproto[5]);
+}
+
+// ===================================================================
+
+class ScalarFloat::_Internal {
+ public:
+  using HasBits = decltype(std::declval<ScalarFloat>()._impl_._has_bits_);
+  static void set_has_secondsintoyear(HasBits* has_bits) {
+    (*has_bits)[0] |= 1u;
+  }
+  static void set_has_nano(HasBits* has_bits) {
+    (*has_bits)[0] |= 2u;
+  }
+  static void set_has_val(HasBits* has_bits) {
+    (*has_bits)[0] |= 4u;
+  }
+  static void set_has_severity(HasBits* has_bits) {
+    (*has_bits)[0] |= 8u;
+  }
+  static void set_has_status(HasBits* has_bits) {
+    (*has_bits)[0] |= 16u;
+  }
+  static void set_has_repeatcount(HasBits* has_bits) {
+    (*has_bits)[0] |= 32u;
+  }
+  static void set_has_fieldactualchange(HasBits* has_bits) {
+    (*has_bits)[0] |= 64u;
+  }
+  static bool MissingRequiredFields(const HasBits& has_bits) {
+    return ((has_bits[0] & 0x00000007) ^ 0x00000007) != 0;
+  }
+};
+
+ScalarFloat::ScalarFloat(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                         bool is_message_owned)
+  : ::PROTOBUF_NAMESPACE_ID::Message(arena, is_message_owned) {
+  SharedCtor(arena, is_message_owned);
+  // @@protoc_insertion_point(arena_constructor:EPICS.ScalarFloat)
+}
+ScalarFloat::ScalarFloat(const ScalarFloat& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message() {
+  ScalarFloat* const _this = this; (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){from._impl_._has_bits_}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.fieldvalues_){from._impl_.fieldvalues_}
+    , decltype(_impl_.secondsintoyear_){}
+    , decltype(_impl_.nano_){}
+    , decltype(_impl_.val_){}
+    , decltype(_impl_.severity_){}
+    , decltype(_impl_.status_){}
+    , decltype(_impl_.repeatcount_){}
+    , decltype(_impl_.fieldactualchange_){}};
+
+  _internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+  ::memcpy(&_impl_.secondsintoyear_, &from._impl_.secondsintoyear_,
+    static_cast<size_t>(reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+    reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  // @@protoc_insertion_point(copy_constructor:EPICS.ScalarFloat)
+}
+
+inline void ScalarFloat::SharedCtor(
+    ::_pb::Arena* arena, bool is_message_owned) {
+  (void)arena;
+  (void)is_message_owned;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.fieldvalues_){arena}
+    , decltype(_impl_.secondsintoyear_){0u}
+    , decltype(_impl_.nano_){0u}
+    , decltype(_impl_.val_){0}
+    , decltype(_impl_.severity_){0}
+    , decltype(_impl_.status_){0}
+    , decltype(_impl_.repeatcount_){0u}
+    , decltype(_impl_.fieldactualchange_){false}
+  };
+}
+
+ScalarFloat::~ScalarFloat() {
+  // @@protoc_insertion_point(destructor:EPICS.ScalarFloat)
+  if (auto *arena = _internal_metadata_.DeleteReturnArena<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>()) {
+  (void)arena;
+    return;
+  }
+  SharedDtor();
+}
+
+inline void ScalarFloat::SharedDtor() {
+  GOOGLE_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.fieldvalues_.~RepeatedPtrField();
+}
+
+void ScalarFloat::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+void ScalarFloat::Clear() {
+// @@protoc_insertion_point(message_clear_start:EPICS.ScalarFloat)
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.fieldvalues_.Clear();
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000007fu) {
+    ::memset(&_impl_.secondsintoyear_, 0, static_cast<size_t>(
+        reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+        reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  }
+  _impl_._has_bits_.Clear();
+  _internal_metadata_.Clear<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+}
+
+const char* ScalarFloat::_InternalParse(const char* ptr, ::_pbi::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  _Internal::HasBits has_bits{};
+  while (!ctx->Done(&ptr)) {
+    uint32_t tag;
+    ptr = ::_pbi::ReadTag(ptr, &tag);
+    switch (tag >> 3) {
+      // required uint32 secondsintoyear = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 8)) {
+          _Internal::set_has_secondsintoyear(&has_bits);
+          _impl_.secondsintoyear_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // required uint32 nano = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 16)) {
+          _Internal::set_has_nano(&has_bits);
+          _impl_.nano_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // required float val = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 29)) {
+          _Internal::set_has_val(&has_bits);
+          _impl_.val_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<float>(ptr);
+          ptr += sizeof(float);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 severity = 4 [default = 0];
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 32)) {
+          _Internal::set_has_severity(&has_bits);
+          _impl_.severity_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 status = 5 [default = 0];
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 40)) {
+          _Internal::set_has_status(&has_bits);
+          _impl_.status_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional uint32 repeatcount = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 48)) {
+          _Internal::set_has_repeatcount(&has_bits);
+          _impl_.repeatcount_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated .EPICS.FieldValue fieldvalues = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 58)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ctx->ParseMessage(_internal_add_fieldvalues(), ptr);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::ExpectTag<58>(ptr));
+        } else
+          goto handle_unusual;
+        continue;
+      // optional bool fieldactualchange = 8;
+      case 8:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 64)) {
+          _Internal::set_has_fieldactualchange(&has_bits);
+          _impl_.fieldactualchange_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint64(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      default:
+        goto handle_unusual;
+    }  // switch
+  handle_unusual:
+    if ((tag == 0) || ((tag & 7) == 4)) {
+      CHK_(ptr);
+      ctx->SetLastTag(tag);
+      goto message_done;
+    }
+    ptr = UnknownFieldParse(
+        tag,
+        _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(),
+        ptr, ctx);
+    CHK_(ptr != nullptr);
+  }  // while
+message_done:
+  _impl_._has_bits_.Or(has_bits);
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto message_done;
+#undef CHK_
+}
+
+uint8_t* ScalarFloat::_InternalSerialize(
+    uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:EPICS.ScalarFloat)
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  cached_has_bits = _impl_._has_bits_[0];
+  // required uint32 secondsintoyear = 1;
+  if (cached_has_bits & 0x00000001u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(1, this->_internal_secondsintoyear(), target);
+  }
+
+  // required uint32 nano = 2;
+  if (cached_has_bits & 0x00000002u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(2, this->_internal_nano(), target);
+  }
+
+  // required float val = 3;
+  if (cached_has_bits & 0x00000004u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteFloatToArray(3, this->_internal_val(), target);
+  }
+
+  // optional int32 severity = 4 [default = 0];
+  if (cached_has_bits & 0x00000008u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(4, this->_internal_severity(), target);
+  }
+
+  // optional int32 status = 5 [default = 0];
+  if (cached_has_bits & 0x00000010u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(5, this->_internal_status(), target);
+  }
+
+  // optional uint32 repeatcount = 6;
+  if (cached_has_bits & 0x00000020u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(6, this->_internal_repeatcount(), target);
+  }
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_fieldvalues_size()); i < n; i++) {
+    const auto& repfield = this->_internal_fieldvalues(i);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+        InternalWriteMessage(7, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  // optional bool fieldactualchange = 8;
+  if (cached_has_bits & 0x00000040u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteBoolToArray(8, this->_internal_fieldactualchange(), target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target = ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:EPICS.ScalarFloat)
+  return target;
+}
+
+size_t ScalarFloat::RequiredFieldsByteSizeFallback() const {
+// @@protoc_insertion_point(required_fields_byte_size_fallback_start:EPICS.ScalarFloat)
+  size_t total_size = 0;
+
+  if (_internal_has_secondsintoyear()) {
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+  }
+
+  if (_internal_has_nano()) {
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+  }
+
+  if (_internal_has_val()) {
+    // required float val = 3;
+    total_size += 1 + 4;
+  }
+
+  return total_size;
+}
+size_t ScalarFloat::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:EPICS.ScalarFloat)
+  size_t total_size = 0;
+
+  if (((_impl_._has_bits_[0] & 0x00000007) ^ 0x00000007) == 0) {  // All required fields are present.
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+
+    // required float val = 3;
+    total_size += 1 + 4;
+
+  } else {
+    total_size += RequiredFieldsByteSizeFallback();
+  }
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  total_size += 1UL * this->_internal_fieldvalues_size();
+  for (const auto& msg : this->_impl_.fieldvalues_) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(msg);
+  }
+
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x00000078u) {
+    // optional int32 severity = 4 [default = 0];
+    if (cached_has_bits & 0x00000008u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_severity());
+    }
+
+    // optional int32 status = 5 [default = 0];
+    if (cached_has_bits & 0x00000010u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_status());
+    }
+
+    // optional uint32 repeatcount = 6;
+    if (cached_has_bits & 0x00000020u) {
+      total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_repeatcount());
+    }
+
+    // optional bool fieldactualchange = 8;
+    if (cached_has_bits & 0x00000040u) {
+      total_size += 1 + 1;
+    }
+
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData ScalarFloat::_class_data_ = {
+    ::PROTOBUF_NAMESPACE_ID::Message::CopyWithSourceCheck,
+    ScalarFloat::MergeImpl
+};
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*ScalarFloat::GetClassData() const { return &_class_data_; }
+
+
+void ScalarFloat::MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg) {
+  auto* const _this = static_cast<ScalarFloat*>(&to_msg);
+  auto& from = static_cast<const ScalarFloat&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:EPICS.ScalarFloat)
+  GOOGLE_DCHECK_NE(&from, _this);
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_impl_.fieldvalues_.MergeFrom(from._impl_.fieldvalues_);
+  cached_has_bits = from._impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000007fu) {
+    if (cached_has_bits & 0x00000001u) {
+      _this->_impl_.secondsintoyear_ = from._impl_.secondsintoyear_;
+    }
+    if (cached_has_bits & 0x00000002u) {
+      _this->_impl_.nano_ = from._impl_.nano_;
+    }
+    if (cached_has_bits & 0x00000004u) {
+      _this->_impl_.val_ = from._impl_.val_;
+    }
+    if (cached_has_bits & 0x00000008u) {
+      _this->_impl_.severity_ = from._impl_.severity_;
+    }
+    if (cached_has_bits & 0x00000010u) {
+      _this->_impl_.status_ = from._impl_.status_;
+    }
+    if (cached_has_bits & 0x00000020u) {
+      _this->_impl_.repeatcount_ = from._impl_.repeatcount_;
+    }
+    if (cached_has_bits & 0x00000040u) {
+      _this->_impl_.fieldactualchange_ = from._impl_.fieldactualchange_;
+    }
+    _this->_impl_._has_bits_[0] |= cached_has_bits;
+  }
+  _this->_internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void ScalarFloat::CopyFrom(const ScalarFloat& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:EPICS.ScalarFloat)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool ScalarFloat::IsInitialized() const {
+  if (_Internal::MissingRequiredFields(_impl_._has_bits_)) return false;
+  if (!::PROTOBUF_NAMESPACE_ID::internal::AllAreInitialized(_impl_.fieldvalues_))
+    return false;
+  return true;
+}
+
+void ScalarFloat::InternalSwap(ScalarFloat* other) {
+  using std::swap;
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  swap(_impl_._has_bits_[0], other->_impl_._has_bits_[0]);
+  _impl_.fieldvalues_.InternalSwap(&other->_impl_.fieldvalues_);
+  ::PROTOBUF_NAMESPACE_ID::internal::memswap<
+      PROTOBUF_FIELD_OFFSET(ScalarFloat, _impl_.fieldactualchange_)
+      + sizeof(ScalarFloat::_impl_.fieldactualchange_)
+      - PROTOBUF_FIELD_OFFSET(ScalarFloat, _impl_.secondsintoyear_)>(
+          reinterpret_cast<char*>(&_impl_.secondsintoyear_),
+          reinterpret_cast<char*>(&other->_impl_.secondsintoyear_));
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata ScalarFloat::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_getter, &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_once,
+      file_level_metadata_carchive_2fbackend_2fEPICSEvent_2eproto[6]);
+}
+
+// ===================================================================
+
+class ScalarDouble::_Internal {
+ public:
+  using HasBits = decltype(std::declval<ScalarDouble>()._impl_._has_bits_);
+  static void set_has_secondsintoyear(HasBits* has_bits) {
+    (*has_bits)[0] |= 1u;
+  }
+  static void set_has_nano(HasBits* has_bits) {
+    (*has_bits)[0] |= 2u;
+  }
+  static void set_has_val(HasBits* has_bits) {
+    (*has_bits)[0] |= 4u;
+  }
+  static void set_has_severity(HasBits* has_bits) {
+    (*has_bits)[0] |= 8u;
+  }
+  static void set_has_status(HasBits* has_bits) {
+    (*has_bits)[0] |= 16u;
+  }
+  static void set_has_repeatcount(HasBits* has_bits) {
+    (*has_bits)[0] |= 32u;
+  }
+  static void set_has_fieldactualchange(HasBits* has_bits) {
+    (*has_bits)[0] |= 64u;
+  }
+  static bool MissingRequiredFields(const HasBits& has_bits) {
+    return ((has_bits[0] & 0x00000007) ^ 0x00000007) != 0;
+  }
+};
+
+ScalarDouble::ScalarDouble(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                         bool is_message_owned)
+  : ::PROTOBUF_NAMESPACE_ID::Message(arena, is_message_owned) {
+  SharedCtor(arena, is_message_owned);
+  // @@protoc_insertion_point(arena_constructor:EPICS.ScalarDouble)
+}
+ScalarDouble::ScalarDouble(const ScalarDouble& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message() {
+  ScalarDouble* const _this = this; (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){from._impl_._has_bits_}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.fieldvalues_){from._impl_.fieldvalues_}
+    , decltype(_impl_.secondsintoyear_){}
+    , decltype(_impl_.nano_){}
+    , decltype(_impl_.val_){}
+    , decltype(_impl_.severity_){}
+    , decltype(_impl_.status_){}
+    , decltype(_impl_.repeatcount_){}
+    , decltype(_impl_.fieldactualchange_){}};
+
+  _internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+  ::memcpy(&_impl_.secondsintoyear_, &from._impl_.secondsintoyear_,
+    static_cast<size_t>(reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+    reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  // @@protoc_insertion_point(copy_constructor:EPICS.ScalarDouble)
+}
+
+inline void ScalarDouble::SharedCtor(
+    ::_pb::Arena* arena, bool is_message_owned) {
+  (void)arena;
+  (void)is_message_owned;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.fieldvalues_){arena}
+    , decltype(_impl_.secondsintoyear_){0u}
+    , decltype(_impl_.nano_){0u}
+    , decltype(_impl_.val_){0}
+    , decltype(_impl_.severity_){0}
+    , decltype(_impl_.status_){0}
+    , decltype(_impl_.repeatcount_){0u}
+    , decltype(_impl_.fieldactualchange_){false}
+  };
+}
+
+ScalarDouble::~ScalarDouble() {
+  // @@protoc_insertion_point(destructor:EPICS.ScalarDouble)
+  if (auto *arena = _internal_metadata_.DeleteReturnArena<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>()) {
+  (void)arena;
+    return;
+  }
+  SharedDtor();
+}
+
+inline void ScalarDouble::SharedDtor() {
+  GOOGLE_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.fieldvalues_.~RepeatedPtrField();
+}
+
+void ScalarDouble::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+void ScalarDouble::Clear() {
+// @@protoc_insertion_point(message_clear_start:EPICS.ScalarDouble)
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.fieldvalues_.Clear();
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000007fu) {
+    ::memset(&_impl_.secondsintoyear_, 0, static_cast<size_t>(
+        reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+        reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  }
+  _impl_._has_bits_.Clear();
+  _internal_metadata_.Clear<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+}
+
+const char* ScalarDouble::_InternalParse(const char* ptr, ::_pbi::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  _Internal::HasBits has_bits{};
+  while (!ctx->Done(&ptr)) {
+    uint32_t tag;
+    ptr = ::_pbi::ReadTag(ptr, &tag);
+    switch (tag >> 3) {
+      // required uint32 secondsintoyear = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 8)) {
+          _Internal::set_has_secondsintoyear(&has_bits);
+          _impl_.secondsintoyear_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // required uint32 nano = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 16)) {
+          _Internal::set_has_nano(&has_bits);
+          _impl_.nano_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // required double val = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 25)) {
+          _Internal::set_has_val(&has_bits);
+          _impl_.val_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<double>(ptr);
+          ptr += sizeof(double);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 severity = 4 [default = 0];
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 32)) {
+          _Internal::set_has_severity(&has_bits);
+          _impl_.severity_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 status = 5 [default = 0];
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 40)) {
+          _Internal::set_has_status(&has_bits);
+          _impl_.status_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional uint32 repeatcount = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 48)) {
+          _Internal::set_has_repeatcount(&has_bits);
+          _impl_.repeatcount_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated .EPICS.FieldValue fieldvalues = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 58)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ctx->ParseMessage(_internal_add_fieldvalues(), ptr);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::ExpectTag<58>(ptr));
+        } else
+          goto handle_unusual;
+        continue;
+      // optional bool fieldactualchange = 8;
+      case 8:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 64)) {
+          _Internal::set_has_fieldactualchange(&has_bits);
+          _impl_.fieldactualchange_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint64(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      default:
+        goto handle_unusual;
+    }  // switch
+  handle_unusual:
+    if ((tag == 0) || ((tag & 7) == 4)) {
+      CHK_(ptr);
+      ctx->SetLastTag(tag);
+      goto message_done;
+    }
+    ptr = UnknownFieldParse(
+        tag,
+        _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(),
+        ptr, ctx);
+    CHK_(ptr != nullptr);
+  }  // while
+message_done:
+  _impl_._has_bits_.Or(has_bits);
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto message_done;
+#undef CHK_
+}
+
+uint8_t* ScalarDouble::_InternalSerialize(
+    uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:EPICS.ScalarDouble)
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  cached_has_bits = _impl_._has_bits_[0];
+  // required uint32 secondsintoyear = 1;
+  if (cached_has_bits & 0x00000001u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(1, this->_internal_secondsintoyear(), target);
+  }
+
+  // required uint32 nano = 2;
+  if (cached_has_bits & 0x00000002u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(2, this->_internal_nano(), target);
+  }
+
+  // required double val = 3;
+  if (cached_has_bits & 0x00000004u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteDoubleToArray(3, this->_internal_val(), target);
+  }
+
+  // optional int32 severity = 4 [default = 0];
+  if (cached_has_bits & 0x00000008u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(4, this->_internal_severity(), target);
+  }
+
+  // optional int32 status = 5 [default = 0];
+  if (cached_has_bits & 0x00000010u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(5, this->_internal_status(), target);
+  }
+
+  // optional uint32 repeatcount = 6;
+  if (cached_has_bits & 0x00000020u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(6, this->_internal_repeatcount(), target);
+  }
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_fieldvalues_size()); i < n; i++) {
+    const auto& repfield = this->_internal_fieldvalues(i);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+        InternalWriteMessage(7, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  // optional bool fieldactualchange = 8;
+  if (cached_has_bits & 0x00000040u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteBoolToArray(8, this->_internal_fieldactualchange(), target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target = ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:EPICS.ScalarDouble)
+  return target;
+}
+
+size_t ScalarDouble::RequiredFieldsByteSizeFallback() const {
+// @@protoc_insertion_point(required_fields_byte_size_fallback_start:EPICS.ScalarDouble)
+  size_t total_size = 0;
+
+  if (_internal_has_secondsintoyear()) {
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+  }
+
+  if (_internal_has_nano()) {
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+  }
+
+  if (_internal_has_val()) {
+    // required double val = 3;
+    total_size += 1 + 8;
+  }
+
+  return total_size;
+}
+size_t ScalarDouble::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:EPICS.ScalarDouble)
+  size_t total_size = 0;
+
+  if (((_impl_._has_bits_[0] & 0x00000007) ^ 0x00000007) == 0) {  // All required fields are present.
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+
+    // required double val = 3;
+    total_size += 1 + 8;
+
+  } else {
+    total_size += RequiredFieldsByteSizeFallback();
+  }
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  total_size += 1UL * this->_internal_fieldvalues_size();
+  for (const auto& msg : this->_impl_.fieldvalues_) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(msg);
+  }
+
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x00000078u) {
+    // optional int32 severity = 4 [default = 0];
+    if (cached_has_bits & 0x00000008u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_severity());
+    }
+
+    // optional int32 status = 5 [default = 0];
+    if (cached_has_bits & 0x00000010u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_status());
+    }
+
+    // optional uint32 repeatcount = 6;
+    if (cached_has_bits & 0x00000020u) {
+      total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_repeatcount());
+    }
+
+    // optional bool fieldactualchange = 8;
+    if (cached_has_bits & 0x00000040u) {
+      total_size += 1 + 1;
+    }
+
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData ScalarDouble::_class_data_ = {
+    ::PROTOBUF_NAMESPACE_ID::Message::CopyWithSourceCheck,
+    ScalarDouble::MergeImpl
+};
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*ScalarDouble::GetClassData() const { return &_class_data_; }
+
+
+void ScalarDouble::MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg) {
+  auto* const _this = static_cast<ScalarDouble*>(&to_msg);
+  auto& from = static_cast<const ScalarDouble&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:EPICS.ScalarDouble)
+  GOOGLE_DCHECK_NE(&from, _this);
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_impl_.fieldvalues_.MergeFrom(from._impl_.fieldvalues_);
+  cached_has_bits = from._impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000007fu) {
+    if (cached_has_bits & 0x00000001u) {
+      _this->_impl_.secondsintoyear_ = from._impl_.secondsintoyear_;
+    }
+    if (cached_has_bits & 0x00000002u) {
+      _this->_impl_.nano_ = from._impl_.nano_;
+    }
+    if (cached_has_bits & 0x00000004u) {
+      _this->_impl_.val_ = from._impl_.val_;
+    }
+    if (cached_has_bits & 0x00000008u) {
+      _this->_impl_.severity_ = from._impl_.severity_;
+    }
+    if (cached_has_bits & 0x00000010u) {
+      _this->_impl_.status_ = from._impl_.status_;
+    }
+    if (cached_has_bits & 0x00000020u) {
+      _this->_impl_.repeatcount_ = from._impl_.repeatcount_;
+    }
+    if (cached_has_bits & 0x00000040u) {
+      _this->_impl_.fieldactualchange_ = from._impl_.fieldactualchange_;
+    }
+    _this->_impl_._has_bits_[0] |= cached_has_bits;
+  }
+  _this->_internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void ScalarDouble::CopyFrom(const ScalarDouble& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:EPICS.ScalarDouble)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool ScalarDouble::IsInitialized() const {
+  if (_Internal::MissingRequiredFields(_impl_._has_bits_)) return false;
+  if (!::PROTOBUF_NAMESPACE_ID::internal::AllAreInitialized(_impl_.fieldvalues_))
+    return false;
+  return true;
+}
+
+void ScalarDouble::InternalSwap(ScalarDouble* other) {
+  using std::swap;
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  swap(_impl_._has_bits_[0], other->_impl_._has_bits_[0]);
+  _impl_.fieldvalues_.InternalSwap(&other->_impl_.fieldvalues_);
+  ::PROTOBUF_NAMESPACE_ID::internal::memswap<
+      PROTOBUF_FIELD_OFFSET(ScalarDouble, _impl_.fieldactualchange_)
+      + sizeof(ScalarDouble::_impl_.fieldactualchange_)
+      - PROTOBUF_FIELD_OFFSET(ScalarDouble, _impl_.secondsintoyear_)>(
+          reinterpret_cast<char*>(&_impl_.secondsintoyear_),
+          reinterpret_cast<char*>(&other->_impl_.secondsintoyear_));
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata ScalarDouble::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_getter, &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_once,
+      file_level_metadata_carchive_2fbackend_2fEPICSEvent_2eproto[7]);
+}
+
+// ===================================================================
+
+class VectorString::_Internal {
+ public:
+  using HasBits = decltype(std::declval<VectorString>()._impl_._has_bits_);
+  static void set_has_secondsintoyear(HasBits* has_bits) {
+    (*has_bits)[0] |= 1u;
+  }
+  static void set_has_nano(HasBits* has_bits) {
+    (*has_bits)[0] |= 2u;
+  }
+  static void set_has_severity(HasBits* has_bits) {
+    (*has_bits)[0] |= 4u;
+  }
+  static void set_has_status(HasBits* has_bits) {
+    (*has_bits)[0] |= 8u;
+  }
+  static void set_has_repeatcount(HasBits* has_bits) {
+    (*has_bits)[0] |= 16u;
+  }
+  static void set_has_fieldactualchange(HasBits* has_bits) {
+    (*has_bits)[0] |= 32u;
+  }
+  static bool MissingRequiredFields(const HasBits& has_bits) {
+    return ((has_bits[0] & 0x00000003) ^ 0x00000003) != 0;
+  }
+};
+
+VectorString::VectorString(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                         bool is_message_owned)
+  : ::PROTOBUF_NAMESPACE_ID::Message(arena, is_message_owned) {
+  SharedCtor(arena, is_message_owned);
+  // @@protoc_insertion_point(arena_constructor:EPICS.VectorString)
+}
+VectorString::VectorString(const VectorString& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message() {
+  VectorString* const _this = this; (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){from._impl_._has_bits_}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.val_){from._impl_.val_}
+    , decltype(_impl_.fieldvalues_){from._impl_.fieldvalues_}
+    , decltype(_impl_.secondsintoyear_){}
+    , decltype(_impl_.nano_){}
+    , decltype(_impl_.severity_){}
+    , decltype(_impl_.status_){}
+    , decltype(_impl_.repeatcount_){}
+    , decltype(_impl_.fieldactualchange_){}};
+
+  _internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+  ::memcpy(&_impl_.secondsintoyear_, &from._impl_.secondsintoyear_,
+    static_cast<size_t>(reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+    reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  // @@protoc_insertion_point(copy_constructor:EPICS.VectorString)
+}
+
+inline void VectorString::SharedCtor(
+    ::_pb::Arena* arena, bool is_message_owned) {
+  (void)arena;
+  (void)is_message_owned;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.val_){arena}
+    , decltype(_impl_.fieldvalues_){arena}
+    , decltype(_impl_.secondsintoyear_){0u}
+    , decltype(_impl_.nano_){0u}
+    , decltype(_impl_.severity_){0}
+    , decltype(_impl_.status_){0}
+    , decltype(_impl_.repeatcount_){0u}
+    , decltype(_impl_.fieldactualchange_){false}
+  };
+}
+
+VectorString::~VectorString() {
+  // @@protoc_insertion_point(destructor:EPICS.VectorString)
+  if (auto *arena = _internal_metadata_.DeleteReturnArena<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>()) {
+  (void)arena;
+    return;
+  }
+  SharedDtor();
+}
+
+inline void VectorString::SharedDtor() {
+  GOOGLE_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.val_.~RepeatedPtrField();
+  _impl_.fieldvalues_.~RepeatedPtrField();
+}
+
+void VectorString::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+void VectorString::Clear() {
+// @@protoc_insertion_point(message_clear_start:EPICS.VectorString)
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.val_.Clear();
+  _impl_.fieldvalues_.Clear();
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000003fu) {
+    ::memset(&_impl_.secondsintoyear_, 0, static_cast<size_t>(
+        reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+        reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  }
+  _impl_._has_bits_.Clear();
+  _internal_metadata_.Clear<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+}
+
+const char* VectorString::_InternalParse(const char* ptr, ::_pbi::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  _Internal::HasBits has_bits{};
+  while (!ctx->Done(&ptr)) {
+    uint32_t tag;
+    ptr = ::_pbi::ReadTag(ptr, &tag);
+    switch (tag >> 3) {
+      // required uint32 secondsintoyear = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 8)) {
+          _Internal::set_has_secondsintoyear(&has_bits);
+          _impl_.secondsintoyear_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // required uint32 nano = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 16)) {
+          _Internal::set_has_nano(&has_bits);
+          _impl_.nano_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated string val = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 26)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            auto str = _internal_add_val();
+            ptr = ::_pbi::InlineGreedyStringParser(str, ptr, ctx);
+            CHK_(ptr);
+            #ifndef NDEBUG
+            ::_pbi::VerifyUTF8(str, "EPICS.VectorString.val");
+            #endif  // !NDEBUG
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::ExpectTag<26>(ptr));
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 severity = 4 [default = 0];
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 32)) {
+          _Internal::set_has_severity(&has_bits);
+          _impl_.severity_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 status = 5 [default = 0];
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 40)) {
+          _Internal::set_has_status(&has_bits);
+          _impl_.status_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional uint32 repeatcount = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 48)) {
+          _Internal::set_has_repeatcount(&has_bits);
+          _impl_.repeatcount_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated .EPICS.FieldValue fieldvalues = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 58)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ctx->ParseMessage(_internal_add_fieldvalues(), ptr);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::ExpectTag<58>(ptr));
+        } else
+          goto handle_unusual;
+        continue;
+      // optional bool fieldactualchange = 8;
+      case 8:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 64)) {
+          _Internal::set_has_fieldactualchange(&has_bits);
+          _impl_.fieldactualchange_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint64(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      default:
+        goto handle_unusual;
+    }  // switch
+  handle_unusual:
+    if ((tag == 0) || ((tag & 7) == 4)) {
+      CHK_(ptr);
+      ctx->SetLastTag(tag);
+      goto message_done;
+    }
+    ptr = UnknownFieldParse(
+        tag,
+        _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(),
+        ptr, ctx);
+    CHK_(ptr != nullptr);
+  }  // while
+message_done:
+  _impl_._has_bits_.Or(has_bits);
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto message_done;
+#undef CHK_
+}
+
+uint8_t* VectorString::_InternalSerialize(
+    uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:EPICS.VectorString)
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  cached_has_bits = _impl_._has_bits_[0];
+  // required uint32 secondsintoyear = 1;
+  if (cached_has_bits & 0x00000001u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(1, this->_internal_secondsintoyear(), target);
+  }
+
+  // required uint32 nano = 2;
+  if (cached_has_bits & 0x00000002u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(2, this->_internal_nano(), target);
+  }
+
+  // repeated string val = 3;
+  for (int i = 0, n = this->_internal_val_size(); i < n; i++) {
+    const auto& s = this->_internal_val(i);
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::VerifyUTF8StringNamedField(
+      s.data(), static_cast<int>(s.length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SERIALIZE,
+      "EPICS.VectorString.val");
+    target = stream->WriteString(3, s, target);
+  }
+
+  // optional int32 severity = 4 [default = 0];
+  if (cached_has_bits & 0x00000004u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(4, this->_internal_severity(), target);
+  }
+
+  // optional int32 status = 5 [default = 0];
+  if (cached_has_bits & 0x00000008u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(5, this->_internal_status(), target);
+  }
+
+  // optional uint32 repeatcount = 6;
+  if (cached_has_bits & 0x00000010u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(6, this->_internal_repeatcount(), target);
+  }
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_fieldvalues_size()); i < n; i++) {
+    const auto& repfield = this->_internal_fieldvalues(i);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+        InternalWriteMessage(7, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  // optional bool fieldactualchange = 8;
+  if (cached_has_bits & 0x00000020u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteBoolToArray(8, this->_internal_fieldactualchange(), target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target = ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:EPICS.VectorString)
+  return target;
+}
+
+size_t VectorString::RequiredFieldsByteSizeFallback() const {
+// @@protoc_insertion_point(required_fields_byte_size_fallback_start:EPICS.VectorString)
+  size_t total_size = 0;
+
+  if (_internal_has_secondsintoyear()) {
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+  }
+
+  if (_internal_has_nano()) {
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+  }
+
+  return total_size;
+}
+size_t VectorString::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:EPICS.VectorString)
+  size_t total_size = 0;
+
+  if (((_impl_._has_bits_[0] & 0x00000003) ^ 0x00000003) == 0) {  // All required fields are present.
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+
+  } else {
+    total_size += RequiredFieldsByteSizeFallback();
+  }
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated string val = 3;
+  total_size += 1 *
+      ::PROTOBUF_NAMESPACE_ID::internal::FromIntSize(_impl_.val_.size());
+  for (int i = 0, n = _impl_.val_.size(); i < n; i++) {
+    total_size += ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+      _impl_.val_.Get(i));
+  }
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  total_size += 1UL * this->_internal_fieldvalues_size();
+  for (const auto& msg : this->_impl_.fieldvalues_) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(msg);
+  }
+
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000003cu) {
+    // optional int32 severity = 4 [default = 0];
+    if (cached_has_bits & 0x00000004u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_severity());
+    }
+
+    // optional int32 status = 5 [default = 0];
+    if (cached_has_bits & 0x00000008u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_status());
+    }
+
+    // optional uint32 repeatcount = 6;
+    if (cached_has_bits & 0x00000010u) {
+      total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_repeatcount());
+    }
+
+    // optional bool fieldactualchange = 8;
+    if (cached_has_bits & 0x00000020u) {
+      total_size += 1 + 1;
+    }
+
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData VectorString::_class_data_ = {
+    ::PROTOBUF_NAMESPACE_ID::Message::CopyWithSourceCheck,
+    VectorString::MergeImpl
+};
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*VectorString::GetClassData() const { return &_class_data_; }
+
+
+void VectorString::MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg) {
+  auto* const _this = static_cast<VectorString*>(&to_msg);
+  auto& from = static_cast<const VectorString&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:EPICS.VectorString)
+  GOOGLE_DCHECK_NE(&from, _this);
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_impl_.val_.MergeFrom(from._impl_.val_);
+  _this->_impl_.fieldvalues_.MergeFrom(from._impl_.fieldvalues_);
+  cached_has_bits = from._impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000003fu) {
+    if (cached_has_bits & 0x00000001u) {
+      _this->_impl_.secondsintoyear_ = from._impl_.secondsintoyear_;
+    }
+    if (cached_has_bits & 0x00000002u) {
+      _this->_impl_.nano_ = from._impl_.nano_;
+    }
+    if (cached_has_bits & 0x00000004u) {
+      _this->_impl_.severity_ = from._impl_.severity_;
+    }
+    if (cached_has_bits & 0x00000008u) {
+      _this->_impl_.status_ = from._impl_.status_;
+    }
+    if (cached_has_bits & 0x00000010u) {
+      _this->_impl_.repeatcount_ = from._impl_.repeatcount_;
+    }
+    if (cached_has_bits & 0x00000020u) {
+      _this->_impl_.fieldactualchange_ = from._impl_.fieldactualchange_;
+    }
+    _this->_impl_._has_bits_[0] |= cached_has_bits;
+  }
+  _this->_internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void VectorString::CopyFrom(const VectorString& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:EPICS.VectorString)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool VectorString::IsInitialized() const {
+  if (_Internal::MissingRequiredFields(_impl_._has_bits_)) return false;
+  if (!::PROTOBUF_NAMESPACE_ID::internal::AllAreInitialized(_impl_.fieldvalues_))
+    return false;
+  return true;
+}
+
+void VectorString::InternalSwap(VectorString* other) {
+  using std::swap;
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  swap(_impl_._has_bits_[0], other->_impl_._has_bits_[0]);
+  _impl_.val_.InternalSwap(&other->_impl_.val_);
+  _impl_.fieldvalues_.InternalSwap(&other->_impl_.fieldvalues_);
+  ::PROTOBUF_NAMESPACE_ID::internal::memswap<
+      PROTOBUF_FIELD_OFFSET(VectorString, _impl_.fieldactualchange_)
+      + sizeof(VectorString::_impl_.fieldactualchange_)
+      - PROTOBUF_FIELD_OFFSET(VectorString, _impl_.secondsintoyear_)>(
+          reinterpret_cast<char*>(&_impl_.secondsintoyear_),
+          reinterpret_cast<char*>(&other->_impl_.secondsintoyear_));
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata VectorString::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_getter, &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_once,
+      file_level_metadata_carchive_2fbackend_2fEPICSEvent_2eproto[8]);
+}
+
+// ===================================================================
+
+class VectorChar::_Internal {
+ public:
+  using HasBits = decltype(std::declval<VectorChar>()._impl_._has_bits_);
+  static void set_has_secondsintoyear(HasBits* has_bits) {
+    (*has_bits)[0] |= 2u;
+  }
+  static void set_has_nano(HasBits* has_bits) {
+    (*has_bits)[0] |= 4u;
+  }
+  static void set_has_val(HasBits* has_bits) {
+    (*has_bits)[0] |= 1u;
+  }
+  static void set_has_severity(HasBits* has_bits) {
+    (*has_bits)[0] |= 8u;
+  }
+  static void set_has_status(HasBits* has_bits) {
+    (*has_bits)[0] |= 16u;
+  }
+  static void set_has_repeatcount(HasBits* has_bits) {
+    (*has_bits)[0] |= 32u;
+  }
+  static void set_has_fieldactualchange(HasBits* has_bits) {
+    (*has_bits)[0] |= 64u;
+  }
+  static bool MissingRequiredFields(const HasBits& has_bits) {
+    return ((has_bits[0] & 0x00000007) ^ 0x00000007) != 0;
+  }
+};
+
+VectorChar::VectorChar(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                         bool is_message_owned)
+  : ::PROTOBUF_NAMESPACE_ID::Message(arena, is_message_owned) {
+  SharedCtor(arena, is_message_owned);
+  // @@protoc_insertion_point(arena_constructor:EPICS.VectorChar)
+}
+VectorChar::VectorChar(const VectorChar& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message() {
+  VectorChar* const _this = this; (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){from._impl_._has_bits_}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.fieldvalues_){from._impl_.fieldvalues_}
+    , decltype(_impl_.val_){}
+    , decltype(_impl_.secondsintoyear_){}
+    , decltype(_impl_.nano_){}
+    , decltype(_impl_.severity_){}
+    , decltype(_impl_.status_){}
+    , decltype(_impl_.repeatcount_){}
+    , decltype(_impl_.fieldactualchange_){}};
+
+  _internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+  _impl_.val_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+    _impl_.val_.Set("", GetArenaForAllocation());
+  #endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (from._internal_has_val()) {
+    _this->_impl_.val_.Set(from._internal_val(), 
+      _this->GetArenaForAllocation());
+  }
+  ::memcpy(&_impl_.secondsintoyear_, &from._impl_.secondsintoyear_,
+    static_cast<size_t>(reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+    reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  // @@protoc_insertion_point(copy_constructor:EPICS.VectorChar)
+}
+
+inline void VectorChar::SharedCtor(
+    ::_pb::Arena* arena, bool is_message_owned) {
+  (void)arena;
+  (void)is_message_owned;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.fieldvalues_){arena}
+    , decltype(_impl_.val_){}
+    , decltype(_impl_.secondsintoyear_){0u}
+    , decltype(_impl_.nano_){0u}
+    , decltype(_impl_.severity_){0}
+    , decltype(_impl_.status_){0}
+    , decltype(_impl_.repeatcount_){0u}
+    , decltype(_impl_.fieldactualchange_){false}
+  };
+  _impl_.val_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+    _impl_.val_.Set("", GetArenaForAllocation());
+  #endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+}
+
+VectorChar::~VectorChar() {
+  // @@protoc_insertion_point(destructor:EPICS.VectorChar)
+  if (auto *arena = _internal_metadata_.DeleteReturnArena<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>()) {
+  (void)arena;
+    return;
+  }
+  SharedDtor();
+}
+
+inline void VectorChar::SharedDtor() {
+  GOOGLE_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.fieldvalues_.~RepeatedPtrField();
+  _impl_.val_.Destroy();
+}
+
+void VectorChar::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+void VectorChar::Clear() {
+// @@protoc_insertion_point(message_clear_start:EPICS.VectorChar)
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.fieldvalues_.Clear();
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x00000001u) {
+    _impl_.val_.ClearNonDefaultToEmpty();
+  }
+  if (cached_has_bits & 0x0000007eu) {
+    ::memset(&_impl_.secondsintoyear_, 0, static_cast<size_t>(
+        reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+        reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  }
+  _impl_._has_bits_.Clear();
+  _internal_metadata_.Clear<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+}
+
+const char* VectorChar::_InternalParse(const char* ptr, ::_pbi::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  _Internal::HasBits has_bits{};
+  while (!ctx->Done(&ptr)) {
+    uint32_t tag;
+    ptr = ::_pbi::ReadTag(ptr, &tag);
+    switch (tag >> 3) {
+      // required uint32 secondsintoyear = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 8)) {
+          _Internal::set_has_secondsintoyear(&has_bits);
+          _impl_.secondsintoyear_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // required uint32 nano = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 16)) {
+          _Internal::set_has_nano(&has_bits);
+          _impl_.nano_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // required bytes val = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 26)) {
+          auto str = _internal_mutable_val();
+          ptr = ::_pbi::InlineGreedyStringParser(str, ptr, ctx);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 severity = 4 [default = 0];
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 32)) {
+          _Internal::set_has_severity(&has_bits);
+          _impl_.severity_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 status = 5 [default = 0];
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 40)) {
+          _Internal::set_has_status(&has_bits);
+          _impl_.status_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional uint32 repeatcount = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 48)) {
+          _Internal::set_has_repeatcount(&has_bits);
+          _impl_.repeatcount_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated .EPICS.FieldValue fieldvalues = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 58)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ctx->ParseMessage(_internal_add_fieldvalues(), ptr);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::ExpectTag<58>(ptr));
+        } else
+          goto handle_unusual;
+        continue;
+      // optional bool fieldactualchange = 8;
+      case 8:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 64)) {
+          _Internal::set_has_fieldactualchange(&has_bits);
+          _impl_.fieldactualchange_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint64(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      default:
+        goto handle_unusual;
+    }  // switch
+  handle_unusual:
+    if ((tag == 0) || ((tag & 7) == 4)) {
+      CHK_(ptr);
+      ctx->SetLastTag(tag);
+      goto message_done;
+    }
+    ptr = UnknownFieldParse(
+        tag,
+        _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(),
+        ptr, ctx);
+    CHK_(ptr != nullptr);
+  }  // while
+message_done:
+  _impl_._has_bits_.Or(has_bits);
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto message_done;
+#undef CHK_
+}
+
+uint8_t* VectorChar::_InternalSerialize(
+    uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:EPICS.VectorChar)
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  cached_has_bits = _impl_._has_bits_[0];
+  // required uint32 secondsintoyear = 1;
+  if (cached_has_bits & 0x00000002u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(1, this->_internal_secondsintoyear(), target);
+  }
+
+  // required uint32 nano = 2;
+  if (cached_has_bits & 0x00000004u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(2, this->_internal_nano(), target);
+  }
+
+  // required bytes val = 3;
+  if (cached_has_bits & 0x00000001u) {
+    target = stream->WriteBytesMaybeAliased(
+        3, this->_internal_val(), target);
+  }
+
+  // optional int32 severity = 4 [default = 0];
+  if (cached_has_bits & 0x00000008u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(4, this->_internal_severity(), target);
+  }
+
+  // optional int32 status = 5 [default = 0];
+  if (cached_has_bits & 0x00000010u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(5, this->_internal_status(), target);
+  }
+
+  // optional uint32 repeatcount = 6;
+  if (cached_has_bits & 0x00000020u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(6, this->_internal_repeatcount(), target);
+  }
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_fieldvalues_size()); i < n; i++) {
+    const auto& repfield = this->_internal_fieldvalues(i);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+        InternalWriteMessage(7, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  // optional bool fieldactualchange = 8;
+  if (cached_has_bits & 0x00000040u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteBoolToArray(8, this->_internal_fieldactualchange(), target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target = ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:EPICS.VectorChar)
+  return target;
+}
+
+size_t VectorChar::RequiredFieldsByteSizeFallback() const {
+// @@protoc_insertion_point(required_fields_byte_size_fallback_start:EPICS.VectorChar)
+  size_t total_size = 0;
+
+  if (_internal_has_val()) {
+    // required bytes val = 3;
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::BytesSize(
+        this->_internal_val());
+  }
+
+  if (_internal_has_secondsintoyear()) {
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+  }
+
+  if (_internal_has_nano()) {
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+  }
+
+  return total_size;
+}
+size_t VectorChar::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:EPICS.VectorChar)
+  size_t total_size = 0;
+
+  if (((_impl_._has_bits_[0] & 0x00000007) ^ 0x00000007) == 0) {  // All required fields are present.
+    // required bytes val = 3;
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::BytesSize(
+        this->_internal_val());
+
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+
+  } else {
+    total_size += RequiredFieldsByteSizeFallback();
+  }
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  total_size += 1UL * this->_internal_fieldvalues_size();
+  for (const auto& msg : this->_impl_.fieldvalues_) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(msg);
+  }
+
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x00000078u) {
+    // optional int32 severity = 4 [default = 0];
+    if (cached_has_bits & 0x00000008u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_severity());
+    }
+
+    // optional int32 status = 5 [default = 0];
+    if (cached_has_bits & 0x00000010u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_status());
+    }
+
+    // optional uint32 repeatcount = 6;
+    if (cached_has_bits & 0x00000020u) {
+      total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_repeatcount());
+    }
+
+    // optional bool fieldactualchange = 8;
+    if (cached_has_bits & 0x00000040u) {
+      total_size += 1 + 1;
+    }
+
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData VectorChar::_class_data_ = {
+    ::PROTOBUF_NAMESPACE_ID::Message::CopyWithSourceCheck,
+    VectorChar::MergeImpl
+};
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*VectorChar::GetClassData() const { return &_class_data_; }
+
+
+void VectorChar::MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg) {
+  auto* const _this = static_cast<VectorChar*>(&to_msg);
+  auto& from = static_cast<const VectorChar&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:EPICS.VectorChar)
+  GOOGLE_DCHECK_NE(&from, _this);
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_impl_.fieldvalues_.MergeFrom(from._impl_.fieldvalues_);
+  cached_has_bits = from._impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000007fu) {
+    if (cached_has_bits & 0x00000001u) {
+      _this->_internal_set_val(from._internal_val());
+    }
+    if (cached_has_bits & 0x00000002u) {
+      _this->_impl_.secondsintoyear_ = from._impl_.secondsintoyear_;
+    }
+    if (cached_has_bits & 0x00000004u) {
+      _this->_impl_.nano_ = from._impl_.nano_;
+    }
+    if (cached_has_bits & 0x00000008u) {
+      _this->_impl_.severity_ = from._impl_.severity_;
+    }
+    if (cached_has_bits & 0x00000010u) {
+      _this->_impl_.status_ = from._impl_.status_;
+    }
+    if (cached_has_bits & 0x00000020u) {
+      _this->_impl_.repeatcount_ = from._impl_.repeatcount_;
+    }
+    if (cached_has_bits & 0x00000040u) {
+      _this->_impl_.fieldactualchange_ = from._impl_.fieldactualchange_;
+    }
+    _this->_impl_._has_bits_[0] |= cached_has_bits;
+  }
+  _this->_internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void VectorChar::CopyFrom(const VectorChar& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:EPICS.VectorChar)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool VectorChar::IsInitialized() const {
+  if (_Internal::MissingRequiredFields(_impl_._has_bits_)) return false;
+  if (!::PROTOBUF_NAMESPACE_ID::internal::AllAreInitialized(_impl_.fieldvalues_))
+    return false;
+  return true;
+}
+
+void VectorChar::InternalSwap(VectorChar* other) {
+  using std::swap;
+  auto* lhs_arena = GetArenaForAllocation();
+  auto* rhs_arena = other->GetArenaForAllocation();
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  swap(_impl_._has_bits_[0], other->_impl_._has_bits_[0]);
+  _impl_.fieldvalues_.InternalSwap(&other->_impl_.fieldvalues_);
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr::InternalSwap(
+      &_impl_.val_, lhs_arena,
+      &other->_impl_.val_, rhs_arena
+  );
+  ::PROTOBUF_NAMESPACE_ID::internal::memswap<
+      PROTOBUF_FIELD_OFFSET(VectorChar, _impl_.fieldactualchange_)
+      + sizeof(VectorChar::_impl_.fieldactualchange_)
+      - PROTOBUF_FIELD_OFFSET(VectorChar, _impl_.secondsintoyear_)>(
+          reinterpret_cast<char*>(&_impl_.secondsintoyear_),
+          reinterpret_cast<char*>(&other->_impl_.secondsintoyear_));
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata VectorChar::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_getter, &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_once,
+      file_level_metadata_carchive_2fbackend_2fEPICSEvent_2eproto[9]);
+}
+
+// ===================================================================
+
+class VectorShort::_Internal {
+ public:
+  using HasBits = decltype(std::declval<VectorShort>()._impl_._has_bits_);
+  static void set_has_secondsintoyear(HasBits* has_bits) {
+    (*has_bits)[0] |= 1u;
+  }
+  static void set_has_nano(HasBits* has_bits) {
+    (*has_bits)[0] |= 2u;
+  }
+  static void set_has_severity(HasBits* has_bits) {
+    (*has_bits)[0] |= 4u;
+  }
+  static void set_has_status(HasBits* has_bits) {
+    (*has_bits)[0] |= 8u;
+  }
+  static void set_has_repeatcount(HasBits* has_bits) {
+    (*has_bits)[0] |= 16u;
+  }
+  static void set_has_fieldactualchange(HasBits* has_bits) {
+    (*has_bits)[0] |= 32u;
+  }
+  static bool MissingRequiredFields(const HasBits& has_bits) {
+    return ((has_bits[0] & 0x00000003) ^ 0x00000003) != 0;
+  }
+};
+
+VectorShort::VectorShort(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                         bool is_message_owned)
+  : ::PROTOBUF_NAMESPACE_ID::Message(arena, is_message_owned) {
+  SharedCtor(arena, is_message_owned);
+  // @@protoc_insertion_point(arena_constructor:EPICS.VectorShort)
+}
+VectorShort::VectorShort(const VectorShort& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message() {
+  VectorShort* const _this = this; (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){from._impl_._has_bits_}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.val_){from._impl_.val_}
+    , /*decltype(_impl_._val_cached_byte_size_)*/{0}
+    , decltype(_impl_.fieldvalues_){from._impl_.fieldvalues_}
+    , decltype(_impl_.secondsintoyear_){}
+    , decltype(_impl_.nano_){}
+    , decltype(_impl_.severity_){}
+    , decltype(_impl_.status_){}
+    , decltype(_impl_.repeatcount_){}
+    , decltype(_impl_.fieldactualchange_){}};
+
+  _internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+  ::memcpy(&_impl_.secondsintoyear_, &from._impl_.secondsintoyear_,
+    static_cast<size_t>(reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+    reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  // @@protoc_insertion_point(copy_constructor:EPICS.VectorShort)
+}
+
+inline void VectorShort::SharedCtor(
+    ::_pb::Arena* arena, bool is_message_owned) {
+  (void)arena;
+  (void)is_message_owned;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.val_){arena}
+    , /*decltype(_impl_._val_cached_byte_size_)*/{0}
+    , decltype(_impl_.fieldvalues_){arena}
+    , decltype(_impl_.secondsintoyear_){0u}
+    , decltype(_impl_.nano_){0u}
+    , decltype(_impl_.severity_){0}
+    , decltype(_impl_.status_){0}
+    , decltype(_impl_.repeatcount_){0u}
+    , decltype(_impl_.fieldactualchange_){false}
+  };
+}
+
+VectorShort::~VectorShort() {
+  // @@protoc_insertion_point(destructor:EPICS.VectorShort)
+  if (auto *arena = _internal_metadata_.DeleteReturnArena<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>()) {
+  (void)arena;
+    return;
+  }
+  SharedDtor();
+}
+
+inline void VectorShort::SharedDtor() {
+  GOOGLE_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.val_.~RepeatedField();
+  _impl_.fieldvalues_.~RepeatedPtrField();
+}
+
+void VectorShort::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+void VectorShort::Clear() {
+// @@protoc_insertion_point(message_clear_start:EPICS.VectorShort)
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.val_.Clear();
+  _impl_.fieldvalues_.Clear();
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000003fu) {
+    ::memset(&_impl_.secondsintoyear_, 0, static_cast<size_t>(
+        reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+        reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  }
+  _impl_._has_bits_.Clear();
+  _internal_metadata_.Clear<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+}
+
+const char* VectorShort::_InternalParse(const char* ptr, ::_pbi::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  _Internal::HasBits has_bits{};
+  while (!ctx->Done(&ptr)) {
+    uint32_t tag;
+    ptr = ::_pbi::ReadTag(ptr, &tag);
+    switch (tag >> 3) {
+      // required uint32 secondsintoyear = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 8)) {
+          _Internal::set_has_secondsintoyear(&has_bits);
+          _impl_.secondsintoyear_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // required uint32 nano = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 16)) {
+          _Internal::set_has_nano(&has_bits);
+          _impl_.nano_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated sint32 val = 3 [packed = true];
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 26)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::PackedSInt32Parser(_internal_mutable_val(), ptr, ctx);
+          CHK_(ptr);
+        } else if (static_cast<uint8_t>(tag) == 24) {
+          _internal_add_val(::PROTOBUF_NAMESPACE_ID::internal::ReadVarintZigZag32(&ptr));
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 severity = 4 [default = 0];
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 32)) {
+          _Internal::set_has_severity(&has_bits);
+          _impl_.severity_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 status = 5 [default = 0];
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 40)) {
+          _Internal::set_has_status(&has_bits);
+          _impl_.status_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional uint32 repeatcount = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 48)) {
+          _Internal::set_has_repeatcount(&has_bits);
+          _impl_.repeatcount_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated .EPICS.FieldValue fieldvalues = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 58)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ctx->ParseMessage(_internal_add_fieldvalues(), ptr);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::ExpectTag<58>(ptr));
+        } else
+          goto handle_unusual;
+        continue;
+      // optional bool fieldactualchange = 8;
+      case 8:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 64)) {
+          _Internal::set_has_fieldactualchange(&has_bits);
+          _impl_.fieldactualchange_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint64(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      default:
+        goto handle_unusual;
+    }  // switch
+  handle_unusual:
+    if ((tag == 0) || ((tag & 7) == 4)) {
+      CHK_(ptr);
+      ctx->SetLastTag(tag);
+      goto message_done;
+    }
+    ptr = UnknownFieldParse(
+        tag,
+        _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(),
+        ptr, ctx);
+    CHK_(ptr != nullptr);
+  }  // while
+message_done:
+  _impl_._has_bits_.Or(has_bits);
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto message_done;
+#undef CHK_
+}
+
+uint8_t* VectorShort::_InternalSerialize(
+    uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:EPICS.VectorShort)
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  cached_has_bits = _impl_._has_bits_[0];
+  // required uint32 secondsintoyear = 1;
+  if (cached_has_bits & 0x00000001u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(1, this->_internal_secondsintoyear(), target);
+  }
+
+  // required uint32 nano = 2;
+  if (cached_has_bits & 0x00000002u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(2, this->_internal_nano(), target);
+  }
+
+  // repeated sint32 val = 3 [packed = true];
+  {
+    int byte_size = _impl_._val_cached_byte_size_.load(std::memory_order_relaxed);
+    if (byte_size > 0) {
+      target = stream->WriteSInt32Packed(
+          3, _internal_val(), byte_size, target);
+    }
+  }
+
+  // optional int32 severity = 4 [default = 0];
+  if (cached_has_bits & 0x00000004u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(4, this->_internal_severity(), target);
+  }
+
+  // optional int32 status = 5 [default = 0];
+  if (cached_has_bits & 0x00000008u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(5, this->_internal_status(), target);
+  }
+
+  // optional uint32 repeatcount = 6;
+  if (cached_has_bits & 0x00000010u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(6, this->_internal_repeatcount(), target);
+  }
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_fieldvalues_size()); i < n; i++) {
+    const auto& repfield = this->_internal_fieldvalues(i);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+        InternalWriteMessage(7, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  // optional bool fieldactualchange = 8;
+  if (cached_has_bits & 0x00000020u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteBoolToArray(8, this->_internal_fieldactualchange(), target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target = ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:EPICS.VectorShort)
+  return target;
+}
+
+size_t VectorShort::RequiredFieldsByteSizeFallback() const {
+// @@protoc_insertion_point(required_fields_byte_size_fallback_start:EPICS.VectorShort)
+  size_t total_size = 0;
+
+  if (_internal_has_secondsintoyear()) {
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+  }
+
+  if (_internal_has_nano()) {
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+  }
+
+  return total_size;
+}
+size_t VectorShort::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:EPICS.VectorShort)
+  size_t total_size = 0;
+
+  if (((_impl_._has_bits_[0] & 0x00000003) ^ 0x00000003) == 0) {  // All required fields are present.
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+
+  } else {
+    total_size += RequiredFieldsByteSizeFallback();
+  }
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated sint32 val = 3 [packed = true];
+  {
+    size_t data_size = ::_pbi::WireFormatLite::
+      SInt32Size(this->_impl_.val_);
+    if (data_size > 0) {
+      total_size += 1 +
+        ::_pbi::WireFormatLite::Int32Size(static_cast<int32_t>(data_size));
+    }
+    int cached_size = ::_pbi::ToCachedSize(data_size);
+    _impl_._val_cached_byte_size_.store(cached_size,
+                                    std::memory_order_relaxed);
+    total_size += data_size;
+  }
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  total_size += 1UL * this->_internal_fieldvalues_size();
+  for (const auto& msg : this->_impl_.fieldvalues_) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(msg);
+  }
+
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000003cu) {
+    // optional int32 severity = 4 [default = 0];
+    if (cached_has_bits & 0x00000004u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_severity());
+    }
+
+    // optional int32 status = 5 [default = 0];
+    if (cached_has_bits & 0x00000008u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_status());
+    }
+
+    // optional uint32 repeatcount = 6;
+    if (cached_has_bits & 0x00000010u) {
+      total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_repeatcount());
+    }
+
+    // optional bool fieldactualchange = 8;
+    if (cached_has_bits & 0x00000020u) {
+      total_size += 1 + 1;
+    }
+
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData VectorShort::_class_data_ = {
+    ::PROTOBUF_NAMESPACE_ID::Message::CopyWithSourceCheck,
+    VectorShort::MergeImpl
+};
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*VectorShort::GetClassData() const { return &_class_data_; }
+
+
+void VectorShort::MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg) {
+  auto* const _this = static_cast<VectorShort*>(&to_msg);
+  auto& from = static_cast<const VectorShort&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:EPICS.VectorShort)
+  GOOGLE_DCHECK_NE(&from, _this);
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_impl_.val_.MergeFrom(from._impl_.val_);
+  _this->_impl_.fieldvalues_.MergeFrom(from._impl_.fieldvalues_);
+  cached_has_bits = from._impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000003fu) {
+    if (cached_has_bits & 0x00000001u) {
+      _this->_impl_.secondsintoyear_ = from._impl_.secondsintoyear_;
+    }
+    if (cached_has_bits & 0x00000002u) {
+      _this->_impl_.nano_ = from._impl_.nano_;
+    }
+    if (cached_has_bits & 0x00000004u) {
+      _this->_impl_.severity_ = from._impl_.severity_;
+    }
+    if (cached_has_bits & 0x00000008u) {
+      _this->_impl_.status_ = from._impl_.status_;
+    }
+    if (cached_has_bits & 0x00000010u) {
+      _this->_impl_.repeatcount_ = from._impl_.repeatcount_;
+    }
+    if (cached_has_bits & 0x00000020u) {
+      _this->_impl_.fieldactualchange_ = from._impl_.fieldactualchange_;
+    }
+    _this->_impl_._has_bits_[0] |= cached_has_bits;
+  }
+  _this->_internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void VectorShort::CopyFrom(const VectorShort& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:EPICS.VectorShort)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool VectorShort::IsInitialized() const {
+  if (_Internal::MissingRequiredFields(_impl_._has_bits_)) return false;
+  if (!::PROTOBUF_NAMESPACE_ID::internal::AllAreInitialized(_impl_.fieldvalues_))
+    return false;
+  return true;
+}
+
+void VectorShort::InternalSwap(VectorShort* other) {
+  using std::swap;
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  swap(_impl_._has_bits_[0], other->_impl_._has_bits_[0]);
+  _impl_.val_.InternalSwap(&other->_impl_.val_);
+  _impl_.fieldvalues_.InternalSwap(&other->_impl_.fieldvalues_);
+  ::PROTOBUF_NAMESPACE_ID::internal::memswap<
+      PROTOBUF_FIELD_OFFSET(VectorShort, _impl_.fieldactualchange_)
+      + sizeof(VectorShort::_impl_.fieldactualchange_)
+      - PROTOBUF_FIELD_OFFSET(VectorShort, _impl_.secondsintoyear_)>(
+          reinterpret_cast<char*>(&_impl_.secondsintoyear_),
+          reinterpret_cast<char*>(&other->_impl_.secondsintoyear_));
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata VectorShort::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_getter, &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_once,
+      file_level_metadata_carchive_2fbackend_2fEPICSEvent_2eproto[10]);
+}
+
+// ===================================================================
+
+class VectorInt::_Internal {
+ public:
+  using HasBits = decltype(std::declval<VectorInt>()._impl_._has_bits_);
+  static void set_has_secondsintoyear(HasBits* has_bits) {
+    (*has_bits)[0] |= 1u;
+  }
+  static void set_has_nano(HasBits* has_bits) {
+    (*has_bits)[0] |= 2u;
+  }
+  static void set_has_severity(HasBits* has_bits) {
+    (*has_bits)[0] |= 4u;
+  }
+  static void set_has_status(HasBits* has_bits) {
+    (*has_bits)[0] |= 8u;
+  }
+  static void set_has_repeatcount(HasBits* has_bits) {
+    (*has_bits)[0] |= 16u;
+  }
+  static void set_has_fieldactualchange(HasBits* has_bits) {
+    (*has_bits)[0] |= 32u;
+  }
+  static bool MissingRequiredFields(const HasBits& has_bits) {
+    return ((has_bits[0] & 0x00000003) ^ 0x00000003) != 0;
+  }
+};
+
+VectorInt::VectorInt(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                         bool is_message_owned)
+  : ::PROTOBUF_NAMESPACE_ID::Message(arena, is_message_owned) {
+  SharedCtor(arena, is_message_owned);
+  // @@protoc_insertion_point(arena_constructor:EPICS.VectorInt)
+}
+VectorInt::VectorInt(const VectorInt& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message() {
+  VectorInt* const _this = this; (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){from._impl_._has_bits_}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.val_){from._impl_.val_}
+    , decltype(_impl_.fieldvalues_){from._impl_.fieldvalues_}
+    , decltype(_impl_.secondsintoyear_){}
+    , decltype(_impl_.nano_){}
+    , decltype(_impl_.severity_){}
+    , decltype(_impl_.status_){}
+    , decltype(_impl_.repeatcount_){}
+    , decltype(_impl_.fieldactualchange_){}};
+
+  _internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+  ::memcpy(&_impl_.secondsintoyear_, &from._impl_.secondsintoyear_,
+    static_cast<size_t>(reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+    reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  // @@protoc_insertion_point(copy_constructor:EPICS.VectorInt)
+}
+
+inline void VectorInt::SharedCtor(
+    ::_pb::Arena* arena, bool is_message_owned) {
+  (void)arena;
+  (void)is_message_owned;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.val_){arena}
+    , decltype(_impl_.fieldvalues_){arena}
+    , decltype(_impl_.secondsintoyear_){0u}
+    , decltype(_impl_.nano_){0u}
+    , decltype(_impl_.severity_){0}
+    , decltype(_impl_.status_){0}
+    , decltype(_impl_.repeatcount_){0u}
+    , decltype(_impl_.fieldactualchange_){false}
+  };
+}
+
+VectorInt::~VectorInt() {
+  // @@protoc_insertion_point(destructor:EPICS.VectorInt)
+  if (auto *arena = _internal_metadata_.DeleteReturnArena<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>()) {
+  (void)arena;
+    return;
+  }
+  SharedDtor();
+}
+
+inline void VectorInt::SharedDtor() {
+  GOOGLE_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.val_.~RepeatedField();
+  _impl_.fieldvalues_.~RepeatedPtrField();
+}
+
+void VectorInt::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+void VectorInt::Clear() {
+// @@protoc_insertion_point(message_clear_start:EPICS.VectorInt)
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.val_.Clear();
+  _impl_.fieldvalues_.Clear();
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000003fu) {
+    ::memset(&_impl_.secondsintoyear_, 0, static_cast<size_t>(
+        reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+        reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  }
+  _impl_._has_bits_.Clear();
+  _internal_metadata_.Clear<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+}
+
+const char* VectorInt::_InternalParse(const char* ptr, ::_pbi::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  _Internal::HasBits has_bits{};
+  while (!ctx->Done(&ptr)) {
+    uint32_t tag;
+    ptr = ::_pbi::ReadTag(ptr, &tag);
+    switch (tag >> 3) {
+      // required uint32 secondsintoyear = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 8)) {
+          _Internal::set_has_secondsintoyear(&has_bits);
+          _impl_.secondsintoyear_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // required uint32 nano = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 16)) {
+          _Internal::set_has_nano(&has_bits);
+          _impl_.nano_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated sfixed32 val = 3 [packed = true];
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 26)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::PackedSFixed32Parser(_internal_mutable_val(), ptr, ctx);
+          CHK_(ptr);
+        } else if (static_cast<uint8_t>(tag) == 29) {
+          _internal_add_val(::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<int32_t>(ptr));
+          ptr += sizeof(int32_t);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 severity = 4 [default = 0];
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 32)) {
+          _Internal::set_has_severity(&has_bits);
+          _impl_.severity_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 status = 5 [default = 0];
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 40)) {
+          _Internal::set_has_status(&has_bits);
+          _impl_.status_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional uint32 repeatcount = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 48)) {
+          _Internal::set_has_repeatcount(&has_bits);
+          _impl_.repeatcount_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated .EPICS.FieldValue fieldvalues = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 58)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ctx->ParseMessage(_internal_add_fieldvalues(), ptr);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::ExpectTag<58>(ptr));
+        } else
+          goto handle_unusual;
+        continue;
+      // optional bool fieldactualchange = 8;
+      case 8:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 64)) {
+          _Internal::set_has_fieldactualchange(&has_bits);
+          _impl_.fieldactualchange_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint64(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      default:
+        goto handle_unusual;
+    }  // switch
+  handle_unusual:
+    if ((tag == 0) || ((tag & 7) == 4)) {
+      CHK_(ptr);
+      ctx->SetLastTag(tag);
+      goto message_done;
+    }
+    ptr = UnknownFieldParse(
+        tag,
+        _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(),
+        ptr, ctx);
+    CHK_(ptr != nullptr);
+  }  // while
+message_done:
+  _impl_._has_bits_.Or(has_bits);
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto message_done;
+#undef CHK_
+}
+
+uint8_t* VectorInt::_InternalSerialize(
+    uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:EPICS.VectorInt)
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  cached_has_bits = _impl_._has_bits_[0];
+  // required uint32 secondsintoyear = 1;
+  if (cached_has_bits & 0x00000001u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(1, this->_internal_secondsintoyear(), target);
+  }
+
+  // required uint32 nano = 2;
+  if (cached_has_bits & 0x00000002u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(2, this->_internal_nano(), target);
+  }
+
+  // repeated sfixed32 val = 3 [packed = true];
+  if (this->_internal_val_size() > 0) {
+    target = stream->WriteFixedPacked(3, _internal_val(), target);
+  }
+
+  // optional int32 severity = 4 [default = 0];
+  if (cached_has_bits & 0x00000004u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(4, this->_internal_severity(), target);
+  }
+
+  // optional int32 status = 5 [default = 0];
+  if (cached_has_bits & 0x00000008u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(5, this->_internal_status(), target);
+  }
+
+  // optional uint32 repeatcount = 6;
+  if (cached_has_bits & 0x00000010u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(6, this->_internal_repeatcount(), target);
+  }
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_fieldvalues_size()); i < n; i++) {
+    const auto& repfield = this->_internal_fieldvalues(i);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+        InternalWriteMessage(7, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  // optional bool fieldactualchange = 8;
+  if (cached_has_bits & 0x00000020u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteBoolToArray(8, this->_internal_fieldactualchange(), target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target = ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:EPICS.VectorInt)
+  return target;
+}
+
+size_t VectorInt::RequiredFieldsByteSizeFallback() const {
+// @@protoc_insertion_point(required_fields_byte_size_fallback_start:EPICS.VectorInt)
+  size_t total_size = 0;
+
+  if (_internal_has_secondsintoyear()) {
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+  }
+
+  if (_internal_has_nano()) {
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+  }
+
+  return total_size;
+}
+size_t VectorInt::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:EPICS.VectorInt)
+  size_t total_size = 0;
+
+  if (((_impl_._has_bits_[0] & 0x00000003) ^ 0x00000003) == 0) {  // All required fields are present.
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+
+  } else {
+    total_size += RequiredFieldsByteSizeFallback();
+  }
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated sfixed32 val = 3 [packed = true];
+  {
+    unsigned int count = static_cast<unsigned int>(this->_internal_val_size());
+    size_t data_size = 4UL * count;
+    if (data_size > 0) {
+      total_size += 1 +
+        ::_pbi::WireFormatLite::Int32Size(static_cast<int32_t>(data_size));
+    }
+    total_size += data_size;
+  }
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  total_size += 1UL * this->_internal_fieldvalues_size();
+  for (const auto& msg : this->_impl_.fieldvalues_) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(msg);
+  }
+
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000003cu) {
+    // optional int32 severity = 4 [default = 0];
+    if (cached_has_bits & 0x00000004u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_severity());
+    }
+
+    // optional int32 status = 5 [default = 0];
+    if (cached_has_bits & 0x00000008u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_status());
+    }
+
+    // optional uint32 repeatcount = 6;
+    if (cached_has_bits & 0x00000010u) {
+      total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_repeatcount());
+    }
+
+    // optional bool fieldactualchange = 8;
+    if (cached_has_bits & 0x00000020u) {
+      total_size += 1 + 1;
+    }
+
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData VectorInt::_class_data_ = {
+    ::PROTOBUF_NAMESPACE_ID::Message::CopyWithSourceCheck,
+    VectorInt::MergeImpl
+};
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*VectorInt::GetClassData() const { return &_class_data_; }
+
+
+void VectorInt::MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg) {
+  auto* const _this = static_cast<VectorInt*>(&to_msg);
+  auto& from = static_cast<const VectorInt&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:EPICS.VectorInt)
+  GOOGLE_DCHECK_NE(&from, _this);
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_impl_.val_.MergeFrom(from._impl_.val_);
+  _this->_impl_.fieldvalues_.MergeFrom(from._impl_.fieldvalues_);
+  cached_has_bits = from._impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000003fu) {
+    if (cached_has_bits & 0x00000001u) {
+      _this->_impl_.secondsintoyear_ = from._impl_.secondsintoyear_;
+    }
+    if (cached_has_bits & 0x00000002u) {
+      _this->_impl_.nano_ = from._impl_.nano_;
+    }
+    if (cached_has_bits & 0x00000004u) {
+      _this->_impl_.severity_ = from._impl_.severity_;
+    }
+    if (cached_has_bits & 0x00000008u) {
+      _this->_impl_.status_ = from._impl_.status_;
+    }
+    if (cached_has_bits & 0x00000010u) {
+      _this->_impl_.repeatcount_ = from._impl_.repeatcount_;
+    }
+    if (cached_has_bits & 0x00000020u) {
+      _this->_impl_.fieldactualchange_ = from._impl_.fieldactualchange_;
+    }
+    _this->_impl_._has_bits_[0] |= cached_has_bits;
+  }
+  _this->_internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void VectorInt::CopyFrom(const VectorInt& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:EPICS.VectorInt)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool VectorInt::IsInitialized() const {
+  if (_Internal::MissingRequiredFields(_impl_._has_bits_)) return false;
+  if (!::PROTOBUF_NAMESPACE_ID::internal::AllAreInitialized(_impl_.fieldvalues_))
+    return false;
+  return true;
+}
+
+void VectorInt::InternalSwap(VectorInt* other) {
+  using std::swap;
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  swap(_impl_._has_bits_[0], other->_impl_._has_bits_[0]);
+  _impl_.val_.InternalSwap(&other->_impl_.val_);
+  _impl_.fieldvalues_.InternalSwap(&other->_impl_.fieldvalues_);
+  ::PROTOBUF_NAMESPACE_ID::internal::memswap<
+      PROTOBUF_FIELD_OFFSET(VectorInt, _impl_.fieldactualchange_)
+      + sizeof(VectorInt::_impl_.fieldactualchange_)
+      - PROTOBUF_FIELD_OFFSET(VectorInt, _impl_.secondsintoyear_)>(
+          reinterpret_cast<char*>(&_impl_.secondsintoyear_),
+          reinterpret_cast<char*>(&other->_impl_.secondsintoyear_));
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata VectorInt::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_getter, &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_once,
+      file_level_metadata_carchive_2fbackend_2fEPICSEvent_2eproto[11]);
+}
+
+// ===================================================================
+
+class VectorEnum::_Internal {
+ public:
+  using HasBits = decltype(std::declval<VectorEnum>()._impl_._has_bits_);
+  static void set_has_secondsintoyear(HasBits* has_bits) {
+    (*has_bits)[0] |= 1u;
+  }
+  static void set_has_nano(HasBits* has_bits) {
+    (*has_bits)[0] |= 2u;
+  }
+  static void set_has_severity(HasBits* has_bits) {
+    (*has_bits)[0] |= 4u;
+  }
+  static void set_has_status(HasBits* has_bits) {
+    (*has_bits)[0] |= 8u;
+  }
+  static void set_has_repeatcount(HasBits* has_bits) {
+    (*has_bits)[0] |= 16u;
+  }
+  static void set_has_fieldactualchange(HasBits* has_bits) {
+    (*has_bits)[0] |= 32u;
+  }
+  static bool MissingRequiredFields(const HasBits& has_bits) {
+    return ((has_bits[0] & 0x00000003) ^ 0x00000003) != 0;
+  }
+};
+
+VectorEnum::VectorEnum(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                         bool is_message_owned)
+  : ::PROTOBUF_NAMESPACE_ID::Message(arena, is_message_owned) {
+  SharedCtor(arena, is_message_owned);
+  // @@protoc_insertion_point(arena_constructor:EPICS.VectorEnum)
+}
+VectorEnum::VectorEnum(const VectorEnum& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message() {
+  VectorEnum* const _this = this; (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){from._impl_._has_bits_}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.val_){from._impl_.val_}
+    , /*decltype(_impl_._val_cached_byte_size_)*/{0}
+    , decltype(_impl_.fieldvalues_){from._impl_.fieldvalues_}
+    , decltype(_impl_.secondsintoyear_){}
+    , decltype(_impl_.nano_){}
+    , decltype(_impl_.severity_){}
+    , decltype(_impl_.status_){}
+    , decltype(_impl_.repeatcount_){}
+    , decltype(_impl_.fieldactualchange_){}};
+
+  _internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+  ::memcpy(&_impl_.secondsintoyear_, &from._impl_.secondsintoyear_,
+    static_cast<size_t>(reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+    reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  // @@protoc_insertion_point(copy_constructor:EPICS.VectorEnum)
+}
+
+inline void VectorEnum::SharedCtor(
+    ::_pb::Arena* arena, bool is_message_owned) {
+  (void)arena;
+  (void)is_message_owned;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.val_){arena}
+    , /*decltype(_impl_._val_cached_byte_size_)*/{0}
+    , decltype(_impl_.fieldvalues_){arena}
+    , decltype(_impl_.secondsintoyear_){0u}
+    , decltype(_impl_.nano_){0u}
+    , decltype(_impl_.severity_){0}
+    , decltype(_impl_.status_){0}
+    , decltype(_impl_.repeatcount_){0u}
+    , decltype(_impl_.fieldactualchange_){false}
+  };
+}
+
+VectorEnum::~VectorEnum() {
+  // @@protoc_insertion_point(destructor:EPICS.VectorEnum)
+  if (auto *arena = _internal_metadata_.DeleteReturnArena<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>()) {
+  (void)arena;
+    return;
+  }
+  SharedDtor();
+}
+
+inline void VectorEnum::SharedDtor() {
+  GOOGLE_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.val_.~RepeatedField();
+  _impl_.fieldvalues_.~RepeatedPtrField();
+}
+
+void VectorEnum::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+void VectorEnum::Clear() {
+// @@protoc_insertion_point(message_clear_start:EPICS.VectorEnum)
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.val_.Clear();
+  _impl_.fieldvalues_.Clear();
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000003fu) {
+    ::memset(&_impl_.secondsintoyear_, 0, static_cast<size_t>(
+        reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+        reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  }
+  _impl_._has_bits_.Clear();
+  _internal_metadata_.Clear<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+}
+
+const char* VectorEnum::_InternalParse(const char* ptr, ::_pbi::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  _Internal::HasBits has_bits{};
+  while (!ctx->Done(&ptr)) {
+    uint32_t tag;
+    ptr = ::_pbi::ReadTag(ptr, &tag);
+    switch (tag >> 3) {
+      // required uint32 secondsintoyear = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 8)) {
+          _Internal::set_has_secondsintoyear(&has_bits);
+          _impl_.secondsintoyear_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // required uint32 nano = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 16)) {
+          _Internal::set_has_nano(&has_bits);
+          _impl_.nano_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated sint32 val = 3 [packed = true];
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 26)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::PackedSInt32Parser(_internal_mutable_val(), ptr, ctx);
+          CHK_(ptr);
+        } else if (static_cast<uint8_t>(tag) == 24) {
+          _internal_add_val(::PROTOBUF_NAMESPACE_ID::internal::ReadVarintZigZag32(&ptr));
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 severity = 4 [default = 0];
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 32)) {
+          _Internal::set_has_severity(&has_bits);
+          _impl_.severity_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 status = 5 [default = 0];
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 40)) {
+          _Internal::set_has_status(&has_bits);
+          _impl_.status_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional uint32 repeatcount = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 48)) {
+          _Internal::set_has_repeatcount(&has_bits);
+          _impl_.repeatcount_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated .EPICS.FieldValue fieldvalues = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 58)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ctx->ParseMessage(_internal_add_fieldvalues(), ptr);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::ExpectTag<58>(ptr));
+        } else
+          goto handle_unusual;
+        continue;
+      // optional bool fieldactualchange = 8;
+      case 8:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 64)) {
+          _Internal::set_has_fieldactualchange(&has_bits);
+          _impl_.fieldactualchange_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint64(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      default:
+        goto handle_unusual;
+    }  // switch
+  handle_unusual:
+    if ((tag == 0) || ((tag & 7) == 4)) {
+      CHK_(ptr);
+      ctx->SetLastTag(tag);
+      goto message_done;
+    }
+    ptr = UnknownFieldParse(
+        tag,
+        _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(),
+        ptr, ctx);
+    CHK_(ptr != nullptr);
+  }  // while
+message_done:
+  _impl_._has_bits_.Or(has_bits);
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto message_done;
+#undef CHK_
+}
+
+uint8_t* VectorEnum::_InternalSerialize(
+    uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:EPICS.VectorEnum)
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  cached_has_bits = _impl_._has_bits_[0];
+  // required uint32 secondsintoyear = 1;
+  if (cached_has_bits & 0x00000001u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(1, this->_internal_secondsintoyear(), target);
+  }
+
+  // required uint32 nano = 2;
+  if (cached_has_bits & 0x00000002u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(2, this->_internal_nano(), target);
+  }
+
+  // repeated sint32 val = 3 [packed = true];
+  {
+    int byte_size = _impl_._val_cached_byte_size_.load(std::memory_order_relaxed);
+    if (byte_size > 0) {
+      target = stream->WriteSInt32Packed(
+          3, _internal_val(), byte_size, target);
+    }
+  }
+
+  // optional int32 severity = 4 [default = 0];
+  if (cached_has_bits & 0x00000004u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(4, this->_internal_severity(), target);
+  }
+
+  // optional int32 status = 5 [default = 0];
+  if (cached_has_bits & 0x00000008u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(5, this->_internal_status(), target);
+  }
+
+  // optional uint32 repeatcount = 6;
+  if (cached_has_bits & 0x00000010u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(6, this->_internal_repeatcount(), target);
+  }
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_fieldvalues_size()); i < n; i++) {
+    const auto& repfield = this->_internal_fieldvalues(i);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+        InternalWriteMessage(7, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  // optional bool fieldactualchange = 8;
+  if (cached_has_bits & 0x00000020u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteBoolToArray(8, this->_internal_fieldactualchange(), target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target = ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:EPICS.VectorEnum)
+  return target;
+}
+
+size_t VectorEnum::RequiredFieldsByteSizeFallback() const {
+// @@protoc_insertion_point(required_fields_byte_size_fallback_start:EPICS.VectorEnum)
+  size_t total_size = 0;
+
+  if (_internal_has_secondsintoyear()) {
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+  }
+
+  if (_internal_has_nano()) {
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+  }
+
+  return total_size;
+}
+size_t VectorEnum::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:EPICS.VectorEnum)
+  size_t total_size = 0;
+
+  if (((_impl_._has_bits_[0] & 0x00000003) ^ 0x00000003) == 0) {  // All required fields are present.
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+
+  } else {
+    total_size += RequiredFieldsByteSizeFallback();
+  }
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated sint32 val = 3 [packed = true];
+  {
+    size_t data_size = ::_pbi::WireFormatLite::
+      SInt32Size(this->_impl_.val_);
+    if (data_size > 0) {
+      total_size += 1 +
+        ::_pbi::WireFormatLite::Int32Size(static_cast<int32_t>(data_size));
+    }
+    int cached_size = ::_pbi::ToCachedSize(data_size);
+    _impl_._val_cached_byte_size_.store(cached_size,
+                                    std::memory_order_relaxed);
+    total_size += data_size;
+  }
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  total_size += 1UL * this->_internal_fieldvalues_size();
+  for (const auto& msg : this->_impl_.fieldvalues_) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(msg);
+  }
+
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000003cu) {
+    // optional int32 severity = 4 [default = 0];
+    if (cached_has_bits & 0x00000004u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_severity());
+    }
+
+    // optional int32 status = 5 [default = 0];
+    if (cached_has_bits & 0x00000008u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_status());
+    }
+
+    // optional uint32 repeatcount = 6;
+    if (cached_has_bits & 0x00000010u) {
+      total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_repeatcount());
+    }
+
+    // optional bool fieldactualchange = 8;
+    if (cached_has_bits & 0x00000020u) {
+      total_size += 1 + 1;
+    }
+
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData VectorEnum::_class_data_ = {
+    ::PROTOBUF_NAMESPACE_ID::Message::CopyWithSourceCheck,
+    VectorEnum::MergeImpl
+};
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*VectorEnum::GetClassData() const { return &_class_data_; }
+
+
+void VectorEnum::MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg) {
+  auto* const _this = static_cast<VectorEnum*>(&to_msg);
+  auto& from = static_cast<const VectorEnum&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:EPICS.VectorEnum)
+  GOOGLE_DCHECK_NE(&from, _this);
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_impl_.val_.MergeFrom(from._impl_.val_);
+  _this->_impl_.fieldvalues_.MergeFrom(from._impl_.fieldvalues_);
+  cached_has_bits = from._impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000003fu) {
+    if (cached_has_bits & 0x00000001u) {
+      _this->_impl_.secondsintoyear_ = from._impl_.secondsintoyear_;
+    }
+    if (cached_has_bits & 0x00000002u) {
+      _this->_impl_.nano_ = from._impl_.nano_;
+    }
+    if (cached_has_bits & 0x00000004u) {
+      _this->_impl_.severity_ = from._impl_.severity_;
+    }
+    if (cached_has_bits & 0x00000008u) {
+      _this->_impl_.status_ = from._impl_.status_;
+    }
+    if (cached_has_bits & 0x00000010u) {
+      _this->_impl_.repeatcount_ = from._impl_.repeatcount_;
+    }
+    if (cached_has_bits & 0x00000020u) {
+      _this->_impl_.fieldactualchange_ = from._impl_.fieldactualchange_;
+    }
+    _this->_impl_._has_bits_[0] |= cached_has_bits;
+  }
+  _this->_internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void VectorEnum::CopyFrom(const VectorEnum& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:EPICS.VectorEnum)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool VectorEnum::IsInitialized() const {
+  if (_Internal::MissingRequiredFields(_impl_._has_bits_)) return false;
+  if (!::PROTOBUF_NAMESPACE_ID::internal::AllAreInitialized(_impl_.fieldvalues_))
+    return false;
+  return true;
+}
+
+void VectorEnum::InternalSwap(VectorEnum* other) {
+  using std::swap;
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  swap(_impl_._has_bits_[0], other->_impl_._has_bits_[0]);
+  _impl_.val_.InternalSwap(&other->_impl_.val_);
+  _impl_.fieldvalues_.InternalSwap(&other->_impl_.fieldvalues_);
+  ::PROTOBUF_NAMESPACE_ID::internal::memswap<
+      PROTOBUF_FIELD_OFFSET(VectorEnum, _impl_.fieldactualchange_)
+      + sizeof(VectorEnum::_impl_.fieldactualchange_)
+      - PROTOBUF_FIELD_OFFSET(VectorEnum, _impl_.secondsintoyear_)>(
+          reinterpret_cast<char*>(&_impl_.secondsintoyear_),
+          reinterpret_cast<char*>(&other->_impl_.secondsintoyear_));
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata VectorEnum::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_getter, &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_once,
+      file_level_metadata_carchive_2fbackend_2fEPICSEvent_2eproto[12]);
+}
+
+// ===================================================================
+
+class VectorFloat::_Internal {
+ public:
+  using HasBits = decltype(std::declval<VectorFloat>()._impl_._has_bits_);
+  static void set_has_secondsintoyear(HasBits* has_bits) {
+    (*has_bits)[0] |= 1u;
+  }
+  static void set_has_nano(HasBits* has_bits) {
+    (*has_bits)[0] |= 2u;
+  }
+  static void set_has_severity(HasBits* has_bits) {
+    (*has_bits)[0] |= 4u;
+  }
+  static void set_has_status(HasBits* has_bits) {
+    (*has_bits)[0] |= 8u;
+  }
+  static void set_has_repeatcount(HasBits* has_bits) {
+    (*has_bits)[0] |= 16u;
+  }
+  static void set_has_fieldactualchange(HasBits* has_bits) {
+    (*has_bits)[0] |= 32u;
+  }
+  static bool MissingRequiredFields(const HasBits& has_bits) {
+    return ((has_bits[0] & 0x00000003) ^ 0x00000003) != 0;
+  }
+};
+
+VectorFloat::VectorFloat(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                         bool is_message_owned)
+  : ::PROTOBUF_NAMESPACE_ID::Message(arena, is_message_owned) {
+  SharedCtor(arena, is_message_owned);
+  // @@protoc_insertion_point(arena_constructor:EPICS.VectorFloat)
+}
+VectorFloat::VectorFloat(const VectorFloat& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message() {
+  VectorFloat* const _this = this; (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){from._impl_._has_bits_}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.val_){from._impl_.val_}
+    , decltype(_impl_.fieldvalues_){from._impl_.fieldvalues_}
+    , decltype(_impl_.secondsintoyear_){}
+    , decltype(_impl_.nano_){}
+    , decltype(_impl_.severity_){}
+    , decltype(_impl_.status_){}
+    , decltype(_impl_.repeatcount_){}
+    , decltype(_impl_.fieldactualchange_){}};
+
+  _internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+  ::memcpy(&_impl_.secondsintoyear_, &from._impl_.secondsintoyear_,
+    static_cast<size_t>(reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+    reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  // @@protoc_insertion_point(copy_constructor:EPICS.VectorFloat)
+}
+
+inline void VectorFloat::SharedCtor(
+    ::_pb::Arena* arena, bool is_message_owned) {
+  (void)arena;
+  (void)is_message_owned;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.val_){arena}
+    , decltype(_impl_.fieldvalues_){arena}
+    , decltype(_impl_.secondsintoyear_){0u}
+    , decltype(_impl_.nano_){0u}
+    , decltype(_impl_.severity_){0}
+    , decltype(_impl_.status_){0}
+    , decltype(_impl_.repeatcount_){0u}
+    , decltype(_impl_.fieldactualchange_){false}
+  };
+}
+
+VectorFloat::~VectorFloat() {
+  // @@protoc_insertion_point(destructor:EPICS.VectorFloat)
+  if (auto *arena = _internal_metadata_.DeleteReturnArena<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>()) {
+  (void)arena;
+    return;
+  }
+  SharedDtor();
+}
+
+inline void VectorFloat::SharedDtor() {
+  GOOGLE_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.val_.~RepeatedField();
+  _impl_.fieldvalues_.~RepeatedPtrField();
+}
+
+void VectorFloat::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+void VectorFloat::Clear() {
+// @@protoc_insertion_point(message_clear_start:EPICS.VectorFloat)
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.val_.Clear();
+  _impl_.fieldvalues_.Clear();
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000003fu) {
+    ::memset(&_impl_.secondsintoyear_, 0, static_cast<size_t>(
+        reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+        reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  }
+  _impl_._has_bits_.Clear();
+  _internal_metadata_.Clear<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+}
+
+const char* VectorFloat::_InternalParse(const char* ptr, ::_pbi::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  _Internal::HasBits has_bits{};
+  while (!ctx->Done(&ptr)) {
+    uint32_t tag;
+    ptr = ::_pbi::ReadTag(ptr, &tag);
+    switch (tag >> 3) {
+      // required uint32 secondsintoyear = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 8)) {
+          _Internal::set_has_secondsintoyear(&has_bits);
+          _impl_.secondsintoyear_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // required uint32 nano = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 16)) {
+          _Internal::set_has_nano(&has_bits);
+          _impl_.nano_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated float val = 3 [packed = true];
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 26)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::PackedFloatParser(_internal_mutable_val(), ptr, ctx);
+          CHK_(ptr);
+        } else if (static_cast<uint8_t>(tag) == 29) {
+          _internal_add_val(::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<float>(ptr));
+          ptr += sizeof(float);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 severity = 4 [default = 0];
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 32)) {
+          _Internal::set_has_severity(&has_bits);
+          _impl_.severity_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 status = 5 [default = 0];
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 40)) {
+          _Internal::set_has_status(&has_bits);
+          _impl_.status_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional uint32 repeatcount = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 48)) {
+          _Internal::set_has_repeatcount(&has_bits);
+          _impl_.repeatcount_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated .EPICS.FieldValue fieldvalues = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 58)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ctx->ParseMessage(_internal_add_fieldvalues(), ptr);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::ExpectTag<58>(ptr));
+        } else
+          goto handle_unusual;
+        continue;
+      // optional bool fieldactualchange = 8;
+      case 8:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 64)) {
+          _Internal::set_has_fieldactualchange(&has_bits);
+          _impl_.fieldactualchange_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint64(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      default:
+        goto handle_unusual;
+    }  // switch
+  handle_unusual:
+    if ((tag == 0) || ((tag & 7) == 4)) {
+      CHK_(ptr);
+      ctx->SetLastTag(tag);
+      goto message_done;
+    }
+    ptr = UnknownFieldParse(
+        tag,
+        _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(),
+        ptr, ctx);
+    CHK_(ptr != nullptr);
+  }  // while
+message_done:
+  _impl_._has_bits_.Or(has_bits);
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto message_done;
+#undef CHK_
+}
+
+uint8_t* VectorFloat::_InternalSerialize(
+    uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:EPICS.VectorFloat)
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  cached_has_bits = _impl_._has_bits_[0];
+  // required uint32 secondsintoyear = 1;
+  if (cached_has_bits & 0x00000001u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(1, this->_internal_secondsintoyear(), target);
+  }
+
+  // required uint32 nano = 2;
+  if (cached_has_bits & 0x00000002u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(2, this->_internal_nano(), target);
+  }
+
+  // repeated float val = 3 [packed = true];
+  if (this->_internal_val_size() > 0) {
+    target = stream->WriteFixedPacked(3, _internal_val(), target);
+  }
+
+  // optional int32 severity = 4 [default = 0];
+  if (cached_has_bits & 0x00000004u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(4, this->_internal_severity(), target);
+  }
+
+  // optional int32 status = 5 [default = 0];
+  if (cached_has_bits & 0x00000008u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(5, this->_internal_status(), target);
+  }
+
+  // optional uint32 repeatcount = 6;
+  if (cached_has_bits & 0x00000010u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(6, this->_internal_repeatcount(), target);
+  }
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_fieldvalues_size()); i < n; i++) {
+    const auto& repfield = this->_internal_fieldvalues(i);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+        InternalWriteMessage(7, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  // optional bool fieldactualchange = 8;
+  if (cached_has_bits & 0x00000020u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteBoolToArray(8, this->_internal_fieldactualchange(), target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target = ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:EPICS.VectorFloat)
+  return target;
+}
+
+size_t VectorFloat::RequiredFieldsByteSizeFallback() const {
+// @@protoc_insertion_point(required_fields_byte_size_fallback_start:EPICS.VectorFloat)
+  size_t total_size = 0;
+
+  if (_internal_has_secondsintoyear()) {
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+  }
+
+  if (_internal_has_nano()) {
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+  }
+
+  return total_size;
+}
+size_t VectorFloat::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:EPICS.VectorFloat)
+  size_t total_size = 0;
+
+  if (((_impl_._has_bits_[0] & 0x00000003) ^ 0x00000003) == 0) {  // All required fields are present.
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+
+  } else {
+    total_size += RequiredFieldsByteSizeFallback();
+  }
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated float val = 3 [packed = true];
+  {
+    unsigned int count = static_cast<unsigned int>(this->_internal_val_size());
+    size_t data_size = 4UL * count;
+    if (data_size > 0) {
+      total_size += 1 +
+        ::_pbi::WireFormatLite::Int32Size(static_cast<int32_t>(data_size));
+    }
+    total_size += data_size;
+  }
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  total_size += 1UL * this->_internal_fieldvalues_size();
+  for (const auto& msg : this->_impl_.fieldvalues_) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(msg);
+  }
+
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000003cu) {
+    // optional int32 severity = 4 [default = 0];
+    if (cached_has_bits & 0x00000004u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_severity());
+    }
+
+    // optional int32 status = 5 [default = 0];
+    if (cached_has_bits & 0x00000008u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_status());
+    }
+
+    // optional uint32 repeatcount = 6;
+    if (cached_has_bits & 0x00000010u) {
+      total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_repeatcount());
+    }
+
+    // optional bool fieldactualchange = 8;
+    if (cached_has_bits & 0x00000020u) {
+      total_size += 1 + 1;
+    }
+
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData VectorFloat::_class_data_ = {
+    ::PROTOBUF_NAMESPACE_ID::Message::CopyWithSourceCheck,
+    VectorFloat::MergeImpl
+};
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*VectorFloat::GetClassData() const { return &_class_data_; }
+
+
+void VectorFloat::MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg) {
+  auto* const _this = static_cast<VectorFloat*>(&to_msg);
+  auto& from = static_cast<const VectorFloat&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:EPICS.VectorFloat)
+  GOOGLE_DCHECK_NE(&from, _this);
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_impl_.val_.MergeFrom(from._impl_.val_);
+  _this->_impl_.fieldvalues_.MergeFrom(from._impl_.fieldvalues_);
+  cached_has_bits = from._impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000003fu) {
+    if (cached_has_bits & 0x00000001u) {
+      _this->_impl_.secondsintoyear_ = from._impl_.secondsintoyear_;
+    }
+    if (cached_has_bits & 0x00000002u) {
+      _this->_impl_.nano_ = from._impl_.nano_;
+    }
+    if (cached_has_bits & 0x00000004u) {
+      _this->_impl_.severity_ = from._impl_.severity_;
+    }
+    if (cached_has_bits & 0x00000008u) {
+      _this->_impl_.status_ = from._impl_.status_;
+    }
+    if (cached_has_bits & 0x00000010u) {
+      _this->_impl_.repeatcount_ = from._impl_.repeatcount_;
+    }
+    if (cached_has_bits & 0x00000020u) {
+      _this->_impl_.fieldactualchange_ = from._impl_.fieldactualchange_;
+    }
+    _this->_impl_._has_bits_[0] |= cached_has_bits;
+  }
+  _this->_internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void VectorFloat::CopyFrom(const VectorFloat& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:EPICS.VectorFloat)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool VectorFloat::IsInitialized() const {
+  if (_Internal::MissingRequiredFields(_impl_._has_bits_)) return false;
+  if (!::PROTOBUF_NAMESPACE_ID::internal::AllAreInitialized(_impl_.fieldvalues_))
+    return false;
+  return true;
+}
+
+void VectorFloat::InternalSwap(VectorFloat* other) {
+  using std::swap;
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  swap(_impl_._has_bits_[0], other->_impl_._has_bits_[0]);
+  _impl_.val_.InternalSwap(&other->_impl_.val_);
+  _impl_.fieldvalues_.InternalSwap(&other->_impl_.fieldvalues_);
+  ::PROTOBUF_NAMESPACE_ID::internal::memswap<
+      PROTOBUF_FIELD_OFFSET(VectorFloat, _impl_.fieldactualchange_)
+      + sizeof(VectorFloat::_impl_.fieldactualchange_)
+      - PROTOBUF_FIELD_OFFSET(VectorFloat, _impl_.secondsintoyear_)>(
+          reinterpret_cast<char*>(&_impl_.secondsintoyear_),
+          reinterpret_cast<char*>(&other->_impl_.secondsintoyear_));
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata VectorFloat::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_getter, &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_once,
+      file_level_metadata_carchive_2fbackend_2fEPICSEvent_2eproto[13]);
+}
+
+// ===================================================================
+
+class VectorDouble::_Internal {
+ public:
+  using HasBits = decltype(std::declval<VectorDouble>()._impl_._has_bits_);
+  static void set_has_secondsintoyear(HasBits* has_bits) {
+    (*has_bits)[0] |= 1u;
+  }
+  static void set_has_nano(HasBits* has_bits) {
+    (*has_bits)[0] |= 2u;
+  }
+  static void set_has_severity(HasBits* has_bits) {
+    (*has_bits)[0] |= 4u;
+  }
+  static void set_has_status(HasBits* has_bits) {
+    (*has_bits)[0] |= 8u;
+  }
+  static void set_has_repeatcount(HasBits* has_bits) {
+    (*has_bits)[0] |= 16u;
+  }
+  static void set_has_fieldactualchange(HasBits* has_bits) {
+    (*has_bits)[0] |= 32u;
+  }
+  static bool MissingRequiredFields(const HasBits& has_bits) {
+    return ((has_bits[0] & 0x00000003) ^ 0x00000003) != 0;
+  }
+};
+
+VectorDouble::VectorDouble(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                         bool is_message_owned)
+  : ::PROTOBUF_NAMESPACE_ID::Message(arena, is_message_owned) {
+  SharedCtor(arena, is_message_owned);
+  // @@protoc_insertion_point(arena_constructor:EPICS.VectorDouble)
+}
+VectorDouble::VectorDouble(const VectorDouble& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message() {
+  VectorDouble* const _this = this; (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){from._impl_._has_bits_}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.val_){from._impl_.val_}
+    , decltype(_impl_.fieldvalues_){from._impl_.fieldvalues_}
+    , decltype(_impl_.secondsintoyear_){}
+    , decltype(_impl_.nano_){}
+    , decltype(_impl_.severity_){}
+    , decltype(_impl_.status_){}
+    , decltype(_impl_.repeatcount_){}
+    , decltype(_impl_.fieldactualchange_){}};
+
+  _internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+  ::memcpy(&_impl_.secondsintoyear_, &from._impl_.secondsintoyear_,
+    static_cast<size_t>(reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+    reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  // @@protoc_insertion_point(copy_constructor:EPICS.VectorDouble)
+}
+
+inline void VectorDouble::SharedCtor(
+    ::_pb::Arena* arena, bool is_message_owned) {
+  (void)arena;
+  (void)is_message_owned;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.val_){arena}
+    , decltype(_impl_.fieldvalues_){arena}
+    , decltype(_impl_.secondsintoyear_){0u}
+    , decltype(_impl_.nano_){0u}
+    , decltype(_impl_.severity_){0}
+    , decltype(_impl_.status_){0}
+    , decltype(_impl_.repeatcount_){0u}
+    , decltype(_impl_.fieldactualchange_){false}
+  };
+}
+
+VectorDouble::~VectorDouble() {
+  // @@protoc_insertion_point(destructor:EPICS.VectorDouble)
+  if (auto *arena = _internal_metadata_.DeleteReturnArena<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>()) {
+  (void)arena;
+    return;
+  }
+  SharedDtor();
+}
+
+inline void VectorDouble::SharedDtor() {
+  GOOGLE_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.val_.~RepeatedField();
+  _impl_.fieldvalues_.~RepeatedPtrField();
+}
+
+void VectorDouble::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+void VectorDouble::Clear() {
+// @@protoc_insertion_point(message_clear_start:EPICS.VectorDouble)
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.val_.Clear();
+  _impl_.fieldvalues_.Clear();
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000003fu) {
+    ::memset(&_impl_.secondsintoyear_, 0, static_cast<size_t>(
+        reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+        reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  }
+  _impl_._has_bits_.Clear();
+  _internal_metadata_.Clear<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+}
+
+const char* VectorDouble::_InternalParse(const char* ptr, ::_pbi::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  _Internal::HasBits has_bits{};
+  while (!ctx->Done(&ptr)) {
+    uint32_t tag;
+    ptr = ::_pbi::ReadTag(ptr, &tag);
+    switch (tag >> 3) {
+      // required uint32 secondsintoyear = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 8)) {
+          _Internal::set_has_secondsintoyear(&has_bits);
+          _impl_.secondsintoyear_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // required uint32 nano = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 16)) {
+          _Internal::set_has_nano(&has_bits);
+          _impl_.nano_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated double val = 3 [packed = true];
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 26)) {
+          ptr = ::PROTOBUF_NAMESPACE_ID::internal::PackedDoubleParser(_internal_mutable_val(), ptr, ctx);
+          CHK_(ptr);
+        } else if (static_cast<uint8_t>(tag) == 25) {
+          _internal_add_val(::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<double>(ptr));
+          ptr += sizeof(double);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 severity = 4 [default = 0];
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 32)) {
+          _Internal::set_has_severity(&has_bits);
+          _impl_.severity_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 status = 5 [default = 0];
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 40)) {
+          _Internal::set_has_status(&has_bits);
+          _impl_.status_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional uint32 repeatcount = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 48)) {
+          _Internal::set_has_repeatcount(&has_bits);
+          _impl_.repeatcount_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated .EPICS.FieldValue fieldvalues = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 58)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ctx->ParseMessage(_internal_add_fieldvalues(), ptr);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::ExpectTag<58>(ptr));
+        } else
+          goto handle_unusual;
+        continue;
+      // optional bool fieldactualchange = 8;
+      case 8:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 64)) {
+          _Internal::set_has_fieldactualchange(&has_bits);
+          _impl_.fieldactualchange_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint64(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      default:
+        goto handle_unusual;
+    }  // switch
+  handle_unusual:
+    if ((tag == 0) || ((tag & 7) == 4)) {
+      CHK_(ptr);
+      ctx->SetLastTag(tag);
+      goto message_done;
+    }
+    ptr = UnknownFieldParse(
+        tag,
+        _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(),
+        ptr, ctx);
+    CHK_(ptr != nullptr);
+  }  // while
+message_done:
+  _impl_._has_bits_.Or(has_bits);
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto message_done;
+#undef CHK_
+}
+
+uint8_t* VectorDouble::_InternalSerialize(
+    uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:EPICS.VectorDouble)
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  cached_has_bits = _impl_._has_bits_[0];
+  // required uint32 secondsintoyear = 1;
+  if (cached_has_bits & 0x00000001u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(1, this->_internal_secondsintoyear(), target);
+  }
+
+  // required uint32 nano = 2;
+  if (cached_has_bits & 0x00000002u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(2, this->_internal_nano(), target);
+  }
+
+  // repeated double val = 3 [packed = true];
+  if (this->_internal_val_size() > 0) {
+    target = stream->WriteFixedPacked(3, _internal_val(), target);
+  }
+
+  // optional int32 severity = 4 [default = 0];
+  if (cached_has_bits & 0x00000004u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(4, this->_internal_severity(), target);
+  }
+
+  // optional int32 status = 5 [default = 0];
+  if (cached_has_bits & 0x00000008u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(5, this->_internal_status(), target);
+  }
+
+  // optional uint32 repeatcount = 6;
+  if (cached_has_bits & 0x00000010u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(6, this->_internal_repeatcount(), target);
+  }
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_fieldvalues_size()); i < n; i++) {
+    const auto& repfield = this->_internal_fieldvalues(i);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+        InternalWriteMessage(7, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  // optional bool fieldactualchange = 8;
+  if (cached_has_bits & 0x00000020u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteBoolToArray(8, this->_internal_fieldactualchange(), target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target = ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:EPICS.VectorDouble)
+  return target;
+}
+
+size_t VectorDouble::RequiredFieldsByteSizeFallback() const {
+// @@protoc_insertion_point(required_fields_byte_size_fallback_start:EPICS.VectorDouble)
+  size_t total_size = 0;
+
+  if (_internal_has_secondsintoyear()) {
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+  }
+
+  if (_internal_has_nano()) {
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+  }
+
+  return total_size;
+}
+size_t VectorDouble::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:EPICS.VectorDouble)
+  size_t total_size = 0;
+
+  if (((_impl_._has_bits_[0] & 0x00000003) ^ 0x00000003) == 0) {  // All required fields are present.
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+
+  } else {
+    total_size += RequiredFieldsByteSizeFallback();
+  }
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated double val = 3 [packed = true];
+  {
+    unsigned int count = static_cast<unsigned int>(this->_internal_val_size());
+    size_t data_size = 8UL * count;
+    if (data_size > 0) {
+      total_size += 1 +
+        ::_pbi::WireFormatLite::Int32Size(static_cast<int32_t>(data_size));
+    }
+    total_size += data_size;
+  }
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  total_size += 1UL * this->_internal_fieldvalues_size();
+  for (const auto& msg : this->_impl_.fieldvalues_) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(msg);
+  }
+
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000003cu) {
+    // optional int32 severity = 4 [default = 0];
+    if (cached_has_bits & 0x00000004u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_severity());
+    }
+
+    // optional int32 status = 5 [default = 0];
+    if (cached_has_bits & 0x00000008u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_status());
+    }
+
+    // optional uint32 repeatcount = 6;
+    if (cached_has_bits & 0x00000010u) {
+      total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_repeatcount());
+    }
+
+    // optional bool fieldactualchange = 8;
+    if (cached_has_bits & 0x00000020u) {
+      total_size += 1 + 1;
+    }
+
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData VectorDouble::_class_data_ = {
+    ::PROTOBUF_NAMESPACE_ID::Message::CopyWithSourceCheck,
+    VectorDouble::MergeImpl
+};
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*VectorDouble::GetClassData() const { return &_class_data_; }
+
+
+void VectorDouble::MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg) {
+  auto* const _this = static_cast<VectorDouble*>(&to_msg);
+  auto& from = static_cast<const VectorDouble&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:EPICS.VectorDouble)
+  GOOGLE_DCHECK_NE(&from, _this);
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_impl_.val_.MergeFrom(from._impl_.val_);
+  _this->_impl_.fieldvalues_.MergeFrom(from._impl_.fieldvalues_);
+  cached_has_bits = from._impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000003fu) {
+    if (cached_has_bits & 0x00000001u) {
+      _this->_impl_.secondsintoyear_ = from._impl_.secondsintoyear_;
+    }
+    if (cached_has_bits & 0x00000002u) {
+      _this->_impl_.nano_ = from._impl_.nano_;
+    }
+    if (cached_has_bits & 0x00000004u) {
+      _this->_impl_.severity_ = from._impl_.severity_;
+    }
+    if (cached_has_bits & 0x00000008u) {
+      _this->_impl_.status_ = from._impl_.status_;
+    }
+    if (cached_has_bits & 0x00000010u) {
+      _this->_impl_.repeatcount_ = from._impl_.repeatcount_;
+    }
+    if (cached_has_bits & 0x00000020u) {
+      _this->_impl_.fieldactualchange_ = from._impl_.fieldactualchange_;
+    }
+    _this->_impl_._has_bits_[0] |= cached_has_bits;
+  }
+  _this->_internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void VectorDouble::CopyFrom(const VectorDouble& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:EPICS.VectorDouble)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool VectorDouble::IsInitialized() const {
+  if (_Internal::MissingRequiredFields(_impl_._has_bits_)) return false;
+  if (!::PROTOBUF_NAMESPACE_ID::internal::AllAreInitialized(_impl_.fieldvalues_))
+    return false;
+  return true;
+}
+
+void VectorDouble::InternalSwap(VectorDouble* other) {
+  using std::swap;
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  swap(_impl_._has_bits_[0], other->_impl_._has_bits_[0]);
+  _impl_.val_.InternalSwap(&other->_impl_.val_);
+  _impl_.fieldvalues_.InternalSwap(&other->_impl_.fieldvalues_);
+  ::PROTOBUF_NAMESPACE_ID::internal::memswap<
+      PROTOBUF_FIELD_OFFSET(VectorDouble, _impl_.fieldactualchange_)
+      + sizeof(VectorDouble::_impl_.fieldactualchange_)
+      - PROTOBUF_FIELD_OFFSET(VectorDouble, _impl_.secondsintoyear_)>(
+          reinterpret_cast<char*>(&_impl_.secondsintoyear_),
+          reinterpret_cast<char*>(&other->_impl_.secondsintoyear_));
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata VectorDouble::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_getter, &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_once,
+      file_level_metadata_carchive_2fbackend_2fEPICSEvent_2eproto[14]);
+}
+
+// ===================================================================
+
+class V4GenericBytes::_Internal {
+ public:
+  using HasBits = decltype(std::declval<V4GenericBytes>()._impl_._has_bits_);
+  static void set_has_secondsintoyear(HasBits* has_bits) {
+    (*has_bits)[0] |= 2u;
+  }
+  static void set_has_nano(HasBits* has_bits) {
+    (*has_bits)[0] |= 4u;
+  }
+  static void set_has_val(HasBits* has_bits) {
+    (*has_bits)[0] |= 1u;
+  }
+  static void set_has_severity(HasBits* has_bits) {
+    (*has_bits)[0] |= 8u;
+  }
+  static void set_has_status(HasBits* has_bits) {
+    (*has_bits)[0] |= 16u;
+  }
+  static void set_has_repeatcount(HasBits* has_bits) {
+    (*has_bits)[0] |= 32u;
+  }
+  static void set_has_fieldactualchange(HasBits* has_bits) {
+    (*has_bits)[0] |= 64u;
+  }
+  static bool MissingRequiredFields(const HasBits& has_bits) {
+    return ((has_bits[0] & 0x00000007) ^ 0x00000007) != 0;
+  }
+};
+
+V4GenericBytes::V4GenericBytes(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                         bool is_message_owned)
+  : ::PROTOBUF_NAMESPACE_ID::Message(arena, is_message_owned) {
+  SharedCtor(arena, is_message_owned);
+  // @@protoc_insertion_point(arena_constructor:EPICS.V4GenericBytes)
+}
+V4GenericBytes::V4GenericBytes(const V4GenericBytes& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message() {
+  V4GenericBytes* const _this = this; (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){from._impl_._has_bits_}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.fieldvalues_){from._impl_.fieldvalues_}
+    , decltype(_impl_.val_){}
+    , decltype(_impl_.secondsintoyear_){}
+    , decltype(_impl_.nano_){}
+    , decltype(_impl_.severity_){}
+    , decltype(_impl_.status_){}
+    , decltype(_impl_.repeatcount_){}
+    , decltype(_impl_.fieldactualchange_){}};
+
+  _internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+  _impl_.val_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+    _impl_.val_.Set("", GetArenaForAllocation());
+  #endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (from._internal_has_val()) {
+    _this->_impl_.val_.Set(from._internal_val(), 
+      _this->GetArenaForAllocation());
+  }
+  ::memcpy(&_impl_.secondsintoyear_, &from._impl_.secondsintoyear_,
+    static_cast<size_t>(reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+    reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  // @@protoc_insertion_point(copy_constructor:EPICS.V4GenericBytes)
+}
+
+inline void V4GenericBytes::SharedCtor(
+    ::_pb::Arena* arena, bool is_message_owned) {
+  (void)arena;
+  (void)is_message_owned;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.fieldvalues_){arena}
+    , decltype(_impl_.val_){}
+    , decltype(_impl_.secondsintoyear_){0u}
+    , decltype(_impl_.nano_){0u}
+    , decltype(_impl_.severity_){0}
+    , decltype(_impl_.status_){0}
+    , decltype(_impl_.repeatcount_){0u}
+    , decltype(_impl_.fieldactualchange_){false}
+  };
+  _impl_.val_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+    _impl_.val_.Set("", GetArenaForAllocation());
+  #endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+}
+
+V4GenericBytes::~V4GenericBytes() {
+  // @@protoc_insertion_point(destructor:EPICS.V4GenericBytes)
+  if (auto *arena = _internal_metadata_.DeleteReturnArena<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>()) {
+  (void)arena;
+    return;
+  }
+  SharedDtor();
+}
+
+inline void V4GenericBytes::SharedDtor() {
+  GOOGLE_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.fieldvalues_.~RepeatedPtrField();
+  _impl_.val_.Destroy();
+}
+
+void V4GenericBytes::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+void V4GenericBytes::Clear() {
+// @@protoc_insertion_point(message_clear_start:EPICS.V4GenericBytes)
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.fieldvalues_.Clear();
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x00000001u) {
+    _impl_.val_.ClearNonDefaultToEmpty();
+  }
+  if (cached_has_bits & 0x0000007eu) {
+    ::memset(&_impl_.secondsintoyear_, 0, static_cast<size_t>(
+        reinterpret_cast<char*>(&_impl_.fieldactualchange_) -
+        reinterpret_cast<char*>(&_impl_.secondsintoyear_)) + sizeof(_impl_.fieldactualchange_));
+  }
+  _impl_._has_bits_.Clear();
+  _internal_metadata_.Clear<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+}
+
+const char* V4GenericBytes::_InternalParse(const char* ptr, ::_pbi::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  _Internal::HasBits has_bits{};
+  while (!ctx->Done(&ptr)) {
+    uint32_t tag;
+    ptr = ::_pbi::ReadTag(ptr, &tag);
+    switch (tag >> 3) {
+      // required uint32 secondsintoyear = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 8)) {
+          _Internal::set_has_secondsintoyear(&has_bits);
+          _impl_.secondsintoyear_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // required uint32 nano = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 16)) {
+          _Internal::set_has_nano(&has_bits);
+          _impl_.nano_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // required bytes val = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 26)) {
+          auto str = _internal_mutable_val();
+          ptr = ::_pbi::InlineGreedyStringParser(str, ptr, ctx);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 severity = 4 [default = 0];
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 32)) {
+          _Internal::set_has_severity(&has_bits);
+          _impl_.severity_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 status = 5 [default = 0];
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 40)) {
+          _Internal::set_has_status(&has_bits);
+          _impl_.status_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional uint32 repeatcount = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 48)) {
+          _Internal::set_has_repeatcount(&has_bits);
+          _impl_.repeatcount_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated .EPICS.FieldValue fieldvalues = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 58)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ctx->ParseMessage(_internal_add_fieldvalues(), ptr);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::ExpectTag<58>(ptr));
+        } else
+          goto handle_unusual;
+        continue;
+      // optional bool fieldactualchange = 8;
+      case 8:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 64)) {
+          _Internal::set_has_fieldactualchange(&has_bits);
+          _impl_.fieldactualchange_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint64(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      default:
+        goto handle_unusual;
+    }  // switch
+  handle_unusual:
+    if ((tag == 0) || ((tag & 7) == 4)) {
+      CHK_(ptr);
+      ctx->SetLastTag(tag);
+      goto message_done;
+    }
+    ptr = UnknownFieldParse(
+        tag,
+        _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(),
+        ptr, ctx);
+    CHK_(ptr != nullptr);
+  }  // while
+message_done:
+  _impl_._has_bits_.Or(has_bits);
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto message_done;
+#undef CHK_
+}
+
+uint8_t* V4GenericBytes::_InternalSerialize(
+    uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:EPICS.V4GenericBytes)
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  cached_has_bits = _impl_._has_bits_[0];
+  // required uint32 secondsintoyear = 1;
+  if (cached_has_bits & 0x00000002u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(1, this->_internal_secondsintoyear(), target);
+  }
+
+  // required uint32 nano = 2;
+  if (cached_has_bits & 0x00000004u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(2, this->_internal_nano(), target);
+  }
+
+  // required bytes val = 3;
+  if (cached_has_bits & 0x00000001u) {
+    target = stream->WriteBytesMaybeAliased(
+        3, this->_internal_val(), target);
+  }
+
+  // optional int32 severity = 4 [default = 0];
+  if (cached_has_bits & 0x00000008u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(4, this->_internal_severity(), target);
+  }
+
+  // optional int32 status = 5 [default = 0];
+  if (cached_has_bits & 0x00000010u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(5, this->_internal_status(), target);
+  }
+
+  // optional uint32 repeatcount = 6;
+  if (cached_has_bits & 0x00000020u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteUInt32ToArray(6, this->_internal_repeatcount(), target);
+  }
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_fieldvalues_size()); i < n; i++) {
+    const auto& repfield = this->_internal_fieldvalues(i);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+        InternalWriteMessage(7, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  // optional bool fieldactualchange = 8;
+  if (cached_has_bits & 0x00000040u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteBoolToArray(8, this->_internal_fieldactualchange(), target);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target = ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:EPICS.V4GenericBytes)
+  return target;
+}
+
+size_t V4GenericBytes::RequiredFieldsByteSizeFallback() const {
+// @@protoc_insertion_point(required_fields_byte_size_fallback_start:EPICS.V4GenericBytes)
+  size_t total_size = 0;
+
+  if (_internal_has_val()) {
+    // required bytes val = 3;
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::BytesSize(
+        this->_internal_val());
+  }
+
+  if (_internal_has_secondsintoyear()) {
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+  }
+
+  if (_internal_has_nano()) {
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+  }
+
+  return total_size;
+}
+size_t V4GenericBytes::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:EPICS.V4GenericBytes)
+  size_t total_size = 0;
+
+  if (((_impl_._has_bits_[0] & 0x00000007) ^ 0x00000007) == 0) {  // All required fields are present.
+    // required bytes val = 3;
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::BytesSize(
+        this->_internal_val());
+
+    // required uint32 secondsintoyear = 1;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_secondsintoyear());
+
+    // required uint32 nano = 2;
+    total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_nano());
+
+  } else {
+    total_size += RequiredFieldsByteSizeFallback();
+  }
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated .EPICS.FieldValue fieldvalues = 7;
+  total_size += 1UL * this->_internal_fieldvalues_size();
+  for (const auto& msg : this->_impl_.fieldvalues_) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(msg);
+  }
+
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x00000078u) {
+    // optional int32 severity = 4 [default = 0];
+    if (cached_has_bits & 0x00000008u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_severity());
+    }
+
+    // optional int32 status = 5 [default = 0];
+    if (cached_has_bits & 0x00000010u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_status());
+    }
+
+    // optional uint32 repeatcount = 6;
+    if (cached_has_bits & 0x00000020u) {
+      total_size += ::_pbi::WireFormatLite::UInt32SizePlusOne(this->_internal_repeatcount());
+    }
+
+    // optional bool fieldactualchange = 8;
+    if (cached_has_bits & 0x00000040u) {
+      total_size += 1 + 1;
+    }
+
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData V4GenericBytes::_class_data_ = {
+    ::PROTOBUF_NAMESPACE_ID::Message::CopyWithSourceCheck,
+    V4GenericBytes::MergeImpl
+};
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*V4GenericBytes::GetClassData() const { return &_class_data_; }
+
+
+void V4GenericBytes::MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg) {
+  auto* const _this = static_cast<V4GenericBytes*>(&to_msg);
+  auto& from = static_cast<const V4GenericBytes&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:EPICS.V4GenericBytes)
+  GOOGLE_DCHECK_NE(&from, _this);
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_impl_.fieldvalues_.MergeFrom(from._impl_.fieldvalues_);
+  cached_has_bits = from._impl_._has_bits_[0];
+  if (cached_has_bits & 0x0000007fu) {
+    if (cached_has_bits & 0x00000001u) {
+      _this->_internal_set_val(from._internal_val());
+    }
+    if (cached_has_bits & 0x00000002u) {
+      _this->_impl_.secondsintoyear_ = from._impl_.secondsintoyear_;
+    }
+    if (cached_has_bits & 0x00000004u) {
+      _this->_impl_.nano_ = from._impl_.nano_;
+    }
+    if (cached_has_bits & 0x00000008u) {
+      _this->_impl_.severity_ = from._impl_.severity_;
+    }
+    if (cached_has_bits & 0x00000010u) {
+      _this->_impl_.status_ = from._impl_.status_;
+    }
+    if (cached_has_bits & 0x00000020u) {
+      _this->_impl_.repeatcount_ = from._impl_.repeatcount_;
+    }
+    if (cached_has_bits & 0x00000040u) {
+      _this->_impl_.fieldactualchange_ = from._impl_.fieldactualchange_;
+    }
+    _this->_impl_._has_bits_[0] |= cached_has_bits;
+  }
+  _this->_internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void V4GenericBytes::CopyFrom(const V4GenericBytes& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:EPICS.V4GenericBytes)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool V4GenericBytes::IsInitialized() const {
+  if (_Internal::MissingRequiredFields(_impl_._has_bits_)) return false;
+  if (!::PROTOBUF_NAMESPACE_ID::internal::AllAreInitialized(_impl_.fieldvalues_))
+    return false;
+  return true;
+}
+
+void V4GenericBytes::InternalSwap(V4GenericBytes* other) {
+  using std::swap;
+  auto* lhs_arena = GetArenaForAllocation();
+  auto* rhs_arena = other->GetArenaForAllocation();
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  swap(_impl_._has_bits_[0], other->_impl_._has_bits_[0]);
+  _impl_.fieldvalues_.InternalSwap(&other->_impl_.fieldvalues_);
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr::InternalSwap(
+      &_impl_.val_, lhs_arena,
+      &other->_impl_.val_, rhs_arena
+  );
+  ::PROTOBUF_NAMESPACE_ID::internal::memswap<
+      PROTOBUF_FIELD_OFFSET(V4GenericBytes, _impl_.fieldactualchange_)
+      + sizeof(V4GenericBytes::_impl_.fieldactualchange_)
+      - PROTOBUF_FIELD_OFFSET(V4GenericBytes, _impl_.secondsintoyear_)>(
+          reinterpret_cast<char*>(&_impl_.secondsintoyear_),
+          reinterpret_cast<char*>(&other->_impl_.secondsintoyear_));
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata V4GenericBytes::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_getter, &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_once,
+      file_level_metadata_carchive_2fbackend_2fEPICSEvent_2eproto[15]);
+}
+
+// ===================================================================
+
+class PayloadInfo::_Internal {
+ public:
+  using HasBits = decltype(std::declval<PayloadInfo>()._impl_._has_bits_);
+  static void set_has_type(HasBits* has_bits) {
+    (*has_bits)[0] |= 4u;
+  }
+  static void set_has_pvname(HasBits* has_bits) {
+    (*has_bits)[0] |= 1u;
+  }
+  static void set_has_year(HasBits* has_bits) {
+    (*has_bits)[0] |= 8u;
+  }
+  static void set_has_elementcount(HasBits* has_bits) {
+    (*has_bits)[0] |= 8192u;
+  }
+  static void set_has_unused00(HasBits* has_bits) {
+    (*has_bits)[0] |= 16u;
+  }
+  static void set_has_unused01(HasBits* has_bits) {
+    (*has_bits)[0] |= 32u;
+  }
+  static void set_has_unused02(HasBits* has_bits) {
+    (*has_bits)[0] |= 64u;
+  }
+  static void set_has_unused03(HasBits* has_bits) {
+    (*has_bits)[0] |= 128u;
+  }
+  static void set_has_unused04(HasBits* has_bits) {
+    (*has_bits)[0] |= 256u;
+  }
+  static void set_has_unused05(HasBits* has_bits) {
+    (*has_bits)[0] |= 512u;
+  }
+  static void set_has_unused06(HasBits* has_bits) {
+    (*has_bits)[0] |= 1024u;
+  }
+  static void set_has_unused07(HasBits* has_bits) {
+    (*has_bits)[0] |= 2048u;
+  }
+  static void set_has_unused08(HasBits* has_bits) {
+    (*has_bits)[0] |= 4096u;
+  }
+  static void set_has_unused09(HasBits* has_bits) {
+    (*has_bits)[0] |= 2u;
+  }
+  static bool MissingRequiredFields(const HasBits& has_bits) {
+    return ((has_bits[0] & 0x0000000d) ^ 0x0000000d) != 0;
+  }
+};
+
+PayloadInfo::PayloadInfo(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                         bool is_message_owned)
+  : ::PROTOBUF_NAMESPACE_ID::Message(arena, is_message_owned) {
+  SharedCtor(arena, is_message_owned);
+  // @@protoc_insertion_point(arena_constructor:EPICS.PayloadInfo)
+}
+PayloadInfo::PayloadInfo(const PayloadInfo& from)
+  : ::PROTOBUF_NAMESPACE_ID::Message() {
+  PayloadInfo* const _this = this; (void)_this;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){from._impl_._has_bits_}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.headers_){from._impl_.headers_}
+    , decltype(_impl_.pvname_){}
+    , decltype(_impl_.unused09_){}
+    , decltype(_impl_.type_){}
+    , decltype(_impl_.year_){}
+    , decltype(_impl_.unused00_){}
+    , decltype(_impl_.unused01_){}
+    , decltype(_impl_.unused02_){}
+    , decltype(_impl_.unused03_){}
+    , decltype(_impl_.unused04_){}
+    , decltype(_impl_.unused05_){}
+    , decltype(_impl_.unused06_){}
+    , decltype(_impl_.unused07_){}
+    , decltype(_impl_.unused08_){}
+    , decltype(_impl_.elementcount_){}};
+
+  _internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+  _impl_.pvname_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+    _impl_.pvname_.Set("", GetArenaForAllocation());
+  #endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (from._internal_has_pvname()) {
+    _this->_impl_.pvname_.Set(from._internal_pvname(), 
+      _this->GetArenaForAllocation());
+  }
+  _impl_.unused09_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+    _impl_.unused09_.Set("", GetArenaForAllocation());
+  #endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (from._internal_has_unused09()) {
+    _this->_impl_.unused09_.Set(from._internal_unused09(), 
+      _this->GetArenaForAllocation());
+  }
+  ::memcpy(&_impl_.type_, &from._impl_.type_,
+    static_cast<size_t>(reinterpret_cast<char*>(&_impl_.elementcount_) -
+    reinterpret_cast<char*>(&_impl_.type_)) + sizeof(_impl_.elementcount_));
+  // @@protoc_insertion_point(copy_constructor:EPICS.PayloadInfo)
+}
+
+inline void PayloadInfo::SharedCtor(
+    ::_pb::Arena* arena, bool is_message_owned) {
+  (void)arena;
+  (void)is_message_owned;
+  new (&_impl_) Impl_{
+      decltype(_impl_._has_bits_){}
+    , /*decltype(_impl_._cached_size_)*/{}
+    , decltype(_impl_.headers_){arena}
+    , decltype(_impl_.pvname_){}
+    , decltype(_impl_.unused09_){}
+    , decltype(_impl_.type_){0}
+    , decltype(_impl_.year_){0}
+    , decltype(_impl_.unused00_){0}
+    , decltype(_impl_.unused01_){0}
+    , decltype(_impl_.unused02_){0}
+    , decltype(_impl_.unused03_){0}
+    , decltype(_impl_.unused04_){0}
+    , decltype(_impl_.unused05_){0}
+    , decltype(_impl_.unused06_){0}
+    , decltype(_impl_.unused07_){0}
+    , decltype(_impl_.unused08_){0}
+    , decltype(_impl_.elementcount_){0}
+  };
+  _impl_.pvname_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+    _impl_.pvname_.Set("", GetArenaForAllocation());
+  #endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  _impl_.unused09_.InitDefault();
+  #ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+    _impl_.unused09_.Set("", GetArenaForAllocation());
+  #endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+}
+
+PayloadInfo::~PayloadInfo() {
+  // @@protoc_insertion_point(destructor:EPICS.PayloadInfo)
+  if (auto *arena = _internal_metadata_.DeleteReturnArena<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>()) {
+  (void)arena;
+    return;
+  }
+  SharedDtor();
+}
+
+inline void PayloadInfo::SharedDtor() {
+  GOOGLE_DCHECK(GetArenaForAllocation() == nullptr);
+  _impl_.headers_.~RepeatedPtrField();
+  _impl_.pvname_.Destroy();
+  _impl_.unused09_.Destroy();
+}
+
+void PayloadInfo::SetCachedSize(int size) const {
+  _impl_._cached_size_.Set(size);
+}
+
+void PayloadInfo::Clear() {
+// @@protoc_insertion_point(message_clear_start:EPICS.PayloadInfo)
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  _impl_.headers_.Clear();
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x00000003u) {
+    if (cached_has_bits & 0x00000001u) {
+      _impl_.pvname_.ClearNonDefaultToEmpty();
+    }
+    if (cached_has_bits & 0x00000002u) {
+      _impl_.unused09_.ClearNonDefaultToEmpty();
+    }
+  }
+  if (cached_has_bits & 0x000000fcu) {
+    ::memset(&_impl_.type_, 0, static_cast<size_t>(
+        reinterpret_cast<char*>(&_impl_.unused03_) -
+        reinterpret_cast<char*>(&_impl_.type_)) + sizeof(_impl_.unused03_));
+  }
+  if (cached_has_bits & 0x00003f00u) {
+    ::memset(&_impl_.unused04_, 0, static_cast<size_t>(
+        reinterpret_cast<char*>(&_impl_.elementcount_) -
+        reinterpret_cast<char*>(&_impl_.unused04_)) + sizeof(_impl_.elementcount_));
+  }
+  _impl_._has_bits_.Clear();
+  _internal_metadata_.Clear<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+}
+
+const char* PayloadInfo::_InternalParse(const char* ptr, ::_pbi::ParseContext* ctx) {
+#define CHK_(x) if (PROTOBUF_PREDICT_FALSE(!(x))) goto failure
+  _Internal::HasBits has_bits{};
+  while (!ctx->Done(&ptr)) {
+    uint32_t tag;
+    ptr = ::_pbi::ReadTag(ptr, &tag);
+    switch (tag >> 3) {
+      // required .EPICS.PayloadType type = 1;
+      case 1:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 8)) {
+          uint64_t val = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint64(&ptr);
+          CHK_(ptr);
+          if (PROTOBUF_PREDICT_TRUE(::EPICS::PayloadType_IsValid(val))) {
+            _internal_set_type(static_cast<::EPICS::PayloadType>(val));
+          } else {
+            ::PROTOBUF_NAMESPACE_ID::internal::WriteVarint(1, val, mutable_unknown_fields());
+          }
+        } else
+          goto handle_unusual;
+        continue;
+      // required string pvname = 2;
+      case 2:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 18)) {
+          auto str = _internal_mutable_pvname();
+          ptr = ::_pbi::InlineGreedyStringParser(str, ptr, ctx);
+          CHK_(ptr);
+          #ifndef NDEBUG
+          ::_pbi::VerifyUTF8(str, "EPICS.PayloadInfo.pvname");
+          #endif  // !NDEBUG
+        } else
+          goto handle_unusual;
+        continue;
+      // required int32 year = 3;
+      case 3:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 24)) {
+          _Internal::set_has_year(&has_bits);
+          _impl_.year_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional int32 elementCount = 4;
+      case 4:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 32)) {
+          _Internal::set_has_elementcount(&has_bits);
+          _impl_.elementcount_ = ::PROTOBUF_NAMESPACE_ID::internal::ReadVarint32(&ptr);
+          CHK_(ptr);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional double unused00 = 5;
+      case 5:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 41)) {
+          _Internal::set_has_unused00(&has_bits);
+          _impl_.unused00_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<double>(ptr);
+          ptr += sizeof(double);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional double unused01 = 6;
+      case 6:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 49)) {
+          _Internal::set_has_unused01(&has_bits);
+          _impl_.unused01_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<double>(ptr);
+          ptr += sizeof(double);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional double unused02 = 7;
+      case 7:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 57)) {
+          _Internal::set_has_unused02(&has_bits);
+          _impl_.unused02_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<double>(ptr);
+          ptr += sizeof(double);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional double unused03 = 8;
+      case 8:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 65)) {
+          _Internal::set_has_unused03(&has_bits);
+          _impl_.unused03_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<double>(ptr);
+          ptr += sizeof(double);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional double unused04 = 9;
+      case 9:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 73)) {
+          _Internal::set_has_unused04(&has_bits);
+          _impl_.unused04_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<double>(ptr);
+          ptr += sizeof(double);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional double unused05 = 10;
+      case 10:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 81)) {
+          _Internal::set_has_unused05(&has_bits);
+          _impl_.unused05_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<double>(ptr);
+          ptr += sizeof(double);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional double unused06 = 11;
+      case 11:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 89)) {
+          _Internal::set_has_unused06(&has_bits);
+          _impl_.unused06_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<double>(ptr);
+          ptr += sizeof(double);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional double unused07 = 12;
+      case 12:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 97)) {
+          _Internal::set_has_unused07(&has_bits);
+          _impl_.unused07_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<double>(ptr);
+          ptr += sizeof(double);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional double unused08 = 13;
+      case 13:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 105)) {
+          _Internal::set_has_unused08(&has_bits);
+          _impl_.unused08_ = ::PROTOBUF_NAMESPACE_ID::internal::UnalignedLoad<double>(ptr);
+          ptr += sizeof(double);
+        } else
+          goto handle_unusual;
+        continue;
+      // optional string unused09 = 14;
+      case 14:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 114)) {
+          auto str = _internal_mutable_unused09();
+          ptr = ::_pbi::InlineGreedyStringParser(str, ptr, ctx);
+          CHK_(ptr);
+          #ifndef NDEBUG
+          ::_pbi::VerifyUTF8(str, "EPICS.PayloadInfo.unused09");
+          #endif  // !NDEBUG
+        } else
+          goto handle_unusual;
+        continue;
+      // repeated .EPICS.FieldValue headers = 15;
+      case 15:
+        if (PROTOBUF_PREDICT_TRUE(static_cast<uint8_t>(tag) == 122)) {
+          ptr -= 1;
+          do {
+            ptr += 1;
+            ptr = ctx->ParseMessage(_internal_add_headers(), ptr);
+            CHK_(ptr);
+            if (!ctx->DataAvailable(ptr)) break;
+          } while (::PROTOBUF_NAMESPACE_ID::internal::ExpectTag<122>(ptr));
+        } else
+          goto handle_unusual;
+        continue;
+      default:
+        goto handle_unusual;
+    }  // switch
+  handle_unusual:
+    if ((tag == 0) || ((tag & 7) == 4)) {
+      CHK_(ptr);
+      ctx->SetLastTag(tag);
+      goto message_done;
+    }
+    ptr = UnknownFieldParse(
+        tag,
+        _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(),
+        ptr, ctx);
+    CHK_(ptr != nullptr);
+  }  // while
+message_done:
+  _impl_._has_bits_.Or(has_bits);
+  return ptr;
+failure:
+  ptr = nullptr;
+  goto message_done;
+#undef CHK_
+}
+
+uint8_t* PayloadInfo::_InternalSerialize(
+    uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const {
+  // @@protoc_insertion_point(serialize_to_array_start:EPICS.PayloadInfo)
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  cached_has_bits = _impl_._has_bits_[0];
+  // required .EPICS.PayloadType type = 1;
+  if (cached_has_bits & 0x00000004u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteEnumToArray(
+      1, this->_internal_type(), target);
+  }
+
+  // required string pvname = 2;
+  if (cached_has_bits & 0x00000001u) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::VerifyUTF8StringNamedField(
+      this->_internal_pvname().data(), static_cast<int>(this->_internal_pvname().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SERIALIZE,
+      "EPICS.PayloadInfo.pvname");
+    target = stream->WriteStringMaybeAliased(
+        2, this->_internal_pvname(), target);
+  }
+
+  // required int32 year = 3;
+  if (cached_has_bits & 0x00000008u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(3, this->_internal_year(), target);
+  }
+
+  // optional int32 elementCount = 4;
+  if (cached_has_bits & 0x00002000u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteInt32ToArray(4, this->_internal_elementcount(), target);
+  }
+
+  // optional double unused00 = 5;
+  if (cached_has_bits & 0x00000010u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteDoubleToArray(5, this->_internal_unused00(), target);
+  }
+
+  // optional double unused01 = 6;
+  if (cached_has_bits & 0x00000020u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteDoubleToArray(6, this->_internal_unused01(), target);
+  }
+
+  // optional double unused02 = 7;
+  if (cached_has_bits & 0x00000040u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteDoubleToArray(7, this->_internal_unused02(), target);
+  }
+
+  // optional double unused03 = 8;
+  if (cached_has_bits & 0x00000080u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteDoubleToArray(8, this->_internal_unused03(), target);
+  }
+
+  // optional double unused04 = 9;
+  if (cached_has_bits & 0x00000100u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteDoubleToArray(9, this->_internal_unused04(), target);
+  }
+
+  // optional double unused05 = 10;
+  if (cached_has_bits & 0x00000200u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteDoubleToArray(10, this->_internal_unused05(), target);
+  }
+
+  // optional double unused06 = 11;
+  if (cached_has_bits & 0x00000400u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteDoubleToArray(11, this->_internal_unused06(), target);
+  }
+
+  // optional double unused07 = 12;
+  if (cached_has_bits & 0x00000800u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteDoubleToArray(12, this->_internal_unused07(), target);
+  }
+
+  // optional double unused08 = 13;
+  if (cached_has_bits & 0x00001000u) {
+    target = stream->EnsureSpace(target);
+    target = ::_pbi::WireFormatLite::WriteDoubleToArray(13, this->_internal_unused08(), target);
+  }
+
+  // optional string unused09 = 14;
+  if (cached_has_bits & 0x00000002u) {
+    ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::VerifyUTF8StringNamedField(
+      this->_internal_unused09().data(), static_cast<int>(this->_internal_unused09().length()),
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormat::SERIALIZE,
+      "EPICS.PayloadInfo.unused09");
+    target = stream->WriteStringMaybeAliased(
+        14, this->_internal_unused09(), target);
+  }
+
+  // repeated .EPICS.FieldValue headers = 15;
+  for (unsigned i = 0,
+      n = static_cast<unsigned>(this->_internal_headers_size()); i < n; i++) {
+    const auto& repfield = this->_internal_headers(i);
+    target = ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::
+        InternalWriteMessage(15, repfield, repfield.GetCachedSize(), target, stream);
+  }
+
+  if (PROTOBUF_PREDICT_FALSE(_internal_metadata_.have_unknown_fields())) {
+    target = ::_pbi::WireFormat::InternalSerializeUnknownFieldsToArray(
+        _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance), target, stream);
+  }
+  // @@protoc_insertion_point(serialize_to_array_end:EPICS.PayloadInfo)
+  return target;
+}
+
+size_t PayloadInfo::RequiredFieldsByteSizeFallback() const {
+// @@protoc_insertion_point(required_fields_byte_size_fallback_start:EPICS.PayloadInfo)
+  size_t total_size = 0;
+
+  if (_internal_has_pvname()) {
+    // required string pvname = 2;
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->_internal_pvname());
+  }
+
+  if (_internal_has_type()) {
+    // required .EPICS.PayloadType type = 1;
+    total_size += 1 +
+      ::_pbi::WireFormatLite::EnumSize(this->_internal_type());
+  }
+
+  if (_internal_has_year()) {
+    // required int32 year = 3;
+    total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_year());
+  }
+
+  return total_size;
+}
+size_t PayloadInfo::ByteSizeLong() const {
+// @@protoc_insertion_point(message_byte_size_start:EPICS.PayloadInfo)
+  size_t total_size = 0;
+
+  if (((_impl_._has_bits_[0] & 0x0000000d) ^ 0x0000000d) == 0) {  // All required fields are present.
+    // required string pvname = 2;
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->_internal_pvname());
+
+    // required .EPICS.PayloadType type = 1;
+    total_size += 1 +
+      ::_pbi::WireFormatLite::EnumSize(this->_internal_type());
+
+    // required int32 year = 3;
+    total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_year());
+
+  } else {
+    total_size += RequiredFieldsByteSizeFallback();
+  }
+  uint32_t cached_has_bits = 0;
+  // Prevent compiler warnings about cached_has_bits being unused
+  (void) cached_has_bits;
+
+  // repeated .EPICS.FieldValue headers = 15;
+  total_size += 1UL * this->_internal_headers_size();
+  for (const auto& msg : this->_impl_.headers_) {
+    total_size +=
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::MessageSize(msg);
+  }
+
+  // optional string unused09 = 14;
+  cached_has_bits = _impl_._has_bits_[0];
+  if (cached_has_bits & 0x00000002u) {
+    total_size += 1 +
+      ::PROTOBUF_NAMESPACE_ID::internal::WireFormatLite::StringSize(
+        this->_internal_unused09());
+  }
+
+  if (cached_has_bits & 0x000000f0u) {
+    // optional double unused00 = 5;
+    if (cached_has_bits & 0x00000010u) {
+      total_size += 1 + 8;
+    }
+
+    // optional double unused01 = 6;
+    if (cached_has_bits & 0x00000020u) {
+      total_size += 1 + 8;
+    }
+
+    // optional double unused02 = 7;
+    if (cached_has_bits & 0x00000040u) {
+      total_size += 1 + 8;
+    }
+
+    // optional double unused03 = 8;
+    if (cached_has_bits & 0x00000080u) {
+      total_size += 1 + 8;
+    }
+
+  }
+  if (cached_has_bits & 0x00003f00u) {
+    // optional double unused04 = 9;
+    if (cached_has_bits & 0x00000100u) {
+      total_size += 1 + 8;
+    }
+
+    // optional double unused05 = 10;
+    if (cached_has_bits & 0x00000200u) {
+      total_size += 1 + 8;
+    }
+
+    // optional double unused06 = 11;
+    if (cached_has_bits & 0x00000400u) {
+      total_size += 1 + 8;
+    }
+
+    // optional double unused07 = 12;
+    if (cached_has_bits & 0x00000800u) {
+      total_size += 1 + 8;
+    }
+
+    // optional double unused08 = 13;
+    if (cached_has_bits & 0x00001000u) {
+      total_size += 1 + 8;
+    }
+
+    // optional int32 elementCount = 4;
+    if (cached_has_bits & 0x00002000u) {
+      total_size += ::_pbi::WireFormatLite::Int32SizePlusOne(this->_internal_elementcount());
+    }
+
+  }
+  return MaybeComputeUnknownFieldsSize(total_size, &_impl_._cached_size_);
+}
+
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData PayloadInfo::_class_data_ = {
+    ::PROTOBUF_NAMESPACE_ID::Message::CopyWithSourceCheck,
+    PayloadInfo::MergeImpl
+};
+const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*PayloadInfo::GetClassData() const { return &_class_data_; }
+
+
+void PayloadInfo::MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg) {
+  auto* const _this = static_cast<PayloadInfo*>(&to_msg);
+  auto& from = static_cast<const PayloadInfo&>(from_msg);
+  // @@protoc_insertion_point(class_specific_merge_from_start:EPICS.PayloadInfo)
+  GOOGLE_DCHECK_NE(&from, _this);
+  uint32_t cached_has_bits = 0;
+  (void) cached_has_bits;
+
+  _this->_impl_.headers_.MergeFrom(from._impl_.headers_);
+  cached_has_bits = from._impl_._has_bits_[0];
+  if (cached_has_bits & 0x000000ffu) {
+    if (cached_has_bits & 0x00000001u) {
+      _this->_internal_set_pvname(from._internal_pvname());
+    }
+    if (cached_has_bits & 0x00000002u) {
+      _this->_internal_set_unused09(from._internal_unused09());
+    }
+    if (cached_has_bits & 0x00000004u) {
+      _this->_impl_.type_ = from._impl_.type_;
+    }
+    if (cached_has_bits & 0x00000008u) {
+      _this->_impl_.year_ = from._impl_.year_;
+    }
+    if (cached_has_bits & 0x00000010u) {
+      _this->_impl_.unused00_ = from._impl_.unused00_;
+    }
+    if (cached_has_bits & 0x00000020u) {
+      _this->_impl_.unused01_ = from._impl_.unused01_;
+    }
+    if (cached_has_bits & 0x00000040u) {
+      _this->_impl_.unused02_ = from._impl_.unused02_;
+    }
+    if (cached_has_bits & 0x00000080u) {
+      _this->_impl_.unused03_ = from._impl_.unused03_;
+    }
+    _this->_impl_._has_bits_[0] |= cached_has_bits;
+  }
+  if (cached_has_bits & 0x00003f00u) {
+    if (cached_has_bits & 0x00000100u) {
+      _this->_impl_.unused04_ = from._impl_.unused04_;
+    }
+    if (cached_has_bits & 0x00000200u) {
+      _this->_impl_.unused05_ = from._impl_.unused05_;
+    }
+    if (cached_has_bits & 0x00000400u) {
+      _this->_impl_.unused06_ = from._impl_.unused06_;
+    }
+    if (cached_has_bits & 0x00000800u) {
+      _this->_impl_.unused07_ = from._impl_.unused07_;
+    }
+    if (cached_has_bits & 0x00001000u) {
+      _this->_impl_.unused08_ = from._impl_.unused08_;
+    }
+    if (cached_has_bits & 0x00002000u) {
+      _this->_impl_.elementcount_ = from._impl_.elementcount_;
+    }
+    _this->_impl_._has_bits_[0] |= cached_has_bits;
+  }
+  _this->_internal_metadata_.MergeFrom<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(from._internal_metadata_);
+}
+
+void PayloadInfo::CopyFrom(const PayloadInfo& from) {
+// @@protoc_insertion_point(class_specific_copy_from_start:EPICS.PayloadInfo)
+  if (&from == this) return;
+  Clear();
+  MergeFrom(from);
+}
+
+bool PayloadInfo::IsInitialized() const {
+  if (_Internal::MissingRequiredFields(_impl_._has_bits_)) return false;
+  if (!::PROTOBUF_NAMESPACE_ID::internal::AllAreInitialized(_impl_.headers_))
+    return false;
+  return true;
+}
+
+void PayloadInfo::InternalSwap(PayloadInfo* other) {
+  using std::swap;
+  auto* lhs_arena = GetArenaForAllocation();
+  auto* rhs_arena = other->GetArenaForAllocation();
+  _internal_metadata_.InternalSwap(&other->_internal_metadata_);
+  swap(_impl_._has_bits_[0], other->_impl_._has_bits_[0]);
+  _impl_.headers_.InternalSwap(&other->_impl_.headers_);
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr::InternalSwap(
+      &_impl_.pvname_, lhs_arena,
+      &other->_impl_.pvname_, rhs_arena
+  );
+  ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr::InternalSwap(
+      &_impl_.unused09_, lhs_arena,
+      &other->_impl_.unused09_, rhs_arena
+  );
+  ::PROTOBUF_NAMESPACE_ID::internal::memswap<
+      PROTOBUF_FIELD_OFFSET(PayloadInfo, _impl_.elementcount_)
+      + sizeof(PayloadInfo::_impl_.elementcount_)
+      - PROTOBUF_FIELD_OFFSET(PayloadInfo, _impl_.type_)>(
+          reinterpret_cast<char*>(&_impl_.type_),
+          reinterpret_cast<char*>(&other->_impl_.type_));
+}
+
+::PROTOBUF_NAMESPACE_ID::Metadata PayloadInfo::GetMetadata() const {
+  return ::_pbi::AssignDescriptors(
+      &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_getter, &descriptor_table_carchive_2fbackend_2fEPICSEvent_2eproto_once,
+      file_level_metadata_carchive_2fbackend_2fEPICSEvent_2eproto[16]);
+}
+
+// @@protoc_insertion_point(namespace_scope)
+}  // namespace EPICS
+PROTOBUF_NAMESPACE_OPEN
+template<> PROTOBUF_NOINLINE ::EPICS::FieldValue*
+Arena::CreateMaybeMessage< ::EPICS::FieldValue >(Arena* arena) {
+  return Arena::CreateMessageInternal< ::EPICS::FieldValue >(arena);
+}
+template<> PROTOBUF_NOINLINE ::EPICS::ScalarString*
+Arena::CreateMaybeMessage< ::EPICS::ScalarString >(Arena* arena) {
+  return Arena::CreateMessageInternal< ::EPICS::ScalarString >(arena);
+}
+template<> PROTOBUF_NOINLINE ::EPICS::ScalarByte*
+Arena::CreateMaybeMessage< ::EPICS::ScalarByte >(Arena* arena) {
+  return Arena::CreateMessageInternal< ::EPICS::ScalarByte >(arena);
+}
+template<> PROTOBUF_NOINLINE ::EPICS::ScalarShort*
+Arena::CreateMaybeMessage< ::EPICS::ScalarShort >(Arena* arena) {
+  return Arena::CreateMessageInternal< ::EPICS::ScalarShort >(arena);
+}
+template<> PROTOBUF_NOINLINE ::EPICS::ScalarInt*
+Arena::CreateMaybeMessage< ::EPICS::ScalarInt >(Arena* arena) {
+  return Arena::CreateMessageInternal< ::EPICS::ScalarInt >(arena);
+}
+template<> PROTOBUF_NOINLINE ::EPICS::ScalarEnum*
+Arena::CreateMaybeMessage< ::EPICS::ScalarEnum >(Arena* arena) {
+  return Arena::CreateMessageInternal< ::EPICS::ScalarEnum >(arena);
+}
+template<> PROTOBUF_NOINLINE ::EPICS::ScalarFloat*
+Arena::CreateMaybeMessage< ::EPICS::ScalarFloat >(Arena* arena) {
+  return Arena::CreateMessageInternal< ::EPICS::ScalarFloat >(arena);
+}
+template<> PROTOBUF_NOINLINE ::EPICS::ScalarDouble*
+Arena::CreateMaybeMessage< ::EPICS::ScalarDouble >(Arena* arena) {
+  return Arena::CreateMessageInternal< ::EPICS::ScalarDouble >(arena);
+}
+template<> PROTOBUF_NOINLINE ::EPICS::VectorString*
+Arena::CreateMaybeMessage< ::EPICS::VectorString >(Arena* arena) {
+  return Arena::CreateMessageInternal< ::EPICS::VectorString >(arena);
+}
+template<> PROTOBUF_NOINLINE ::EPICS::VectorChar*
+Arena::CreateMaybeMessage< ::EPICS::VectorChar >(Arena* arena) {
+  return Arena::CreateMessageInternal< ::EPICS::VectorChar >(arena);
+}
+template<> PROTOBUF_NOINLINE ::EPICS::VectorShort*
+Arena::CreateMaybeMessage< ::EPICS::VectorShort >(Arena* arena) {
+  return Arena::CreateMessageInternal< ::EPICS::VectorShort >(arena);
+}
+template<> PROTOBUF_NOINLINE ::EPICS::VectorInt*
+Arena::CreateMaybeMessage< ::EPICS::VectorInt >(Arena* arena) {
+  return Arena::CreateMessageInternal< ::EPICS::VectorInt >(arena);
+}
+template<> PROTOBUF_NOINLINE ::EPICS::VectorEnum*
+Arena::CreateMaybeMessage< ::EPICS::VectorEnum >(Arena* arena) {
+  return Arena::CreateMessageInternal< ::EPICS::VectorEnum >(arena);
+}
+template<> PROTOBUF_NOINLINE ::EPICS::VectorFloat*
+Arena::CreateMaybeMessage< ::EPICS::VectorFloat >(Arena* arena) {
+  return Arena::CreateMessageInternal< ::EPICS::VectorFloat >(arena);
+}
+template<> PROTOBUF_NOINLINE ::EPICS::VectorDouble*
+Arena::CreateMaybeMessage< ::EPICS::VectorDouble >(Arena* arena) {
+  return Arena::CreateMessageInternal< ::EPICS::VectorDouble >(arena);
+}
+template<> PROTOBUF_NOINLINE ::EPICS::V4GenericBytes*
+Arena::CreateMaybeMessage< ::EPICS::V4GenericBytes >(Arena* arena) {
+  return Arena::CreateMessageInternal< ::EPICS::V4GenericBytes >(arena);
+}
+template<> PROTOBUF_NOINLINE ::EPICS::PayloadInfo*
+Arena::CreateMaybeMessage< ::EPICS::PayloadInfo >(Arena* arena) {
+  return Arena::CreateMessageInternal< ::EPICS::PayloadInfo >(arena);
+}
+PROTOBUF_NAMESPACE_CLOSE
+
+// @@protoc_insertion_point(global_scope)
+#include <google/protobuf/port_undef.inc>
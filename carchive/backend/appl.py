@@ -7,7 +7,7 @@ Copyright 2015 Brookhaven Science Assoc.
 import logging
 _log = logging.getLogger("carchive.appl")
 
-import json, time, calendar, datetime, math, re
+import json, time, calendar, datetime, math, re, functools
 
 from urllib import urlencode
 
@@ -15,17 +15,22 @@ from cStringIO import StringIO
 
 import numpy as np
 
-from twisted.internet import defer, protocol, reactor, threads
+from twisted.internet import defer, protocol, reactor
 from twisted.python import failure
-from twisted.web.client import ResponseDone
+from twisted.web.client import ResponseDone, FileBodyProducer
+from twisted.web.http_headers import Headers
 
 from ..date import isoString, makeTime, timeTuple
 from ..dtype import dbr_time
 from ..status import get_status
-from ..util import BufferingLineProtocol, LimitedAgent
+from ..util import BufferingLineProtocol, LimitedAgent, Accumulator
+from .. import segcache
+from ..nameindex import NameIndex, IndexLoader
 from .EPICSEvent_pb2 import PayloadInfo
+from .decodepool import getDecodePool
+from . import procdecode
 
-from carchive.backend.pbdecode import decoders, unescape, DecodeError, linesplitter
+from carchive.backend.pbdecode import decoders, bufdecoders, unescape, DecodeError, linesplitter
 
 _dtypes = {
     0: np.dtype('a40'),
@@ -48,6 +53,17 @@ _dtypes = dict([(k,np.dtype(v)) for k,v in _dtypes.iteritems()])
 
 _is_vect = set([7,8,9,10,11,12,13,14])
 
+def parseHeader(raw):
+    """Decode an escaped PayloadInfo line.
+
+    Returns (PayloadInfo, start of the year in seconds past the POSIX epoch)
+    """
+    H = PayloadInfo()
+    H.ParseFromString(unescape(raw))
+    if H.year<0:
+        H.year = 1 # -1 when no samples available
+    return H, calendar.timegm(datetime.date(H.year,1,1).timetuple())
+
 class PBReceiver(BufferingLineProtocol):
     """Receive and incrementaionally decode a stream of protobuf.
 
@@ -57,6 +73,17 @@ class PBReceiver(BufferingLineProtocol):
 
     The PB stream begins with a header line (PayloadInfo) followed by zero
     or more value lines, then possibly a blank line and another header.
+
+    With splitLines=False the rx buffer is not split into a list of lines.
+    Instead it is decoded in place by the bufdecoders, which find line
+    boundaries, unescape, and decode in a single pass.
+
+    When cb is an Accumulator, and splitLines=False, samples are
+    decoded directly into its storage and cb is never called.
+
+    cb may return a Deferred to apply backpressure.  Processing of
+    the current buffer completes only when it has fired, and reading
+    is paused while the next buffer is full.
     """
 
     # max number of bytes to accumulate before processing
@@ -73,23 +100,184 @@ class PBReceiver(BufferingLineProtocol):
     inthread = True
 
     def __init__(self, cb, cbArgs=(), cbKWs={}, nreport=1000,
-                 count=None, name=None, cadiscon=0, inthread=None):
+                 count=None, name=None, cadiscon=0, inthread=None,
+                 splitLines=None):
         BufferingLineProtocol.__init__(self)
         self._S, self.defer = StringIO(), defer.Deferred()
         self.name, self.nreport, self.cadiscon = name, nreport, cadiscon
 
         self.header, self._dec, self.name = None, None, name
+        self._rawheader = None
         self._count_limit, self._count = count, 0
         self._CB, self._CB_args, self._CB_kws = cb, cbArgs, cbKWs
+        self._acc, self._waits = None, []
+        if isinstance(cb, Accumulator) and not cbArgs and not cbKWs:
+            self._acc = cb
         if inthread is not None:
             self.inthread = inthread # override default
+        if splitLines is not None:
+            self.splitLines = splitLines # override default
 
     def processLines(self, lines, prev=None):
         _log.debug("Process %d lines for %s", len(lines), self.name)
         if self.inthread:
-            return threads.deferToThread(self.process, lines, prev or 0)
+            D = getDecodePool().run(self.name, sum(map(len, lines)),
+                                    self.process, lines, prev or 0)
+            return D.addCallback(self._afterCB)
+        else:
+            return self._afterCB(self.process(lines, prev or 0))
+
+    def processBuffer(self, buf, end, prev=None):
+        _log.debug("Process %d bytes for %s", end, self.name)
+        engine = procdecode.getProcessDecoder()
+        if engine is not None:
+            limit = 0
+            if self._count_limit:
+                limit = self._count_limit-self._count
+            D = engine.decode(self.name, buf, end, self._rawheader, self.cadiscon, limit)
+            D.addCallback(self._decoded, buf, end, prev or 0)
+            return D.addCallback(self._afterCB)
+        elif self.inthread:
+            D = getDecodePool().run(self.name, end,
+                                    self.decodeBuffer, buf, end, prev or 0)
+            return D.addCallback(self._afterCB)
+        else:
+            return self._afterCB(self.decodeBuffer(buf, end, prev or 0))
+
+    def _decoded(self, R, buf, end, countSoFar):
+        """Deliver samples decoded by the ProcessDecoder
+        """
+        if R is None:
+            # too large for the shared memory slot
+            return getDecodePool().run(self.name, end,
+                                       self.decodeBuffer, buf, end, countSoFar)
+
+        chunks, raw = R
+        if raw is None:
+            self.header = self._rawheader = None
+        elif raw!=self._rawheader:
+            self._parseHeader(raw)
+
+        for V, M in chunks:
+            if self._acc is not None:
+                self._acc(V, M)
+                self._count += len(M)
+                if self._limitReached():
+                    break
+            elif self._push(V, M, absolute=True):
+                break
+        return self._count
+
+    def _callCB(self, V, M):
+        D = self._CB(V, M, *self._CB_args, **self._CB_kws)
+        if isinstance(D, defer.Deferred):
+            self._waits.append(D)
+
+    def _afterCB(self, R):
+        """Wait for any Deferreds returned by the user callback
+        for the samples of one buffer.
+
+        In thread mode, the callbacks queued with callFromThread()
+        have all run before the result from the worker is delivered.
+        """
+        W, self._waits = self._waits, []
+        if not W:
+            return R
+        return defer.gatherResults(W, consumeErrors=True).addCallback(lambda _ign:R)
+
+    def _parseHeader(self, raw):
+        try:
+            self.header, self._year = parseHeader(raw)
+        except ValueError:
+            _log.error("Error docoding header: %s %s", self.name, repr(raw))
+            raise
+        self._rawheader = raw
+        return self.header
+
+    def _push(self, V, M, absolute=False):
+        """Deliver decoded samples to the user callback.
+        Unless absolute=True, sample times are relative to the start of the year.
+
+        Returns True when the count limit has been reached.
+        """
+        M = np.rec.array(M, dtype=dbr_time)
+
+        if not absolute:
+            M['sec'] += self._year
+
+        #TODO: recheck _count_limit here as len(M)>=Nsamp due to
+        #  disconnect events
+        self._count += len(M)
+
+        if len(M)==0:
+            _log.warn("%s discarding 0 length array %s %s", self.name, V, M)
         else:
-            return self.process(lines, prev or 0)
+            #_log.debug("pushing %s samples: %s", V.shape, self.name)
+            if self.inthread:
+                reactor.callFromThread(self._callCB, V, M)
+            else:
+                self._callCB(V, M)
+
+        return self._limitReached()
+
+    def _limitReached(self):
+        if self._count_limit and self._count>=self._count_limit:
+            _log.debug("%s count limit reached (%d,%d)", self.name,
+                       self._count, self._count_limit)
+            self.transport.stopProducing()
+            return True
+        return False
+
+    def decodeBuffer(self, buf, end, countSoFar):
+        """Decode the complete lines in buf[:end]
+        """
+        pos = 0
+        while pos<end:
+            if buf[pos]=='\n':
+                # new header will be next
+                self.header = None
+                pos += 1
+                continue
+
+            elif not self.header:
+                # first message in the stream
+                eol = buf.index('\n', pos, end)
+                self._parseHeader(buf[pos:eol])
+                pos = eol+1
+                continue
+
+            H = self.header
+
+            limit = 0
+            if self._count_limit:
+                assert self._count < self._count_limit
+                limit = self._count_limit-self._count
+
+            N0 = len(self._acc) if self._acc is not None else 0
+            try:
+                if self._acc is not None:
+                    # samples stored with absolute times
+                    N, pos = bufdecoders[H.type](buf, pos, end, self.cadiscon,
+                                                 self._year, limit, self._acc)
+                else:
+                    V, M, pos = bufdecoders[H.type](buf, pos, end, self.cadiscon,
+                                                    self._year, limit)
+            except Exception as e:
+                if isinstance(e, DecodeError):
+                    _log.error("Failed to decode sample %s %s %s", self.name,H.type,repr(e.args[0]))
+                if self._acc is not None:
+                    self._acc.truncate(N0) # drop any rows reserved
+                raise
+
+            if self._acc is not None:
+                self._count += N
+                if self._limitReached():
+                    break
+
+            elif self._push(V, M):
+                break
+
+        return self._count
 
 
     def process(self, lines, linesSoFar):
@@ -112,15 +300,7 @@ class PBReceiver(BufferingLineProtocol):
 
             if not self.header:
                 # first message in the stream
-                self.header = H = PayloadInfo()
-                H.ParseFromString(unescape(P[0]))
-                try:
-                    if H.year<0:
-                        H.year = 1 # -1 when no samples available
-                    self._year = calendar.timegm(datetime.date(H.year,1,1).timetuple())
-                except ValueError:
-                    _log.error("Error docoding header: %s %s %s", self.name, H.year, repr(P[0]))
-                    raise
+                H = self._parseHeader(P[0])
                 P = P[1:]
             else:
                 # use header from previous
@@ -142,28 +322,7 @@ class PBReceiver(BufferingLineProtocol):
                 _log.error("Failed to decode sample %s %s %s", self.name,H.type,repr(e.args[0]))
                 raise
 
-            M = np.rec.array(M, dtype=dbr_time)
-
-            M['sec'] += self._year
-
-            #TODO: recheck _count_limit here as len(M)>=Nsamp due to
-            #  disconnect events
-            self._count += len(M)
-
-            if len(M)==0:
-                _log.warn("%s discarding 0 length array %s %s", self.name, V, M)
-            else:
-                #_log.debug("pushing %s samples: %s", V.shape, self.name)
-                if self.inthread:
-                    reactor.callFromThread(self._CB, V, M, *self._CB_args, **self._CB_kws)
-                else:
-                    D = self._CB(V, M, *self._CB_args, **self._CB_kws)
-                    assert not isinstance(D, defer.Deferred), "appl does not support callbacks w/ deferred"
-
-            if self._count_limit and self._count>=self._count_limit:
-                _log.debug("%s count limit reached (%d,%d)", self.name,
-                           self._count, self._count_limit)
-                self.transport.stopProducing()
+            if self._push(V, M):
                 break
 
         return self._count
@@ -191,6 +350,14 @@ class JSONReceiver(protocol.Protocol):
         else:
             self.defer.errback(reason)
 
+class DiscardReceiver(protocol.Protocol):
+    """Receive and ignore a response body
+    """
+    def __init__(self):
+        self.defer = defer.Deferred()
+    def connectionLost(self, reason):
+        self.defer.callback(None)
+
 @defer.inlineCallbacks
 def fetchJSON(agent, url, code=200):
     R = yield agent.request('GET', str(url))
@@ -222,9 +389,135 @@ def getArchive(conf):
 
     defer.returnValue(Appliance(A, D, conf))
 
+def plotBinSize(T0, Tend, count):
+    """Bin size (seconds) which fetchplot() requests for the time range
+    [T0, Tend) (POSIX seconds) and number of bins.
+
+    >>> plotBinSize(0, 1100, 100), plotBinSize(0, 1099, 100)
+    (11, 10)
+    """
+    return (Tend-T0)//count
+
+def splitInterval(S0, S1, N, align=1):
+    """Split the time range [S0, S1) (POSIX seconds) into at most N
+    slices whose internal boundaries are multiples of 'align' seconds.
+
+    Returns the list of boundaries, including S0 and S1.
+
+    >>> splitInterval(100, 400, 3)
+    [100, 200, 300, 400]
+    >>> splitInterval(150, 400, 3, align=100)
+    [150, 200, 300, 400]
+    >>> splitInterval(150, 1000, 2, align=100)
+    [150, 500, 1000]
+    >>> splitInterval(150, 180, 4, align=100)
+    [150, 180]
+    """
+    step = int(math.ceil((S1-S0)/float(N*align)))*align
+    step = max(step, align)
+    B = [S0]
+    T = (S0//step+1)*step
+    while T<S1:
+        B.append(T)
+        T += step
+    B.append(S1)
+    return B
+
+class _SliceReorder(object):
+    """Re-order samples received by concurrent requests for
+    consecutive time slices.
+
+    Samples of slice #i are passed to the callback as they arrive
+    if all earlier slices are complete.  Otherwise they are buffered
+    until then.
+
+    The appliance includes the last sample before the start of a
+    request, so samples outside of [B[i], B[i+1]) are dropped
+    (except before the start of the first slice).
+
+    Buffered samples are acknowledged with a Deferred which fires
+    when they are delivered, so that the receiver of a later slice
+    pauses instead of buffering the whole slice.
+
+    After fail(), these Deferreds, and those returned for any further
+    samples, fail so that the receivers stop.
+    """
+    def __init__(self, bounds, cb, cbArgs=(), cbKWs={}):
+        self._B, self._N = bounds, len(bounds)-1
+        self._CB, self._CB_args, self._CB_kws = cb, cbArgs, cbKWs
+        self._next, self.count = 0, 0
+        self._pending = [[] for i in range(self._N)]
+        self._waiting = [None]*self._N
+        self._done = [False]*self._N
+        self.failure = None
+
+    def receiver(self, i):
+        return functools.partial(self._recv, i)
+
+    def _recv(self, i, V, M):
+        sel = np.ones(len(M), dtype=np.bool)
+        if i>0:
+            sel &= M['sec']>=self._B[i]
+        if i<self._N-1:
+            sel &= M['sec']<self._B[i+1]
+        if not sel.all():
+            V, M = V[sel], M[sel]
+        if len(M)==0:
+            return
+
+        if self.failure is not None:
+            return defer.fail(self.failure)
+        elif i==self._next:
+            return self._deliver(V, M)
+        else:
+            self._pending[i].append((V, M))
+            if self._waiting[i] is None:
+                self._waiting[i] = defer.Deferred()
+            return self._waiting[i]
+
+    def _deliver(self, V, M):
+        self.count += len(M)
+        return self._CB(V, M, *self._CB_args, **self._CB_kws)
+
+    def fail(self, F):
+        """Called when the fetch of a slice fails.  Returns F.
+        """
+        if self.failure is None:
+            self.failure = F
+            self._pending = [[] for i in range(self._N)]
+            W, self._waiting = self._waiting, [None]*self._N
+            for D in W:
+                if D is not None:
+                    D.errback(F)
+        return F
+
+    def complete(self, i):
+        if self.failure is not None:
+            return self.count
+        self._done[i] = True
+        while self._next<self._N and self._done[self._next]:
+            self._next += 1
+            if self._next<self._N:
+                P, self._pending[self._next] = self._pending[self._next], []
+                W = [self._deliver(V, M) for V, M in P]
+                D, self._waiting[self._next] = self._waiting[self._next], None
+                if D is not None:
+                    W = [X for X in W if isinstance(X, defer.Deferred)]
+                    defer.gatherResults(W, consumeErrors=True).chainDeferred(D)
+        return self.count
+
 class Appliance(object):
     def __init__(self, agent, info, conf):
         self._agent, self._info, self._conf = agent, info, conf
+        self._cache = segcache.fromConf(conf)
+        # only change the process wide pool if configured
+        getDecodePool().configure(workers=conf.getint('decodethreads'),
+                                  maxqueue=conf.getint('decodequeue'))
+        procdecode.configure(conf.getint('decodeprocs') or 0)
+        self._names = None
+        maxage = conf.getint('nameindex', 600)
+        if maxage>0:
+            self._names = IndexLoader(self._loadNames, maxage=maxage)
 
     def archives(self, pattern):
         return ['all']
@@ -265,14 +558,20 @@ class Appliance(object):
             if not pattern.endswith('$') and not pattern.endswith('.*'):
                 pattern=pattern+'.*'
 
-        url='%s/getAllPVs?%s'%(self._info['mgmtURL'],urlencode({'regex':pattern}))
+        R = index = None
+        if self._names is not None:
+            try:
+                index = yield self._names.get()
+            except Exception:
+                _log.exception("Failed to load name index")
+            else:
+                R = [pv for pv,_D in index.search(pattern, full=True)]
 
-        yield self._agent.acquire()
-        try:
-            _log.debug("Query: %s", url)
-            R = yield fetchJSON(self._agent, url)
-        finally:
-            self._agent.release()
+        if not R:
+            # not in the index, may be newly added
+            R = yield self._getAllPVs({'regex':pattern})
+            if index is not None:
+                index.update([(pv, None) for pv in R])
 
         if not breakDown:
             meta = makeTime(0), makeTime(time.time())
@@ -284,6 +583,21 @@ class Appliance(object):
         defer.returnValue(R)
 
     @defer.inlineCallbacks
+    def _getAllPVs(self, query):
+        url='%s/getAllPVs?%s'%(self._info['mgmtURL'],urlencode(query))
+
+        yield self._agent.acquire()
+        try:
+            _log.debug("Query: %s", url)
+            R = yield fetchJSON(self._agent, url)
+        finally:
+            self._agent.release()
+        defer.returnValue(R)
+
+    def _loadNames(self):
+        return self._getAllPVs({'limit':-1}).addCallback(
+            lambda R:NameIndex([(pv, None) for pv in R]))
+
     def fetchraw(self, pv, callback,
                  cbArgs=(), cbKWs={},
                  T0=None, Tend=None,
@@ -291,6 +605,83 @@ class Appliance(object):
                  archs=None, breakDown=None,
                  enumAsInt=False, cadiscon=0):
 
+        if self._cache is not None and not count:
+            try:
+                T0, Tend = timeTuple(makeTime(T0)), timeTuple(makeTime(Tend))
+            except (OverflowError, ValueError, AttributeError):
+                pass # eg. datetime.min
+            else:
+                def fetch(cb, A, B):
+                    return self._fetchraw(pv, cb, T0=A, Tend=B, chunkSize=chunkSize,
+                                          cadiscon=cadiscon)
+                key = 'appl %s %s %d'%(self._conf.get('url'), pv, cadiscon)
+                return self._cache.fetch(key, fetch, callback, cbArgs, cbKWs,
+                                         T0=T0, Tend=Tend, chunkSize=chunkSize)
+
+        return self._fetchraw(pv, callback, cbArgs, cbKWs, T0=T0, Tend=Tend,
+                              count=count, chunkSize=chunkSize, cadiscon=cadiscon)
+
+    def _fetchraw(self, pv, callback, cbArgs=(), cbKWs={},
+                  T0=None, Tend=None, count=None, chunkSize=None, cadiscon=0):
+
+        nsplit = self._conf.getint('splitfetch', 0)
+        if nsplit>1 and not count:
+            # count limited requests must be sequential
+            T0, Tend = makeTime(T0), makeTime(Tend)
+            try:
+                S0, S1 = timeTuple(T0)[0], timeTuple(Tend)[0]
+            except (OverflowError, ValueError, AttributeError):
+                S0 = S1 = None # eg. datetime.min
+
+            if S0 is not None and S1>S0:
+                B = splitInterval(S0, S1, nsplit,
+                                  align=self._conf.getint('splitalign', 86400))
+                if len(B)>2:
+                    return self._fetchsplit(pv, callback, cbArgs, cbKWs,
+                                            T0, Tend, B, chunkSize, cadiscon)
+
+        return self._fetchone(pv, callback, cbArgs, cbKWs, T0, Tend,
+                              count, chunkSize, cadiscon)
+
+    def _fetchsplit(self, pv, callback, cbArgs, cbKWs, T0, Tend, B,
+                    chunkSize, cadiscon):
+        """Fetch consecutive time slices concurrently
+        """
+        _log.debug("Split %s into %d slices", pv, len(B)-1)
+        R = _SliceReorder(B, callback, cbArgs, cbKWs)
+
+        # replace interior boundaries with full times
+        times = [T0]+[makeTime(T) for T in B[1:-1]]+[Tend]
+
+        def failed(F):
+            if R.failure is None:
+                R.fail(F)
+                # stop the other slices
+                for X in Ds:
+                    X.cancel()
+            return F
+
+        Ds = []
+        for i in range(len(B)-1):
+            if R.failure is not None:
+                break
+            D = self._fetchone(pv, R.receiver(i), (), {},
+                               times[i], times[i+1],
+                               None, chunkSize, cadiscon)
+            D.addCallback(lambda C, i=i: R.complete(i))
+            D.addErrback(failed)
+            Ds.append(D)
+
+        D = defer.gatherResults(Ds, consumeErrors=True)
+        D.addCallback(lambda _: R.count)
+        # the first failure, not the cancellation of the other slices
+        D.addErrback(lambda F: R.failure or F)
+        return D
+
+    @defer.inlineCallbacks
+    def _fetchone(self, pv, callback, cbArgs, cbKWs, T0, Tend,
+                  count, chunkSize, cadiscon):
+
         Q = {
             'pv':pv,
             'from':isoString(makeTime(T0)),
@@ -309,19 +700,21 @@ class Appliance(object):
                 defer.returnValue(0)
     
             P = PBReceiver(callback, cbArgs, cbKWs, name=pv,
-                           nreport=chunkSize, count=count, cadiscon=cadiscon)
+                           nreport=chunkSize, count=count, cadiscon=cadiscon,
+                           splitLines=not (self._conf.getboolean('streamdecode', False)
+                                           or procdecode.getProcessDecoder() is not None))
         
             R.deliverBody(P)
             C = yield P.defer
         finally:
             self._agent.release()
 
-        if P._tend is not None and _log.isEnabledFor(logging.DEBUG):
+        if P._tend is not None:
             elapsed = P._tend - P._tstart
-            rate = P._nbytes/elapsed
-            _log.debug("%s rx'd %d bytes in %f sec (%f Bps)",
-                       pv, P._nbytes, elapsed, rate)
-            
+            getDecodePool().received(pv, P._nbytes, elapsed)
+            if _log.isEnabledFor(logging.DEBUG):
+                _log.debug("%s rx'd %d bytes in %f sec (%f Bps)",
+                           pv, P._nbytes, elapsed, P._nbytes/elapsed if elapsed else 0)
 
         defer.returnValue(C)
 
@@ -343,7 +736,7 @@ class Appliance(object):
             raise ValueError("invalid sample count (%s <= 0)"%(count,))
 
         delta = Tend-T0
-        N = math.ceil(delta/count) # average sample period
+        N = plotBinSize(T0, Tend, count) # average sample period
 
         if N<=1 or delta<=0:
             _log.info("Time range %s too short for plot bin %s, switching to raw", delta, count)
@@ -379,10 +772,22 @@ class Appliance(object):
             metas[i]['severity'] = 104
             _log.error("Fault while processing %s: %s", pvs[i], F)
 
+        if self._conf.getboolean('bulksnap', True):
+            Ds = []
+            for i in range(0, Npvs, chunkSize):
+                Ds.append(self._fetchsnapbulk(pvs[i:i+chunkSize], i, Tlast,
+                                              values, metas))
+            R = yield defer.gatherResults(Ds)
+            missing = sum(R, [])
+            if missing:
+                _log.debug("%d PVs not found by getDataAtTime", len(missing))
+        else:
+            missing = range(Npvs)
+
         Ds = []
 
-        for i,pv in enumerate(pvs):
-            D = self.fetchraw(pv, store, cbArgs=(i,),
+        for i in missing:
+            D = self.fetchraw(pvs[i], store, cbArgs=(i,),
                               T0=Tcur, Tend=Tlast,
                               count=2)
             D.addErrback(fault, i)
@@ -391,3 +796,56 @@ class Appliance(object):
         yield defer.DeferredList(Ds)
 
         defer.returnValue((values, metas))
+
+    @defer.inlineCallbacks
+    def _fetchsnapbulk(self, pvs, offset, T, values, metas):
+        """Retrieve the most recent sample at time T for a group of PVs
+        with a single getDataAtTime request.
+
+        Results are stored in values[offset:] and metas[offset:].
+        Returns a list of the indicies of PVs which were not found.
+        """
+        url = str('%s/data/getDataAtTime?%s'%(self._info['dataRetrievalURL'],
+                                              urlencode({'at':isoString(makeTime(T))})))
+        body = FileBodyProducer(StringIO(json.dumps(pvs)))
+
+        J = None
+        yield self._agent.acquire()
+        try:
+            _log.debug("Query: %s for %d PVs", url, len(pvs))
+            R = yield self._agent.request('POST', url,
+                                          Headers({'Content-Type':['application/json']}),
+                                          body)
+
+            if R.code==200:
+                P = JSONReceiver()
+                R.deliverBody(P)
+                J = yield P.defer
+            else:
+                _log.error("%s for getDataAtTime", R.code)
+                # read out the error page so the connection can be reused
+                P = DiscardReceiver()
+                R.deliverBody(P)
+                yield P.defer
+        except Exception:
+            _log.exception("getDataAtTime fails")
+        finally:
+            self._agent.release()
+
+        if not isinstance(J, dict):
+            defer.returnValue(range(offset, offset+len(pvs)))
+
+        missing = []
+        for i,pv in enumerate(pvs, offset):
+            S = J.get(pv)
+            if not S:
+                missing.append(i)
+                continue
+            V = S.get('val')
+            if isinstance(V, list):
+                V = V[0] if len(V) else None
+            values[i] = V
+            metas[i] = (S.get('severity',0), S.get('status',0),
+                        S.get('secs',0), S.get('nanos',0))
+
+        defer.returnValue(missing)
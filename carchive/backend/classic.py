@@ -15,6 +15,8 @@ import time, math
 from xmlrpclib import Fault
 
 from fnmatch import fnmatch
+from itertools import chain
+from operator import itemgetter
 from collections import defaultdict
 import numpy as np
 
@@ -23,13 +25,16 @@ from datetime import datetime
 
 from twisted.internet import defer
 from twisted.internet.defer import FirstError
+from twisted.python import failure
 
 # Use EOL hack
-from ..rpcmunge import NiceProxy as Proxy
+from ..rpcmunge import NiceProxy as Proxy, SampleColumns
 #from twisted.web.xmlrpc import Proxy
 
 from ..dtype import dbr_time
-from ..util import HandledError
+from ..util import HandledError, Cache
+from .. import segcache
+from ..nameindex import NameIndex, IndexLoader
 
 from twisted.internet.error import ConnectionRefusedError
 
@@ -64,6 +69,83 @@ _dtypes = {
     3: np.float64
 }
 
+_meta_names = ('severity', 'status', 'sec', 'ns')
+_meta_fields = itemgetter('sevr', 'stat', 'secs', 'nano')
+_value_field = itemgetter('value')
+
+def _xml2numpy(XML, dtype, states=None):
+    """Convert a list of sample structs, as returned by archiver.values,
+    into arrays of values and dbr_time.
+
+    If states is not None, then integer values are replaced with the
+    corresponding state string.
+
+    >>> XML = [{'value':[1,0], 'sevr':0, 'stat':0, 'secs':10, 'nano':1},
+    ...        {'value':[5], 'sevr':2, 'stat':3, 'secs':11, 'nano':2}]
+    >>> V, M = _xml2numpy(XML, np.int32)
+    >>> V
+    array([[1, 0],
+           [5, 0]], dtype=int32)
+    >>> M['sec'], M['severity']
+    (array([10, 11], dtype=uint32), array([0, 2], dtype=uint32))
+    >>> V, M = _xml2numpy(XML, _dtypes[1], states=['zero', 'one'])
+    >>> V
+    array([['one', 'zero'],
+           ['5', '']], dtype='|S26')
+    """
+    N = len(XML)
+    metadata = np.ndarray(N, dtype=dbr_time)
+    rawtype = np.dtype(dtype if states is None else np.int64)
+
+    if isinstance(XML, SampleColumns):
+        # already in columns from the streaming parser
+        L, flat, cols = XML.columns()
+        for name, C in zip(_meta_names, cols):
+            metadata[name] = C
+        flat = flat.astype(rawtype, copy=False)
+
+    else:
+        if N:
+            for name, C in zip(_meta_names, zip(*map(_meta_fields, XML))):
+                metadata[name] = np.fromiter(C, dtype=np.int64, count=N)
+
+        V = map(_value_field, XML)
+        L = np.fromiter(map(len, V), dtype=np.int32, count=N)
+
+        flat = chain.from_iterable(V)
+        if rawtype.kind=='S':
+            flat = np.asarray(list(flat), dtype=rawtype)
+        else:
+            flat = np.fromiter(flat, dtype=rawtype, count=L.sum())
+
+    maxelem = L.max() if N else 0
+
+    # mask of elements present in each sample (row)
+    present = None
+    if (L==maxelem).all():
+        # all samples have the same length (always for scalars)
+        raw = flat.reshape((N, maxelem))
+    else:
+        present = np.arange(maxelem)[None,:] < L[:,None]
+        raw = np.zeros((N, maxelem), dtype=rawtype)
+        raw[present] = flat
+
+    if states is None:
+        return raw, metadata
+
+    # map enum values through a look-up table of state strings
+    table = np.asarray(states, dtype=dtype)
+    valid = (raw>=0) & (raw<len(table))
+
+    values = np.zeros(raw.shape, dtype=dtype)
+    values[valid] = table[raw[valid]]
+    if not valid.all():
+        values[~valid] = map(str, raw[~valid])
+    if present is not None:
+        values[~present] = ''
+
+    return values, metadata
+
 @defer.inlineCallbacks
 def getArchive(conf):
     """getArchive(conf=...)
@@ -78,7 +160,8 @@ def getArchive(conf):
     maxreq = conf.getint('maxrequests', 10)
     maxq = conf.getint('maxquery')
     
-    proxy=Proxy(url, limit=maxreq, qlimit=maxq)
+    proxy=Proxy(url, limit=maxreq, qlimit=maxq,
+                stream=conf.getboolean('streamparse', False))
     proxy.connectTimeout=3.0
 
     info = proxy.callRemote('archiver.info').addErrback(_connerror)
@@ -88,12 +171,194 @@ def getArchive(conf):
     
     defer.returnValue(Archive(proxy, conf, info, archs))
 
+def _nameent(R):
+    """Unpack one entry of an archiver.names reply
+    """
+    return R['name'], (R['start_sec'], R['start_nano']), (R['end_sec'], R['end_nano'])
+
+# Max. number of names found in the index which are looked up by name.
+# When more match, the original pattern is sent instead.
+_NAMES_LOOKUP = 100
+
+def _namesPattern(names):
+    """Pattern matching exactly the given names.
+    The server uses POSIX extended regular expressions, so no (?:...)
+
+    >>> _namesPattern(['a:b', 'c'])
+    '^(a\\\\:b|c)$'
+    """
+    return '^(%s)$'%'|'.join(map(re.escape, names))
+
+# End time of a section which may still be growing
+_OPEN_END = (2**31-1, 0)
+
+class QueryPlanner(object):
+    """Plans the requests needed for the samples of a PV in a time range.
+
+    The time range of the samples in each archive section,
+    as found by search(breakDown=True), is cached per PV.
+    As samples may have been added since, the newest section
+    of a cached result is taken to extend to the end of time.
+    """
+    def __init__(self, archive, maxcount=1000, maxage=300):
+        self._archive = archive
+        self._cache = Cache(maxcount=maxcount, maxage=maxage)
+
+    @defer.inlineCallbacks
+    def sections(self, pv, archs=None):
+        """Returns a Deferred firing with a list [(firstTime, lastTime, archKey)]
+        """
+        key = (pv, tuple(archs) if isinstance(archs, list) else archs)
+        S = self._cache.get(key)
+        if S is None:
+            R = yield self._archive.search(exact=pv, archs=archs,
+                                           breakDown=True, rawTime=True)
+            S = R.get(pv, [])
+            self._cache.set(key, S)
+        elif len(S):
+            F, _L, K = S[-1]
+            S = S[:-1]+[(F, _OPEN_END, K)]
+        defer.returnValue(S)
+
+    @staticmethod
+    def plan(sections, Tcur, Tend):
+        """Find a set of non-overlapping requests (Rstart, Rend, archKey)
+        covering [Tcur, Tend)
+
+        >>> S = [((100,0), (199,0), 1), ((150,0), (299,0), 2), ((300,0), (399,0), 3)]
+        >>> QueryPlanner.plan(S, (120,0), (350,0))
+        [((120, 0), (199, 1000), 1), ((199, 1000), (299, 1000), 2), ((300, 0), (350, 0), 3)]
+        >>> QueryPlanner.plan(S, (400,0), (450,0))
+        []
+        """
+        plan = []
+        for F, L, K in sections:
+            # some mis-match of definitions
+            # the search results give the times
+            # of the first and last samples
+            # inclusive.
+            #  time range [F, L]
+            # However, values() query end time
+            # is exclusive
+            #  time range [F, L)
+            # We step the end time forward by 1 micro-second
+            # to ensure that the last sample can be returned.
+            # Note: it seems that Channel Archiver uses
+            # micro-sec resolution times for comparisons...
+            LS, LN = L
+            LN += 1000
+            if LN>1000000000:
+                LS += 1
+                LN = 0
+            L = LS, LN
+
+            if L <= Tcur:
+                continue # Too early, keep going
+            elif F >= Tend:
+                break # No more data in range
+
+            # range to request from this archive
+            Rstart = max(Tcur, F)
+            Rend   = min(Tend, L)
+
+            plan.append((Rstart, Rend, K))
+
+            Tcur =  Rend
+        return plan
+
+class _SectionMerge(object):
+    """Pass samples from concurrent requests for consecutive sections
+    to the callback in order.
+
+    Samples of the earliest incomplete section are passed through
+    as they arrive.  Samples of later sections are buffered until then,
+    and acknowledged with a Deferred which fires when they are delivered,
+    so that the fetch of a later section pauses instead of buffering
+    the whole section.
+    'finished' fires when all sections are complete and delivered.
+
+    After fail(), these Deferreds, and those returned for any further
+    samples, fail so that the fetches stop.
+    """
+    def __init__(self, nsect, cb, cbArgs=(), cbKWs={}):
+        self._CB, self._CB_args, self._CB_kws = cb, cbArgs, cbKWs
+        self._bufs = [[] for i in range(nsect)]
+        self._waiting = [None]*nsect
+        self._done = [False]*nsect
+        self._live, self._flushing = 0, False
+        self.failure = None
+        self.finished = defer.Deferred()
+
+    def receiver(self, i):
+        def rx(V, M, **kws):
+            if self.failure is not None:
+                return defer.fail(self.failure)
+            elif i==self._live and not self._flushing:
+                return self._CB(V, M, *self._CB_args, **dict(self._CB_kws, **kws))
+            self._bufs[i].append((V, M, kws))
+            if self._waiting[i] is None:
+                self._waiting[i] = defer.Deferred()
+            return self._waiting[i]
+        return rx
+
+    def fail(self, F):
+        """Called when the fetch of a section fails.  Returns F.
+        """
+        if self.failure is None:
+            self.failure = F
+            self._bufs = [[] for B in self._bufs]
+            W, self._waiting = self._waiting, [None]*len(self._waiting)
+            for D in W:
+                if D is not None:
+                    D.errback(F)
+        return F
+
+    def complete(self, N, i):
+        self._done[i] = True
+        self._advance()
+        return N
+
+    @defer.inlineCallbacks
+    def _advance(self):
+        if self._flushing or self.finished.called or self.failure is not None:
+            return
+        self._flushing = True
+        try:
+            while self._live<len(self._done):
+                i = self._live
+                buf = self._bufs[i]
+                while buf:
+                    V, M, kws = buf.pop(0)
+                    yield defer.maybeDeferred(self._CB, V, M, *self._CB_args,
+                                              **dict(self._CB_kws, **kws))
+                    if not buf:
+                        # may resume the fetch, and buffer more
+                        D, self._waiting[i] = self._waiting[i], None
+                        if D is not None:
+                            D.callback(None)
+                if not self._done[i]:
+                    break
+                self._live += 1
+        except:
+            F = failure.Failure()
+            self.fail(F)
+            self.finished.errback(F)
+        else:
+            if self._live==len(self._done):
+                self.finished.callback(None)
+        finally:
+            self._flushing = False
+
 class Archive(object):
     """
     """
     def __init__(self, proxy, conf, info, archs):
         self._proxy = proxy
         self.conf = conf
+        self._cache = segcache.fromConf(conf)
+        self._planner = QueryPlanner(self, maxage=conf.getint('plancache', 300))
+        self._nameage = conf.getint('nameindex', 0)
+        self._names = {} # archive key -> IndexLoader
         if PVER < info['ver']:
             _log.warn('Archive server protocol version %d is newer then ours (%d).\n'+
                       'Attempting to proceed.', info['ver'], PVER)
@@ -193,22 +458,27 @@ class Archive(object):
         archs = self._archname2key(archs)
 
         _log.debug('Searching for %s in %s', pattern, archs)
-        Ds = [None]*len(archs)
-        
-        for i,a in enumerate(archs):
-            Ds[i] = self._proxy.callRemote('archiver.names', a, pattern).addErrback(_connerror)
+        Ds = [self._indexnames(a, pattern) for a in archs]
+        Ds = yield defer.DeferredList(Ds, fireOnOneErrback=True).addErrback(_connerror)
 
+        # The index holds only names.  Time ranges always come from the server,
+        # and every archive is asked, as a PV may since have been added to another.
+        names = set()
+        for _junk, A in Ds:
+            names.update(A)
+        if names and len(names)<=_NAMES_LOOKUP:
+            pattern = _namesPattern(sorted(names))
+        # Otherwise not in any index (or no index), and may have been added
+        # since the index was loaded.  Or too many to list.
+
+        Ds = [self._servernames(a, pattern) for a in archs]
         Ds = yield defer.DeferredList(Ds, fireOnOneErrback=True).addErrback(_connerror)
 
         if breakDown:
             results = defaultdict(list)
             
             for i, (junk, A) in enumerate(Ds):
-                for R in A:
-                    # Note: Order based on sorting by key name
-                    ens, es, ss, sns, pv = R.values()
-                    F = (ss, sns)
-                    L = (es, ens)
+                for pv, F, L in A:
                     if not rawTime:
                         F, L = makeTime(F), makeTime(L)
                     results[pv].append( (F, L, archs[i]) )
@@ -220,11 +490,7 @@ class Archive(object):
             results = defaultdict(lambda:[None]*2)
             
             for junk, A in Ds:
-                for R in A:
-                    # Note: Order based on sorting by key name
-                    ens, es, ss, sns, pv = R.values()
-                    F = (ss, sns)
-                    L = (es, ens)
+                for pv, F, L in A:
                     if not rawTime:
                         F, L = makeTime(F), makeTime(L)
                     C = results[pv]
@@ -237,6 +503,38 @@ class Archive(object):
 
         defer.returnValue(results)
 
+    @defer.inlineCallbacks
+    def _indexnames(self, arch, pattern):
+        """List of the names of PVs in one archive matching pattern,
+        taken from the name index of the archive.
+        """
+        if self._nameage<=0:
+            defer.returnValue([])
+        loader = self._names.get(arch)
+        if loader is None:
+            loader = self._names[arch] = IndexLoader(lambda:self._loadNames(arch),
+                                                     maxage=self._nameage)
+        index = yield loader.get()
+        defer.returnValue([pv for pv,_D in index.search(pattern)])
+
+    @defer.inlineCallbacks
+    def _servernames(self, arch, pattern):
+        """List of (pv, (firstsec, firstnano), (lastsec, lastnano))
+        for the PVs in one archive matching pattern.
+        Names are added to the name index.
+        """
+        A = yield self._proxy.callRemote('archiver.names', arch, pattern).addErrback(_connerror)
+        R = map(_nameent, A)
+        loader = self._names.get(arch)
+        if loader is not None and loader.index is not None:
+            loader.index.update([(pv, None) for pv, _F, _L in R])
+        defer.returnValue(R)
+
+    def _loadNames(self, arch):
+        D = self._proxy.callRemote('archiver.names', arch, '').addErrback(_connerror)
+        D.addCallback(lambda A:NameIndex([(R['name'], None) for R in A]))
+        return D
+
     @defer.inlineCallbacks
     def _fetchdata(self, arch, pv, callback,
                    cbArgs=(), cbKWs={},
@@ -268,111 +566,144 @@ class Archive(object):
 
         Tcur = timeTuple(T0)
         Tlast =timeTuple(Tend)
+
+        # Pages are requested by _fetchpages() and queued for conversion
+        # and delivery here.  Up to 'prefetch' pages may be requested
+        # before the callback has accepted the preceding page.
+        depth = max(0, self.conf.getint('prefetch', 0))
+        Q, sem, stop = defer.DeferredQueue(), defer.DeferredSemaphore(depth+1), []
+
+        self._fetchpages(Q, sem, stop, arch, pv, Tcur, Tlast, C, count, how)
+
+        try:
+            while True:
+                page = yield Q.get()
+                if isinstance(page, failure.Failure):
+                    page.raiseException()
+                elif not isinstance(page, tuple):
+                    N = page # total sample count
+                    break
+
+                data, dup = page
+                del page
+
+                maxcount = data[0]['count']
+
+                the_meta = data[0]['meta']
+                if data[0]['meta']['type']==0:
+                    states = data[0]['meta']['states']
+                else:
+                    states = []
+
+                orig_type = data[0]['type']
+                vtype = orig_type
+                if vtype==1 and enumAsInt:
+                    vtype = 2
+
+                try:
+                    dtype = _dtypes[vtype]
+                except KeyError:
+                    raise ValueError("Server gives unknown value type %d"%vtype)
+
+                values, metadata = _xml2numpy(data[0]['values'], dtype,
+                                              states if vtype==1 else None)
+
+                if not displayMeta:
+                    maxelem = values.shape[1]
+                    assert maxcount==maxelem, "Value shape inconsistent. %d %d"%(maxcount,maxelem)
+
+                del data
+
+                if dup:
+                    # remove duplicate sample
+                    values = values[1:]
+                    metadata = metadata[1:]
+
+                if displayMeta:
+                    extraMeta = {'orig_type':orig_type, 'the_meta':the_meta, 'reported_arr_size':maxcount}
+                    yield defer.maybeDeferred(callback, values, metadata, *cbArgs, extraMeta=extraMeta, **cbKWs)
+                else:
+                    yield defer.maybeDeferred(callback, values, metadata, *cbArgs, **cbKWs)
+
+                sem.release()
+        except:
+            # stop requesting, and wake _fetchpages() if waiting
+            stop.append(True)
+            if sem.tokens<sem.limit:
+                sem.release()
+            raise
+
+        defer.returnValue(N)
+
+    @defer.inlineCallbacks
+    def _fetchpages(self, Q, sem, stop, arch, pv, Tcur, Tlast, C, count, how):
+        """Request successive pages of samples for _fetchdata().
+
+        Each page begins with the last sample of the previous page.
+        Pages are put in Q as a tuple (data, dup) where dup is True
+        when the first sample is such a duplicate.  The total sample
+        count, or a Failure, is put last.
+        """
         N = 0
         first = True
         last = False
-        while not last and Tcur < Tlast:
-            _log.debug('archiver.values(%s,%s,%s,%s,%d,%d)',
-                       self.__rarchs[arch],pv,Tcur,Tlast,C,how)
-            D = self._proxy.callRemote('archiver.values',
-                                       arch, [pv],
-                                       Tcur[0], Tcur[1],
-                                       Tlast[0], Tlast[1],
-                                       C, how).addErrback(_connerror)
-
-            D.addCallback(_optime, time.time())
-
-            try:
-                data = yield D
-            except:
-                _log.fatal('Query fails')
-                raise
+        try:
+            while not last and Tcur < Tlast:
+                yield sem.acquire()
+                if stop:
+                    break
 
-            assert len(data)==1, "Server returned more than one PVs? (%s)"%len(data)
+                _log.debug('archiver.values(%s,%s,%s,%s,%d,%d)',
+                           self.__rarchs[arch],pv,Tcur,Tlast,C,how)
+                D = self._proxy.callRemote('archiver.values',
+                                           arch, [pv],
+                                           Tcur[0], Tcur[1],
+                                           Tlast[0], Tlast[1],
+                                           C, how, caller=pv).addErrback(_connerror)
 
-            assert data[0]['name']==pv, "Server gives us %s != %s"%(data[0]['name'], pv)
+                D.addCallback(_optime, time.time())
 
-            vals = data[0]['values']
+                try:
+                    data = yield D
+                except:
+                    _log.fatal('Query fails')
+                    raise
 
-            maxcount = data[0]['count']
+                if stop:
+                    break
 
-            _log.debug("Query yields %u points"%len(vals))
+                assert len(data)==1, "Server returned more than one PVs? (%s)"%len(data)
 
-            N += len(vals)
-            last = len(vals)<C
-            if count and N>=count:
-                last = True
+                assert data[0]['name']==pv, "Server gives us %s != %s"%(data[0]['name'], pv)
 
-            the_meta = data[0]['meta']
-            if data[0]['meta']['type']==0:
-                states = data[0]['meta']['states']
-            else:
-                states = []
+                vals = data[0]['values']
 
-            orig_type = data[0]['type']
-            vtype = orig_type
-            if vtype==1 and enumAsInt:
-                vtype = 2
+                _log.debug("Query yields %u points"%len(vals))
 
-            try:
-                dtype = _dtypes[vtype]
-            except KeyError:
-                raise ValueError("Server gives unknown value type %d"%vtype)
+                N += len(vals)
+                last = len(vals)<C
+                if count and N>=count:
+                    last = True
 
-            XML = data[0]['values']
-            
-            if len(XML)==0:
-                break
-
-            if vtype == 1:
-                for V in XML:
-                    for i,pnt in enumerate(V['value']):
-                        try:
-                            V['value'][i] = states[pnt]
-                        except IndexError:
-                            V['value'][i] = str(pnt)
-
-            maxelem=0
-            metadata = np.ndarray(len(XML), dtype=dbr_time)
-            for i,E in enumerate(XML):
-                maxelem = max(maxelem, len(E['value']))
-                metadata[i] = (E['sevr'], E['stat'], E['secs'], E['nano'])
-
-            if not displayMeta:
-                assert maxcount==maxelem, "Value shape inconsistent. %d %d"%(maxcount,maxelem)
-
-            values = np.ndarray((len(XML), maxelem), dtype=dtype)
-            
-            for i,E in enumerate(XML):
-                V = E['value']
-                values[i,:len(V)] = V
-                values[i,len(V):] = 0
+                if len(vals)==0:
+                    break
 
-            del XML
-            del data
-            
-            if first:
+                dup = not first
                 first = False
-            else:
-                # remove duplicate sample
-                values = values[1:]
-                metadata = metadata[1:]
 
-            # no non-duplicate samples
-            if len(metadata)==0:
-                break
+                # no non-duplicate samples
+                if dup and len(vals)==1:
+                    break
 
-            Tcur = (int(metadata[-1]['sec']), int(metadata[-1]['ns']+1))
-            
-            if displayMeta:
-                extraMeta = {'orig_type':orig_type, 'the_meta':the_meta, 'reported_arr_size':maxcount}
-                yield defer.maybeDeferred(callback, values, metadata, *cbArgs, extraMeta=extraMeta, **cbKWs)
-            else:
-                yield defer.maybeDeferred(callback, values, metadata, *cbArgs, **cbKWs)
+                Tcur = (int(vals[-1]['secs']), int(vals[-1]['nano']+1))
 
-        defer.returnValue(N)
+                Q.put((data, dup))
+                del data, vals
+        except:
+            Q.put(failure.Failure())
+        else:
+            Q.put(N)
 
-    @defer.inlineCallbacks
     def fetchraw(self, pv, callback,
                  cbArgs=(), cbKWs={},
                  T0=None, Tend=None,
@@ -383,11 +714,37 @@ class Archive(object):
 
         Results are passed to the given callback as they arrive.
         """
-        if breakDown is None:
-            breakDown = yield self.search(exact=pv, archs=archs,
-                                          breakDown=True, rawTime=True)
+        kws = {'chunkSize':chunkSize, 'archs':archs, 'breakDown':breakDown,
+               'enumAsInt':enumAsInt}
+
+        if self._cache is None or count or displayMeta:
+            return self._fetchraw(pv, callback, cbArgs, cbKWs, T0, Tend,
+                                  count=count, displayMeta=displayMeta,
+                                  rawTimes=rawTimes, **kws)
+
+        if not rawTimes:
+            T0, Tend = timeTuple(makeTime(T0)), timeTuple(makeTime(Tend))
+
+        def fetch(cb, A, B):
+            return self._fetchraw(pv, cb, T0=A, Tend=B, rawTimes=True, **kws)
+
+        if isinstance(archs, (list, tuple)):
+            archs = sorted(archs)
+        key = 'classic %s %s %s %s'%(self.conf.get('url'), pv, archs, enumAsInt)
+        return self._cache.fetch(key, fetch, callback, cbArgs, cbKWs,
+                                 T0=T0, Tend=Tend, chunkSize=chunkSize)
 
-        breakDown = breakDown[pv]
+    @defer.inlineCallbacks
+    def _fetchraw(self, pv, callback,
+                  cbArgs=(), cbKWs={},
+                  T0=None, Tend=None,
+                  count=None, chunkSize=None,
+                  archs=None, breakDown=None,
+                  enumAsInt=False, displayMeta=False, rawTimes=False):
+        if breakDown is None:
+            breakDown = yield self._planner.sections(pv, archs)
+        else:
+            breakDown = breakDown[pv]
 
         if len(breakDown)==0:
             _log.error("PV not archived")
@@ -401,46 +758,9 @@ class Archive(object):
         _log.debug("Time range: %s -> %s", Tcur, Tend)
         _log.debug("Planning with: %s", map(lambda (a,b,c):(a,b,self.__rarchs[c]), breakDown))
 
-        plan = []
-        
-        # Plan queries
-        # Find a set of non-overlapping regions
-        for F, L, K in breakDown:
-            # some mis-match of definitions
-            # the search results give the times
-            # of the first and last samples
-            # inclusive.
-            #  time range [F, L]
-            # However, values() query end time
-            # is exclusive
-            #  time range [F, L)
-            # We step the end time forward by 1 micro-second
-            # to ensure that the last sample can be returned.
-            # Note: it seems that Channel Archiver uses
-            # micro-sec resolution times for comparisons...
-            _log.debug("Before: %s", L)
-            LS, LN = L
-            LN += 1000
-            if LN>1000000000:
-                LS += 1
-                LN = 0
-            L = LS, LN
-            _log.debug("After: %s", L)
-
-            if L <= Tcur:
-                continue # Too early, keep going
-            elif F >= Tend:
-                break # No more data in range
+        plan = QueryPlanner.plan(breakDown, Tcur, Tend)
 
-            # range to request from this archive
-            Rstart = max(Tcur, F)
-            Rend   = min(Tend, L)
-
-            plan.append((Rstart, Rend, K))
-            
-            Tcur =  Rend
-
-        if len(plan)==0 and len(breakDown)>0 and breakDown[-1][1] <= Tcur:
+        if len(plan)==0 and breakDown[-1][1] <= Tcur:
             # requested range is later than last recorded sample,
             # which is all we can return
             F, L, K = breakDown[-1]
@@ -455,14 +775,53 @@ class Archive(object):
 
         _log.debug("Using plan of %d queries %s", len(plan), map(lambda (a,b,c):(a,b,self.__rarchs[c]), plan))
 
-        N = yield self._nextraw(0, pv=pv, plan=plan,
-                                Ctot=0, Climit=count,
-                                callback=callback, cbArgs=cbArgs,
-                                cbKWs=cbKWs, chunkSize=chunkSize,
-                                enumAsInt=enumAsInt, displayMeta=displayMeta)
+        if count or len(plan)==1:
+            # sections must be fetched in order to find the remaining count
+            N = yield self._nextraw(0, pv=pv, plan=plan,
+                                    Ctot=0, Climit=count,
+                                    callback=callback, cbArgs=cbArgs,
+                                    cbKWs=cbKWs, chunkSize=chunkSize,
+                                    enumAsInt=enumAsInt, displayMeta=displayMeta)
+        else:
+            N = yield self._fetchplan(pv, plan, callback, cbArgs, cbKWs,
+                                      chunkSize=chunkSize, enumAsInt=enumAsInt,
+                                      displayMeta=displayMeta)
 
         defer.returnValue(N)
 
+    @defer.inlineCallbacks
+    def _fetchplan(self, pv, plan, callback, cbArgs, cbKWs, how=0, **kws):
+        """Fetch all sections of a plan concurrently.
+
+        Samples are passed to the callback in time order.
+        plan entries are (T0, Tend, archKey) or (T0, Tend, archKey, count)
+        """
+        merge = _SectionMerge(len(plan), callback, cbArgs, cbKWs)
+
+        Ds = []
+        for i,P in enumerate(plan):
+            T0, Tend, arch = P[:3]
+            count = P[3] if len(P)>3 else None
+            _log.debug("Query %s %s -> %s for %s (%s)", self.__rarchs[arch], T0, Tend, pv, count)
+
+            D = self._fetchdata(arch, pv, merge.receiver(i),
+                                T0=T0, Tend=Tend, count=count,
+                                how=how, **kws)
+            D.addCallback(merge.complete, i)
+            D.addErrback(merge.fail)
+            Ds.append(D)
+
+        D = defer.gatherResults(Ds, consumeErrors=True)
+        @D.addErrback
+        def failed(F):
+            # any failure of merge.finished is also one of a section
+            merge.finished.addErrback(lambda _F:None)
+            return F
+        Ns = yield D.addErrback(_connerror)
+        yield merge.finished
+
+        defer.returnValue(sum(Ns))
+
     def _nextraw(self, partcount, pv, plan, Ctot, Climit,
                  callback, cbArgs, cbKWs, chunkSize,
                  enumAsInt, displayMeta=False):
@@ -518,10 +877,9 @@ class Archive(object):
             defer.returnValue(D)
 
         if breakDown is None:
-            breakDown = yield self.search(exact=pv, archs=archs,
-                                          breakDown=True, rawTime=True)
-
-        breakDown = breakDown[pv]
+            breakDown = yield self._planner.sections(pv, archs)
+        else:
+            breakDown = breakDown[pv]
 
         if len(breakDown)==0:
             _log.error("PV not archived")
@@ -532,40 +890,14 @@ class Archive(object):
         _log.debug("Time range: %s -> %s", Tcur, Tend)
         _log.debug("Planning with: %s", map(lambda (a,b,c):(a,b,self.__rarchs[c]), breakDown))
 
-        N = 0
-        # Plan queries
-        # Find a set of non-overlapping regions
-        for F, L, K in breakDown:
-            LS, LN = L
-            LN += 1000
-            if LN>1000000000:
-                LS += 1
-                LN = 0
-            L = LS, LN
-
-            if L <= Tcur:
-                continue # Too early, keep going
-            elif F >= Tend:
-                break # No more data in range
-
-            # range to request from this archive
-            Rstart = max(Tcur, F)
-            Rend   = min(Tend, L)
-
+        plan = []
+        for Rstart, Rend, K in QueryPlanner.plan(breakDown, Tcur, Tend):
             Rcount = int(math.ceil((Rend[0]-Rstart[0])*rate))
+            plan.append((Rstart, Rend, K, Rcount))
 
-            _log.debug("Query %s %s -> %s for %s (%d)", self.__rarchs[K], Rstart, Rend, pv, Rcount)
-
-            D = self._fetchdata(K, pv, callback,
-                                cbArgs=cbArgs, cbKWs=cbKWs,
-                                T0=Rstart, Tend=Rend,
-                                count=Rcount,
-                                chunkSize=chunkSize,
-                                enumAsInt=enumAsInt,
-                                how=3)
-
-            Nc = yield D
-            N += Nc
+        N = yield self._fetchplan(pv, plan, callback, cbArgs, cbKWs,
+                                  chunkSize=chunkSize, enumAsInt=enumAsInt,
+                                  how=3)
 
         defer.returnValue(N)
 
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright 2015 Brookhaven Science Assoc.
+ as operator of Brookhaven National Lab.
+
+Worker threads for decoding Appliance replies, with statistics.
+"""
+
+import logging
+_log = logging.getLogger("carchive.decodepool")
+
+import time, collections
+
+from twisted.internet import defer, threads
+from twisted.python.threadpool import ThreadPool
+
+from ..util import Cache
+
+class PVStats(object):
+    """Totals for one PV
+    """
+    __slots__ = ('jobs', 'decbytes', 'dectime', 'rxbytes', 'rxtime')
+    def __init__(self):
+        self.jobs, self.decbytes, self.dectime = 0, 0, 0.0
+        self.rxbytes, self.rxtime = 0, 0.0
+
+class DecodePool(object):
+    """A ThreadPool dedicated to decoding, separate from the reactor's
+    pool which is shared with DNS lookups and others.
+
+    At most 'workers' jobs run concurrently, and at most 'maxqueue'
+    wait for a worker.  Further jobs wait in the reactor thread
+    for a free slot.  Either limit may be changed with configure(),
+    which also applies to jobs already waiting.
+
+    Time spent decoding, and bytes decoded and received, are
+    accumulated for each PV for up to an hour.  As python 2 has
+    no per thread CPU clock, decode time is the elapsed time in the worker.
+
+    >>> P = DecodePool(workers=2, maxqueue=2)
+    >>> P.received('pv', 100, 2.0)
+    >>> S = P.pvstats('pv')
+    >>> S.rxbytes, S.rxtime
+    (100, 2.0)
+    """
+    def __init__(self, workers=4, maxqueue=16, reactor=None):
+        if reactor is None:
+            from twisted.internet import reactor
+        self._reactor = reactor
+        self.workers, self.maxqueue = workers, maxqueue
+        self.pool = None
+        # jobs holding a slot, and Deferreds of those waiting for one
+        self._active, self._waiting = 0, collections.deque()
+
+        self.stats = Cache(maxcount=1000, maxage=3600)
+        self.jobs, self.decbytes, self.dectime = 0, 0, 0.0
+        self.waittime = 0.0
+
+    def configure(self, workers=None, maxqueue=None):
+        if workers is not None:
+            self.workers = max(1, workers)
+        if maxqueue is not None:
+            self.maxqueue = max(0, maxqueue)
+        self._wake()
+        if self.pool is not None:
+            self.pool.adjustPoolsize(maxthreads=self.workers)
+
+    def _start(self):
+        self.pool = ThreadPool(minthreads=0, maxthreads=self.workers, name='pbdecode')
+        self.pool.start()
+        self._reactor.addSystemEventTrigger('during', 'shutdown', self._stop)
+
+    def _stop(self):
+        P, self.pool = self.pool, None
+        if P is not None:
+            P.stop()
+
+    @property
+    def inprogress(self):
+        """Number of jobs running or waiting for a worker
+        """
+        return self._active
+
+    @property
+    def waiting(self):
+        """Number of jobs waiting for a slot
+        """
+        return len(self._waiting)
+
+    def pvstats(self, name):
+        S = self.stats.get(name)
+        if S is None:
+            S = PVStats()
+            self.stats.set(name, S)
+        return S
+
+    def received(self, name, nbytes, elapsed):
+        """Record the bytes received for a request
+        """
+        S = self.pvstats(name)
+        S.rxbytes += nbytes
+        S.rxtime += elapsed
+
+    def run(self, name, nbytes, fn, *args):
+        """Call fn(*args) in a worker.  Returns a Deferred.
+        """
+        if self.pool is None:
+            self._start()
+        if self._active<self.workers+self.maxqueue:
+            self._active += 1
+            D = defer.succeed(None)
+        else:
+            D = defer.Deferred(self._waiting.remove)
+            self._waiting.append(D)
+        D.addCallback(self._submit, time.time(), name, nbytes, fn, args)
+        return D
+
+    def _wake(self):
+        while self._waiting and self._active<self.workers+self.maxqueue:
+            self._active += 1
+            self._waiting.popleft().callback(None)
+
+    def _release(self, R):
+        self._active -= 1
+        self._wake()
+        return R
+
+    def _submit(self, _ignored, queued, name, nbytes, fn, args):
+        D = threads.deferToThreadPool(self._reactor, self.pool,
+                                      self._timed, queued, fn, args)
+        D.addCallback(self._done, name, nbytes)
+        D.addBoth(self._release)
+        return D
+
+    def _timed(self, queued, fn, args):
+        # in worker thread
+        T0 = time.time()
+        R = fn(*args)
+        return R, T0-queued, time.time()-T0
+
+    def _done(self, result, name, nbytes):
+        R, wait, elapsed = result
+        self.jobs += 1
+        self.decbytes += nbytes
+        self.dectime += elapsed
+        self.waittime += wait
+
+        S = self.pvstats(name)
+        S.jobs += 1
+        S.decbytes += nbytes
+        S.dectime += elapsed
+        return R
+
+    def report(self):
+        """Summary as a list of lines of text
+        """
+        L = ['Decode workers: %d  max queue: %d  in progress: %d  waiting: %d'%(
+                self.workers, self.maxqueue, self.inprogress, self.waiting),
+             'Jobs: %d  bytes: %d  decode time: %.3f s  wait time: %.3f s'%(self.jobs, self.decbytes,
+                                                                            self.dectime, self.waittime),
+             '',
+             '%-40s %8s %12s %10s %12s %12s'%('PV', 'jobs', 'dec. bytes', 'dec. s', 'dec. B/s', 'rx B/s')]
+        for name, S in sorted(self.stats.items()):
+            L.append('%-40s %8d %12d %10.3f %12.0f %12.0f'%(name, S.jobs, S.decbytes, S.dectime,
+                     S.decbytes/S.dectime if S.dectime else 0,
+                     S.rxbytes/S.rxtime if S.rxtime else 0))
+        return L
+
+_pool = None
+
+def getDecodePool():
+    """The process wide DecodePool
+    """
+    global _pool
+    if _pool is None:
+        _pool = DecodePool()
+    return _pool
@@ -5,110 +5,192 @@ This software is Copyright by the
 """
 from __future__ import print_function
 import datetime, os
+import numpy
 from carchive.backend import EPICSEvent_pb2 as pbt
 from carchive.backend.pb import escape as pb_escape
 from carchive.backend.pb import filepath as pb_filepath
 from carchive.backend.pb import verify as pb_verify
+from carchive.backend.pb import index as pb_index
 
 class AppenderError(Exception):
     pass
 
+# Size of the write buffer of each file. Samples are written to the file in blocks of
+# about this size, and when the file is closed at the end of its segment.
+WRITE_BUFFER_SIZE = 1 << 20
+
 class Appender(object):
-    def __init__(self, pv_name, gran, out_dir, delimiters, ignore_ts_start, pvlog):
+    def __init__(self, pv_name, gran, out_dir, delimiters, ignore_ts_start, pvlog, full_verify=False, index_interval=0):
         self._pv_name = pv_name
         self._gran = gran
         self._out_dir = out_dir
         self._delimiters = delimiters
-        self._ignore_ts_start = ignore_ts_start
         self._pvlog = pvlog
+        self._full_verify = full_verify
+        self._index_interval = index_interval
+        
+        # The lower bound as (seconds since 1970, nanoseconds).
+        if ignore_ts_start is not None:
+            year, into_year_sec, nanoseconds = ignore_ts_start
+            self._ignore_ts_start = (_epoch_seconds(datetime.datetime(year, 1, 1)) + into_year_sec, nanoseconds)
+        else:
+            self._ignore_ts_start = None
         
         # Start with no file open.
         self._cur_file = None
         self._cur_start = None
         self._cur_end = None
+        self._cur_year = None
         self._cur_path = None
+        self._cur_offset = None
+        self._cur_index = None
         
     def close(self):
         # Close any file we have open.
-        if self._cur_file is not None:
-            self._cur_file.close()
+        self._close_file()
     
-    def write_sample(self, sample_pb, dt_seconds, nanoseconds, pb_type):
-        ''' Determines the appropriate file for the sample (based on the timestamp) and 
-        writes the given sample into a file.'''  
-        # Extract the number of seconds into the year. This should be exact.
-        td = (dt_seconds - datetime.datetime(dt_seconds.year, 1, 1))
-        into_year_sec_fp = (td.seconds + td.days * 24 * 3600)
-        into_year_sec = int(into_year_sec_fp)
-        sample_ts = (into_year_sec, nanoseconds)
+    def _close_file(self):
+        if self._cur_file is None:
+            return
         
+        # Close the data file before the index, so the index does not get ahead of the data.
+        self._cur_file.close()
+        self._cur_file = None
+        if self._cur_index is not None:
+            self._cur_index.close()
+            self._cur_index = None
+    
+    def write_sample(self, sample_pb, secs, nanoseconds, pb_type):
+        ''' Determines the appropriate file for the sample (based on the timestamp) and 
+        writes the given sample into a file. secs is the whole seconds since 1970 UTC.'''  
         # Ignore sample if requested by the lower bound.
         if self._ignore_ts_start is not None:
-            if (dt_seconds.year, into_year_sec, nanoseconds) <= self._ignore_ts_start:
+            if (secs, nanoseconds) <= self._ignore_ts_start:
                 self._pvlog.ignored_initial_sample()
                 return
         
+        # Only a sample outside of the current segment needs a call to _open_file().
+        if self._cur_file is None or not (self._cur_start <= secs < self._cur_end):
+            if not self._open_file(secs, nanoseconds, pb_type):
+                return
+        
         # Write timestamp to sample.
-        sample_pb.secondsintoyear, sample_pb.nano = sample_ts
+        into_year_sec = secs - self._cur_year
+        sample_pb.secondsintoyear, sample_pb.nano = into_year_sec, nanoseconds
         
-        # Serialize sample.
-        sample_serialized = sample_pb.SerializeToString()
+        # Finally write the sample.
+        sample_line = pb_escape.escape_line(sample_pb.SerializeToString())
+        self._cur_file.write(sample_line)
+        if self._cur_index is not None:
+            self._cur_index.add(into_year_sec, self._cur_offset)
+        self._cur_offset += len(sample_line)
         
-        # If this sample does not belong to the currently opened file, close the file.
-        # Note that it's ok to use dt_seconds here since we don't support sub-second granularity.
-        # Same goes for the get_segment_for_time call below.
-        if self._cur_file is not None and not (self._cur_start <= dt_seconds < self._cur_end):
-            self._cur_file.close()
-            self._cur_file = None
+        self._pvlog.archived_sample()
+    
+    def write_samples(self, lines, ends, secs, nanos, pb_type):
+        ''' Writes samples which were already encoded as escaped lines (see pbdecode.encoders).
+        Sample i is lines[ends[i-1]:ends[i]]. secs and nanos are arrays of the sample times
+        since 1970 UTC, which must be in order and in one year.'''
+        count = len(secs)
+        i = 0
         
-        # Need to open a file?
-        if self._cur_file is None:
-            # Determine the segment for this sample.
-            segment = self._gran.get_segment_for_time(dt_seconds)
-            self._cur_start = segment.start_time()
-            self._cur_end = segment.next_segment().start_time()
-            
-            # Sanity check the segment bounds.
-            assert (self._cur_start <= dt_seconds < self._cur_end)
-            
-            # Determine the path of the file.
-            self._cur_path = pb_filepath.get_path_for_suffix(self._out_dir, self._delimiters, self._pv_name, segment.file_suffix())
-            pb_filepath.make_sure_path_exists(os.path.dirname(self._cur_path))
-            
-            self._pvlog.info('File: {0}'.format(self._cur_path))
-            
-            # Open file. This creates the file if it does not exist,
-            # and the the cursor is set to the *end*.
-            self._cur_file = open(self._cur_path, 'a+b')
-            
-            # Seek to the beginning.
-            self._cur_file.seek(0, 0)
+        # Ignore samples if requested by the lower bound.
+        if self._ignore_ts_start is not None:
+            ignore_secs, ignore_nanos = self._ignore_ts_start
+            times = secs.astype(numpy.int64) * 1000000000 + nanos
+            i = int(numpy.searchsorted(times, ignore_secs * 1000000000 + ignore_nanos, side='right'))
+            self._pvlog.ignored_initial_sample(i)
+        
+        while i < count:
+            if not self._open_file(int(secs[i]), int(nanos[i]), pb_type):
+                # This sample is dropped, as by write_sample().
+                i += 1
+                continue
             
-            # We fail if we found samples newer than this one in the file.
-            upper_ts_bound = sample_ts
+            # All of the samples up to the end of this file.
+            end = i + int(numpy.searchsorted(secs[i:], self._cur_end, side='left'))
+            first = ends[i-1] if i else 0
+            self._cur_file.write(lines[first:ends[end-1]])
+            if self._cur_index is not None:
+                offsets = numpy.empty(end - i, dtype=numpy.int64)
+                offsets[0] = 0
+                offsets[1:] = ends[i:end-1] - first
+                self._cur_index.add_many(secs[i:end] - self._cur_year, offsets + self._cur_offset)
+            self._cur_offset += int(ends[end-1] - first)
+            self._pvlog.archived_sample(end - i)
+            i = end
+    
+    def _open_file(self, secs, nanoseconds, pb_type):
+        ''' Make sure that the file for a sample at the given time is open.
+        Returns False if the existing file can not be appended to.'''
+        # If this sample does not belong to the currently opened file, close the file.
+        # Segment bounds are kept as whole seconds since 1970, which is ok since we don't
+        # support sub-second granularity. Same goes for the get_segment_for_time call below.
+        if self._cur_file is not None:
+            if self._cur_start <= secs < self._cur_end:
+                return True
+            self._close_file()
+        
+        # Determine the segment for this sample.
+        dt_seconds = _EPOCH + datetime.timedelta(seconds=secs)
+        segment = self._gran.get_segment_for_time(dt_seconds)
+        self._cur_start = _epoch_seconds(segment.start_time())
+        self._cur_end = _epoch_seconds(segment.next_segment().start_time())
+        self._cur_year = _epoch_seconds(datetime.datetime(dt_seconds.year, 1, 1))
+        
+        # Sanity check the segment bounds.
+        assert (self._cur_start <= secs < self._cur_end)
+        
+        # Determine the path of the file.
+        self._cur_path = pb_filepath.get_path_for_suffix(self._out_dir, self._delimiters, self._pv_name, segment.file_suffix())
+        pb_filepath.make_sure_path_exists(os.path.dirname(self._cur_path))
+        
+        self._pvlog.info('File: {0}'.format(self._cur_path))
+        
+        # Open file. This creates the file if it does not exist,
+        # and the the cursor is set to the *end*.
+        cur_file = open(self._cur_path, 'a+b', WRITE_BUFFER_SIZE)
+        
+        # Seek to the beginning.
+        cur_file.seek(0, 0)
+        
+        # We fail if we found samples newer than this one in the file.
+        upper_ts_bound = (secs - self._cur_year, nanoseconds)
+        
+        # Verify any existing contents of the file.
+        try:
+            pb_verify.verify_stream(cur_file, pb_type=pb_type, pv_name=self._pv_name, year=dt_seconds.year, upper_ts_bound=upper_ts_bound, full=self._full_verify)
             
-            # Verify any existing contents of the file.
-            try:
-                pb_verify.verify_stream(self._cur_file, pb_type=pb_type, pv_name=self._pv_name, year=dt_seconds.year, upper_ts_bound=upper_ts_bound)
-                
-            except pb_verify.VerificationError as e:
-                self._pvlog.error('Verification failed: {0}: {1}'.format(self._cur_path, e))
-                self._cur_file.close()
-                self._cur_file = None
-                return;
-                #raise AppenderError('Verification failed: {0}: {1}'.format(self._cur_path, e))
+        except pb_verify.VerificationError as e:
+            self._pvlog.error('Verification failed: {0}: {1}'.format(self._cur_path, e))
+            cur_file.close()
+            return False
+            #raise AppenderError('Verification failed: {0}: {1}'.format(self._cur_path, e))
+        
+        except pb_verify.EmptyFileError:
+            # Build header.
+            header_pb = pbt.PayloadInfo()
+            header_pb.type = pb_type
+            header_pb.pvname = self._pv_name
+            header_pb.year = dt_seconds.year
             
-            except pb_verify.EmptyFileError:
-                # Build header.
-                header_pb = pbt.PayloadInfo()
-                header_pb.type = pb_type
-                header_pb.pvname = self._pv_name
-                header_pb.year = dt_seconds.year
-                
-                # Write header. Note that since there was no header we are still at the start of the file.
-                self._cur_file.write(pb_escape.escape_line(header_pb.SerializeToString()))
+            # Write header. Note that since there was no header we are still at the start of the file.
+            cur_file.write(pb_escape.escape_line(header_pb.SerializeToString()))
         
-        # Finally write the sample.
-        self._cur_file.write(pb_escape.escape_line(sample_serialized))
+        # Samples will be written at the end of the file.
+        cur_file.seek(0, 2)
+        self._cur_file = cur_file
+        self._cur_offset = cur_file.tell()
         
-        self._pvlog.archived_sample()
+        # Keep the index of this file.
+        if self._index_interval > 0:
+            self._cur_index = pb_index.IndexWriter(self._cur_path, self._index_interval, self._cur_offset)
+        
+        return True
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+def _epoch_seconds(dt):
+    ''' Whole seconds since 1970 of a UTC datetime. '''
+    td = dt - _EPOCH
+    return td.seconds + td.days * 24 * 3600
@@ -5,15 +5,31 @@ This software is Copyright by the
 """
 from __future__ import print_function
 import math, datetime
+import numpy
 from carchive.backend import EPICSEvent_pb2 as pbt
 from carchive.backend.pb import dtypes as pb_dtypes
 from carchive.backend.pb import appender as pb_appender
+try:
+    from carchive.backend.pbdecode import encoders as pb_encoders
+except ImportError:
+    pb_encoders = None
+
+# Value arrays accepted by the encoders (as fetched from a classic server).
+_ENCODE_DTYPES = {}
+for T in (pbt.SCALAR_DOUBLE, pbt.WAVEFORM_DOUBLE):
+    _ENCODE_DTYPES[T] = numpy.dtype(numpy.float64)
+for T in (pbt.SCALAR_INT, pbt.WAVEFORM_INT, pbt.SCALAR_ENUM, pbt.WAVEFORM_ENUM):
+    _ENCODE_DTYPES[T] = numpy.dtype(numpy.int32)
+for T in (pbt.SCALAR_STRING, pbt.WAVEFORM_STRING):
+    _ENCODE_DTYPES[T] = numpy.dtype('S40')
+
+_EPOCH_DATE = datetime.date(1970, 1, 1)
 
 class SkipPvError(Exception):
     pass
 
 class Exporter(object):
-    def __init__(self, pv_name, gran, out_dir, delimiters, ignore_ts_start, pvlog, mysql_writer=None):
+    def __init__(self, pv_name, gran, out_dir, delimiters, ignore_ts_start, pvlog, mysql_writer=None, full_verify=False, index_interval=0):
         self._pv_name = pv_name
         self._pvlog = pvlog
         self._mysql_writer = mysql_writer
@@ -30,7 +46,8 @@ class Exporter(object):
         self._print_mysql = True
         self._last_timestamp_secnano = None
         self._prev_severity = 0;
-        self._appender = pb_appender.Appender(pv_name, gran, out_dir, delimiters, ignore_ts_start, pvlog)
+        self._appender = pb_appender.Appender(pv_name, gran, out_dir, delimiters, ignore_ts_start, pvlog, full_verify,
+                                              index_interval)
     
     # with statement entry
     def __enter__(self):
@@ -95,13 +112,13 @@ class Exporter(object):
             self._last_meta = new_meta
             self._meta_dirty = True
         
-        # Iterate samples in chunk.
-        for (i, meta) in enumerate(meta_vec):
-            # Convert value to a standard format.
-            value = list(data[i]) if is_waveform else data[i][0]
-            
-            # Process the sample.
-            self._process_sample(value, int(meta[0]), int(meta[1]), int(meta[2]), int(meta[3]))
+        # Process the samples in chunk.
+        encoder = None if pb_encoders is None else pb_encoders.get(self._pb_type)
+        if encoder is None or data.dtype != _ENCODE_DTYPES[self._pb_type]:
+            for i in range(len(meta_vec)):
+                self._process_one(data, meta_vec, i, is_waveform)
+        else:
+            self._process_chunk(encoder, data, meta_vec, is_waveform)
                     
         if self._mysql_writer is not None and self._print_mysql:
             self._print_mysql = False
@@ -121,6 +138,54 @@ class Exporter(object):
                                              scalar=not self._is_waveform, ncount=array_size,
                                              pv_type=pv_type)
     
+    def _process_one(self, data, meta_vec, i, is_waveform):
+        # Convert value to a standard format.
+        value = list(data[i]) if is_waveform else data[i][0]
+        
+        # Process the sample.
+        meta = meta_vec[i]
+        self._process_sample(value, int(meta[0]), int(meta[1]), int(meta[2]), int(meta[3]))
+    
+    def _process_chunk(self, encoder, data, meta_vec, is_waveform):
+        ''' Process the samples in a chunk. Runs of plain samples, which need no fieldvalues,
+        are encoded and written together. Other samples go through _process_sample. '''
+        data, meta_vec = numpy.ascontiguousarray(data), numpy.ascontiguousarray(meta_vec)
+        sevr, secs, nano = meta_vec['severity'], meta_vec['sec'], meta_vec['ns']
+        days = secs // (24 * 3600)
+        times = secs.astype(numpy.int64) * 1000000000 + nano
+        
+        # A run of plain samples ends before a sample with an unusual severity
+        # (disconnected, archiver off, repeat, ...), on a new day, or an out-of-order time.
+        breaks = sevr > 3
+        breaks[1:] |= (days[1:] != days[:-1]) | (times[1:] < times[:-1])
+        break_idx = numpy.flatnonzero(breaks)
+        
+        count = len(meta_vec)
+        i = 0
+        while i < count:
+            last = self._last_timestamp_secnano
+            if (breaks[i] or self._pv_disconnected or self._meta_dirty or
+                    _EPOCH_DATE + datetime.timedelta(days=int(days[i])) != self._last_meta_day or
+                    (last is not None and (int(secs[i]), int(nano[i])) < last)):
+                self._process_one(data, meta_vec, i, is_waveform)
+                i += 1
+                continue
+            
+            k = numpy.searchsorted(break_idx, i, side='right')
+            end = int(break_idx[k]) if k < len(break_idx) else count
+            
+            # One run of samples, in one day.
+            year = (_EPOCH_DATE + datetime.timedelta(days=int(days[i]))).year
+            sectoyear = int((datetime.date(year, 1, 1) - _EPOCH_DATE).days) * 24 * 3600
+            lines, ends = encoder(data[i:end], meta_vec[i:end], sectoyear)
+            try:
+                self._appender.write_samples(lines, ends, secs[i:end], nano[i:end], self._pb_type)
+            except pb_appender.AppenderError as e:
+                raise SkipPvError(e)
+            
+            self._last_timestamp_secnano = (int(secs[end-1]), int(nano[end-1]))
+            i = end
+    
     def _process_sample(self, value, sevr, stat, secs, nano):
         #print('sample VAL={} SEVR={} STAT={} SECS={} NANO={}'.format(value, sevr, stat, secs, nano))
 
@@ -130,9 +195,11 @@ class Exporter(object):
         dt_seconds = datetime.datetime(1970, 1, 1) + datetime.timedelta(seconds=secs)
         
         # Skip out-of-order samples in input.
+        # So the samples in each file are in time order, which verify_stream relies on.
         secnano = (secs, nano)
         if self._last_timestamp_secnano is not None and secnano < self._last_timestamp_secnano:
             self._pvlog.error('Out-of-order sample: last={0} this={1}'.format(self._last_timestamp_secnano, secnano))
+            return
         self._last_timestamp_secnano = secnano
         
         # Build sample structure. But leave the time to the appender.
@@ -191,7 +258,7 @@ class Exporter(object):
         
         # Write it via the appender.
         try:
-            self._appender.write_sample(sample_pb, dt_seconds, nano, self._pb_type)
+            self._appender.write_sample(sample_pb, secs, nano, self._pb_type)
         except pb_appender.AppenderError as e:
             raise SkipPvError(e)
     
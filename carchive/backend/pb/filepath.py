@@ -9,10 +9,10 @@ import platform
 
 if platform.system() == 'Windows':
     pathName='{0}@{1}.pb'
-    fileName = '{0}@(.*).pb';
+    fileName = '{0}@(.*)\\.pb$';
 else:
     pathName='{0}:{1}.pb'
-    fileName = '{0}:(.*).pb';
+    fileName = '{0}:(.*)\\.pb$';
 
 def make_sure_path_exists(path):
     ''' Make sure that the given path exists. Create it if it doesn't. '''
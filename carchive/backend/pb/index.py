@@ -0,0 +1,116 @@
+"""
+This software is Copyright by the
+ Board of Trustees of Michigan
+ State University (c) Copyright 2015.
+"""
+from __future__ import print_function
+import os, struct, bisect
+import google.protobuf as protobuf
+from carchive.backend import EPICSEvent_pb2 as pbt
+from carchive.backend.pb import escape as pb_escape
+from carchive.backend.pb import dtypes as pb_dtypes
+
+# Each entry of an index file is the secondsintoyear of a sample and the byte offset
+# of its line in the data file, as little endian unsigned 32 and 64 bit integers.
+ENTRY = struct.Struct('<IQ')
+
+class IndexReadError(Exception):
+    pass
+
+def get_index_path(path):
+    ''' Returns the path of the index file of a data file. '''
+    return path + '.idx'
+
+def read_index(path, size=None):
+    ''' Returns the entries of the index of a data file as a list of (secondsintoyear, offset).
+    Entries which are out of order, or which point at or after size (the size of the data file,
+    if given) are dropped with all entries after them. Returns an empty list if there is no index. '''
+    try:
+        with open(get_index_path(path), 'rb') as f:
+            data = f.read()
+    except IOError:
+        return []
+
+    entries = []
+    last = (0, 0)
+    for pos in xrange(0, len(data) - len(data) % ENTRY.size, ENTRY.size):
+        entry = ENTRY.unpack_from(data, pos)
+        if entry[1] <= last[1] or entry[0] < last[0] or (size is not None and entry[1] >= size):
+            break
+        entries.append(entry)
+        last = entry
+    return entries
+
+class IndexWriter(object):
+    ''' Appends an entry to the index of a data file for every interval-th sample written.
+
+    size is the current size of the data file. Entries left by a previous run which point
+    beyond it, because the data was not written when that run stopped, are removed. As
+    readers only use the index to find a place to start reading, it need not cover samples
+    written before the index was enabled. '''
+
+    def __init__(self, path, interval, size):
+        self._interval = interval
+        self._count = 0
+
+        entries = read_index(path, size)
+        self._file = open(get_index_path(path), 'ab')
+        self._file.truncate(len(entries) * ENTRY.size)
+
+    def close(self):
+        self._file.close()
+
+    def add(self, secondsintoyear, offset):
+        ''' Called for each sample written at the given offset of the data file. '''
+        if self._count % self._interval == 0:
+            self._file.write(ENTRY.pack(secondsintoyear, offset))
+        self._count += 1
+
+    def add_many(self, secondsintoyear, offsets):
+        ''' Called for samples written with the given sequences of times and offsets. '''
+        count = len(offsets)
+        first = -self._count % self._interval
+        self._file.write(''.join(ENTRY.pack(int(secondsintoyear[i]), int(offsets[i]))
+                                 for i in xrange(first, count, self._interval)))
+        self._count += count
+
+def iter_samples(path, start=None):
+    ''' Yields the samples of a data file, as PB messages, beginning with the first at or
+    after start, a (secondsintoyear, nano) tuple. If the file has an index, reading begins at
+    the last indexed sample before start, instead of at the beginning of the file. '''
+    with open(path, 'rb') as stream:
+        # Read the header.
+        header_data = stream.readline()
+        if not header_data.endswith(pb_escape.NEWLINE_CHAR):
+            raise IndexReadError('Missing header')
+        header_pb = pbt.PayloadInfo()
+        try:
+            header_pb.ParseFromString(pb_escape.unescape_data(header_data[:-1]))
+        except (pb_escape.UnescapeError, protobuf.message.DecodeError) as e:
+            raise IndexReadError('Failed to decode header: {0}'.format(e))
+        pb_class = pb_dtypes.get_pb_class_for_type(header_pb.type)
+
+        if start is not None:
+            # Samples in the same second as start may come before the indexed sample.
+            entries = read_index(path, os.fstat(stream.fileno()).st_size)
+            i = bisect.bisect_left(entries, (start[0], 0))
+            if i > 0:
+                offset = entries[i - 1][1]
+                stream.seek(offset - 1)
+                if stream.read(1) != pb_escape.NEWLINE_CHAR:
+                    raise IndexReadError('Index does not match data')
+
+        try:
+            for sample_data in pb_escape.iter_lines(stream):
+                sample_pb = pb_class()
+                try:
+                    sample_pb.ParseFromString(sample_data)
+                except protobuf.message.DecodeError as e:
+                    raise IndexReadError('Failed to decode sample: {0}'.format(e))
+                if start is not None:
+                    if (sample_pb.secondsintoyear, sample_pb.nano) < start:
+                        continue
+                    start = None
+                yield sample_pb
+        except pb_escape.IterationError as e:
+            raise IndexReadError('Reading samples: {0}'.format(e))
@@ -0,0 +1,58 @@
+"""
+This software is Copyright by the
+ Board of Trustees of Michigan
+ State University (c) Copyright 2015.
+"""
+import os
+from carchive.backend.pb.filepath import make_sure_path_exists
+
+class ExportJournal(object):
+    ''' Records the PVs which have been exported, so that an interrupted export can
+    be resumed without exporting them again. Each line of the file is "<status> <pv name>".
+    PVs which failed are tried again. A PV which was in progress is exported again,
+    but only the samples after the last one in its files are written.'''
+    
+    DONE = 'done'
+    ERROR = 'error'
+    
+    def __init__(self, path):
+        self._path = path
+        self._done = set()
+        # Size of the complete lines.
+        size = None
+        if os.path.exists(path):
+            size = 0
+            with open(path, 'r') as f:
+                for line in f:
+                    # A line without a newline was being written when the export stopped.
+                    if not line.endswith('\n'):
+                        break
+                    size += len(line)
+                    status, _, pv_name = line[:-1].partition(' ')
+                    if status == self.DONE:
+                        self._done.add(pv_name)
+                    elif status == self.ERROR:
+                        self._done.discard(pv_name)
+        dir_name = os.path.dirname(path)
+        if dir_name:
+            make_sure_path_exists(dir_name)
+        self._file = open(path, 'a')
+        if size is not None:
+            # Remove a partial line, so that it is not completed by the next record.
+            self._file.truncate(size)
+    
+    def is_done(self, pv_name):
+        return pv_name in self._done
+    
+    def record(self, pv_name, status):
+        ''' Append the status of a PV. The line is on disk when this returns. '''
+        self._file.write('{0} {1}\n'.format(status, pv_name))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        if status == self.DONE:
+            self._done.add(pv_name)
+    
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
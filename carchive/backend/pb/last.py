@@ -12,7 +12,9 @@ from carchive.backend.pb import verify as pb_verify
 class FindLastSampleError(Exception):
     pass
 
-def find_last_sample_timestamp(pv_name, out_dir, gran, delimiters):
+def find_last_sample_timestamp(pv_name, out_dir, gran, delimiters, full_verify=False):
+    ''' Returns (year, secondsintoyear, nano) of the last exported sample of a PV, or None.
+    Only the header and the last sample of each file are read, unless full_verify is True. '''
     # Get the directory path and the prefix of data files.
     dir_path, file_prefix = pb_filepath.get_dir_and_prefix(out_dir, delimiters, pv_name)
     
@@ -49,7 +51,7 @@ def find_last_sample_timestamp(pv_name, out_dir, gran, delimiters):
         
         # Go through this file.
         with open(file_path, 'rb') as stream:
-            results = pb_verify.verify_stream(stream, pv_name=pv_name)
+            results = pb_verify.verify_stream(stream, pv_name=pv_name, full=full_verify)
         
         # If any samples were found in this file, the last timestamp in the
         # file is what we're looking for. Else continue looking into the previous file.
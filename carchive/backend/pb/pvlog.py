@@ -26,11 +26,11 @@ class PvLog(object):
         self._messages = []
         self._log = logging.getLogger('carchive.backend.pb.{0}'.format(pv_name))
     
-    def archived_sample(self):
-        self._archived_count += 1
+    def archived_sample(self, count=1):
+        self._archived_count += count
     
-    def ignored_initial_sample(self):
-        self._initial_ignored_count += 1
+    def ignored_initial_sample(self, count=1):
+        self._initial_ignored_count += count
     
     def message(self, text, severity):
         msg = {'text': text, 'severity': severity}
@@ -15,7 +15,15 @@ class EmptyFileError(Exception):
 class VerificationError(Exception):
     pass
 
-def verify_stream(stream, pb_type=None, pv_name=None, year=None, upper_ts_bound=None):
+# Block size when reading the end of a file backwards.
+TAIL_BLOCK_SIZE = 1 << 20
+
+def verify_stream(stream, pb_type=None, pv_name=None, year=None, upper_ts_bound=None, full=False):
+    ''' Check the header of a PB file and find the timestamp of the last sample.
+    If full is True every sample is parsed and checked against upper_ts_bound.
+    Otherwise only the last line is read (backwards from the end of the file) and checked,
+    as the Exporter drops out-of-order samples, so each file is in time order. Files
+    written by versions which kept out-of-order samples need full verification. '''
     # Prepare line iterator.
     line_iterator = pb_escape.iter_lines(stream)
     
@@ -45,12 +53,20 @@ def verify_stream(stream, pb_type=None, pv_name=None, year=None, upper_ts_bound=
     # Find PB class for this data type.
     pb_class = pb_dtypes.get_pb_class_for_type(header_pb.type)
     
+    if full:
+        samples = line_iterator
+    else:
+        # The header is the first line, so the samples begin after its escaped form.
+        header_end = len(pb_escape.escape_line(header_data))
+        last_line = read_last_line(stream, header_end)
+        samples = [] if last_line is None else [last_line]
+    
     # Will be returning the last timestamp (if any).
     last_timestamp = None
     
     # Iterate the file to the end, checking for problems.
     try:
-        for sample_data in line_iterator:
+        for sample_data in samples:
             # Parse sample.
             sample_pb = pb_class()
             try:
@@ -73,3 +89,35 @@ def verify_stream(stream, pb_type=None, pv_name=None, year=None, upper_ts_bound=
         'last_timestamp': last_timestamp,
         'year': header_pb.year,
     }
+
+def read_last_line(stream, start):
+    ''' Returns the last line of a stream, unescaped, reading backwards from the end in blocks.
+    Returns None if there are no lines after the offset start. '''
+    stream.seek(0, 2)
+    pos = stream.tell()
+    if pos <= start:
+        return None
+    
+    # Read blocks until the newline before the last line is found, or the start is reached.
+    buf = ''
+    while True:
+        block_start = max(start, pos - TAIL_BLOCK_SIZE)
+        stream.seek(block_start, 0)
+        buf = stream.read(pos - block_start) + buf
+        pos = block_start
+        
+        if not buf.endswith(pb_escape.NEWLINE_CHAR):
+            raise VerificationError('Reading samples: Missing line terminator at end of file')
+        
+        line_start = buf.rfind(pb_escape.NEWLINE_CHAR, 0, len(buf) - 1)
+        if line_start >= 0:
+            line = buf[line_start + 1:-1]
+            break
+        if pos == start:
+            line = buf[:-1]
+            break
+    
+    try:
+        return pb_escape.unescape_data(line)
+    except pb_escape.UnescapeError as e:
+        raise VerificationError('Reading samples: {0}'.format(e))
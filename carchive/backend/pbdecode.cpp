@@ -27,6 +27,11 @@ public:
     inline PyObject* release() { PyObject* ret=obj; obj=NULL; return ret; }
     inline PyObject* get() const { return obj; }
     inline bool isnull() const { return obj==NULL; }
+    // take ownership of a new reference
+    void steal(PyObject* n) {
+        Py_XDECREF(obj);
+        obj = n;
+    }
     template<class C>
     inline C* as() const { return (C*)obj; }
     template<class C>
@@ -279,28 +284,67 @@ template<typename E, class PB> struct vectop<E, PB, false> {
     }
 };
 
-template<typename E, class PB, bool vect>
-PyObject* PBD_decode_X(PyObject *unused, PyObject *args)
+// one escaped line (w/o newline) in some larger buffer
+struct span {
+    const char *buf;
+    Py_ssize_t len;
+    span(const char *b, Py_ssize_t l) :buf(b), len(l) {}
+};
+
+/* Ask an accumulator for storage for nrows samples of up to ncols elements.
+ * acc.reserve(nrows, ncols, dtype) returns a tuple (values, meta, offset)
+ * where rows [offset, offset+nrows) of both arrays may be filled.
+ */
+static
+bool reserve(PyObject *acc, Py_ssize_t nrows, Py_ssize_t ncols,
+             PyArray_Descr *dtype, Py_ssize_t esize,
+             PyRef& outval, PyRef& outmeta, Py_ssize_t& base)
 {
-    PyObject *lines;
-    int cadismod;
-    unsigned long sectoyear = 0;
+    PyRef dtref((PyObject*)dtype);
+    PyRef ret(PyObject_CallMethod(acc, "reserve", "nnO", nrows, ncols, dtref.get()));
+    if(ret.isnull())
+        return false;
 
-    if(!PyArg_ParseTuple(args, "O!i|k",
-                         &PyList_Type, &lines,
-                         &cadismod,
-                         &sectoyear
-                         ))
-        return NULL;
+    PyArrayObject *V, *M;
+    if(!PyArg_ParseTuple(ret.get(), "O!O!n;reserve() must return (values, meta, offset)",
+                         &PyArray_Type, &V, &PyArray_Type, &M, &base))
+        return false;
 
-    Py_ssize_t nlines = PyList_Size(lines);
-    if(nlines<0)
-        return NULL;
+    if(PyArray_NDIM(V)!=2 || PyArray_NDIM(M)!=1
+            || !PyArray_ISCARRAY(V) || !PyArray_ISCARRAY(M)
+            || !PyArray_EquivTypes(PyArray_DESCR(V), dtype)
+            || PyArray_ITEMSIZE(V)!=esize
+            || PyArray_ITEMSIZE(M)!=sizeof(meta)) {
+        PyErr_Format(PyExc_TypeError, "reserve() returned arrays with wrong type or layout");
+        return false;
+    }
 
-    if(cadismod<0 || cadismod>1)
-        return PyErr_Format(PyExc_ValueError, "CA disconnect mode not recognised: %d", cadismod);
+    if(base<0 || base+nrows>PyArray_DIM(V,0) || base+nrows>PyArray_DIM(M,0)
+            || ncols>PyArray_DIM(V,1)) {
+        PyErr_Format(PyExc_ValueError, "reserve() returned arrays which are too small");
+        return false;
+    }
 
-    GIL locker;
+    outval.reset((PyObject*)V);
+    outmeta.reset((PyObject*)M);
+    return true;
+}
+
+/* Decode escaped sample lines into a tuple (values, meta).
+ *
+ * If acc is not NULL then samples are instead stored in the arrays
+ * provided by acc.reserve(), with sectoyear added to the seconds,
+ * and the number of samples stored is returned.
+ *
+ * Called with the GIL released by locker.
+ * Always returns with the GIL held.
+ */
+template<typename E, class PB, bool vect>
+PyObject* decode_lines(const std::vector<span>& lines, int cadismod,
+                       unsigned long sectoyear, GIL& locker,
+                       PyObject *acc=NULL)
+{
+    Py_ssize_t nlines = lines.size();
 
     std::vector<PB> decoders(nlines);
     // keep track of which lines expand to more than one sample.
@@ -308,17 +352,9 @@ PyObject* PBD_decode_X(PyObject *unused, PyObject *args)
     Py_ssize_t nextrasamp = 0; // # of output lines
     size_t maxelements = 0;
 
-    /* check that all elements of input list are strings */
     for(Py_ssize_t i=0; i<nlines; i++) {
-        PyObject *line = PyList_GET_ITEM(lines, i);
-
-        if(!PyString_Check(line)) {
-            locker.lock();
-            return PyErr_Format(PyExc_TypeError, "Input list item must be a string");
-        }
-
-        const char *buf = PyString_AS_STRING(line);
-        Py_ssize_t buflen = PyString_GET_SIZE(line);
+        const char *buf = lines[i].buf;
+        Py_ssize_t buflen = lines[i].len;
         PB& D = decoders[i];
 
         try {
@@ -381,19 +417,29 @@ PyObject* PBD_decode_X(PyObject *unused, PyObject *args)
 
     locker.lock();
 
-    PyRef outval(PyArray_Zeros(2, valdims, npytype<E>::get(), 0));
-    Py_INCREF(dtype_meta);
-    PyRef outmeta(PyArray_Zeros(1, &metadims, dtype_meta, 0));
+    PyRef outval(NULL), outmeta(NULL);
+    Py_ssize_t base = 0; // first output row
 
-    if(outval.isnull() || outmeta.isnull())
-        return NULL;
+    if(acc) {
+        if(!reserve(acc, metadims, valdims[1], npytype<E>::get(),
+                    ::store<E>::esize(), outval, outmeta, base))
+            return NULL;
+
+    } else {
+        outval.steal(PyArray_Zeros(2, valdims, npytype<E>::get(), 0));
+        Py_INCREF(dtype_meta);
+        outmeta.steal(PyArray_Zeros(1, &metadims, dtype_meta, 0));
+
+        if(outval.isnull() || outmeta.isnull())
+            return NULL;
+    }
 
     locker.unlock();
 
     for(Py_ssize_t i=0, j=0; i<nlines; i++, j++) {
         const PB& D = decoders[i];
-        meta *M = (meta*)PyArray_GETPTR1(outmeta.get(), j);
-        char *val = (char*)PyArray_GETPTR2(outval.get(), j, 0);
+        meta *M = (meta*)PyArray_GETPTR1(outmeta.get(), base+j);
+        char *val = (char*)PyArray_GETPTR2(outval.get(), base+j, 0);
 
         if(cadismod==0 && extrasamp[i]) {
             bool havets = false;
@@ -418,7 +464,7 @@ PyObject* PBD_decode_X(PyObject *unused, PyObject *args)
                     unsigned int prevS=0, nextS = D.secondsintoyear(),
                                  prevNS=0, nextNS = D.nano();
                     if(j>0) {
-                        meta *prevM = (meta*)PyArray_GETPTR1(outmeta.get(), j-1);
+                        meta *prevM = (meta*)PyArray_GETPTR1(outmeta.get(), base+j-1);
                         prevS = prevM->sec;
                         prevNS= prevM->nano;
                     }
@@ -464,8 +510,8 @@ PyObject* PBD_decode_X(PyObject *unused, PyObject *args)
 
             // increment for the real sample
             j++;
-            M = (meta*)PyArray_GETPTR1(outmeta.get(), j);
-            val = (char*)PyArray_GETPTR2(outval.get(), j, 0);
+            M = (meta*)PyArray_GETPTR1(outmeta.get(), base+j);
+            val = (char*)PyArray_GETPTR2(outval.get(), base+j, 0);
         }
 
         vectop<E,PB,vect>::store(D, val);
@@ -481,8 +527,230 @@ PyObject* PBD_decode_X(PyObject *unused, PyObject *args)
 
     }
 
+    if(acc) {
+        for(Py_ssize_t j=0; j<metadims; j++) {
+            meta *M = (meta*)PyArray_GETPTR1(outmeta.get(), base+j);
+            M->sec += sectoyear;
+        }
+        locker.lock();
+        return PyInt_FromSsize_t(metadims);
+    }
+
     locker.lock();
-    return Py_BuildValue("OO", outval.release(), outmeta.release());
+    return Py_BuildValue("NN", outval.release(), outmeta.release());
+}
+
+template<typename E, class PB, bool vect>
+PyObject* PBD_decode_X(PyObject *unused, PyObject *args)
+{
+    PyObject *lines;
+    int cadismod;
+    unsigned long sectoyear = 0;
+
+    if(!PyArg_ParseTuple(args, "O!i|k",
+                         &PyList_Type, &lines,
+                         &cadismod,
+                         &sectoyear
+                         ))
+        return NULL;
+
+    Py_ssize_t nlines = PyList_Size(lines);
+    if(nlines<0)
+        return NULL;
+
+    if(cadismod<0 || cadismod>1)
+        return PyErr_Format(PyExc_ValueError, "CA disconnect mode not recognised: %d", cadismod);
+
+    std::vector<span> spans;
+    spans.reserve(nlines);
+
+    /* check that all elements of input list are strings */
+    for(Py_ssize_t i=0; i<nlines; i++) {
+        PyObject *line = PyList_GET_ITEM(lines, i);
+
+        if(!PyString_Check(line))
+            return PyErr_Format(PyExc_TypeError, "Input list item must be a string");
+
+        spans.push_back(span(PyString_AS_STRING(line), PyString_GET_SIZE(line)));
+    }
+
+    GIL locker;
+
+    return decode_lines<E,PB,vect>(spans, cadismod, sectoyear, locker);
+}
+
+/* Decode sample lines directly from a receive buffer.
+ *
+ * decode_buffer_*(buf, pos, end, cadismod, sectoyear=0, limit=0, acc=None)
+ *
+ * Starting at offset 'pos' find newline terminated lines up to offset 'end',
+ * which are unescaped and decoded in a single pass.  Stops at the first
+ * blank line (a header follows), at the first partial line,
+ * or after 'limit' lines if limit>0.
+ *
+ * Returns a tuple (values, meta, pos) where 'pos' is the offset of
+ * the first byte not consumed.
+ *
+ * If an accumulator is given (see carchive.util.Accumulator), then samples
+ * are stored through acc.reserve() with absolute times (sectoyear added),
+ * and a tuple (count, pos) is returned instead.
+ */
+template<typename E, class PB, bool vect>
+PyObject* PBD_decode_buf_X(PyObject *unused, PyObject *args)
+{
+    const char *buf;
+    Py_ssize_t buflen, pos, end, limit = 0;
+    int cadismod;
+    unsigned long sectoyear = 0;
+    PyObject *acc = Py_None;
+
+    if(!PyArg_ParseTuple(args, "s#nni|knO",
+                         &buf, &buflen,
+                         &pos, &end,
+                         &cadismod,
+                         &sectoyear,
+                         &limit,
+                         &acc
+                         ))
+        return NULL;
+
+    if(cadismod<0 || cadismod>1)
+        return PyErr_Format(PyExc_ValueError, "CA disconnect mode not recognised: %d", cadismod);
+
+    if(pos<0 || end<pos || end>buflen)
+        return PyErr_Format(PyExc_ValueError, "Invalid buffer range [%zd, %zd) of %zd",
+                            pos, end, buflen);
+
+    GIL locker;
+
+    std::vector<span> spans;
+
+    while(pos<end && (limit<=0 || (Py_ssize_t)spans.size()<limit)) {
+        const char *line = buf+pos,
+                   *eol = (const char*)memchr(line, '\n', end-pos);
+        if(!eol || eol==line)
+            break; // partial line, or blank line before next header
+
+        spans.push_back(span(line, eol-line));
+        pos += eol-line+1;
+    }
+
+    PyRef ret(decode_lines<E,PB,vect>(spans, cadismod, sectoyear, locker,
+                                      acc==Py_None ? NULL : acc));
+    if(ret.isnull())
+        return NULL;
+
+    if(acc!=Py_None)
+        return Py_BuildValue("On", ret.get(), pos);
+
+    return Py_BuildValue("OOn", PyTuple_GET_ITEM(ret.get(), 0),
+                                PyTuple_GET_ITEM(ret.get(), 1), pos);
+}
+
+// load one value from an element of a numpy array
+
+template<typename E> struct loadval {
+    static E get(const char *V, Py_ssize_t esize) { return *(const E*)V; }
+};
+template<> struct loadval<std::string> {
+    static std::string get(const char *V, Py_ssize_t esize) {
+        return std::string(V, strnlen(V, esize));
+    }
+};
+
+template<typename E, class PB, bool vect> struct encodeop {
+    static void set(PB& pb, const char *row, Py_ssize_t ncols, Py_ssize_t esize) {
+        for(Py_ssize_t j=0; j<ncols; j++, row+=esize)
+            pb.add_val(loadval<E>::get(row, esize));
+    }
+};
+
+template<typename E, class PB> struct encodeop<E, PB, false> {
+    static void set(PB& pb, const char *row, Py_ssize_t ncols, Py_ssize_t esize) {
+        pb.set_val(loadval<E>::get(row, esize));
+    }
+};
+
+/* Encode samples as escaped sample lines.
+ *
+ * encode_*(values, meta, sectoyear)
+ *
+ * 'values' is a 2-d array with one row for each sample (all columns of
+ * a row are stored for vectors), and 'meta' the matching dbr_time array.
+ * sectoyear is subtracted from the seconds.
+ *
+ * Returns a tuple (lines, ends) where 'lines' is a string of newline
+ * terminated lines, and ends[i] is the offset just after the line of sample i.
+ */
+template<typename E, class PB, bool vect>
+PyObject* PBD_encode_X(PyObject *unused, PyObject *args)
+{
+    PyArrayObject *V, *M;
+    unsigned long sectoyear;
+
+    if(!PyArg_ParseTuple(args, "O!O!k",
+                         &PyArray_Type, &V,
+                         &PyArray_Type, &M,
+                         &sectoyear
+                         ))
+        return NULL;
+
+    PyRef dtref((PyObject*)npytype<E>::get());
+    const Py_ssize_t esize = store<E>::esize();
+
+    if(PyArray_NDIM(V)!=2 || PyArray_NDIM(M)!=1
+            || !PyArray_ISCARRAY_RO(V) || !PyArray_ISCARRAY_RO(M)
+            || !PyArray_EquivTypes(PyArray_DESCR(V), (PyArray_Descr*)dtref.get())
+            || PyArray_ITEMSIZE(V)!=esize
+            || PyArray_ITEMSIZE(M)!=sizeof(meta))
+        return PyErr_Format(PyExc_TypeError, "values or meta array with wrong type or layout");
+
+    npy_intp nrows = PyArray_DIM(M,0);
+    const Py_ssize_t ncols = PyArray_DIM(V,1);
+    if(PyArray_DIM(V,0)!=nrows || ncols<1)
+        return PyErr_Format(PyExc_ValueError, "values and meta arrays have different lengths");
+
+    PyRef ends(PyArray_SimpleNew(1, &nrows, NPY_INTP));
+    if(ends.isnull())
+        return NULL;
+    npy_intp *pend = (npy_intp*)PyArray_DATA(ends.as<PyArrayObject>());
+
+    std::string out, ser;
+    {
+        GIL locker;
+
+        const char *row = PyArray_BYTES(V);
+        const meta *pmeta = (const meta*)PyArray_DATA(M);
+        const npy_intp stride = PyArray_STRIDE(V,0);
+        PB pb;
+
+        out.reserve(nrows*(16+ncols*esize));
+
+        for(npy_intp i=0; i<nrows; i++, row+=stride) {
+            pb.Clear();
+            pb.set_secondsintoyear(pmeta[i].sec - sectoyear);
+            pb.set_nano(pmeta[i].nano);
+            encodeop<E,PB,vect>::set(pb, row, ncols, esize);
+            pb.set_severity(pmeta[i].severity);
+            pb.set_status(pmeta[i].status);
+
+            pb.SerializeToString(&ser);
+
+            size_t base = out.size();
+            Py_ssize_t elen = escape_plan(ser.data(), ser.size());
+            out.resize(base+elen+1);
+            escape(ser.data(), ser.size(), &out[base], elen);
+            out[base+elen] = '\n';
+
+            pend[i] = out.size();
+        }
+    }
+
+    PyRef lines(PyString_FromStringAndSize(out.data(), out.size()));
+    if(lines.isnull())
+        return NULL;
+
+    return Py_BuildValue("NN", lines.release(), ends.release());
 }
 
 static
@@ -642,6 +910,52 @@ static PyMethodDef PBDMethods[] = {
     {"decode_vector_double", PBD_decode_X<double, EPICS::VectorDouble, true>, METH_VARARGS,
      "Decode protobuf stream into numpy array"},
 
+    {"decode_buffer_scalar_string", PBD_decode_buf_X<std::string, EPICS::ScalarString, false>, METH_VARARGS,
+     "Decode protobuf lines from a buffer into numpy arrays"},
+    {"decode_buffer_scalar_byte", PBD_decode_buf_X<char, EPICS::ScalarByte, false>, METH_VARARGS,
+     "Decode protobuf lines from a buffer into numpy arrays"},
+    {"decode_buffer_scalar_short", PBD_decode_buf_X<short, EPICS::ScalarShort, false>, METH_VARARGS,
+     "Decode protobuf lines from a buffer into numpy arrays"},
+    {"decode_buffer_scalar_int", PBD_decode_buf_X<int32_t, EPICS::ScalarInt, false>, METH_VARARGS,
+     "Decode protobuf lines from a buffer into numpy arrays"},
+    {"decode_buffer_scalar_enum", PBD_decode_buf_X<int32_t, EPICS::ScalarEnum, false>, METH_VARARGS,
+     "Decode protobuf lines from a buffer into numpy arrays"},
+    {"decode_buffer_scalar_float", PBD_decode_buf_X<float, EPICS::ScalarFloat, false>, METH_VARARGS,
+     "Decode protobuf lines from a buffer into numpy arrays"},
+    {"decode_buffer_scalar_double", PBD_decode_buf_X<double, EPICS::ScalarDouble, false>, METH_VARARGS,
+     "Decode protobuf lines from a buffer into numpy arrays"},
+
+    {"decode_buffer_vector_string", PBD_decode_buf_X<std::string, EPICS::VectorString, true>, METH_VARARGS,
+     "Decode protobuf lines from a buffer into numpy arrays"},
+    {"decode_buffer_vector_short", PBD_decode_buf_X<short, EPICS::VectorShort, true>, METH_VARARGS,
+     "Decode protobuf lines from a buffer into numpy arrays"},
+    {"decode_buffer_vector_int", PBD_decode_buf_X<int32_t, EPICS::VectorInt, true>, METH_VARARGS,
+     "Decode protobuf lines from a buffer into numpy arrays"},
+    {"decode_buffer_vector_enum", PBD_decode_buf_X<int32_t, EPICS::VectorEnum, true>, METH_VARARGS,
+     "Decode protobuf lines from a buffer into numpy arrays"},
+    {"decode_buffer_vector_float", PBD_decode_buf_X<float, EPICS::VectorFloat, true>, METH_VARARGS,
+     "Decode protobuf lines from a buffer into numpy arrays"},
+    {"decode_buffer_vector_double", PBD_decode_buf_X<double, EPICS::VectorDouble, true>, METH_VARARGS,
+     "Decode protobuf lines from a buffer into numpy arrays"},
+
+    {"encode_scalar_string", PBD_encode_X<std::string, EPICS::ScalarString, false>, METH_VARARGS,
+     "Encode numpy arrays as escaped protobuf lines"},
+    {"encode_scalar_int", PBD_encode_X<int32_t, EPICS::ScalarInt, false>, METH_VARARGS,
+     "Encode numpy arrays as escaped protobuf lines"},
+    {"encode_scalar_enum", PBD_encode_X<int32_t, EPICS::ScalarEnum, false>, METH_VARARGS,
+     "Encode numpy arrays as escaped protobuf lines"},
+    {"encode_scalar_double", PBD_encode_X<double, EPICS::ScalarDouble, false>, METH_VARARGS,
+     "Encode numpy arrays as escaped protobuf lines"},
+
+    {"encode_vector_string", PBD_encode_X<std::string, EPICS::VectorString, true>, METH_VARARGS,
+     "Encode numpy arrays as escaped protobuf lines"},
+    {"encode_vector_int", PBD_encode_X<int32_t, EPICS::VectorInt, true>, METH_VARARGS,
+     "Encode numpy arrays as escaped protobuf lines"},
+    {"encode_vector_enum", PBD_encode_X<int32_t, EPICS::VectorEnum, true>, METH_VARARGS,
+     "Encode numpy arrays as escaped protobuf lines"},
+    {"encode_vector_double", PBD_encode_X<double, EPICS::VectorDouble, true>, METH_VARARGS,
+     "Encode numpy arrays as escaped protobuf lines"},
+
     {"linesplitter", splitter, METH_VARARGS, "Group AA PB lines"},
 
     {"_getLogger", getLog, METH_NOARGS, "Fetch extension module logger"},
@@ -671,15 +985,63 @@ static const mapent decodemap[] = {
     {NULL}
 };
 
+static const mapent bufdecodemap[] = {
+    {"decode_buffer_scalar_string", EPICS::SCALAR_STRING},
+    {"decode_buffer_scalar_byte", EPICS::SCALAR_BYTE},
+    {"decode_buffer_scalar_short", EPICS::SCALAR_SHORT},
+    {"decode_buffer_scalar_int", EPICS::SCALAR_INT},
+    {"decode_buffer_scalar_enum", EPICS::SCALAR_ENUM},
+    {"decode_buffer_scalar_float", EPICS::SCALAR_FLOAT},
+    {"decode_buffer_scalar_double", EPICS::SCALAR_DOUBLE},
+
+    {"decode_buffer_vector_string", EPICS::WAVEFORM_STRING},
+    {"decode_buffer_vector_short", EPICS::WAVEFORM_SHORT},
+    {"decode_buffer_vector_int", EPICS::WAVEFORM_INT},
+    {"decode_buffer_vector_enum", EPICS::WAVEFORM_ENUM},
+    {"decode_buffer_vector_float", EPICS::WAVEFORM_FLOAT},
+    {"decode_buffer_vector_double", EPICS::WAVEFORM_DOUBLE},
+    {NULL}
+};
+
+static const mapent encodemap[] = {
+    {"encode_scalar_string", EPICS::SCALAR_STRING},
+    {"encode_scalar_int", EPICS::SCALAR_INT},
+    {"encode_scalar_enum", EPICS::SCALAR_ENUM},
+    {"encode_scalar_double", EPICS::SCALAR_DOUBLE},
+
+    {"encode_vector_string", EPICS::WAVEFORM_STRING},
+    {"encode_vector_int", EPICS::WAVEFORM_INT},
+    {"encode_vector_enum", EPICS::WAVEFORM_ENUM},
+    {"encode_vector_double", EPICS::WAVEFORM_DOUBLE},
+    {NULL}
+};
+
+/* build a dictionary mapping PayloadType to decoder function */
+static
+PyObject* buildDecodeMap(PyObject *mod, const mapent *pcur)
+{
+    PyRef map(PyDict_New());
+    if(!map.get())
+        return NULL;
+
+    for(; pcur->v; pcur++) {
+        PyRef meth(PyObject_GetAttrString(mod, pcur->v));
+        if(meth.isnull())
+            return NULL;
+        PyRef pint(PyInt_FromLong(pcur->k));
+        if(pint.isnull())
+            return NULL;
+        if(PyDict_SetItem(map.get(), pint.get(), meth.get())==-1)
+            return NULL;
+    }
+    return map.release();
+}
+
 PyMODINIT_FUNC
 initpbdecode(void)
 {
-    PyRef map(PyDict_New());
     PyObject *mod;
 
-    if(!map.get())
-        return;
-
     GOOGLE_PROTOBUF_VERIFY_VERSION;
 
     mod = Py_InitModule(moduleName, PBDMethods);
@@ -687,19 +1049,11 @@ initpbdecode(void)
         return;
     import_array();
 
-    /* build a dictionary mapping PayloadType to decoder function */
-    for(const mapent *pcur = decodemap; pcur->v; pcur++) {
-        PyObject *meth = PyObject_GetAttrString(mod, pcur->v);
-        if(!meth)
-            break;
-        PyObject *pint = PyInt_FromLong(pcur->k);
-        if(!pint)
-            break;
-        if(PyDict_SetItem(map.get(), pint, meth)==-1) {
-            Py_DECREF(pint);
-            break;
-        }
-    }
+    PyRef map(buildDecodeMap(mod, decodemap)),
+          bufmap(buildDecodeMap(mod, bufdecodemap)),
+          encmap(buildDecodeMap(mod, encodemap));
+    if(map.isnull() || bufmap.isnull() || encmap.isnull())
+        return;
 
     // create dtype for struct meta
     PyArray_Descr* tval = PyArray_DescrNewFromType(NPY_VOID);
@@ -718,6 +1072,8 @@ initpbdecode(void)
     PyModule_AddObject(mod, "strtype", (PyObject*)tval);
 
     PyModule_AddObject(mod, "decoders", map.release());
+    PyModule_AddObject(mod, "bufdecoders", bufmap.release());
+    PyModule_AddObject(mod, "encoders", encmap.release());
 
     decoderError = PyErr_NewException(decoderErrorName,
                                       PyExc_ValueError, NULL);
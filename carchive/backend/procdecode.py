@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright 2015 Brookhaven Science Assoc.
+ as operator of Brookhaven National Lab.
+
+Decoding of Appliance replies in worker processes.
+
+Each worker process has a slot of shared memory (an anonymous mmap
+inherited through fork()).  A receive buffer is copied into the
+slot, and decoded by the worker with the usual bufdecoders.
+The decoded arrays are placed in the slot after the input,
+so only their position and shape pass through the pipe to the worker.
+
+As a process forked while other threads run may inherit locks held
+by those threads, the workers must be started before any thread,
+eg. by calling prestart() before the reactor runs.
+"""
+
+import logging
+_log = logging.getLogger("carchive.procdecode")
+
+import mmap, multiprocessing, threading, cPickle
+
+import numpy as np
+
+from twisted.internet import defer
+
+from ..dtype import dbr_time
+from .decodepool import getDecodePool
+
+_meta = np.dtype(dbr_time)
+
+class SlotOverflow(Exception):
+    pass
+
+def _align(N):
+    return (N+15)&~15
+
+class _SlotWriter(object):
+    """Storage for samples in shared memory, used as the
+    Accumulator argument of the bufdecoders.
+    """
+    def __init__(self, shm, start):
+        self.shm, self.pos, self.chunks = shm, _align(start), []
+
+    def reserve(self, count, width, dtype):
+        dtype, width = np.dtype(dtype), max(1, width)
+        voff = self.pos
+        moff = _align(voff+count*width*dtype.itemsize)
+        end = _align(moff+count*_meta.itemsize)
+        if end>len(self.shm):
+            raise SlotOverflow()
+
+        V = np.ndarray((count, width), dtype=dtype, buffer=self.shm, offset=voff)
+        V.fill(0) # vector samples may be shorter than width
+        M = np.ndarray((count,), dtype=_meta, buffer=self.shm, offset=moff)
+        self.chunks.append((dtype.str, count, width, voff, moff))
+        self.pos = end
+        return V, M, 0
+
+def _decode(shm, end, header, cadiscon, limit):
+    """Decode the complete lines in shm[:end].
+    header is the raw header line in effect at the start, or None.
+
+    Returns (chunks, header) where each chunk is
+    (dtype, count, width, value offset, meta offset),
+    and header is the raw header line in effect at the end.
+    """
+    from .appl import parseHeader
+    from .pbdecode import bufdecoders
+
+    out = _SlotWriter(shm, end)
+    H, year = parseHeader(header) if header else (None, 0)
+    pos, count = 0, 0
+    while pos<end:
+        if shm[pos]=='\n':
+            # new header will be next
+            header = None
+            pos += 1
+            continue
+
+        elif header is None:
+            eol = shm.find('\n', pos, end)
+            header = shm[pos:eol]
+            H, year = parseHeader(header)
+            pos = eol+1
+            continue
+
+        N, pos = bufdecoders[H.type](shm, pos, end, cadiscon, year,
+                                     limit-count if limit else 0, out)
+        count += N
+        if limit and count>=limit:
+            break
+
+    return out.chunks, header
+
+def _worker(conn, shm):
+    while True:
+        try:
+            req = conn.recv()
+        except EOFError:
+            break
+        if req is None:
+            break
+        try:
+            R = ('ok',)+_decode(shm, *req)
+        except SlotOverflow:
+            R = ('overflow',)
+        except Exception as e:
+            # raised again by the caller, so it can catch eg. DecodeError
+            try:
+                cPickle.dumps(e, cPickle.HIGHEST_PROTOCOL)
+            except Exception:
+                e = RuntimeError('%s: %s'%(e.__class__.__name__, e))
+            R = ('error', e)
+        conn.send(R)
+
+class ProcessDecoder(object):
+    """A pool of decoder processes
+
+    Requests are passed to the workers from threads of the DecodePool.
+    """
+    def __init__(self, nprocs, slotsize=32*2**20, reactor=None):
+        if reactor is None:
+            from twisted.internet import reactor
+        self.nprocs, self.slotsize = nprocs, slotsize
+        self._idle = defer.DeferredQueue()
+        self._workers = []
+        for i in range(nprocs):
+            shm = mmap.mmap(-1, slotsize)
+            conn, child = multiprocessing.Pipe()
+            P = multiprocessing.Process(target=_worker, args=(child, shm),
+                                        name='pbdecode-%d'%i)
+            P.daemon = True
+            P.start()
+            child.close()
+            W = (P, conn, shm)
+            self._workers.append(W)
+            self._idle.put(W)
+
+        # one thread to wait on each worker
+        pool = getDecodePool()
+        pool.configure(workers=max(pool.workers, nprocs))
+        reactor.addSystemEventTrigger('during', 'shutdown', self.close)
+
+    def close(self):
+        W, self._workers = self._workers, []
+        for P, conn, shm in W:
+            try:
+                conn.send(None)
+            except (IOError, OSError):
+                pass
+            P.join(1.0)
+            conn.close()
+
+    @defer.inlineCallbacks
+    def decode(self, name, buf, end, header, cadiscon=0, limit=0):
+        """Decode the complete lines in buf[:end].
+
+        Returns a Deferred which fires with ([(values, meta)], header)
+        where meta times are absolute.  Or None if the input or output
+        does not fit in a slot.  Fails with the exception raised by
+        the worker, eg. DecodeError.
+        """
+        if end>self.slotsize//2:
+            defer.returnValue(None)
+
+        W = yield self._idle.get()
+        try:
+            R = yield getDecodePool().run(name, end, self._call, W, buf, end,
+                                          header, cadiscon, limit)
+        finally:
+            self._idle.put(W)
+        defer.returnValue(R)
+
+    def _call(self, W, buf, end, header, cadiscon, limit):
+        # in DecodePool thread
+        _P, conn, shm = W
+        shm[:end] = buf[:end]
+        conn.send((end, header, cadiscon, limit))
+        R = conn.recv()
+
+        if R[0]=='overflow':
+            return None
+        elif R[0]=='error':
+            raise R[1]
+
+        chunks, header = R[1], R[2]
+        out = []
+        for dtype, count, width, voff, moff in chunks:
+            # copy out before the slot is re-used
+            V = np.ndarray((count, width), dtype=dtype, buffer=shm, offset=voff).copy()
+            M = np.ndarray((count,), dtype=_meta, buffer=shm, offset=moff).copy()
+            out.append((V, M))
+        return out, header
+
+_engine = None
+
+def configure(nprocs):
+    """Start nprocs decoder processes, if not already running.
+    Does nothing, with a warning, once other threads are running.
+    """
+    global _engine
+    if _engine is None and nprocs>0:
+        if threading.active_count()>1:
+            _log.warn("Threads running, not starting %d decoder processes", nprocs)
+        else:
+            _engine = ProcessDecoder(nprocs)
+    return _engine
+
+def prestart(conf):
+    """Start the decoder processes of an Appliance configuration.
+    Call before the reactor, or any other thread, starts.
+    """
+    if conf.get('urltype')=='appl':
+        configure(conf.getint('decodeprocs') or 0)
+
+def getProcessDecoder():
+    """The process wide ProcessDecoder, or None if not configured
+    """
+    return _engine
@@ -4,18 +4,23 @@ Copyright 2015 Brookhaven Science Assoc.
  as operator of Brookhaven National Lab.
 """
 
-import os.path
+import os.path, json
 
 from twisted.trial import unittest
 
-from twisted.internet import defer, error, protocol
+from twisted.internet import defer, error, protocol, reactor
+from twisted.internet.task import deferLater
+from twisted.python import failure
+from twisted.web.client import ResponseDone
 from twisted.test import proto_helpers
 
 import numpy as np
 from numpy.testing import assert_array_almost_equal
 
 from .. import appl
+from ...a2aproxy.plotcache import PlotCache
 from ...dtype import dbr_time
+from ... import util
 
 # Read in an example PB message stream
 with open(os.path.join(os.path.dirname(__file__), 'testdata.pb')) as F:
@@ -53,12 +58,14 @@ class CB(object):
 class TestApplST(unittest.TestCase):
     timeout = 1
     inthread = False
+    splitLines = True
 
     def setUp(self):
         self.alldone = False
         self.cb = cb = CB()
         self.P = appl.PBReceiver(cb, name='LN-AM{RadMon:1}DoseRate-I',
-                                 inthread=self.inthread)
+                                 inthread=self.inthread,
+                                 splitLines=self.splitLines)
         self.T = proto_helpers.StringTransport()
 
     def tearDown(self):
@@ -141,3 +148,241 @@ class TestApplST(unittest.TestCase):
 
 class TestApplMT(TestApplST):
     inthread = True
+
+class TestApplBufST(TestApplST):
+    splitLines = False
+
+class TestApplBufMT(TestApplST):
+    inthread = True
+    splitLines = False
+
+class TestApplAccum(unittest.TestCase):
+    timeout = 1
+    inthread = False
+    splitLines = False
+
+    @defer.inlineCallbacks
+    def test_decodeall(self):
+        A = util.Accumulator(capacity=4)
+        P = appl.PBReceiver(A, name='LN-AM{RadMon:1}DoseRate-I',
+                            inthread=self.inthread,
+                            splitLines=self.splitLines)
+        P.makeConnection(proto_helpers.StringTransport())
+        P.dataReceived(_data)
+        P.connectionLost(protocol.connectionDone)
+
+        C = yield P.defer
+        self.assertEqual(C,22)
+        self.assertEqual(len(A), 22)
+
+        assert_array_almost_equal(A.values, _all_values)
+        assert_array_almost_equal(A.metas['severity'], _all_metas['severity'])
+        assert_array_almost_equal(A.metas['status'], _all_metas['status'])
+        assert_array_almost_equal(A.metas['sec'], _all_metas['sec'])
+        assert_array_almost_equal(A.metas['ns'], _all_metas['ns'])
+
+class TestApplAccumMT(TestApplAccum):
+    inthread = True
+
+class TestApplAccumLines(TestApplAccum):
+    splitLines = True
+
+class TestApplBackpressure(unittest.TestCase):
+    timeout = 1
+    inthread = False
+
+    @defer.inlineCallbacks
+    def test_wait(self):
+        waits = []
+        def cb(V, M):
+            waits.append(defer.Deferred())
+            return waits[-1]
+        T = proto_helpers.StringTransport()
+        P = appl.PBReceiver(cb, name='LN-AM{RadMon:1}DoseRate-I',
+                            inthread=self.inthread, splitLines=False)
+        P.rx_buf_size = 1 # process each line
+        P.makeConnection(T)
+        [P.dataReceived(B) for B in _data]
+        # reading paused while processing
+        self.assertEqual(T.producerState, 'paused')
+        P.connectionLost(protocol.connectionDone)
+
+        # processing waits for each callback to complete
+        while not P.defer.called:
+            yield deferLater(reactor, 0.001, lambda:None)
+            W = [D for D in waits if not D.called]
+            if W:
+                self.assertFalse(P.defer.called)
+                W[0].callback(None)
+
+        C = yield P.defer
+        self.assertEqual(C, 22)
+        self.assertTrue(len(waits)>1)
+
+class TestApplBackpressureMT(TestApplBackpressure):
+    inthread = True
+
+class TestSliceReorder(unittest.TestCase):
+    def _chunk(self, secs):
+        M = np.zeros(len(secs), dtype=dbr_time)
+        M['sec'] = secs
+        return np.asarray(secs, dtype=np.float64).reshape((-1,1)), M
+
+    def test_order(self):
+        cb = CB()
+        R = appl._SliceReorder([5, 10, 20, 30], cb)
+
+        # slice 2 arrives first, including the sample before its start
+        R.receiver(2)(*self._chunk([19, 20, 21]))
+        R.receiver(1)(*self._chunk([4, 11]))
+        self.assertEqual(len(cb.data), 0)
+        R.receiver(0)(*self._chunk([1, 6, 10]))
+        self.assertEqual(len(cb.data), 1)
+
+        R.complete(1)
+        self.assertEqual(len(cb.data), 1)
+        R.complete(0)
+        self.assertEqual(len(cb.data), 3)
+        R.receiver(2)(*self._chunk([31]))
+        self.assertEqual(R.complete(2), 6)
+
+        V = np.concatenate([V for V,M in cb.data], axis=0)
+        assert_array_almost_equal(V[:,0], [1, 6, 11, 20, 21, 31])
+
+    def test_wait(self):
+        cb = CB()
+        R = appl._SliceReorder([5, 10, 20], cb)
+
+        # samples of a later slice are held until delivered
+        D = R.receiver(1)(*self._chunk([11]))
+        self.assertIsInstance(D, defer.Deferred)
+        self.assertIsNone(R.receiver(0)(*self._chunk([6])))
+        self.assertFalse(D.called)
+
+        R.complete(0)
+        self.assertTrue(D.called)
+        self.assertEqual(len(cb.data), 2)
+
+    def test_fail(self):
+        cb = CB()
+        S = appl.Appliance(FakeAgent({}), {}, FakeConf())
+        slices, cancelled = [], []
+        def fetchone(pv, callback, *args):
+            D = defer.Deferred(cancelled.append)
+            slices.append((callback, D))
+            return D
+        S._fetchone = fetchone
+
+        D = S._fetchsplit('pv', cb, (), {}, None, None, [5, 10, 20, 30], None, 0)
+        W = slices[2][0](*self._chunk([21])) # waits for slices 0 and 1
+        slices[0][1].errback(RuntimeError('oops'))
+
+        self.assertEqual(cancelled, [slices[1][1], slices[2][1]])
+        self.assertFailure(W, RuntimeError) # so the receiver stops
+        self.assertFailure(slices[1][0](*self._chunk([11])), RuntimeError)
+        self.assertEqual(len(cb.data), 0)
+        return self.assertFailure(D, RuntimeError)
+
+class FakeConf(dict):
+    def getboolean(self, key, default=None):
+        return self.get(key, default)
+    getint = getboolean
+
+class FakeResponse(object):
+    def __init__(self, code, body=''):
+        self.code, self.body = code, body
+        self.delivered = False
+    def deliverBody(self, P):
+        self.delivered = True
+        P.makeConnection(proto_helpers.StringTransport())
+        P.dataReceived(self.body)
+        P.connectionLost(failure.Failure(ResponseDone()))
+
+class FakeAgent(object):
+    def __init__(self, replies):
+        self.replies, self.requests = replies, []
+    def acquire(self):
+        return defer.succeed(None)
+    def release(self):
+        pass
+    def request(self, method, url, headers=None, body=None):
+        self.requests.append((method, url.split('?')[0]))
+        R = self.replies.get(method, FakeResponse(404))
+        if isinstance(R, list):
+            R = R.pop(0) # one reply per request
+        return defer.succeed(R)
+
+class TestSnapBulk(unittest.TestCase):
+    @defer.inlineCallbacks
+    def test_snap(self):
+        A = FakeAgent({'POST':FakeResponse(200, json.dumps({
+            'pv:a':{'secs':1423234604, 'nanos':5, 'severity':1, 'status':3, 'val':4.5},
+            'pv:c':{'secs':1423234605, 'nanos':6, 'severity':0, 'status':0, 'val':[7, 8]},
+        }))})
+        S = appl.Appliance(A, {'dataRetrievalURL':'http://x/retrieval'}, FakeConf())
+
+        V, M = yield S.fetchsnap(['pv:a', 'pv:b', 'pv:c'], T=1423234610, chunkSize=2)
+
+        self.assertEqual(A.requests, [
+            ('POST', 'http://x/retrieval/data/getDataAtTime'),
+            ('POST', 'http://x/retrieval/data/getDataAtTime'),
+            ('GET', 'http://x/retrieval/data/getData.raw'), # fallback for pv:b
+        ])
+        self.assertEqual(list(V), [4.5, 0, 7])
+        self.assertEqual(list(M['sec']), [1423234604, 0, 1423234605])
+        self.assertEqual(list(M['severity']), [1, 0, 0])
+        self.assertEqual(list(M['status']), [3, 0, 0])
+
+    @defer.inlineCallbacks
+    def test_error(self):
+        E = FakeResponse(500, 'Internal Server Error')
+        A = FakeAgent({'POST':E})
+        S = appl.Appliance(A, {'dataRetrievalURL':'http://x/retrieval'}, FakeConf())
+
+        V, M = [None]*2, [None]*2
+        R = yield S._fetchsnapbulk(['pv:a', 'pv:b'], 0, 1423234610, V, M)
+        self.assertEqual(R, [0, 1])
+        self.assertTrue(E.delivered) # body discarded
+
+class TestPlot(unittest.TestCase):
+    def test_binsize(self):
+        S = appl.Appliance(FakeAgent({}), {}, FakeConf())
+        S.fetchraw = lambda pv, *args, **kws: pv
+
+        for Tend, name in [(2100, 'caplotbinning_11(pv)'),
+                           (2099, 'caplotbinning_10(pv)')]: # not a multiple of count
+            self.assertEqual(S.fetchplot('pv', None, T0=1000, Tend=Tend, count=100), name)
+        # one cache entry per bin size
+        self.assertEqual(PlotCache.key('pv', 1000, 2100, 100)[1], 11)
+        self.assertEqual(PlotCache.key('pv', 1000, 2099, 100)[1], 10)
+
+
+class TestSearch(unittest.TestCase):
+    @defer.inlineCallbacks
+    def test_index(self):
+        A = FakeAgent({'GET':FakeResponse(200, json.dumps(['pv:a', 'pv:b', 'other']))})
+        S = appl.Appliance(A, {'mgmtURL':'http://x/mgmt/bpl'}, FakeConf())
+
+        R = yield S.search(pattern='^pv:')
+        self.assertEqual(sorted(R), ['pv:a', 'pv:b'])
+        R = yield S.search(exact='other')
+        self.assertEqual(R.keys(), ['other'])
+        self.assertEqual(len(A.requests), 1) # only the index load
+
+        A.replies['GET'] = FakeResponse(200, json.dumps(['pv:new']))
+        R = yield S.search(exact='pv:new')
+        self.assertEqual(R.keys(), ['pv:new'])
+        R = yield S.search(pattern='new')
+        self.assertEqual(R.keys(), ['pv:new'])
+        self.assertEqual(len(A.requests), 2)
+
+    @defer.inlineCallbacks
+    def test_index_fails(self):
+        A = FakeAgent({'GET':[FakeResponse(500), FakeResponse(200, json.dumps(['pv:a']))]})
+        S = appl.Appliance(A, {'mgmtURL':'http://x/mgmt/bpl'}, FakeConf())
+
+        # falls back to a server side search
+        R = yield S.search(pattern='^pv:')
+        self.assertEqual(R.keys(), ['pv:a'])
+        self.assertEqual(len(A.requests), 2)
+        self.flushLoggedErrors(RuntimeError)
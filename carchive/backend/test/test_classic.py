@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright 2015 Brookhaven Science Assoc.
+ as operator of Brookhaven National Lab.
+"""
+
+import re
+
+from twisted.trial import unittest
+
+from twisted.internet import defer
+
+from numpy.testing import assert_array_equal
+
+from .. import classic
+
+class FakeConf(dict):
+    def getint(self, key, default=None):
+        return self.get(key, default)
+
+class FakeProxy(object):
+    """Serves 'archiver.values' for one scalar PV, beginning each
+    reply with the last sample at or before the requested start time.
+    """
+    def __init__(self, secs):
+        if not isinstance(secs, dict):
+            secs = {1:secs}
+        self.secs, self.calls = secs, []
+    def callRemote(self, meth, arch, pvs, s0, ns0, s1, ns1, count, how, caller=None):
+        assert meth=='archiver.values', meth
+        self.calls.append((s0, ns0))
+        secs = self.secs[arch]
+        S = [s for s in secs if (s,0)<=(s0,ns0)][-1:]
+        S += [s for s in secs if (s,0)>(s0,ns0) and (s,0)<=(s1,ns1)]
+        S = S[:count]
+        vals = [{'value':[float(s)], 'sevr':0, 'stat':0, 'secs':s, 'nano':0}
+                for s in S]
+        return defer.succeed([{'name':pvs[0], 'count':1, 'type':3,
+                               'meta':{'type':1}, 'values':vals}])
+
+_info = {'ver':0, 'desc':'', 'stat':[], 'sevr':[], 'how':[]}
+
+class TestFetchData(unittest.TestCase):
+    prefetch = 0
+
+    def setUp(self):
+        self.P = FakeProxy(range(100, 110))
+        self.A = classic.Archive(self.P, FakeConf(prefetch=self.prefetch),
+                                 _info, [{'name':'arch', 'key':1}])
+        self.data = []
+
+    @defer.inlineCallbacks
+    def test_all(self):
+        def cb(V, M):
+            self.data.append(V[:,0])
+        N = yield self.A._fetchdata(1, 'pv', cb, T0=100, Tend=200, chunkSize=3)
+
+        assert_array_equal(sum(map(list, self.data), []), range(100, 110))
+        self.assertEqual(N, 14) # includes duplicates
+        self.assertEqual(len(self.P.calls), 5)
+
+    @defer.inlineCallbacks
+    def test_slow(self):
+        pending = []
+        def cb(V, M):
+            self.data.append(V[:,0])
+            D = defer.Deferred()
+            pending.append(D)
+            return D
+
+        D = self.A._fetchdata(1, 'pv', cb, T0=100, Tend=200, chunkSize=3)
+
+        while pending:
+            # requests in progress while one page is being delivered
+            self.assertEqual(len(self.P.calls), min(5, len(self.data)+self.prefetch))
+            pending.pop(0).callback(None)
+
+        N = yield D
+        self.assertEqual(N, 14)
+        assert_array_equal(sum(map(list, self.data), []), range(100, 110))
+
+class TestFetchDataPrefetch(TestFetchData):
+    prefetch = 2
+
+class NamesProxy(object):
+    def __init__(self, names):
+        self.names, self.calls = names, []
+    def callRemote(self, meth, arch, pattern):
+        assert meth=='archiver.names', meth
+        self.calls.append((arch, pattern))
+        return defer.succeed([{'name':N, 'start_sec':S, 'start_nano':0,
+                               'end_sec':E, 'end_nano':0}
+                              for N,S,E in self.names.get(arch, [])
+                              if re.search(pattern, N)])
+
+class TestSearch(unittest.TestCase):
+    def setUp(self):
+        self.P = NamesProxy({1:[('pv:a', 100, 109), ('pv:b', 100, 109)],
+                             2:[('pv:a', 110, 119), ('other', 110, 119)]})
+        self.A = classic.Archive(self.P, FakeConf(nameindex=600), _info,
+                                 [{'name':'old', 'key':1}, {'name':'new', 'key':2}])
+
+    @defer.inlineCallbacks
+    def test_index(self):
+        R = yield self.A.search(pattern='^pv:', archs=[1, 2], rawTime=True)
+        self.assertEqual(R, {'pv:a':((100,0), (119,0)), 'pv:b':((100,0), (109,0))})
+        # the names found in the index are looked up
+        self.assertEqual(sorted(self.P.calls), [(1, ''), (1, '^(pv\\:a|pv\\:b)$'),
+                                                (2, ''), (2, '^(pv\\:a|pv\\:b)$')])
+
+        R = yield self.A.search(exact='pv:a', archs=[1, 2], breakDown=True, rawTime=True)
+        self.assertEqual(R, {'pv:a':[((100,0), (109,0), 1), ((110,0), (119,0), 2)]})
+        self.assertEqual(self.P.calls[4:], [(1, '^(pv\\:a)$'), (2, '^(pv\\:a)$')])
+
+    @defer.inlineCallbacks
+    def test_ranges(self):
+        yield self.A.search(pattern='^pv:', archs=[1, 2], rawTime=True)
+
+        # time ranges are not taken from the index
+        self.P.names[2][0] = ('pv:a', 110, 130)
+        # added to another archive since the index was loaded
+        self.P.names[2].append(('pv:b', 120, 125))
+
+        R = yield self.A.search(pattern='^pv:', archs=[1, 2], rawTime=True)
+        self.assertEqual(R, {'pv:a':((100,0), (130,0)), 'pv:b':((100,0), (125,0))})
+
+    @defer.inlineCallbacks
+    def test_miss(self):
+        yield self.A.search(exact='pv:a', archs=[1], rawTime=True)
+        self.P.names[1].append(('pv:new', 105, 109))
+
+        R = yield self.A.search(exact='pv:new', archs=[1], rawTime=True)
+        self.assertEqual(R, {'pv:new':((105,0), (109,0))})
+        self.assertEqual(self.P.calls[2:], [(1, '^pv\\:new$')])
+
+        # now in the index
+        R = yield self.A.search(pattern='new', archs=[1], rawTime=True)
+        self.assertEqual(R, {'pv:new':((105,0), (109,0))})
+        self.assertEqual(self.P.calls[3:], [(1, '^(pv\\:new)$')])
+
+    @defer.inlineCallbacks
+    def test_disabled(self):
+        # disabled by default
+        self.A = classic.Archive(self.P, FakeConf(), _info,
+                                 [{'name':'old', 'key':1}])
+        R = yield self.A.search(pattern='b$', archs=[1], rawTime=True)
+        self.assertEqual(R, {'pv:b':((100,0), (109,0))})
+        self.assertEqual(self.P.calls, [(1, 'b$')])
+
+class TestSections(unittest.TestCase):
+    def setUp(self):
+        self.P = FakeProxy({1:range(100, 110), 2:range(110, 120)})
+        self.A = classic.Archive(self.P, FakeConf(), _info,
+                                 [{'name':'old', 'key':1}, {'name':'new', 'key':2}])
+        self.breakDown = {'pv':[((100,0), (109,0), 1), ((110,0), (119,0), 2)]}
+        self.data = []
+
+    @defer.inlineCallbacks
+    def test_concurrent(self):
+        pending = []
+        def cb(V, M):
+            self.data.append(V[:,0])
+            D = defer.Deferred()
+            pending.append(D)
+            return D
+
+        D = self.A.fetchraw('pv', cb, T0=(100,0), Tend=(200,0), chunkSize=3, rawTimes=True,
+                            breakDown=self.breakDown)
+
+        # both sections requested, but only the first delivered.
+        # the second waits for its first page to be delivered.
+        self.assertEqual(self.P.calls, [(100,0), (110,0)])
+        self.assertEqual(len(self.data), 1)
+
+        while pending:
+            pending.pop(0).callback(None)
+
+        N = yield D
+        self.assertEqual(N, 28) # includes duplicates
+        assert_array_equal(sum(map(list, self.data), []), range(100, 120))
+
+    def test_fail(self):
+        def cb(V, M):
+            raise RuntimeError('oops')
+        D = self.A.fetchraw('pv', cb, T0=(100,0), Tend=(200,0), chunkSize=3, rawTimes=True,
+                            breakDown=self.breakDown)
+        self.assertEqual(self.P.calls, [(100,0), (110,0)]) # second section stopped
+        return self.assertFailure(D, RuntimeError)
+
+    @defer.inlineCallbacks
+    def test_count(self):
+        # count limited requests are sequential
+        N = yield self.A.fetchraw('pv', lambda V,M:self.data.append(V[:,0]),
+                                  T0=(100,0), Tend=(200,0), count=12, chunkSize=3, rawTimes=True,
+                                  breakDown=self.breakDown)
+        self.assertEqual(N, 12) # includes duplicates
+        assert_array_equal(sum(map(list, self.data), []), range(100, 109))
+        self.assertEqual(len(self.P.calls), 4)
+
+class PlanProxy(FakeProxy):
+    """Also answers 'archiver.names' for the PV
+    """
+    def callRemote(self, meth, arch, *args, **kws):
+        if meth=='archiver.values':
+            return FakeProxy.callRemote(self, meth, arch, *args, **kws)
+        assert meth=='archiver.names', meth
+        secs = self.secs[arch]
+        return defer.succeed([{'name':'pv', 'start_sec':secs[0], 'start_nano':0,
+                               'end_sec':secs[-1], 'end_nano':0}])
+
+class TestPlanCache(unittest.TestCase):
+    def setUp(self):
+        self.P = PlanProxy({1:range(100, 110), 2:range(110, 120)})
+        self.A = classic.Archive(self.P, FakeConf(nameindex=0), _info,
+                                 [{'name':'old', 'key':1}, {'name':'new', 'key':2}])
+
+    @defer.inlineCallbacks
+    def fetch(self, T0, Tend):
+        data = []
+        yield self.A.fetchraw('pv', lambda V,M:data.append(V[:,0]), T0=(T0,0), Tend=(Tend,0),
+                              chunkSize=100, rawTimes=True)
+        defer.returnValue(sum(map(list, data), []))
+
+    @defer.inlineCallbacks
+    def test_newdata(self):
+        R = yield self.fetch(115, 200)
+        self.assertEqual(R, range(115, 120))
+
+        # samples arrive after the plan is cached
+        self.P.secs[2].extend(range(120, 130))
+        R = yield self.fetch(115, 200)
+        self.assertEqual(R, range(115, 130))
+
+        # later than the cached end of the newest section
+        R = yield self.fetch(125, 200)
+        self.assertEqual(R, range(125, 130))
+
+        S = yield self.A._planner.sections('pv')
+        self.assertEqual(S[0], ((100,0), (109,0), 1))
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright 2015 Brookhaven Science Assoc.
+ as operator of Brookhaven National Lab.
+"""
+
+import threading
+
+from twisted.trial import unittest
+
+from twisted.internet import defer
+
+from ..decodepool import DecodePool
+
+class TestPool(unittest.TestCase):
+    timeout = 2
+
+    def setUp(self):
+        self.P = DecodePool(workers=1, maxqueue=1)
+
+    def tearDown(self):
+        self.P._stop()
+
+    @defer.inlineCallbacks
+    def test_run(self):
+        main = threading.current_thread()
+        R = yield self.P.run('pv', 42, lambda x:(x, threading.current_thread() is main), 5)
+        self.assertEqual(R, (5, False))
+        S = self.P.pvstats('pv')
+        self.assertEqual((S.jobs, S.decbytes), (1, 42))
+        self.assertEqual(self.P.jobs, 1)
+
+    @defer.inlineCallbacks
+    def test_queue(self):
+        E = threading.Event()
+        Ds = [self.P.run('pv', 1, E.wait, 1.0) for i in range(3)]
+        self.assertEqual(self.P.inprogress, 2)
+        self.assertEqual(self.P.waiting, 1)
+
+        self.P.configure(maxqueue=2)
+        self.assertEqual(self.P.inprogress, 3)
+        self.assertEqual(self.P.waiting, 0)
+
+        E.set()
+        yield defer.gatherResults(Ds)
+        self.assertEqual(self.P.inprogress, 0)
+        self.assertEqual(self.P.pvstats('pv').jobs, 3)
+
+    @defer.inlineCallbacks
+    def test_limit(self):
+        E = threading.Event()
+        Ds = [self.P.run('pv', 1, E.wait, 1.0) for i in range(4)]
+        self.assertEqual((self.P.inprogress, self.P.waiting), (2, 2))
+
+        C = Ds.pop()
+        C.cancel() # gives up waiting
+        self.assertFailure(C, defer.CancelledError)
+        self.assertEqual((self.P.inprogress, self.P.waiting), (2, 1))
+
+        self.P.configure(maxqueue=0)
+        E.set()
+        yield defer.gatherResults(Ds)
+        self.assertEqual((self.P.inprogress, self.P.waiting), (0, 0))
+        self.assertEqual(self.P.pvstats('pv').jobs, 3)
+        self.assertEqual([name for name, S in self.P.stats.items()], ['pv'])
@@ -16,6 +16,7 @@ import numpy
 from numpy.testing import assert_equal, assert_array_equal
 
 from ...dtype import dbr_time
+from ...util import Accumulator
 from .. import pbdecode
 from ..appl import _dtypes
 
@@ -316,6 +317,101 @@ class TestDecodeVector(TestCase):
                 print 'Error in test_decode for',name
                 raise
 
+class TestDecodeBuffer(TestCase):
+    def _lines(self, vals):
+        S = _fields[6]()
+        raw = []
+        for i,V in enumerate(vals):
+            S.Clear()
+            S.val = V
+            S.secondsintoyear = 1024+i
+            S.nano = 0x1234+i
+            raw.append(pbdecode.escape(S.SerializeToString()))
+        return raw
+
+    def test_decode(self):
+        raw = self._lines([42.1, 42.2, 42.3])
+        buf = '\n'.join(raw)+'\n'
+
+        V, M, pos = pbdecode.bufdecoders[6](buf, 0, len(buf), 1)
+        M = numpy.rec.array(M, dtype=dbr_time)
+
+        self.assertEqual(pos, len(buf))
+        self.assertEqual(V.shape, (3,1))
+        assert_array_equal(V[:,0], [42.1, 42.2, 42.3])
+        assert_array_equal(M['sec'], [1024, 1025, 1026])
+        assert_array_equal(M['ns'], [0x1234, 0x1235, 0x1236])
+
+    def test_stop(self):
+        raw = self._lines([42.1, 42.2, 42.3])
+        buf = raw[0]+'\n'+raw[1]+'\n\n'+raw[2]+'\n'+raw[0][:3]
+        end = buf.rfind('\n')+1
+
+        # stop at blank line
+        V, M, pos = pbdecode.bufdecoders[6](buf, 0, end, 1)
+        self.assertEqual(V.shape, (2,1))
+        self.assertEqual(buf[pos], '\n')
+
+        # stop at partial line
+        V, M, pos = pbdecode.bufdecoders[6](buf, pos+1, len(buf), 1)
+        self.assertEqual(V.shape, (1,1))
+        self.assertEqual(V[0,0], 42.3)
+        self.assertEqual(pos, end)
+
+        # stop at limit
+        V, M, pos = pbdecode.bufdecoders[6](buf, 0, end, 1, 0, 1)
+        self.assertEqual(V.shape, (1,1))
+        self.assertEqual(pos, len(raw[0])+1)
+
+        # nothing to do
+        V, M, pos = pbdecode.bufdecoders[6](buf, end, end, 1)
+        self.assertEqual(V.shape[0], 0)
+        self.assertEqual(pos, end)
+
+    def test_fail(self):
+        self.assertRaises(ValueError, pbdecode.bufdecoders[6], 'abc\n', 2, 1, 1)
+        self.assertRaises(ValueError, pbdecode.bufdecoders[6], 'abc\n', 0, 5, 1)
+        self.assertRaises(ValueError, pbdecode.bufdecoders[6], 'abc\n', 0, 4, 2)
+
+    def test_accumulate(self):
+        raw = self._lines([42.1, 42.2, 42.3])
+        buf = '\n'.join(raw)+'\n'
+        A = Accumulator(capacity=2)
+
+        N, pos = pbdecode.bufdecoders[6](buf, 0, len(buf), 1, 100, 2, A)
+        self.assertEqual(N, 2)
+        N, pos = pbdecode.bufdecoders[6](buf, pos, len(buf), 1, 100, 0, A)
+        self.assertEqual(N, 1)
+        self.assertEqual(pos, len(buf))
+
+        self.assertEqual(len(A), 3)
+        assert_array_equal(A.values[:,0], [42.1, 42.2, 42.3])
+        assert_array_equal(A.metas['sec'], [1124, 1125, 1126])
+        assert_array_equal(A.metas['ns'], [0x1234, 0x1235, 0x1236])
+
+    def test_accumulate_vector(self):
+        S = _fields[13]()
+        raw = []
+        for i,V in enumerate([[1.0], [2.0, 3.0], [4.0, 5.0, 6.0]]):
+            S.Clear()
+            S.val.extend(V)
+            S.secondsintoyear = 1024+i
+            S.nano = i
+            raw.append(pbdecode.escape(S.SerializeToString()))
+        A = Accumulator(capacity=1)
+
+        for L in raw:
+            buf = L+'\n'
+            N, pos = pbdecode.bufdecoders[13](buf, 0, len(buf), 1, 0, 0, A)
+            self.assertEqual((N, pos), (1, len(buf)))
+
+        assert_array_equal(A.values, [[1,0,0],[2,3,0],[4,5,6]])
+        assert_array_equal(A.metas['sec'], [1024, 1025, 1026])
+
+        # mixing types is an error
+        buf = self._lines([1.0])[0]+'\n'
+        self.assertRaises(ValueError, pbdecode.bufdecoders[5], buf, 0, len(buf), 1, 0, 0, A)
+
 class TestSpecial(TestCase):
     def setUp(self):
         H = self.H = CaptureHandler()
@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright 2015 Brookhaven Science Assoc.
+ as operator of Brookhaven National Lab.
+"""
+
+import os, calendar
+
+import numpy as np
+
+from twisted.trial import unittest
+from twisted.internet import defer
+
+from ...dtype import dbr_time
+from ...cmd import pbrawexport
+from ..pb import exporter, appender, granularity, pvlog, last, verify, index, journal
+from .. import EPICSEvent_pb2 as pbt
+
+_meta = {'units':'mm', 'prec':2, 'alarm_low':0.0, 'alarm_high':10.0,
+         'warn_low':1.0, 'warn_high':9.0, 'disp_low':0.0, 'disp_high':10.0}
+
+def _samples(N, width, dtype):
+    """N samples from 2014-12-31 22:00 UTC over about two days,
+    with some disconnects, repeats and out of order times.
+    """
+    T0 = calendar.timegm((2014, 12, 31, 22, 0, 0))
+    M = np.zeros(N, dtype=dbr_time)
+    M['sec'] = T0 + np.arange(N)*173
+    M['ns'] = np.arange(N)*1001
+    M['severity'] = np.arange(N)%3
+    M['severity'][20:23] = 3904 # disconnected
+    M['severity'][100] = 3848 # archive off
+    M['severity'][150:152] = 3856 # repeat
+    M['sec'][300], M['sec'][301] = M['sec'][301], M['sec'][300]
+    M['status'] = np.arange(N)%5
+
+    V = np.arange(N*width).reshape((N, width))
+    if dtype.kind=='S':
+        V = V.astype(dtype)
+        V[5,0] = 'a\nb\x1bc' # needs escaping
+    else:
+        V = V.astype(dtype)
+    return V, M
+
+class TestEncode(unittest.TestCase):
+    """The chunk encoder gives the same files as encoding each sample
+    """
+    if exporter.pb_encoders is None:
+        skip = "pbdecode not built"
+
+    def _export(self, out, V, M, orig_type, width, gran='1hour', ignore=None):
+        log = pvlog.PvLog('TST:pv')
+        with exporter.Exporter('TST:pv', granularity.get_granularity(gran), out,
+                               [':'], ignore, log, index_interval=7) as E:
+            for i in range(0, len(M), 50):
+                meta = _meta if i<200 else dict(_meta, units='m')
+                E(V[i:i+50], M[i:i+50], {'orig_type':orig_type,
+                                         'reported_arr_size':width,
+                                         'the_meta':meta})
+        return log
+
+    def _files(self, out):
+        F = {}
+        for D, _dirs, files in os.walk(out):
+            for N in files:
+                with open(os.path.join(D, N), 'rb') as FP:
+                    F[os.path.relpath(os.path.join(D, N), out)] = FP.read()
+        return F
+
+    def _compare(self, orig_type, width, dtype, **kws):
+        V, M = _samples(1000, width, np.dtype(dtype))
+
+        A, B = self.mktemp(), self.mktemp()
+        LA = self._export(A, V, M, orig_type, width, **kws)
+
+        encoders, exporter.pb_encoders = exporter.pb_encoders, None
+        try:
+            LB = self._export(B, V, M, orig_type, width, **kws)
+        finally:
+            exporter.pb_encoders = encoders
+
+        FA, FB = self._files(A), self._files(B)
+        self.assertTrue(len([K for K in FA if K.endswith('.idx')])>1)
+        self.assertEqual(sorted(FA), sorted(FB))
+        for K in FA:
+            self.assertEqual(FA[K], FB[K], K)
+        self.assertEqual(LA.build_report(), LB.build_report())
+
+    def test_double(self):
+        self._compare(3, 1, np.float64)
+
+    def test_int_waveform(self):
+        self._compare(2, 5, np.int32, gran='1day')
+
+    def test_enum(self):
+        self._compare(1, 1, np.int32)
+
+    def test_string(self):
+        self._compare(0, 1, 'S40', gran='1month')
+
+    def test_ignore(self):
+        # resume from a sample on 2015-01-01
+        T = calendar.timegm((2015, 1, 1, 3, 0, 0))
+        self._compare(3, 1, np.float64,
+                      ignore=(2015, T-calendar.timegm((2015, 1, 1, 0, 0, 0)), 0))
+
+class TestAppender(unittest.TestCase):
+    def test_segments(self):
+        out = self.mktemp()
+        A = appender.Appender('TST:pv', granularity.get_granularity('1month'), out, [':'],
+                              (2014, 100, 0), pvlog.PvLog('TST:pv'))
+        Y = calendar.timegm((2014, 1, 1, 0, 0, 0))
+        times = [Y+100, Y+101, Y+31*86400-1, Y+31*86400, Y+365*86400+5]
+        for i, T in enumerate(times):
+            P = pbt.ScalarDouble(val=float(i))
+            A.write_sample(P, T, i, pbt.SCALAR_DOUBLE)
+        A.close()
+
+        def read(name):
+            return [(P.secondsintoyear, P.nano, P.val)
+                    for P in index.iter_samples(os.path.join(out, 'TST', name))]
+        # the first sample is at the lower bound, so not written
+        self.assertEqual(read('pv:2014_01.pb'), [(101, 1, 1.0), (31*86400-1, 2, 2.0)])
+        self.assertEqual(read('pv:2014_02.pb'), [(31*86400, 3, 3.0)])
+        self.assertEqual(read('pv:2015_01.pb'), [(5, 4, 4.0)])
+
+class TestLastSample(unittest.TestCase):
+    """Reading only the end of a file finds the same last sample
+    as checking every sample
+    """
+    def setUp(self):
+        self.out = self.mktemp()
+        V, M = _samples(1000, 3, np.dtype(np.int32))
+        with exporter.Exporter('TST:pv', granularity.get_granularity('1day'), self.out,
+                               [':'], None, pvlog.PvLog('TST:pv')) as E:
+            E(V, M, {'orig_type':2, 'reported_arr_size':3, 'the_meta':_meta})
+        self.files = []
+        for D, _dirs, files in os.walk(self.out):
+            self.files.extend(os.path.join(D, N) for N in files)
+        self.files.sort()
+        self.assertEqual(len(self.files), 3)
+
+        # exercise reading in several blocks
+        self.blocksize, verify.TAIL_BLOCK_SIZE = verify.TAIL_BLOCK_SIZE, 7
+
+    def tearDown(self):
+        verify.TAIL_BLOCK_SIZE = self.blocksize
+
+    def _verify(self, name, full):
+        with open(name, 'rb') as F:
+            return verify.verify_stream(F, pv_name='TST:pv', full=full)
+
+    def test_files(self):
+        for name in self.files:
+            R = self._verify(name, False)
+            self.assertNotEqual(R['last_timestamp'], None)
+            self.assertEqual(R, self._verify(name, True))
+
+    def test_find_last(self):
+        gran = granularity.get_granularity('1day')
+        R = last.find_last_sample_timestamp('TST:pv', self.out, gran, [':'])
+        self.assertNotEqual(R, None)
+        self.assertEqual(R, last.find_last_sample_timestamp('TST:pv', self.out, gran, [':'],
+                                                            full_verify=True))
+
+    def test_order(self):
+        # the out of order sample is dropped
+        count = 0
+        for name in self.files:
+            S = [(P.secondsintoyear, P.nano) for P in index.iter_samples(name)]
+            self.assertEqual(S, sorted(S), name)
+            count += len(S)
+        self.assertEqual(count, 1000-4-1) # also not disconnected or archive off
+
+    def test_header_only(self):
+        with open(self.files[0], 'rb') as F:
+            header = F.readline()
+        with open(self.files[0], 'wb') as F:
+            F.write(header)
+        self.assertEqual(self._verify(self.files[0], False)['last_timestamp'], None)
+
+    def test_partial(self):
+        with open(self.files[0], 'ab') as F:
+            F.write('\x08\x01')
+        self.assertRaises(verify.VerificationError, self._verify, self.files[0], False)
+        self.assertRaises(verify.VerificationError, self._verify, self.files[0], True)
+
+class TestIndex(unittest.TestCase):
+    """Reading from a time with the index gives the same samples
+    as reading the whole file
+    """
+    def _export(self, V, M, ignore=None):
+        with exporter.Exporter('TST:pv', granularity.get_granularity('1year'), self.out,
+                               [':'], ignore, pvlog.PvLog('TST:pv'), index_interval=10) as E:
+            E(V, M, {'orig_type':3, 'reported_arr_size':1, 'the_meta':_meta})
+
+    def setUp(self):
+        self.out = self.mktemp()
+        # several samples in each second
+        V, M = _samples(1000, 1, np.dtype(np.float64))
+        M['sec'] = M['sec'][0] + np.arange(1000)//3
+        M['ns'] = (np.arange(1000)%3)*1000
+        M['severity'] = 0
+        self._export(V[:600], M[:600])
+        # resume, appending to the same file
+        Y = calendar.timegm((2014, 1, 1, 0, 0, 0))
+        self._export(V[550:], M[550:], ignore=(2014, int(M['sec'][599])-Y, int(M['ns'][599])))
+        self.path = os.path.join(self.out, 'TST', 'pv:2014.pb')
+
+    def test_index(self):
+        S = [(P.secondsintoyear, P.nano) for P in index.iter_samples(self.path)]
+        self.assertEqual(len(S), 1000)
+        E = index.read_index(self.path)
+        self.assertEqual(len(E), 100)
+        for secs, _offset in E:
+            P = next(index.iter_samples(self.path, (secs, 0)))
+            self.assertEqual(P.secondsintoyear, secs)
+
+        for T in [S[0], S[1], S[2], S[29], S[30], S[500], (S[500][0], 1), S[-1], (S[-1][0]+1, 0)]:
+            R = [(P.secondsintoyear, P.nano) for P in index.iter_samples(self.path, T)]
+            self.assertEqual(R, [X for X in S if X>=T])
+
+    def test_stale(self):
+        # the index of samples which were not written is ignored
+        with open(self.path, 'rb') as F:
+            data = F.read()
+        E = index.read_index(self.path)
+        with open(self.path, 'wb') as F:
+            F.write(data[:E[50][1]])
+        self.assertEqual(index.read_index(self.path, len(data[:E[50][1]])), E[:50])
+        S = [(P.secondsintoyear, P.nano) for P in index.iter_samples(self.path, (E[60][0], 0))]
+        self.assertEqual(S, [])
+
+class TestJournal(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(self.mktemp(), 'journal')
+
+    def test_replay(self):
+        J = journal.ExportJournal(self.path)
+        J.record('a', J.DONE)
+        J.record('b', J.ERROR)
+        J.record('c', J.DONE)
+        J.close()
+        with open(self.path, 'a') as F:
+            F.write('error c\ndone b\ndone d') # stopped while writing d
+
+        J = journal.ExportJournal(self.path)
+        self.assertEqual([pv for pv in 'abcd' if J.is_done(pv)], ['a', 'b'])
+        J.record('c', J.DONE)
+        J.close()
+
+        J = journal.ExportJournal(self.path)
+        self.assertEqual([pv for pv in 'abcd' if J.is_done(pv)], ['a', 'b', 'c'])
+        J.close()
+        with open(self.path) as F:
+            self.assertEqual(F.read().splitlines()[-3:], ['error c', 'done b', 'done c'])
+
+class FakeOpt(object):
+    export_no_default_delimiters, export_delimiter = False, None
+    export_granularity = '1day'
+    appliance_name, mysql_write_connected = None, None
+    start, end = None, None
+    export_journal = None
+    export_concurrent = 1
+    export_verify, export_index = False, 0
+    archive, chunk = ['*'], 1000
+
+class FakeArchive(object):
+    """Fails fetchraw() for the PVs in errors with the given exception
+    """
+    def __init__(self, errors):
+        self.errors, self.fetched = errors, []
+
+    def fetchraw(self, pv, callback, **kws):
+        self.fetched.append(pv)
+        if pv in self.errors:
+            return defer.fail(self.errors[pv])
+        V, M = _samples(1000, 1, np.dtype(np.float64))
+        callback(V[:10], M[:10], {'orig_type':3, 'reported_arr_size':1, 'the_meta':_meta})
+        return defer.succeed(len(M))
+
+class TestExportCmd(unittest.TestCase):
+    def setUp(self):
+        self.opt = FakeOpt()
+        self.opt.export_out_dir = self.mktemp()
+        self.opt.export_journal = os.path.join(self.opt.export_out_dir, 'journal')
+
+    def _journal(self):
+        with open(self.opt.export_journal) as F:
+            return sorted(F.read().splitlines())
+
+    @defer.inlineCallbacks
+    def test_skip(self):
+        self.opt.export_concurrent = 2
+        A = FakeArchive({'TST:b':exporter.SkipPvError('bad')})
+        R = yield pbrawexport.cmd(archive=A, opt=self.opt, args=['TST:a', 'TST:b', 'TST:c'])
+        self.assertEqual(R, 0)
+        self.assertEqual(A.fetched, ['TST:a', 'TST:b', 'TST:c'])
+        self.assertEqual(self._journal(), ['done TST:a', 'done TST:c', 'error TST:b'])
+        self.assertTrue(os.path.exists(os.path.join(self.opt.export_out_dir, 'TST', 'c:2014_12_31.pb')))
+
+    @defer.inlineCallbacks
+    def test_error(self):
+        A = FakeArchive({'TST:b':RuntimeError('oops')})
+        D = pbrawexport.cmd(archive=A, opt=self.opt, args=['TST:a', 'TST:b', 'TST:c'])
+        yield self.assertFailure(D, RuntimeError)
+        self.assertEqual(A.fetched, ['TST:a', 'TST:b']) # c not started
+        self.assertEqual(self._journal(), ['done TST:a'])
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright 2015 Brookhaven Science Assoc.
+ as operator of Brookhaven National Lab.
+"""
+
+import threading
+
+from twisted.trial import unittest
+
+from twisted.internet import defer, protocol
+from twisted.test import proto_helpers
+
+import numpy as np
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from .. import appl, procdecode
+from ..pbdecode import DecodeError
+from .test_appl import _data, _all_values, _all_metas
+from ... import util
+
+class TestProcDecode(unittest.TestCase):
+    timeout = 5
+
+    def setUp(self):
+        self.engine = procdecode.ProcessDecoder(2, slotsize=2**16)
+
+    def tearDown(self):
+        self.engine.close()
+
+    @defer.inlineCallbacks
+    def test_decode(self):
+        R = yield self.engine.decode('x', _data, len(_data), None)
+        chunks, header = R
+        self.assertIsNotNone(header)
+        self.assertEqual(len(chunks), 2)
+
+        V = np.concatenate([C[0] for C in chunks])
+        M = np.concatenate([C[1] for C in chunks])
+        assert_array_almost_equal(V, _all_values)
+        assert_array_equal(M['sec'], _all_metas['sec'])
+        assert_array_equal(M['ns'], _all_metas['ns'])
+        assert_array_equal(M['status'], _all_metas['status'])
+
+    @defer.inlineCallbacks
+    def test_limit(self):
+        chunks, _H = yield self.engine.decode('x', _data, len(_data), None, limit=5)
+        self.assertEqual(sum([len(M) for V,M in chunks]), 5)
+
+    @defer.inlineCallbacks
+    def test_overflow(self):
+        data = '\n'.join([_data]*1000)
+        R = yield self.engine.decode('x', data, len(data), None)
+        self.assertIsNone(R)
+
+    def test_error(self):
+        # invalid escape sequence
+        data = _data.split('\n')[0]+'\n\x1b\x09\n'
+        return self.assertFailure(self.engine.decode('x', data, len(data), None),
+                                  ValueError)
+
+    @defer.inlineCallbacks
+    def test_decodeerror(self):
+        def bad(*args):
+            raise DecodeError('bad sample')
+        self.patch(procdecode, '_decode', bad)
+        engine = procdecode.ProcessDecoder(1, slotsize=2**16) # forked with bad()
+        try:
+            yield self.assertFailure(engine.decode('x', _data, len(_data), None),
+                                     DecodeError)
+        finally:
+            engine.close()
+
+    def test_threads(self):
+        self.patch(procdecode, '_engine', None)
+        E = threading.Event()
+        T = threading.Thread(target=E.wait)
+        T.start()
+        try:
+            self.assertIsNone(procdecode.configure(1)) # not forked
+        finally:
+            E.set()
+            T.join()
+
+    @defer.inlineCallbacks
+    def test_receiver(self):
+        procdecode._engine, prev = self.engine, procdecode._engine
+        try:
+            # with a small buffer, the header is carried over between buffers.
+            # too large for the slot, falls back to thread.
+            for N, bufsize in [(1, 256), (10, 256), (100, 2**20)]:
+                data = '\n'.join([_data]*N)
+                A = util.Accumulator()
+                P = appl.PBReceiver(A, name='x', splitLines=False)
+                P.rx_buf_size = bufsize
+                P.makeConnection(proto_helpers.StringTransport())
+                for i in range(0, len(data), 100):
+                    P.dataReceived(data[i:i+100])
+                P.connectionLost(protocol.connectionDone)
+                C = yield P.defer
+                self.assertEqual(C, N*22)
+                assert_array_equal(A.metas['sec'][:22], _all_metas['sec'])
+        finally:
+            procdecode._engine = prev
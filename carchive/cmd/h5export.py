@@ -15,9 +15,9 @@ from twisted.internet import defer
 
 from carchive.date import makeTimeInterval, timeTuple
 from carchive.dtype import dbr_time
+from carchive.util import Accumulator
 
 def printData(data, meta, archive, info):
-    metaset = info.metaset
     assert len(meta)>0, 'Empty dataset'
     
     if not info.valset: # first data
@@ -28,21 +28,13 @@ def printData(data, meta, archive, info):
                                             shape = (0,0),
                                             dtype=data.dtype,
                                             maxshape=(None,None),
-                                            chunks=data.shape,
+                                            chunks=(info.chunk, data.shape[1]),
                                             shuffle=True,
                                             compression='gzip')
         info.valset = valset
     else: # additional data
         valset = info.valset
 
-    if metaset.shape[0]:
-        lastsamp = (metaset['sec'][-1], metaset['ns'][-1])
-        newstart = (meta['sec'][0], meta['ns'][0])  
-        
-        if(lastsamp >= newstart):
-            _log.info('Ignoring overlapping data. %s >= %s', lastsamp, newstart)
-            return  
-
     mstart = info.metaset.shape[0]
     info.metaset.resize((mstart+meta.shape[0],))
     
@@ -70,6 +62,31 @@ def printData(data, meta, archive, info):
 
     _log.debug("%s total samples for %s", valset.shape, info.pv)
 
+def bufferData(data, meta, archive, info):
+    """Combine small chunks before writing to HDF5
+
+    Samples not newer than the last one kept are dropped.
+    """
+    if info.last is not None:
+        sec, ns = info.last
+        keep = (meta['sec']>sec) | ((meta['sec']==sec) & (meta['ns']>ns))
+        if not keep.all():
+            _log.info('Ignoring %d overlapping samples. <= %s',
+                      len(keep)-keep.sum(), info.last)
+            data, meta = data[keep], meta[keep]
+            if len(meta)==0:
+                return
+
+    info.acc(data, meta)
+    info.last = (meta['sec'][-1], meta['ns'][-1])
+    if len(info.acc)>=info.flushsize:
+        flushData(archive, info)
+
+def flushData(archive, info):
+    if len(info.acc):
+        printData(info.acc.values, info.acc.metas, archive, info)
+        info.acc.clear()
+
 class printInfo(object):
     pass
 
@@ -132,17 +149,26 @@ def cmd(archive=None, opt=None, args=None, conf=None, **kws):
                                                shuffle=True,
                                                compression='gzip')
 
+        P.last = None
+        if P.metaset.shape[0]:
+            M = P.metaset[-1]
+            P.last = (M['sec'], M['ns'])
+
         P.valset = None
+        P.chunk = Chk
+        P.acc = Accumulator(capacity=Chk)
+        P.flushsize = 16*Chk
 
         print pv
-        D = archive.fetchraw(pv, printData, archs=archs,
+        D = archive.fetchraw(pv, bufferData, archs=archs,
                                    cbArgs=(archive, P),
                                    T0=T0, Tend=Tend,
                                    count=count, chunkSize=Chk,
                                    enumAsInt=opt.enumAsInt)
 
         @D.addCallback
-        def show(C, pv=pv):
+        def show(C, pv=pv, P=P):
+            flushData(archive, P)
             _log.info('%s received %s points', pv,C)
 
         Ds[i] = D
@@ -13,6 +13,7 @@ from carchive.backend.pb import last as pb_last
 from carchive.backend.pb import timestamp as pb_timestamp
 from carchive.backend.pb import pvlog as pb_pvlog
 from carchive.backend.pb import mysql as pb_mysql
+from carchive.backend.pb import journal as pb_journal
 import logging
 from logging import INFO
 
@@ -24,8 +25,6 @@ class PbExportError(Exception):
 
 @defer.inlineCallbacks
 def cmd(archive=None, opt=None, args=None, conf=None, **kws):
-    archs = opt.archive
-    
     # Get out dir.
     if opt.export_out_dir is None:
         raise PbExportError('Output directory not specified!')
@@ -70,52 +69,41 @@ def cmd(archive=None, opt=None, args=None, conf=None, **kws):
     # Print some info.
     _log.info('Will export data of these PVs: {0}'.format(', '.join(pvs)))
     
+    # Skip PVs which a previous run has exported.
+    journal = None
+    if opt.export_journal is not None:
+        journal = pb_journal.ExportJournal(opt.export_journal)
+        done = [pv for pv in pvs if journal.is_done(pv)]
+        if done:
+            _log.info('Skipping {0} PVs already exported according to the journal'.format(len(done)))
+            pvs = [pv for pv in pvs if not journal.is_done(pv)]
+    
     # Keep PV-specific logs.
-    pv_logs = []
+    pv_logs = [pb_pvlog.PvLog(pv) for pv in pvs]
     
     mysql_writer = pb_mysql.MySqlWriter(out_dir,appliance_name,delimiters,mysql_write_connected)
     
-    # Archive PVs one by one.
-    for pv in pvs:
-        _log.info('Exporting data for PV: {0}'.format(pv))
-        
-        # Create and remember a PvLog object.
-        pvlog = pb_pvlog.PvLog(pv)
-        pv_logs.append(pvlog)
-        
-        # Find the last sample timestamp for this PV.
-        # This is used as-is as a lower bound filter after the query.
-        last_timestamp = pb_last.find_last_sample_timestamp(pv, out_dir, gran, delimiters)
-        
-        pvlog.info('Last timestamp: {0}'.format(last_timestamp))
-        
-        # We don't want samples <=last_timestamp, we can't write those out.
-        # Due to conversion errors, we limit the query conservatively, and filter out any
-        # initial samples we get that we don't want.
-        if last_timestamp is not None:
-            low_limit_dt = pb_timestamp.pb_to_dt(*last_timestamp) - datetime.timedelta(seconds=1)
-            query_start_ca_t = max(start_ca_t, pb_timestamp.dt_to_carchive(low_limit_dt))
-        else:
-            query_start_ca_t = start_ca_t
-        
-        pvlog.info('Query low limit: {0}'.format(query_start_ca_t))
-        # Create exporter instance.
-        with pb_exporter.Exporter(pv, gran, out_dir, delimiters, last_timestamp, pvlog, mysql_writer) as the_exporter:
-            try:
-                # Ask for samples.
-                segment_data = yield archive.fetchraw(
-                    pv, the_exporter, archs=archs, cbArgs=(),
-                    T0=query_start_ca_t, Tend=end_ca_t, chunkSize=opt.chunk,
-                    enumAsInt=True, displayMeta=True, rawTimes=True
-                )
-            except pb_exporter.SkipPvError as e:
-                #report error and continue with the next PV
-                _log.error('PV ERROR: {0}: {1}'.format(pv, e))
-                pvlog.error(str(e))
-        #Write the pv info to mysql
-        mysql_writer.write_pv_info()
-        
+    # Archive several PVs at a time.
+    sem = defer.DeferredSemaphore(max(1, opt.export_concurrent))
+    errors = []
+    
+    def export(pv, pvlog):
+        # After an error, start no more PVs.
+        if errors:
+            return
+        D = export_pv(archive, opt, pv, pvlog, out_dir, gran, delimiters, start_ca_t, end_ca_t,
+                      mysql_writer, journal)
+        D.addErrback(errors.append)
+        return D
+    
+    yield defer.DeferredList([sem.run(export, pv, pvlog) for pv, pvlog in zip(pvs, pv_logs)])
+    
     mysql_writer.close()
+    if journal is not None:
+        journal.close()
+    if errors:
+        errors[0].raiseException()
+    
     _log.info('ALL DONE, REPORT FOLLOWS\n')
     
     # Print out logs.
@@ -125,6 +113,49 @@ def cmd(archive=None, opt=None, args=None, conf=None, **kws):
     
     defer.returnValue(0)
 
+@defer.inlineCallbacks
+def export_pv(archive, opt, pv, pvlog, out_dir, gran, delimiters, start_ca_t, end_ca_t,
+              mysql_writer, journal):
+    _log.info('Exporting data for PV: {0}'.format(pv))
+    
+    # Find the last sample timestamp for this PV.
+    # This is used as-is as a lower bound filter after the query.
+    last_timestamp = pb_last.find_last_sample_timestamp(pv, out_dir, gran, delimiters, opt.export_verify)
+    
+    pvlog.info('Last timestamp: {0}'.format(last_timestamp))
+    
+    # We don't want samples <=last_timestamp, we can't write those out.
+    # Due to conversion errors, we limit the query conservatively, and filter out any
+    # initial samples we get that we don't want.
+    if last_timestamp is not None:
+        low_limit_dt = pb_timestamp.pb_to_dt(*last_timestamp) - datetime.timedelta(seconds=1)
+        query_start_ca_t = max(start_ca_t, pb_timestamp.dt_to_carchive(low_limit_dt))
+    else:
+        query_start_ca_t = start_ca_t
+    
+    pvlog.info('Query low limit: {0}'.format(query_start_ca_t))
+    status = pb_journal.ExportJournal.DONE
+    # Create exporter instance.
+    with pb_exporter.Exporter(pv, gran, out_dir, delimiters, last_timestamp, pvlog, mysql_writer,
+                              opt.export_verify, opt.export_index) as the_exporter:
+        try:
+            # Ask for samples.
+            segment_data = yield archive.fetchraw(
+                pv, the_exporter, archs=opt.archive, cbArgs=(),
+                T0=query_start_ca_t, Tend=end_ca_t, chunkSize=opt.chunk,
+                enumAsInt=True, displayMeta=True, rawTimes=True
+            )
+        except pb_exporter.SkipPvError as e:
+            #report error and continue with the next PV
+            _log.error('PV ERROR: {0}: {1}'.format(pv, e))
+            pvlog.error(str(e))
+            status = pb_journal.ExportJournal.ERROR
+    #Write the pv info to mysql
+    mysql_writer.write_pv_info(pv)
+    
+    if journal is not None:
+        journal.record(pv, status)
+
 TIME_FORMATS = [
     "%Y-%m-%d %H:%M:%S.%f",
     "%Y-%m-%d %H:%M:%S",
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright 2015 Brookhaven Science Assoc.
+ as operator of Brookhaven National Lab.
+
+Client side index of PV names.
+
+Names are kept in a sorted list, so all names with a given prefix
+occupy a contiguous range which is found by bisection
+(a flattened prefix trie).  Regular expression searches
+test only the names in the range of the literal prefix of the pattern.
+"""
+
+import logging
+_log = logging.getLogger("carchive.nameindex")
+
+import re, time
+from bisect import bisect_left
+
+from twisted.internet import defer
+
+_special = '.^$*+?{}[]|()'
+
+def literalPrefix(pattern, anchored=False):
+    """Find the literal string which all matches of the given regular
+    expression must begin with.  If anchored=False then only
+    patterns beginning with '^' have a prefix.
+
+    >>> literalPrefix('^LN-AM\\\\{RadMon:1\\\\}DoseRate-I$')
+    'LN-AM{RadMon:1}DoseRate-I'
+    >>> literalPrefix('^SR:C0[1-3]-.*')
+    'SR:C0'
+    >>> literalPrefix('SR:C01')
+    ''
+    >>> literalPrefix('SR:C01', anchored=True)
+    'SR:C01'
+    >>> literalPrefix('^ab?c'), literalPrefix('^ab+c'), literalPrefix('^ab\\\\d')
+    ('a', 'ab', 'ab')
+    >>> literalPrefix('^ab|cd')
+    ''
+    """
+    if pattern.startswith('^'):
+        pattern = pattern[1:]
+    elif not anchored:
+        return ''
+    if '|' in pattern:
+        return '' # alternation
+
+    out, i = [], 0
+    while i<len(pattern):
+        C = pattern[i]
+        if C=='\\':
+            if i+1>=len(pattern) or pattern[i+1].isalnum():
+                break # eg. \d
+            C, N = pattern[i+1], 2
+        elif C in _special:
+            break
+        else:
+            N = 1
+
+        Q = pattern[i+N:i+N+1]
+        if Q and Q in '*?{':
+            break # this character is optional
+        out.append(C)
+        if Q=='+':
+            break
+        i += N
+
+    return ''.join(out)
+
+class NameIndex(object):
+    """Sorted list of names, each with some associated data.
+
+    >>> I = NameIndex([('B:1', 1), ('A:2', 2), ('A:1', 3)])
+    >>> I.search('^A:')
+    [('A:1', 3), ('A:2', 2)]
+    >>> I.search(':1')
+    [('A:1', 3), ('B:1', 1)]
+    >>> I.search('A:', full=True)
+    []
+    >>> I.update([('A:3', 4), ('A:1', 5)])
+    >>> I.search('^A:.*', full=True)
+    [('A:1', 5), ('A:2', 2), ('A:3', 4)]
+    >>> I.get('B:1'), I.get('B:2')
+    (1, None)
+    """
+    def __init__(self, items=(), clock=time.time):
+        items = sorted(items)
+        self.names = [N for N,_D in items]
+        self.data = [D for _N,D in items]
+        self.clock = clock
+        self.loaded = clock()
+
+    def __len__(self):
+        return len(self.names)
+
+    def age(self):
+        return self.clock()-self.loaded
+
+    def prefixRange(self, prefix):
+        """Range of indicies [lo, hi) of the names beginning with prefix
+        """
+        names = self.names
+        if not prefix:
+            return 0, len(names)
+        lo = bisect_left(names, prefix)
+        if ord(prefix[-1])<0x7f:
+            # first string after all those beginning with prefix
+            hi = bisect_left(names, prefix[:-1]+chr(ord(prefix[-1])+1), lo)
+        else:
+            hi = lo
+            while hi<len(names) and names[hi].startswith(prefix):
+                hi += 1
+        return lo, hi
+
+    def get(self, name, default=None):
+        i = bisect_left(self.names, name)
+        if i<len(self.names) and self.names[i]==name:
+            return self.data[i]
+        return default
+
+    def search(self, pattern, full=False):
+        """Returns a sorted list of (name, data) for names matching the
+        regular expression pattern.
+
+        If full=True then the pattern must match the entire name.
+        Otherwise it may match any part.
+        """
+        lo, hi = self.prefixRange(literalPrefix(pattern, anchored=full))
+        if full:
+            match = re.compile('(?:%s)\\Z'%pattern).match
+        else:
+            match = re.compile(pattern).search
+
+        names, data = self.names, self.data
+        return [(names[i], data[i]) for i in xrange(lo, hi) if match(names[i])]
+
+    def update(self, items):
+        """Add or replace entries
+        """
+        for N, D in items:
+            i = bisect_left(self.names, N)
+            if i<len(self.names) and self.names[i]==N:
+                self.data[i] = D
+            else:
+                self.names.insert(i, N)
+                self.data.insert(i, D)
+
+class IndexLoader(object):
+    """Holds a NameIndex which is (re)loaded when older than maxage.
+
+    load() must return a Deferred which fires with a new NameIndex.
+    Concurrent get() calls share a single load().
+    """
+    def __init__(self, load, maxage=600):
+        self.load, self.maxage = load, maxage
+        self.index, self._waiting = None, None
+
+    def get(self):
+        I = self.index
+        if I is not None and I.age()<self.maxage:
+            return defer.succeed(I)
+
+        D = defer.Deferred()
+        if self._waiting is None:
+            self._waiting = [D]
+            defer.maybeDeferred(self.load).addBoth(self._loaded)
+        else:
+            self._waiting.append(D)
+        return D
+
+    def _loaded(self, R):
+        W, self._waiting = self._waiting, None
+        if isinstance(R, NameIndex):
+            _log.debug("Loaded index of %d names", len(R))
+            self.index = R
+            for D in W:
+                D.callback(R)
+        else:
+            for D in W:
+                D.errback(R)
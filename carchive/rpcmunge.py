@@ -8,15 +8,23 @@ of non-standard HTTP servers.
 In particular handle headers with '\n' instead of '\n\r'
 which is perpetrated by xmlrpc-c
 
-Also implement throttling of the number of outstanding queries
+Also implement throttling of the number of outstanding queries,
+and incremental parsing of archiver.values responses
 """
 
 import logging
 _log = logging.getLogger("carchive.rpcmunge")
 
+import xmlrpclib, time
+from array import array
+from collections import OrderedDict, deque
+
+import numpy as np
+
 from twisted.internet import defer
+from twisted.python import failure
 
-#from twisted.web.http import HTTPClient
+from twisted.web.http import HTTPClient
 from twisted.web.xmlrpc import QueryProtocol, _QueryFactory, Proxy
 
 class NiceQueryProtocol(QueryProtocol):
@@ -46,42 +54,338 @@ class NiceQueryFactory(_QueryFactory):
     noisy = False
     protocol = NiceQueryProtocol
 
+_sample_keys = frozenset(['stat', 'sevr', 'secs', 'nano', 'value'])
+
+class SampleColumns(object):
+    """Compact storage for the list of sample structs in an
+    archiver.values response.
+
+    Each meta-data member, the number of elements of each sample,
+    and the concatenated elements are held in arrays.
+    Indexing gives back a sample struct.
+
+    >>> S = SampleColumns()
+    >>> S.append({'stat':0, 'sevr':0, 'secs':10, 'nano':5, 'value':[1.5, 2.5]})
+    >>> S.append({'stat':1, 'sevr':2, 'secs':11, 'nano':6, 'value':[3.5]})
+    >>> len(S)
+    2
+    >>> S[-1] == {'stat':1, 'sevr':2, 'secs':11, 'nano':6, 'value':[3.5]}
+    True
+    >>> S.columns()[1]
+    array([1.5, 2.5, 3.5])
+    """
+    def __init__(self):
+        self.stat, self.sevr = array('I'), array('I')
+        self.secs, self.nano = array('I'), array('I')
+        self.lengths = array('I')
+        self.elements = None # type determined by the first sample
+
+    def __len__(self):
+        return len(self.secs)
+
+    def append(self, S):
+        V = S['value']
+        if self.elements is None:
+            if len(V)==0:
+                pass
+            elif isinstance(V[0], float):
+                self.elements = array('d')
+            elif isinstance(V[0], int):
+                self.elements = array('l')
+            else:
+                self.elements = []
+        elif self.elements.__class__ is array and self.elements.typecode=='l' \
+                and any(isinstance(E, float) for E in V):
+            self.elements = array('d', self.elements)
+
+        self.stat.append(S['stat'])
+        self.sevr.append(S['sevr'])
+        self.secs.append(S['secs'])
+        self.nano.append(S['nano'])
+        self.lengths.append(len(V))
+        if len(V):
+            self.elements.extend(V)
+
+    def __getitem__(self, i):
+        if i<0:
+            i += len(self)
+        if i<0 or i>=len(self):
+            raise IndexError(i)
+        E = self.elements
+        start = (len(E) if E is not None else 0) - sum(self.lengths[i:])
+        return {'stat':self.stat[i], 'sevr':self.sevr[i],
+                'secs':self.secs[i], 'nano':self.nano[i],
+                'value':list(E[start:start+self.lengths[i]]) if E is not None else []}
+
+    def columns(self):
+        """Returns a tuple (lengths, elements, (sevr, stat, secs, nano))
+        of numpy arrays.
+        """
+        def conv(A):
+            return np.frombuffer(A, dtype=A.typecode) if len(A) else np.zeros(0, dtype=A.typecode)
+        E = self.elements
+        if E is None:
+            E = np.zeros(0)
+        elif isinstance(E, list):
+            E = np.asarray(E)
+        else:
+            E = conv(E)
+        return conv(self.lengths), E, tuple(map(conv, (self.sevr, self.stat, self.secs, self.nano)))
+
+class ValuesUnmarshaller(xmlrpclib.Unmarshaller):
+    """Unmarshaller which stores sample structs in a SampleColumns
+    as each is completed, instead of building a list of dictionaries.
+    """
+    def __init__(self, *args, **kws):
+        xmlrpclib.Unmarshaller.__init__(self, *args, **kws)
+        self._columns = {} # {array mark:SampleColumns}
+
+    dispatch = xmlrpclib.Unmarshaller.dispatch.copy()
+
+    def end_struct(self, data):
+        mark = self._marks[-1]
+        items = self._stack[mark:]
+        if len(items)!=10 or frozenset(items[0::2])!=_sample_keys or len(self._marks)<2:
+            return xmlrpclib.Unmarshaller.end_struct(self, data)
+
+        # a sample in the values array
+        self._marks.pop()
+        C = self._columns.get(self._marks[-1])
+        if C is None:
+            C = self._columns[self._marks[-1]] = SampleColumns()
+        C.append(dict(zip(items[0::2], items[1::2])))
+        del self._stack[mark:]
+        self._value = 0
+    dispatch["struct"] = end_struct
+
+    def end_array(self, data):
+        C = self._columns.pop(self._marks[-1], None)
+        if C is None:
+            return xmlrpclib.Unmarshaller.end_array(self, data)
+        mark = self._marks.pop()
+        assert len(self._stack)==mark, "Samples mixed with other values"
+        self._stack.append(C)
+        self._value = 0
+    dispatch["array"] = end_array
+
+class ValuesQueryProtocol(NiceQueryProtocol):
+    """Parse the response body as it arrives, instead of buffering it.
+    """
+    def connectionMade(self):
+        NiceQueryProtocol.connectionMade(self)
+        self._target = ValuesUnmarshaller(use_datetime=self.factory.useDateTime)
+        self._parser = xmlrpclib.ExpatParser(self._target)
+        self._error = None
+
+    def handleResponsePart(self, data):
+        if self._error is None:
+            try:
+                self._parser.feed(data)
+            except:
+                self._error = failure.Failure()
+
+    def handleResponse(self, contents):
+        self.transport.loseConnection()
+        self._response = contents # always empty
+
+    def connectionLost(self, reason):
+        HTTPClient.connectionLost(self, reason)
+        if self._response is not None:
+            self._response = None
+            self.factory.parseStream(self._parser, self._target, self._error)
+
+class StreamQueryFactory(NiceQueryFactory):
+    """Parse archiver.values responses with ValuesQueryProtocol.
+    The 'values' member of each PV is then a SampleColumns.
+    """
+    def __init__(self, path, host, method, *args, **kws):
+        NiceQueryFactory.__init__(self, path, host, method, *args, **kws)
+        if method=='archiver.values':
+            self.protocol = ValuesQueryProtocol
+
+    def parseStream(self, parser, target, error):
+        if not self.deferred:
+            return
+        try:
+            if error is not None:
+                error.raiseException()
+            parser.close()
+            response = target.close()[0]
+        except:
+            deferred, self.deferred = self.deferred, None
+            deferred.errback(failure.Failure())
+        else:
+            deferred, self.deferred = self.deferred, None
+            deferred.callback(response)
+
+class _MethodQueue(object):
+    """Requests waiting for one method, with a FIFO for each caller.
+    """
+    def __init__(self, method, weight):
+        self.method, self.weight = method, weight
+        self.deficit = 0.0
+        self._callers = OrderedDict() # caller -> deque
+        self.depth = 0
+        self.served, self.waited, self.maxwait = 0, 0.0, 0.0
+
+    def push(self, caller, item):
+        try:
+            self._callers[caller].append(item)
+        except KeyError:
+            self._callers[caller] = deque([item])
+        self.depth += 1
+
+    def pop(self):
+        # next caller in round robin order
+        caller = next(iter(self._callers))
+        Q = self._callers.pop(caller)
+        item = Q.popleft()
+        if Q:
+            self._callers[caller] = Q # back of the line
+        self.depth -= 1
+        return item
+
+class RequestScheduler(object):
+    """Orders requests waiting to be sent.
+
+    Each method has its own queue.  Queues are served in proportion
+    to their weight (deficit round robin), so cheap requests are not
+    stuck behind many expensive ones.  Within a queue, each caller
+    has its own FIFO, and callers are served round robin.
+
+    >>> S = RequestScheduler({'values':1}, defweight=2, clock=lambda:0)
+    >>> for i in range(3):
+    ...     S.push('values', 'arget', 'V%d'%i)
+    >>> S.push('values', 'user', 'U0')
+    >>> for i in range(3):
+    ...     S.push('names', None, 'N%d'%i)
+    >>> [S.pop() for i in range(7)]
+    ['V0', 'N0', 'N1', 'U0', 'N2', 'V1', 'V2']
+    >>> S.push('values', None, 'V3')
+    >>> S.push('names', None, 'N3')
+    >>> S.pop(lambda M:M=='names'), S.pop(lambda M:M=='names'), len(S)
+    ('N3', None, 1)
+    """
+    def __init__(self, weights=None, defweight=1, clock=time.time):
+        self.weights, self.defweight = weights or {}, defweight
+        self.clock = clock
+        self._queues = {} # method -> _MethodQueue
+        self._active = deque() # _MethodQueue with waiting requests
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def push(self, method, caller, item):
+        try:
+            Q = self._queues[method]
+        except KeyError:
+            Q = self._queues[method] = _MethodQueue(method,
+                                            self.weights.get(method, self.defweight))
+        if not Q.depth:
+            self._active.append(Q)
+        Q.push(caller, (self.clock(), item))
+        self._len += 1
+
+    def pop(self, allowed=None):
+        """Remove and return the next request for which allowed(method)
+        is True.  Returns None if there are none.
+        """
+        A = self._active
+        visited, eligible = 0, False
+        while A:
+            if visited==len(A):
+                if not eligible:
+                    return None
+                visited, eligible = 0, False
+
+            Q = A[0]
+            if allowed is None or allowed(Q.method):
+                eligible = True
+                if Q.deficit<1.0:
+                    Q.deficit += Q.weight
+
+                if Q.deficit>=1.0:
+                    Q.deficit -= 1.0
+                    T0, item = Q.pop()
+                    self._len -= 1
+                    wait = self.clock()-T0
+                    Q.served += 1
+                    Q.waited += wait
+                    Q.maxwait = max(Q.maxwait, wait)
+                    if not Q.depth:
+                        Q.deficit = 0.0
+                        A.popleft()
+                    elif Q.deficit<1.0:
+                        A.rotate(-1)
+                    return item
+
+            A.rotate(-1)
+            visited += 1
+        return None
+
+    def report(self):
+        """Queue depth and wait times as a list of lines of text
+        """
+        L = ['%-20s %6s %6s %8s %10s %10s'%('Method', 'weight', 'depth',
+                                            'served', 'avg wait', 'max wait')]
+        for M, Q in sorted(self._queues.items()):
+            L.append('%-20s %6g %6d %8d %10.3f %10.3f'%(M, Q.weight, Q.depth, Q.served,
+                     Q.waited/Q.served if Q.served else 0, Q.maxwait))
+        return L
+
 class NiceProxy(Proxy):
+    """Proxy which limits the number of requests in progress.
+
+    At most 'limit' archiver.values requests, or 'qlimit' requests
+    of other methods, may be in progress.  Further requests wait
+    in a RequestScheduler, with other methods given 'weight' times the
+    share of archiver.values.  Callers identified with the 'caller'
+    keyword argument of callRemote() are served fairly.
+    """
     queryFactory = NiceQueryFactory
 
     def __init__(self, *args, **kws):
         self.__limit = kws.pop('limit', 10)
         self.__qlimit = kws.pop('qlimit', 10)
+        W = kws.pop('weight', 4)
+        if kws.pop('stream', False):
+            self.queryFactory = StreamQueryFactory
         Proxy.__init__(self, *args, **kws)
         self.__inprog = 0
-        self.__waiting = []
+        self.scheduler = RequestScheduler({'archiver.values':1}, defweight=W)
+
+    def __allowed(self, method):
+        if method=='archiver.values':
+            return self.__inprog<self.__limit
+        return self.__inprog<self.__qlimit
 
-    def callRemote(self, *args):
-        lim = self.__limit
-        if args[0]!='archiver.values':
-            lim = self.__qlimit
-        if self.__inprog<lim:
+    def callRemote(self, *args, **kws):
+        caller = kws.pop('caller', None)
+        if self.__allowed(args[0]):
             _log.debug("Immedate request execution: %s", args)
-            D = Proxy.callRemote(self, *args)
-            D.addBoth(self.__complete)
-            self.__inprog += 1
-            return D
+            return self.__start(args)
 
         _log.debug("Delay request until later: %s", args)
         D = defer.Deferred()
-        self.__waiting.append((D,args))
+        self.scheduler.push(args[0], caller, (D,args))
+        return D
+
+    def __start(self, args):
+        D = Proxy.callRemote(self, *args)
+        D.addBoth(self.__complete)
+        self.__inprog += 1
         return D
 
     def __complete(self, R):
         self.__inprog -= 1
-        if len(self.__waiting):
-            D, args = self.__waiting.pop(0)
+        while True:
+            W = self.scheduler.pop(self.__allowed)
+            if W is None:
+                break
+            D, args = W
             _log.debug("Delayed request now executing: %s", args)
-            D2 = Proxy.callRemote(self, *args)
-            D2.addBoth(self.__complete)
-            D2.chainDeferred(D)
-            self.__inprog += 1
-        else:
-            _log.debug("No delayed requests pending. %d requesting in progress",
-                       self.__inprog)
+            self.__start(args).chainDeferred(D)
+        _log.debug("%d requests in progress, %d waiting",
+                   self.__inprog, len(self.scheduler))
         return R
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright 2015 Brookhaven Science Assoc.
+ as operator of Brookhaven National Lab.
+
+On-disk cache of retrieved raw samples.
+
+Samples are stored as blocks (segments) covering a time range [T0, Tend)
+of one PV.  Each segment is a .npz file holding the values and dbr_time
+arrays of all samples in that range, preceded by the last sample
+before T0 (if any).
+
+Requests are split into pieces which are either covered by a segment,
+or fetched from the archiver and then stored as new segments.
+Samples of a long piece are stored as they arrive, in segments of
+at most about 'segsamples' samples.
+
+Time ranges later than 'holdoff' seconds before now are never stored
+as recent data may still be arriving.
+
+The total size of the cache is limited by removing the least recently
+used segments.  The total is found by scanning the cache directory once,
+then kept up to date as segments are stored.
+"""
+
+import logging
+_log = logging.getLogger("carchive.segcache")
+
+import os, time, hashlib, tempfile
+
+import numpy as np
+
+from twisted.internet import defer
+
+from .dtype import dbr_time
+from .util import Accumulator
+
+def _ns(T):
+    """(sec, nsec) -> nanoseconds
+    """
+    return T[0]*1000000000 + T[1]
+
+def _tuple(T):
+    return divmod(T, 1000000000)
+
+def _times(M):
+    return M['sec'].astype(np.int64)*1000000000 + M['ns']
+
+def fromConf(conf):
+    """Create a SegmentCache if configured.  Otherwise return None
+    """
+    D = conf.get('cachedir')
+    if not D:
+        return None
+    return SegmentCache(os.path.expanduser(D),
+                        maxsize=conf.getint('cachesize', 1024)*2**20,
+                        holdoff=conf.getint('cacheholdoff', 3600),
+                        segsamples=conf.getint('cachesegment', 100000))
+
+class SegmentCache(object):
+    def __init__(self, path, maxsize=2**30, holdoff=3600, segsamples=100000):
+        self.path, self.maxsize, self.holdoff = path, maxsize, holdoff
+        self.segsamples = segsamples
+        self._size = None # total size of segments, found when first needed
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+    def _pvdir(self, key):
+        return os.path.join(self.path, hashlib.sha1(key).hexdigest())
+
+    def segments(self, key):
+        """List of the segments (T0, Tend, filename) for key,
+        sorted by start time.  Times in nanoseconds.
+        """
+        D = self._pvdir(key)
+        try:
+            names = os.listdir(D)
+        except OSError:
+            return []
+        segs = []
+        for N in names:
+            B, ext = os.path.splitext(N)
+            if ext!='.npz':
+                continue
+            try:
+                T0, Tend = map(int, B.split('-'))
+            except ValueError:
+                continue
+            segs.append((T0, Tend, os.path.join(D, N)))
+        segs.sort()
+        return segs
+
+    def plan(self, key, T0, Tend):
+        """Split [T0, Tend) (nanoseconds) into a list of pieces (T0, Tend, filename)
+        where filename is None for pieces which are not cached.
+
+        >>> C = SegmentCache.__new__(SegmentCache)
+        >>> C.segments = lambda key: [(10, 20, 'a'), (30, 40, 'b'), (40, 50, 'c')]
+        >>> C.plan('x', 0, 100)
+        [(0, 10, None), (10, 20, 'a'), (20, 30, None), (30, 40, 'b'), (40, 50, 'c'), (50, 100, None)]
+        >>> C.plan('x', 15, 35)
+        [(15, 20, 'a'), (20, 30, None), (30, 35, 'b')]
+        >>> C.plan('x', 21, 29)
+        [(21, 29, None)]
+        """
+        pieces, cur = [], T0
+        for S, E, F in self.segments(key):
+            if E<=cur:
+                continue
+            elif S>=Tend:
+                break
+            if S>cur:
+                pieces.append((cur, S, None))
+                cur = S
+            E = min(E, Tend)
+            pieces.append((cur, E, F))
+            cur = E
+        if cur<Tend:
+            pieces.append((cur, Tend, None))
+        return pieces
+
+    def load(self, filename):
+        with open(filename, 'rb') as F:
+            Z = np.load(F)
+            V, M = Z['values'], Z['meta']
+        os.utime(filename, None) # mark as recently used
+        return V, M
+
+    def store(self, key, T0, Tend, V, M):
+        """Store samples as the segment [T0, Tend).
+        """
+        D = self._pvdir(key)
+        if not os.path.isdir(D):
+            os.makedirs(D)
+            with open(os.path.join(D, 'key'), 'w') as F:
+                F.write(key)
+
+        fd, tmp = tempfile.mkstemp(dir=D, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as F:
+            np.savez(F, values=V, meta=M)
+        name = os.path.join(D, '%d-%d.npz'%(T0, Tend))
+        if self._size is not None:
+            self._size += os.stat(tmp).st_size
+            if os.path.exists(name):
+                self._size -= os.stat(name).st_size
+        os.rename(tmp, name)
+
+        self.evict()
+
+    def evict(self):
+        """Remove least recently used segments until the cache is
+        smaller than maxsize.
+
+        The cache directory is scanned only when the running total
+        is unknown or too large.
+        """
+        if self._size is not None and self._size<=self.maxsize:
+            return
+
+        files, total = [], 0
+        for D in os.listdir(self.path):
+            D = os.path.join(self.path, D)
+            if not os.path.isdir(D):
+                continue
+            for N in os.listdir(D):
+                if N.endswith('.npz'):
+                    N = os.path.join(D, N)
+                    S = os.stat(N)
+                    files.append((S.st_mtime, S.st_size, N))
+                    total += S.st_size
+
+        files.sort()
+        while total>self.maxsize and files:
+            _T, size, N = files.pop(0)
+            _log.debug("Evict %s", N)
+            try:
+                os.remove(N)
+            except OSError:
+                pass
+            total -= size
+
+        self._size = total
+
+    @defer.inlineCallbacks
+    def fetch(self, key, fetch, callback, cbArgs=(), cbKWs={},
+              T0=None, Tend=None, chunkSize=None):
+        """Fetch samples of key in [T0, Tend) using the cache where possible.
+
+        fetch(cb, T0, Tend) is called to request samples for the
+        pieces which are not cached, and must return a Deferred.
+        Times are (sec, nsec) tuples.
+
+        As with an uncached request, the last sample before T0 is included.
+        Returns the number of samples passed to the callback.
+        """
+        T0, Tend = _ns(T0), _ns(Tend)
+        cutoff = int(time.time()-self.holdoff)*1000000000
+        chunkSize = chunkSize or 1000
+        N = [0]
+
+        def deliver(V, M):
+            N[0] += len(M)
+            return callback(V, M, *cbArgs, **cbKWs)
+
+        pieces = self.plan(key, T0, Tend)
+        for i,(A, B, F) in enumerate(pieces):
+            first, last = i==0, i==len(pieces)-1
+
+            if F is not None:
+                try:
+                    V, M = self.load(F)
+                except (IOError, OSError, ValueError, KeyError):
+                    _log.exception("Can't read %s", F)
+                    F = None
+                else:
+                    _log.debug("%s [%d, %d) from cache", key, A, B)
+                    T = _times(M)
+                    start = np.searchsorted(T, A, side='left')
+                    if first and start>0:
+                        start -= 1 # include previous sample
+                    end = np.searchsorted(T, B, side='left')
+
+                    for j in range(start, end, chunkSize):
+                        E = min(j+chunkSize, end)
+                        yield defer.maybeDeferred(deliver, V[j:E], M[j:E])
+
+            if F is None:
+                _log.debug("%s [%d, %d) from archiver", key, A, B)
+                # samples of the segment [start, ...) not yet stored,
+                # none if the piece is too recent to store
+                stop = min(B, cutoff)
+                seg = {'acc':Accumulator() if stop>A else None, 'start':A}
+
+                def rx(V, M, A=A, B=B, first=first, last=last, seg=seg, stop=stop):
+                    if seg['acc'] is not None:
+                        seg['acc'](V, M)
+                        if len(seg['acc'])>=self.segsamples:
+                            self._storePart(key, seg, stop)
+                    T = _times(M)
+                    sel = np.ones(len(M), dtype=np.bool)
+                    if not first:
+                        sel &= T>=A # previous sample is already delivered
+                    if not last:
+                        sel &= T<B
+                    if not sel.all():
+                        V, M = V[sel], M[sel]
+                    if len(M):
+                        return deliver(V, M)
+
+                yield fetch(rx, _tuple(A), _tuple(B))
+
+                if seg['acc'] is not None and stop>seg['start']:
+                    V, M = seg['acc'].values, seg['acc'].metas
+                    if V is None:
+                        # remember that there is no data
+                        V, M = np.zeros((0,1)), np.zeros(0, dtype=dbr_time)
+                    self._storeBefore(key, seg['start'], stop, V, M)
+
+        defer.returnValue(N[0])
+
+    def _storeBefore(self, key, T0, Tend, V, M):
+        sel = _times(M)<Tend
+        try:
+            self.store(key, T0, Tend, V[sel], M[sel])
+        except (IOError, OSError):
+            _log.exception("Can't store %s", key)
+
+    def _storePart(self, key, seg, stop):
+        """Store the samples received so far as the segment [start, E)
+        where E is the time of the last sample received, and keep
+        only those needed for the following segment.
+        """
+        acc = seg['acc']
+        V, M = acc.values, acc.metas
+        T = _times(M)
+        E = min(T[-1], stop)
+        if E<=seg['start']:
+            if E>=stop:
+                seg['acc'] = None # nothing will be stored
+            return # all at the same time as the start
+
+        self._storeBefore(key, seg['start'], E, V, M)
+
+        if E>=stop:
+            seg['acc'] = None # nothing more will be stored
+        else:
+            # the next segment begins with the last sample before E
+            i = max(0, np.searchsorted(T, E, side='left')-1)
+            seg['acc'] = Accumulator()
+            seg['acc'](V[i:], M[i:])
+        seg['start'] = E
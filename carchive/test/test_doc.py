@@ -3,6 +3,8 @@ Copyright 2015 Brookhaven Science Assoc.
  as operator of Brookhaven National Lab.
 """
 
-from .. import date, util, _conf
+from .. import date, util, _conf, rpcmunge, segcache, nameindex
+from ..backend import appl, classic, decodepool
+from ..a2aproxy import plotcache
 
-__doctests__ = [date, util, _conf]
+__doctests__ = [date, util, _conf, rpcmunge, segcache, nameindex, appl, classic, decodepool, plotcache]
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright 2015 Brookhaven Science Assoc.
+ as operator of Brookhaven National Lab.
+"""
+
+import xmlrpclib
+
+from twisted.internet import defer, protocol
+from twisted.trial import unittest
+from twisted.test import proto_helpers
+
+from numpy.testing import assert_array_equal
+
+from .. import rpcmunge
+from ..backend import classic
+
+def _sample(S, V):
+    return {'stat':0, 'sevr':S%3, 'secs':1000+S, 'nano':S, 'value':V}
+
+_result = [{
+    'name':'pv:wave',
+    'meta':{'type':1, 'disp_high':10.0, 'disp_low':0.0, 'alarm_high':0.0,
+            'alarm_low':0.0, 'warn_high':0.0, 'warn_low':0.0, 'prec':2,
+            'units':'mm'},
+    'type':3,
+    'count':3,
+    'values':[_sample(i, [float(i)]*(1+i%3)) for i in range(10)],
+}]
+
+class TestStreamParse(unittest.TestCase):
+    def _parse(self, body, step=7):
+        T = rpcmunge.ValuesUnmarshaller()
+        P = xmlrpclib.ExpatParser(T)
+        for i in range(0, len(body), step):
+            P.feed(body[i:i+step])
+        P.close()
+        return T.close()[0]
+
+    def test_values(self):
+        body = xmlrpclib.dumps((_result,), methodresponse=True)
+        R = self._parse(body)
+        self.assertEqual(len(R), 1)
+        self.assertEqual(R[0]['name'], 'pv:wave')
+        self.assertEqual(R[0]['meta'], _result[0]['meta'])
+
+        C = R[0]['values']
+        self.assertTrue(isinstance(C, rpcmunge.SampleColumns))
+        self.assertEqual(len(C), 10)
+        self.assertEqual(C[-1], _result[0]['values'][-1])
+
+        V1, M1 = classic._xml2numpy(C, classic._dtypes[3])
+        V2, M2 = classic._xml2numpy(_result[0]['values'], classic._dtypes[3])
+        assert_array_equal(V1, V2)
+        assert_array_equal(M1, M2)
+
+    def test_empty(self):
+        R = dict(_result[0], values=[])
+        body = xmlrpclib.dumps(([R],), methodresponse=True)
+        self.assertEqual(self._parse(body)[0]['values'], [])
+
+    def test_fault(self):
+        body = xmlrpclib.dumps(xmlrpclib.Fault(-600, 'bad'), methodresponse=True)
+        self.assertRaises(xmlrpclib.Fault, self._parse, body)
+
+class TestStreamProtocol(unittest.TestCase):
+    def _request(self, status, body):
+        F = rpcmunge.StreamQueryFactory('/', 'localhost', 'archiver.values',
+                                        args=(1, ['pv:wave'], 0, 0, 0, 0, 10, 0))
+        D, P = F.deferred, F.buildProtocol(None)
+        self.assertTrue(isinstance(P, rpcmunge.ValuesQueryProtocol))
+        P.makeConnection(proto_helpers.StringTransport())
+
+        msg = 'HTTP/1.1 %s\r\nContent-Length: %d\r\n\r\n%s'%(status, len(body), body)
+        for i in range(0, len(msg), 13):
+            P.dataReceived(msg[i:i+13])
+        P.connectionLost(protocol.connectionDone)
+        return D
+
+    @defer.inlineCallbacks
+    def test_values(self):
+        body = xmlrpclib.dumps((_result,), methodresponse=True)
+        R = yield self._request('200 OK', body)
+        self.assertEqual(len(R[0]['values']), 10)
+
+    def test_fault(self):
+        body = xmlrpclib.dumps(xmlrpclib.Fault(-600, 'bad'), methodresponse=True)
+        return self.assertFailure(self._request('200 OK', body), xmlrpclib.Fault)
+
+    def test_badxml(self):
+        return self.assertFailure(self._request('200 OK', '<methodResponse><params'),
+                                  Exception)
+
+class TestNiceProxy(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        def callRemote(proxy, *args):
+            D = defer.Deferred()
+            self.calls.append((args, D))
+            return D
+        self.patch(rpcmunge.Proxy, 'callRemote', callRemote)
+        self.P = rpcmunge.NiceProxy('http://localhost/', limit=1, qlimit=2)
+
+    @defer.inlineCallbacks
+    def test_limits(self):
+        Ds = [self.P.callRemote('archiver.values', 1, caller='a'),
+              self.P.callRemote('archiver.values', 2, caller='a'),
+              self.P.callRemote('archiver.values', 3, caller='a'),
+              self.P.callRemote('archiver.values', 4, caller='b'),
+              self.P.callRemote('archiver.names', 5),
+              self.P.callRemote('archiver.names', 6)]
+        # one values, one other
+        self.assertEqual([A[1] for A,_D in self.calls], [1, 5])
+        self.assertEqual(len(self.P.scheduler), 4)
+
+        # names is next, then b is not stuck behind all of a
+        for i in range(6):
+            self.calls[i][1].callback(i)
+        self.assertEqual([A[1] for A,_D in self.calls], [1, 5, 6, 2, 4, 3])
+        self.assertEqual(len(self.P.scheduler), 0)
+
+        R = yield defer.gatherResults(Ds)
+        self.assertEqual(R, [0, 3, 5, 4, 1, 2])
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+Copyright 2015 Brookhaven Science Assoc.
+ as operator of Brookhaven National Lab.
+"""
+
+import os, time
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from twisted.internet import defer
+from twisted.trial import unittest
+
+from ..dtype import dbr_time
+from .. import segcache
+
+# one sample every 10 seconds, starting an hour ago
+_secs = np.arange(1000)*10 + int(time.time()) - 10*3600
+
+class FakeSource(object):
+    """Like the archiver, also returns the last sample before T0
+    """
+    def __init__(self):
+        self.calls = []
+    def __call__(self, cb, T0, Tend):
+        self.calls.append((T0[0], Tend[0]))
+        i = max(0, np.searchsorted(_secs, T0[0], side='left')-1)
+        j = np.searchsorted(_secs, Tend[0], side='left')
+        M = np.zeros(j-i, dtype=dbr_time)
+        M['sec'] = _secs[i:j]
+        V = M['sec'].astype(np.float64).reshape((-1,1))
+        for k in range(0, len(M), 7):
+            cb(V[k:k+7], M[k:k+7])
+        return defer.succeed(len(M))
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        self.C = segcache.SegmentCache(self.mktemp(), holdoff=0)
+        self.S = FakeSource()
+
+    @defer.inlineCallbacks
+    def fetch(self, T0, Tend):
+        data = []
+        N = yield self.C.fetch('pv', self.S, lambda V,M:data.append(M['sec']),
+                               T0=(T0,0), Tend=(Tend,0), chunkSize=5)
+        data = np.concatenate(data) if data else np.zeros(0)
+        self.assertEqual(N, len(data))
+        defer.returnValue(list(data))
+
+    @defer.inlineCallbacks
+    def test_fetch(self):
+        T0, T1 = _secs[100]+5, _secs[200]+5
+        expect = list(_secs[100:201])
+
+        R = yield self.fetch(T0, T1)
+        self.assertEqual(R, expect)
+        self.assertEqual(len(self.S.calls), 1)
+
+        # now cached
+        R = yield self.fetch(T0, T1)
+        self.assertEqual(R, expect)
+        self.assertEqual(len(self.S.calls), 1)
+
+        # sub-range is cached
+        R = yield self.fetch(_secs[150], _secs[160])
+        self.assertEqual(R, list(_secs[149:160]))
+        self.assertEqual(len(self.S.calls), 1)
+
+        # only fetch the missing ends
+        R = yield self.fetch(_secs[50]+5, _secs[250]+5)
+        self.assertEqual(R, list(_secs[50:251]))
+        self.assertEqual(self.S.calls[1:], [(_secs[50]+5, T0), (T1, _secs[250]+5)])
+
+        R = yield self.fetch(_secs[40]+5, _secs[260]+5)
+        self.assertEqual(R, list(_secs[40:261]))
+        self.assertEqual(len(self.S.calls), 5)
+
+    @defer.inlineCallbacks
+    def test_holdoff(self):
+        self.C.holdoff = 8*3600
+        self.C.segsamples = 5
+        parts = []
+        storePart = self.C._storePart
+        def countPart(*args):
+            parts.append(args)
+            storePart(*args)
+        self.C._storePart = countPart
+
+        R = yield self.fetch(_secs[-100], _secs[-1]+1)
+        self.assertEqual(R, list(_secs[-101:]))
+        # nothing stored, or kept to be stored
+        self.assertEqual(self.C.segments('pv'), [])
+        self.assertEqual(parts, [])
+
+    @defer.inlineCallbacks
+    def test_evict(self):
+        yield self.fetch(_secs[100], _secs[200])
+        yield self.fetch(_secs[300], _secs[400])
+        segs = self.C.segments('pv')
+        self.assertEqual(len(segs), 2)
+
+        # make the first most recently used
+        os.utime(segs[1][2], (1, 1))
+        self.C.maxsize = os.stat(segs[0][2]).st_size
+        self.C.evict()
+        self.assertEqual(self.C.segments('pv'), segs[:1])
+
+    @defer.inlineCallbacks
+    def test_segments(self):
+        # stored while arriving, in segments of about 20 samples
+        self.C.segsamples = 20
+        T0, T1 = _secs[100]+5, _secs[200]+5
+        R = yield self.fetch(T0, T1)
+        self.assertEqual(R, list(_secs[100:201]))
+
+        segs = self.C.segments('pv')
+        self.assertTrue(len(segs)>3, segs)
+        self.assertEqual(segs[0][0], T0*1000000000)
+        self.assertEqual(segs[-1][1], T1*1000000000)
+        for (_S, E, _F), (S, _E, _F2) in zip(segs[:-1], segs[1:]):
+            self.assertEqual(E, S)
+        for _S, _E, F in segs:
+            self.assertTrue(len(self.C.load(F)[1])<=27)
+
+        # segment boundaries are invisible
+        R = yield self.fetch(_secs[130]+5, _secs[170]+5)
+        self.assertEqual(R, list(_secs[130:171]))
+        R = yield self.fetch(T0, T1)
+        self.assertEqual(R, list(_secs[100:201]))
+        self.assertEqual(len(self.S.calls), 1)
+
+    @defer.inlineCallbacks
+    def test_size(self):
+        yield self.fetch(_secs[100], _secs[200])
+        yield self.fetch(_secs[300], _secs[400])
+        total = sum(os.stat(F).st_size for _S, _E, F in self.C.segments('pv'))
+        self.assertEqual(self.C._size, total)
+
+        # the directory isn't scanned again while the total is below maxsize
+        listdir, segcache.os.listdir = segcache.os.listdir, None
+        try:
+            self.C.evict()
+        finally:
+            segcache.os.listdir = listdir
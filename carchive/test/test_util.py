@@ -4,6 +4,8 @@ Copyright 2015 Brookhaven Science Assoc.
  as operator of Brookhaven National Lab.
 """
 
+import numpy
+
 from twisted.internet import defer, error, protocol
 from twisted.trial import unittest
 from twisted.test import proto_helpers
@@ -11,6 +13,7 @@ from twisted.python import failure
 #defer.Deferred.debug=1
 
 from .. import util
+from ..dtype import dbr_time
 
 #from twisted.internet.defer import Deferred as RealDeferred
 #
@@ -242,3 +245,30 @@ class TestBLP(unittest.TestCase):
             pass
 
         self.alldone = True
+
+class TestAccumulator(unittest.TestCase):
+    def test_reuse(self):
+        A = util.Accumulator(capacity=4)
+        M = numpy.zeros(1, dtype=dbr_time)
+        M['sec'], M['severity'] = 5, 3
+        A(numpy.asarray([[1, 2, 3]]), M)
+        A.clear()
+
+        # a shorter waveform doesn't keep the tail of the old sample
+        A(numpy.asarray([[9]]), numpy.zeros(1, dtype=dbr_time))
+        self.assertEqual(A.values.tolist(), [[9, 0, 0]])
+        self.assertEqual(A.metas['severity'].tolist(), [0])
+
+        V, M, i = A.reserve(2, 3, A.values.dtype)
+        self.assertEqual(i, 1)
+        self.assertEqual(V[1:3].tolist(), [[0, 0, 0]]*2)
+
+    def test_truncate(self):
+        A = util.Accumulator(capacity=4)
+        A(numpy.asarray([[1], [2]]), numpy.zeros(2, dtype=dbr_time))
+        A.reserve(3, 1, A.values.dtype)
+        self.assertEqual(len(A), 5)
+        A.truncate(2)
+        self.assertEqual(A.values.tolist(), [[1], [2]])
+        A.truncate(3)
+        self.assertEqual(len(A), 2)
@@ -47,16 +47,18 @@ def getArchive(conf):
     except KeyError:
         pass
 
-    if not _reactor[0]:
-        RR = _reactor[0] = archive.ReactorRunner()
-        RR.start()
-
     name = conf
     if not conf or isinstance(conf, str):
         conf = _conf.loadConfig(conf)
     else:
         if 'urltype' not in conf:
             raise ValueError('Invalid configuration')
+
+    if not _reactor[0]:
+        from .backend.procdecode import prestart
+        prestart(conf) # before the reactor thread
+        RR = _reactor[0] = archive.ReactorRunner()
+        RR.start()
     S = _reactor[0].call(archive.getArchive, conf)
     _servers[name] = S
     return S
@@ -110,13 +112,6 @@ def arsearch(names, match = WILDCARD,
 
     return pvs
 
-class _Agg(object):
-    def __init__(self):
-        self.vals, self.metas = [], []
-    def __call__(self, data, meta):
-        self.vals.append(data)
-        self.metas.append(meta)
-
 class _AddPV(object):
     def __init__(self, pv, cb):
         self.pv, self.cb = pv, cb
@@ -207,7 +202,7 @@ def arget(names, match = WILDCARD, mode = RAW,
     if callback:
         args = [(fn, (str(name), _AddPV(name, callback)), {}) for name in names]
     else:
-        args = [(fn, (str(name), _Agg()), {}) for name in names]
+        args = [(fn, (str(name), util.Accumulator()), {}) for name in names]
 
     _reactor[0].callAll(args)
 
@@ -216,12 +211,10 @@ def arget(names, match = WILDCARD, mode = RAW,
 
     ret = {}
     for _a, (pv, data), _b in args:
-        if len(data.vals)==0:
+        if len(data)==0:
             continue # no data
 
-        vals = numpy.concatenate(data.vals, axis=0)
-        meta = numpy.concatenate(data.metas,axis=0)
-        ret[pv] = vals, meta
+        ret[pv] = data.values, data.metas.view(numpy.recarray)
 
     if scalar and len(names)==1:
         assert len(ret)==1, len(ret)
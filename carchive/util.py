@@ -9,6 +9,8 @@ _log = logging.getLogger(__name__)
 import re, collections, time
 from cStringIO import StringIO
 
+import numpy
+
 from twisted.web.client import Agent
 from twisted.web.server import Site
 from twisted.application.internet import TCPServer
@@ -18,6 +20,8 @@ from twisted.python import failure
 
 from twisted.web.client import ResponseDone, ResponseFailed
 
+from .dtype import dbr_time
+
 class HandledError(Exception):
     pass
 
@@ -100,6 +104,10 @@ class Cache(object):
     >>> C.set('A', 40, now=4)
     >>> C.get('A', now=4)
     40
+    >>> C.items(now=2)
+    [('C', 4), ('D', 5), ('A', 40)]
+    >>> C.items(now=3)
+    [('A', 40)]
     """
     def __init__(self, maxcount=100, maxage=30, clock=time.time):
         self.clock = clock
@@ -159,6 +167,161 @@ class Cache(object):
             K, _ = self._values.popitem(last=False)
             del self._times[K]
 
+    def __len__(self):
+        return len(self._values)
+
+    def items(self, now=None):
+        """List of (key, value) of the entries which have not expired,
+        oldest first
+        """
+        if now is None:
+            now = self.clock()
+        return [(K, V) for K, V in self._values.iteritems()
+                if now-self._times[K]<=self.maxage]
+
+class LRUCache(Cache):
+    """A Cache where get() marks an entry as recently used,
+    so the least recently used entry is evicted first.
+    Counts hits and misses.
+
+    >>> C=LRUCache(maxcount=2, maxage=2)
+    >>> C.set('A', 1, now=0)
+    >>> C.set('B', 2, now=0)
+    >>> C.get('A', now=1)
+    1
+    >>> C.set('C', 3, now=1)
+    >>> list(C._values)
+    ['A', 'C']
+    >>> C.get('A', now=3), C.get('B', now=3)
+    (None, None)
+    >>> C.hits, C.misses, len(C)
+    (1, 2, 1)
+    """
+    def __init__(self, *args, **kws):
+        super(LRUCache, self).__init__(*args, **kws)
+        self.hits = self.misses = 0
+
+    def get(self, key, defv=None, now=None):
+        try:
+            V = self._values.pop(key)
+        except KeyError:
+            self.misses += 1
+            return defv
+
+        if now is None:
+            now = self.clock()
+        if now-self._times[key]>self.maxage:
+            # expired
+            del self._times[key]
+            self.misses += 1
+            return defv
+
+        self._values[key] = V # now most recently used
+        self.hits += 1
+        return V
+
+class Accumulator(object):
+    """Growable storage for samples.
+
+    Values and dbr_time meta-data are stored in arrays which
+    are re-allocated with twice the capacity when full,
+    and grown in width when a longer waveform arrives.
+
+    Usable as a fetchraw() callback, and also accepted by
+    the pbdecode buffer decoders, which fill it directly (see reserve()).
+
+    >>> A=Accumulator(capacity=2)
+    >>> M=numpy.zeros(2, dtype=dbr_time)
+    >>> M['sec'] = [1, 2]
+    >>> A(numpy.asarray([[1.0],[2.0]]), M)
+    >>> A(numpy.asarray([[3.0, 4.0]]), M[:1])
+    >>> len(A), A._V.shape
+    (3, (4, 2))
+    >>> A.values
+    array([[1., 0.],
+           [2., 0.],
+           [3., 4.]])
+    >>> A.metas['sec']
+    array([1, 2, 1], dtype=uint32)
+    """
+    def __init__(self, capacity=1024):
+        self._cap = max(1, capacity)
+        self._V, self._M = None, None
+        self._N = 0
+
+    def __len__(self):
+        return self._N
+
+    @property
+    def values(self):
+        """Array of values [count, max. element count]
+        """
+        return self._V[:self._N] if self._V is not None else None
+
+    @property
+    def metas(self):
+        """Array of dbr_time [count]
+        """
+        return self._M[:self._N] if self._M is not None else None
+
+    def clear(self):
+        """Discard samples, but keep storage for re-use
+        """
+        self._N = 0
+
+    def truncate(self, count):
+        """Discard all but the first 'count' samples.
+        eg. those reserved by a decoder which then failed.
+        """
+        self._N = min(self._N, count)
+
+    def reserve(self, count, width, dtype):
+        """Make space for 'count' samples with up to 'width' elements
+        and advance the sample count.
+
+        Returns a tuple (values, meta, offset) where the new samples
+        are to be stored in rows [offset, offset+count).
+        These rows are zeroed, as storage is re-used after clear().
+        """
+        dtype = numpy.dtype(dtype)
+        V, M, N = self._V, self._M, self._N
+
+        if V is None:
+            cap = self._cap
+            while cap<count:
+                cap *= 2
+            V = numpy.zeros((cap, max(1, width)), dtype=dtype)
+            M = numpy.zeros(cap, dtype=dbr_time)
+
+        elif V.dtype!=dtype:
+            raise ValueError("Sample type changed from %s to %s"%(V.dtype, dtype))
+
+        elif N+count>V.shape[0] or width>V.shape[1]:
+            cap = V.shape[0]
+            while cap<N+count:
+                cap *= 2
+            V2 = numpy.zeros((cap, max(width, V.shape[1])), dtype=dtype)
+            V2[:N,:V.shape[1]] = V[:N]
+            M2 = numpy.zeros(cap, dtype=dbr_time)
+            M2[:N] = M[:N]
+            V, M = V2, M2
+
+        else:
+            V[N:N+count] = 0
+            M[N:N+count] = numpy.zeros(1, dtype=dbr_time)
+
+        self._V, self._M, self._N = V, M, N+count
+        return V, M, N
+
+    def __call__(self, data, meta):
+        N = len(meta)
+        if self._V is not None and self._V.dtype!=data.dtype:
+            # eg. strings of varying length
+            self._V = self._V.astype(numpy.promote_types(self._V.dtype, data.dtype))
+        V, M, i = self.reserve(N, data.shape[1], self._V.dtype if self._V is not None else data.dtype)
+        V[i:i+N, :data.shape[1]] = data
+        M[i:i+N] = meta
+
 class BufferingLineProtocol(protocol.Protocol):
     """A line based protocol which buffers lines and delivers them in bulk.
 
@@ -176,8 +339,13 @@ class BufferingLineProtocol(protocol.Protocol):
     
     @ivar rx_buf_size: Number of bytes to buffer before processing
     @type rx_buf_size: C{int}
+
+    @ivar splitLines: If False then complete lines are not split, but passed
+    as a single string to C{processBuffer} instead of C{processLines}.
+    @type splitLines: C{bool}
     """
     rx_buf_size = 2**20
+    splitLines = True
 
     def __init__(self):
         # This Deferred will fire when the request ends with the result
@@ -203,6 +371,16 @@ class BufferingLineProtocol(protocol.Protocol):
         """
         raise NotImplementedError()
 
+    def processBuffer(self, buf, end, prev=None):
+        """Called with a string of which the first C{end} bytes
+        are complete lines (including the final newline).
+
+        Used instead of processLines() when splitLines is False.
+
+        @param prev: As with processLines()
+        """
+        raise NotImplementedError()
+
     def connectionMade(self):
         self.rxbuf = StringIO()
         # trick cStringIO to allocate the full buffer size
@@ -228,6 +406,19 @@ class BufferingLineProtocol(protocol.Protocol):
             self.active = False
             return
 
+        if not self.splitLines:
+            buf = self.rxbuf.getvalue()
+            end = buf.rfind('\n')+1
+            if end==0:
+                return # no newline found
+
+            self.rxbuf.truncate(0)
+            # any bytes after the last newline are a partial line
+            self.rxbuf.write(buf[end:])
+            assert self._defer.called
+            self._defer.addCallback(self._invoke, lines=(buf, end))
+            return
+
         # split into complete lines
         L = self.rxbuf.getvalue().split('\n')
         if len(L)==1:
@@ -239,10 +430,16 @@ class BufferingLineProtocol(protocol.Protocol):
         assert self._defer.called
         self._defer.addCallback(self._invoke, lines=L[:-1])
 
+    def _process(self, lines, prev):
+        if self.splitLines:
+            return self.processLines(lines, prev=prev)
+        buf, end = lines
+        return self.processBuffer(buf, end, prev=prev)
+
     @defer.inlineCallbacks
     def _invoke(self, V, lines):
         try:
-            self._last = defer.maybeDeferred(self.processLines, lines, prev=V)
+            self._last = defer.maybeDeferred(self._process, lines, V)
             V = yield self._last
             # processing complete
             if not self.active:
@@ -276,14 +473,19 @@ class BufferingLineProtocol(protocol.Protocol):
             # normal completion
             if self.rxbuf.tell()>0:
                 # process remaining
-                lines = self.rxbuf.getvalue().split('\n')
+                buf = self.rxbuf.getvalue()
+                if self.splitLines:
+                    lines = buf.split('\n')
+                    partial, lines = lines[-1], lines[:-1]
+                else:
+                    partial, lines = buf[-1]!='\n', (buf, len(buf))
                 @self._defer.addCallback
                 def _flush(V):
-                    if len(lines[-1])>0:
+                    if partial:
                         # last line is incomplete
                         raise RuntimeError('connection closed with partial line')
 
-                    return self._invoke(V, lines=lines[:-1])
+                    return self._invoke(V, lines=lines)
 
         else:
             # abnormal connection termination
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Copyright 2015 Brookhaven Science Assoc.
+ as operator of Brookhaven National Lab.
+
+Benchmark of writing PB files with the pbraw Exporter
+
+Exports generated samples of a scalar double PV to a temporary directory
+and prints the rate in samples per second.
+"""
+
+from __future__ import print_function
+
+import time, shutil, tempfile, calendar
+
+import numpy as np
+
+def getargs():
+    import argparse
+    P = argparse.ArgumentParser()
+    P.add_argument('-N', '--count', type=int, default=200000, help='Number of samples')
+    P.add_argument('-C', '--chunk', type=int, default=1000, help='Samples per chunk')
+    P.add_argument('-P', '--period', type=float, default=1.0, help='Seconds between samples')
+    P.add_argument('-G', '--granularity', default='1hour')
+    P.add_argument('-R', '--repeat', type=int, default=3, help='Best of this many runs')
+    P.add_argument('--no-encoders', action='store_true',
+                   help='Encode each sample in python, as without pbdecode')
+    return P.parse_args()
+
+def samples(N, period):
+    from carchive.dtype import dbr_time
+    T = calendar.timegm((2015, 1, 1, 0, 0, 0))*1000000000 + (np.arange(N)*period*1e9).astype(np.int64)
+    M = np.zeros(N, dtype=dbr_time)
+    M['sec'], M['ns'] = np.divmod(T, 1000000000)
+    V = np.random.uniform(0, 10, (N, 1))
+    return V, M
+
+def export(V, M, args):
+    from carchive.backend.pb import exporter, granularity, pvlog
+    meta = {'units':'mm', 'prec':2, 'alarm_low':0.0, 'alarm_high':10.0,
+            'warn_low':1.0, 'warn_high':9.0, 'disp_low':0.0, 'disp_high':10.0}
+    out = tempfile.mkdtemp()
+    try:
+        T0 = time.time()
+        with exporter.Exporter('BENCH:pv', granularity.get_granularity(args.granularity), out,
+                               [':'], None, pvlog.PvLog('BENCH:pv')) as E:
+            for i in range(0, len(M), args.chunk):
+                E(V[i:i+args.chunk], M[i:i+args.chunk],
+                  {'orig_type':3, 'reported_arr_size':1, 'the_meta':meta})
+        return time.time()-T0
+    finally:
+        shutil.rmtree(out)
+
+def main(args):
+    from carchive.backend.pb import exporter
+    if args.no_encoders:
+        exporter.pb_encoders = None
+    print('Encoders:', 'no' if exporter.pb_encoders is None else 'yes')
+
+    V, M = samples(args.count, args.period)
+    T = min(export(V, M, args) for _i in range(args.repeat))
+    print('%d samples in %.3f s, %.0f samples/s'%(args.count, T, args.count/T))
+
+if __name__=='__main__':
+    main(getargs())
@@ -146,6 +146,7 @@ Exports of data to Archiver Appliance and H5 are supported.
                 'carchive.a2aproxy',
                 'carchive.a2aproxy.test',
                 'carchive.archmiddle',
+                'carchive.archmiddle.test',
                 'carchive.cmd',
                 'carchive.backend',
                 'carchive.backend.test',
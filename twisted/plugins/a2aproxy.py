@@ -34,10 +34,16 @@ class Options(usage.Options):
         ['port', 'P', 8888, "Port to listen on (default 7004)", int],
         ['appl', 'A', "http://localhost:17665/mgmt/bpl/getApplianceInfo", "/getApplianceInfo URL"],
         ['manhole', 'M', 2222, "Manhole port (default not-run)", int],
+        ['concurrent', 'C', 4, "Max. PVs fetched concurrently for one request (default 4)", int],
+        ['plotcache', '', 64, "Size of the plot bin reply cache in MB, 0 to disable (default 64)", int],
+        ['decodethreads', '', 4, "Number of decoder threads (default 4)", int],
+        ['decodequeue', '', 16, "Max. decode jobs waiting for a thread (default 16)", int],
     ]
     def postOptions(self):
         if self['port'] < 1 or self['port'] > 65535:
             raise usage.UsageError('Port out of range')
+        if self['concurrent'] < 1:
+            raise usage.UsageError('concurrent must be >= 1')
 
 class Maker(object):
     implements(service.IServiceMaker, IPlugin)
@@ -61,7 +67,17 @@ class Maker(object):
 
         serv = service.MultiService()
 
-        fact = LimitedSite(buildResource(opts['appl']))
+        from carchive.backend.decodepool import getDecodePool
+        getDecodePool().configure(workers=opts['decodethreads'],
+                                  maxqueue=opts['decodequeue'])
+
+        plotcache = None
+        if opts['plotcache']>0:
+            from carchive.a2aproxy.plotcache import PlotCache
+            plotcache = PlotCache(maxsize=opts['plotcache']*2**20)
+
+        fact = LimitedSite(buildResource(opts['appl'], concurrent=opts['concurrent'],
+                                         plotcache=plotcache))
 
         serv.addService(LimitedTCPServer(opts['port'], fact, interface=opts['ip']))
 
@@ -72,6 +88,7 @@ class Maker(object):
 
             # populate manhole shell locals
             SF.namespace['site'] = fact
+            SF.namespace['plotcache'] = plotcache
 
             serv.addService(SS)
         else:
@@ -74,14 +74,13 @@ class Maker(object):
             _M.append((k,int(v[0]), v[1:]))
 
         KM = KeyNameMap(_M)
-        info = InfoCache(server['url'], KM)
+        info = InfoCache(server['url'], KM,
+                         pvlimit=server.getint('cache.limit', 500),
+                         timeout=server.getfloat('cache.timeout', 3600))
 
         root, leaf = buildResource(info, reactor)
         fact = Site(root)
 
-        info.pvlimit = server.getint('cache.limit', 500)
-        info.timeout = server.getfloat('cache.timeout', 3600)
-
         mservice.addService(TCPServer(server.getint('port'),
                                   fact,
                                   interface=server.get('interface','')))
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Copyright 2015 Brookhaven Science Assoc.
+ as operator of Brookhaven National Lab.
+
+Benchmark of encoding archiver.values replies in the a2aproxy
+
+Compares encoding each sample with _sample_head, _encoder and _sample_foot
+with encoding a chunk with encodeSamples(), and prints seconds per chunk.
+"""
+
+from __future__ import print_function
+
+import time
+
+import numpy as np
+
+def getargs():
+    import argparse
+    P = argparse.ArgumentParser()
+    P.add_argument('-N', '--count', type=int, default=10000, help='Samples per chunk of scalars')
+    P.add_argument('-W', '--width', type=int, default=1000, help='Elements per waveform')
+    P.add_argument('-R', '--repeat', type=int, default=5, help='Mean of this many runs')
+    return P.parse_args()
+
+def persample(V, M):
+    from carchive.a2aproxy import xrpcrequest as X
+    E = X._encoder[X._d2x[V.dtype]]
+    out = []
+    for i in range(len(M)):
+        SM = M[i]
+        out.append(X._sample_head%{'stat':SM['status'], 'sevr':SM['severity'],
+                                   'secs':SM['sec'], 'nano':SM['ns']})
+        out.append(X._sample_start+''.join(map(E, V[i,:]))+X._sample_foot)
+    return ''.join(out)
+
+def chunks(N, W):
+    from carchive.dtype import dbr_time
+    def meta(N):
+        M = np.zeros(N, dtype=dbr_time)
+        M['sec'] = 1400000000+np.arange(N)
+        M['ns'] = np.arange(N)*1001
+        return M
+    Nw = max(1, N//W)
+    return [
+        ('%d scalar doubles'%N, np.random.uniform(0, 10, (N, 1)), meta(N)),
+        ('%d scalar floats'%N, np.random.uniform(0, 10, (N, 1)).astype(np.float32), meta(N)),
+        ('%d scalar ints'%N, np.arange(N, dtype=np.int32).reshape((N, 1)), meta(N)),
+        ('%d x %d waveform double'%(Nw, W), np.random.uniform(0, 10, (Nw, W)), meta(Nw)),
+        ('%d x %d waveform int16'%(Nw, W), np.arange(Nw*W, dtype=np.int16).reshape((Nw, W)), meta(Nw)),
+        ('%d strings'%N, np.asarray([['a<b%d'%i] for i in range(N)], dtype='a40'), meta(N)),
+    ]
+
+def timed(fn, V, M, repeat):
+    T0 = time.time()
+    for _i in range(repeat):
+        fn(V, M)
+    return (time.time()-T0)/repeat
+
+def main(args):
+    from carchive.a2aproxy.xrpcrequest import encodeSamples
+    print('%-28s %10s %10s'%('chunk', 'per sample', 'chunk'))
+    for name, V, M in chunks(args.count, args.width):
+        print('%-28s %10.3f %10.3f'%(name, timed(persample, V, M, args.repeat),
+                                     timed(encodeSamples, V, M, args.repeat)))
+
+if __name__=='__main__':
+    main(getargs())